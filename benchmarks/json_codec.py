@@ -0,0 +1,88 @@
+"""
+Benchmark of the JSON codecs on realistic A2A payloads.
+
+Encodes and decodes a ``Task`` with a long history and artifacts, and a
+``Conversation`` of many messages, with every installed codec (see
+``python_a2a.codec``). Times are per payload, best of several runs.
+
+Usage (with python_a2a installed, e.g. ``pip install -e .``):
+    python benchmarks/json_codec.py [--messages 50] [--number 200]
+"""
+
+import argparse
+import timeit
+
+from python_a2a import (
+    Conversation, FunctionCallContent, FunctionParameter, Message, MessageRole,
+    Task, TaskState, TaskStatus, TextContent, codec
+)
+
+PARAGRAPH = (
+    "The quarterly report shows revenue growth of 12% driven by the new "
+    "subscription tier, while support costs decreased after the rollout of "
+    "the self-service portal. "
+) * 4
+
+
+def make_conversation(messages):
+    conversation = Conversation()
+    for i in range(messages):
+        if i % 5 == 4:
+            content = FunctionCallContent(name="lookup_account", parameters=[
+                FunctionParameter(name="account_id", value=f"acct-{i}"),
+                FunctionParameter(name="fields", value=["balance", "plan", "renewal_date"]),
+            ])
+        else:
+            content = TextContent(text=f"{i}: {PARAGRAPH}")
+        role = MessageRole.USER if i % 2 == 0 else MessageRole.AGENT
+        conversation.add_message(Message(content=content, role=role))
+    return conversation
+
+
+def make_task(messages):
+    history = [message.to_dict() for message in make_conversation(messages).messages]
+    return Task(
+        id="task-42",
+        session_id="session-7",
+        status=TaskStatus(state=TaskState.COMPLETED, message={"info": "done"}),
+        message=history[-1],
+        history=history,
+        artifacts=[{"name": f"part-{i}", "parts": [{"type": "text", "text": PARAGRAPH}]} for i in range(5)],
+        metadata={"model": "example-model", "tokens": {"input": 5231, "output": 812}},
+    )
+
+
+def best_us(fn, number):
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=50, help="Messages per payload")
+    parser.add_argument("--number", type=int, default=200, help="Iterations per timing")
+    args = parser.parse_args()
+
+    payloads = {
+        "task": (make_task(args.messages), Task),
+        "conversation": (make_conversation(args.messages), Conversation),
+    }
+    previous = codec.get_codec()
+
+    print(f"{'payload':>12} {'codec':>8} {'size':>8} {'dumps (us)':>11} {'loads (us)':>11} "
+          f"{'to_json (us)':>13} {'from_json (us)':>15}")
+    for name, (model, model_class) in payloads.items():
+        data = model.to_dict()
+        for codec_name in codec.available_codecs():
+            codec.set_codec(codec_name)
+            encoded = codec.dumps(data)
+            text = model.to_json()
+            print(f"{name:>12} {codec_name:>8} {len(encoded):>8} "
+                  f"{best_us(lambda: codec.dumps(data), args.number):>11.1f} "
+                  f"{best_us(lambda: codec.loads(encoded), args.number):>11.1f} "
+                  f"{best_us(model.to_json, args.number):>13.1f} "
+                  f"{best_us(lambda: model_class.from_json(text), args.number):>15.1f}")
+    codec.set_codec(previous)
+
+
+if __name__ == "__main__":
+    main()
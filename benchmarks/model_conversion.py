@@ -0,0 +1,82 @@
+"""
+Benchmark of payload conversion for large conversations.
+
+Builds a conversation of text, function call, function response and error
+messages, and times reading and writing it in both wire formats through the
+model methods (``Conversation.from_dict``, ``to_dict`` and
+``to_google_a2a``), which detect the wire format once per payload. It also
+times converting message payloads to the Google A2A format directly with
+``message_dict_to_google`` against converting them through ``Message``
+objects, and reading only the routing headers of each message with
+``LazyMessage`` against ``Message.from_dict``.
+
+Usage (with python_a2a installed, e.g. ``pip install -e .``):
+    python benchmarks/model_conversion.py [--messages 10000]
+"""
+
+import argparse
+import time
+
+from python_a2a import (
+    Conversation, ErrorContent, FunctionCallContent, FunctionParameter,
+    FunctionResponseContent, LazyMessage, Message, MessageRole, TextContent
+)
+from python_a2a.models.converters import message_dict_to_google
+
+
+def build_conversation(count):
+    conversation = Conversation(conversation_id="conversation-1")
+    contents = [
+        lambda i: TextContent(text=f"message {i}"),
+        lambda i: FunctionCallContent(name="lookup", parameters=[FunctionParameter(name="id", value=i)]),
+        lambda i: FunctionResponseContent(name="lookup", response={"id": i, "found": True}),
+        lambda i: ErrorContent(message=f"error {i}"),
+    ]
+    for i in range(count):
+        conversation.add_message(Message(content=contents[i % len(contents)](i), role=MessageRole.AGENT,
+                                         message_id=f"message-{i}"))
+    return conversation
+
+
+def best_ms(fn, repeat=5):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=10000, help="number of messages in the conversation")
+    args = parser.parse_args()
+
+    conversation = build_conversation(args.messages)
+    python_payload = conversation.to_dict()
+    google_payload = conversation.to_google_a2a()
+    message_payloads = python_payload["messages"]
+
+    cases = [
+        ("from_dict (python_a2a)", lambda: Conversation.from_dict(python_payload)),
+        ("from_dict (google_a2a)", lambda: Conversation.from_dict(google_payload)),
+        ("to_dict", conversation.to_dict),
+        ("to_google_a2a", conversation.to_google_a2a),
+        ("messages to google via models",
+         lambda: [Message.from_dict(m).to_google_a2a() for m in message_payloads]),
+        ("messages to google directly", lambda: [message_dict_to_google(m) for m in message_payloads]),
+        ("headers via Message.from_dict",
+         lambda: [(m.conversation_id, m.role) for m in map(Message.from_dict, message_payloads)]),
+        ("headers via LazyMessage",
+         lambda: [(m.conversation_id, m.role) for m in map(LazyMessage, message_payloads)]),
+    ]
+
+    print(f"{args.messages} messages")
+    print(f"{'operation':<32} {'ms':>9} {'µs/message':>11}")
+    for name, fn in cases:
+        elapsed = best_ms(fn)
+        print(f"{name:<32} {elapsed:>9.2f} {elapsed * 1000 / args.messages:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark of the memory footprint and construction time of message models.
+
+The models (``Message``, the content classes, ``Task`` and ``TaskStatus``)
+are slotted dataclasses. This compares them with equivalent plain
+dataclasses, whose instances carry a ``__dict__`` as the models did before:
+memory per message (with its ``TextContent``, measured with tracemalloc over
+many messages held at once) and the time to construct one.
+
+Usage (with python_a2a installed, e.g. ``pip install -e .``):
+    python benchmarks/model_memory.py [--messages 100000]
+"""
+
+import argparse
+import dataclasses
+import gc
+import timeit
+import tracemalloc
+
+from python_a2a import Message, MessageRole, Task, TaskState, TaskStatus, TextContent
+from python_a2a.models import BaseModel
+
+
+def unslotted(cls):
+    """Build a plain dataclass with the same fields as a slotted model"""
+    specs = []
+    for f in dataclasses.fields(cls):
+        if f.default_factory is not dataclasses.MISSING:
+            spec = dataclasses.field(default_factory=f.default_factory)
+        elif f.default is not dataclasses.MISSING:
+            spec = dataclasses.field(default=f.default)
+        else:
+            spec = dataclasses.field()
+        specs.append((f.name, f.type, spec))
+    return dataclasses.make_dataclass(f"Plain{cls.__name__}", specs, bases=(BaseModel,))
+
+
+PlainMessage = unslotted(Message)
+PlainTextContent = unslotted(TextContent)
+PlainTask = unslotted(Task)
+PlainTaskStatus = unslotted(TaskStatus)
+
+
+def bytes_per_item(make, count):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    items = [make(i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del items
+    return (after - before) / count
+
+
+def best_us(fn, number=20000):
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=100000, help="number of messages held for the memory test")
+    args = parser.parse_args()
+
+    # Message IDs and texts are shared, so only the model objects are measured
+    message_id = "2f1c8a52-0c4e-4a2b-9a55-1b8f6c3d7e90"
+    variants = [
+        ("plain dataclass", PlainMessage, PlainTextContent, PlainTask, PlainTaskStatus),
+        ("slotted", Message, TextContent, Task, TaskStatus),
+    ]
+
+    print(f"{'models':<16} {'bytes/message':>14} {'message µs':>11} {'task µs':>9}")
+    for name, message_cls, content_cls, task_cls, status_cls in variants:
+        def make_message(i=0):
+            return message_cls(content=content_cls(text="hello"), role=MessageRole.USER,
+                               message_id=message_id, conversation_id="conversation-1")
+
+        def make_task():
+            return task_cls(id="task-1", session_id="session-1",
+                            status=status_cls(state=TaskState.COMPLETED, timestamp="now"))
+
+        memory = bytes_per_item(make_message, args.messages)
+        print(f"{name:<16} {memory:>14.0f} {best_us(make_message):>11.2f} {best_us(make_task):>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
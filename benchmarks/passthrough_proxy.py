@@ -0,0 +1,74 @@
+"""
+Benchmark of the per-request work of a gateway forwarding A2A requests.
+
+Compares, for a ``tasks/send`` request and its reply, what a gateway does
+with each body between receiving and forwarding it:
+
+- decoding it into ``Task`` objects and encoding it again with ``to_dict``
+  (what a gateway built from ``A2AClient`` and ``A2AServer`` does),
+- the pass-through apps reading the JSON-RPC envelope to route the request
+  (``RawRequest.method``),
+- the pass-through apps forwarding it without routing on its content.
+
+Network time is left out; only the CPU time spent on the bodies is measured.
+
+Usage (with python_a2a installed, e.g. ``pip install -e .``):
+    python benchmarks/passthrough_proxy.py [--text-size 2000]
+"""
+
+import argparse
+import timeit
+
+from python_a2a import Task, codec
+from python_a2a.server import RawRequest
+
+
+def build_bodies(text_size):
+    message = {"role": "user", "conversation_id": "conversation-1",
+               "content": {"type": "text", "text": "x" * text_size}}
+    request = {"jsonrpc": "2.0", "id": 1, "method": "tasks/send",
+               "params": {"id": "task-1", "sessionId": "session-1", "message": message}}
+    reply = {"jsonrpc": "2.0", "id": 1, "result": {
+        "id": "task-1", "sessionId": "session-1",
+        "status": {"state": "completed", "timestamp": "2024-01-01T00:00:00"},
+        "message": message,
+        "artifacts": [{"parts": [{"type": "text", "text": "y" * text_size}]}]
+    }}
+    return codec.dumps(request), codec.dumps(reply)
+
+
+def best_us(fn, number=5000):
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--text-size", type=int, default=2000, help="characters of text in the request and reply")
+    args = parser.parse_args()
+
+    request_body, reply_body = build_bodies(args.text_size)
+
+    def reencode():
+        request = codec.loads(request_body)
+        task = Task.from_dict(request["params"])
+        forwarded = codec.dumps({**request, "params": task.to_dict()})
+        reply = codec.loads(reply_body)
+        result = Task.from_dict(reply["result"])
+        returned = codec.dumps({**reply, "result": result.to_dict()})
+        return forwarded, returned
+
+    def route_on_envelope():
+        return RawRequest(request_body).method, request_body, reply_body
+
+    def forward():
+        return RawRequest(request_body).body, reply_body
+
+    print(f"{len(request_body)} byte request, {len(reply_body)} byte reply")
+    print(f"{'gateway':<28} {'µs/request':>11}")
+    for name, fn in [("decode and re-encode", reencode), ("route on envelope", route_on_envelope),
+                     ("forward", forward)]:
+        print(f"{name:<28} {best_us(fn):>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Load test comparing the Flask and ASGI servers under concurrent requests.
+
+Each agent simulates an LLM call by waiting ``--latency`` seconds per
+message. The same number of concurrent clients is pointed at:
+
+- the Flask app (``create_flask_app``) on Werkzeug's threaded server,
+- the ASGI app (``create_asgi_app``) on uvicorn, with a synchronous handler
+  (run in uvicorn's thread pool),
+- the ASGI app on uvicorn, with a coroutine handler awaited on the loop.
+
+Synchronous handlers on the ASGI app are bounded by the size of the thread
+pool (40 threads by default), so only coroutine handlers get the full
+benefit of the event loop.
+
+Usage (with python_a2a installed, e.g. ``pip install -e .``):
+    python benchmarks/server_throughput.py [--requests 400] [--concurrency 100] [--latency 0.2]
+"""
+
+import argparse
+import asyncio
+import logging
+import socket
+import threading
+import time
+
+import aiohttp
+
+from python_a2a import BaseA2AServer, Message, MessageRole, TextContent
+from python_a2a.server.asgi import create_asgi_app
+from python_a2a.server.http import create_flask_app
+
+
+class SyncAgent(BaseA2AServer):
+    """Agent whose handler blocks while waiting for the (simulated) model"""
+
+    def __init__(self, latency):
+        self.latency = latency
+
+    def handle_message(self, message):
+        time.sleep(self.latency)
+        return Message(content=TextContent(text=message.content.text), role=MessageRole.AGENT,
+                       parent_message_id=message.message_id)
+
+
+class AsyncAgent(SyncAgent):
+    """Agent whose handler awaits the (simulated) model"""
+
+    async def handle_message(self, message):
+        await asyncio.sleep(self.latency)
+        return Message(content=TextContent(text=message.content.text), role=MessageRole.AGENT,
+                       parent_message_id=message.message_id)
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def serve_flask(agent):
+    from werkzeug.serving import make_server
+
+    server = make_server("127.0.0.1", free_port(), create_flask_app(agent), threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_port}", server.shutdown
+
+
+def serve_asgi(agent):
+    import uvicorn
+
+    port = free_port()
+    config = uvicorn.Config(create_asgi_app(agent), host="127.0.0.1", port=port,
+                            log_level="warning", backlog=4096)
+    server = uvicorn.Server(config)
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+
+    def stop():
+        server.should_exit = True
+
+    return f"http://127.0.0.1:{port}", stop
+
+
+async def load(url, requests, concurrency):
+    """Send ``requests`` messages with ``concurrency`` clients; return requests per second"""
+    payload = Message(content=TextContent(text="ping"), role=MessageRole.USER).to_dict()
+    semaphore = asyncio.Semaphore(concurrency)
+    connector = aiohttp.TCPConnector(limit=concurrency)
+
+    async with aiohttp.ClientSession(connector=connector) as session:
+        async def one():
+            async with semaphore:
+                async with session.post(f"{url}/a2a", json=payload) as response:
+                    assert response.status == 200, response.status
+                    await response.read()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(requests)))
+        return requests / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=400, help="Total number of requests")
+    parser.add_argument("--concurrency", type=int, default=100, help="Concurrent clients")
+    parser.add_argument("--latency", type=float, default=0.2, help="Simulated model latency in seconds")
+    args = parser.parse_args()
+    logging.getLogger("werkzeug").setLevel(logging.WARNING)
+
+    scenarios = [
+        ("flask (threaded)", serve_flask, SyncAgent),
+        ("asgi, sync handler", serve_asgi, SyncAgent),
+        ("asgi, async handler", serve_asgi, AsyncAgent),
+    ]
+
+    ideal = args.concurrency / args.latency
+    print(f"{args.requests} requests, {args.concurrency} concurrent, {args.latency}s latency "
+          f"(ideal: {ideal:.0f} req/s)")
+    for name, serve, agent_class in scenarios:
+        url, stop = serve(agent_class(args.latency))
+        try:
+            asyncio.run(load(url, min(args.requests, args.concurrency), args.concurrency))  # warm up
+            throughput = asyncio.run(load(url, args.requests, args.concurrency))
+        finally:
+            stop()
+        print(f"{name:>22}: {throughput:8.1f} req/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark the incremental SSE decoder against the previous string-buffer parser.
+
+The previous parser appended every decoded chunk to a string buffer and used
+``"\\n\\n" in buffer`` / ``buffer.split("\\n\\n", 1)`` to find events, which
+re-scans (and copies) the accumulated text. Its cost grows quadratically
+when a single event spans many chunks, or when one chunk carries many events.
+``SSEDecoder`` only keeps the trailing partial line, so its cost stays
+linear in the size of the stream.
+
+Usage (with python_a2a installed, e.g. ``pip install -e .``):
+    python benchmarks/sse_decoder.py [--sizes 1 2 4 8] [--chunk-size 4096]
+"""
+
+import argparse
+import json
+import time
+
+from python_a2a.client.sse import SSEDecoder
+
+
+def legacy_parse(chunks):
+    """The event parsing loop previously used by StreamingClient._process_stream"""
+    events = 0
+    buffer = ""
+    for chunk in chunks:
+        buffer += chunk.decode("utf-8")
+        while "\n\n" in buffer:
+            event, buffer = buffer.split("\n\n", 1)
+            for line in event.split("\n"):
+                line = line.strip()
+                if line.startswith("data:"):
+                    events += 1
+    return events
+
+
+def decoder_parse(chunks):
+    """Parse the same stream with SSEDecoder"""
+    decoder = SSEDecoder()
+    events = 0
+    for chunk in chunks:
+        events += len(decoder.feed(chunk))
+    return events
+
+
+def large_event_stream(size, chunk_size):
+    """One event of ``size`` bytes delivered in ``chunk_size`` chunks"""
+    payload = json.dumps({"content": "x" * size, "lastChunk": True})
+    stream = f"event: chunk\ndata: {payload}\n\n".encode("utf-8")
+    return [stream[i:i + chunk_size] for i in range(0, len(stream), chunk_size)]
+
+
+def many_events_stream(size, chunk_size):
+    """Many small token events, delivered in a few large chunks"""
+    event = ("data: " + json.dumps({"content": "token ", "append": True}) + "\n\n").encode("utf-8")
+    stream = event * (size // len(event))
+    return [stream[i:i + chunk_size] for i in range(0, len(stream), chunk_size)]
+
+
+def measure(parse, chunks, repeat=3):
+    """Best wall-clock time of ``repeat`` runs"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse(chunks)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 2, 4, 8], help="Stream sizes in MB")
+    parser.add_argument("--chunk-size", type=int, default=4096, help="Chunk size for the single large event")
+    parser.add_argument("--burst-size", type=int, default=1024 * 1024, help="Chunk size for the many-events stream")
+    args = parser.parse_args()
+
+    scenarios = [
+        ("one large event", large_event_stream, args.chunk_size),
+        ("many small events", many_events_stream, args.burst_size),
+    ]
+
+    for name, make_stream, chunk_size in scenarios:
+        print(f"\n{name} (chunks of {chunk_size} bytes)")
+        print(f"{'size':>8} {'legacy (s)':>12} {'decoder (s)':>12} {'decoder MB/s':>14}")
+        for size_mb in args.sizes:
+            chunks = make_stream(size_mb * 1024 * 1024, chunk_size)
+            assert legacy_parse(chunks) == decoder_parse(chunks)
+
+            legacy = measure(legacy_parse, chunks)
+            decoder = measure(decoder_parse, chunks)
+            print(f"{size_mb:>6}MB {legacy:>12.4f} {decoder:>12.4f} {size_mb / decoder:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
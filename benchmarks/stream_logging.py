@@ -0,0 +1,69 @@
+"""
+Micro-benchmark of the per-chunk cost of the Flask streaming route.
+
+Streams of increasing length are read through the Flask test client, with
+stream tracing disabled (the default) and enabled (DEBUG, sent to a
+NullHandler so only the logging cost is measured). The per-chunk time
+should stay flat as streams grow, and disabled tracing should add nothing
+measurable.
+
+Usage (with python_a2a installed, e.g. ``pip install -e .``):
+    python benchmarks/stream_logging.py [--chunks 1000 10000 50000]
+"""
+
+import argparse
+import logging
+import time
+
+from python_a2a import BaseA2AServer, Message, MessageRole, TextContent
+from python_a2a.server.http import create_flask_app, stream_logger
+
+
+class TokenAgent(BaseA2AServer):
+    """Agent streaming ``count`` small tokens"""
+
+    def __init__(self, count):
+        self.count = count
+
+    def handle_message(self, message):
+        return message
+
+    async def stream_response(self, message):
+        for _ in range(self.count):
+            yield "token "
+
+
+def per_chunk_us(count, repeat=3):
+    """Best per-chunk time, in microseconds, to stream ``count`` chunks"""
+    client = create_flask_app(TokenAgent(count)).test_client()
+    payload = Message(content=TextContent(text="go"), role=MessageRole.USER).to_dict()
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        response = client.post("/stream", json=payload)
+        response.get_data()
+        best = min(best, time.perf_counter() - start)
+    return best / count * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chunks", type=int, nargs="+", default=[1000, 10000, 50000],
+                        help="Stream lengths in chunks")
+    args = parser.parse_args()
+
+    stream_logger.addHandler(logging.NullHandler())
+    stream_logger.propagate = False
+
+    print(f"{'chunks':>8} {'tracing off (us/chunk)':>24} {'tracing on (us/chunk)':>23}")
+    for count in args.chunks:
+        stream_logger.setLevel(logging.WARNING)
+        disabled = per_chunk_us(count)
+        stream_logger.setLevel(logging.DEBUG)
+        enabled = per_chunk_us(count)
+        print(f"{count:>8} {disabled:>24.2f} {enabled:>23.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Memory use of A2AServer task storage over many tasks.
+
+Tasks are stored in a bounded ``MemoryTaskStore`` and a ``SQLiteTaskStore``
+and the traced Python memory is reported at checkpoints. With a bounded
+store the memory should stay flat once ``--max-tasks`` tasks are stored.
+
+Usage (with python_a2a installed, e.g. ``pip install -e .``):
+    python benchmarks/task_store_memory.py [--tasks 1000000] [--max-tasks 10000]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+from python_a2a import Message, MessageRole, Task, TextContent
+from python_a2a.server import MemoryTaskStore, SQLiteTaskStore
+
+
+def run(name, store, count):
+    message = Message(content=TextContent(text="x" * 200), role=MessageRole.USER).to_dict()
+    checkpoints = {count // 10 * i for i in range(1, 11)}
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    for i in range(1, count + 1):
+        store[f"task-{i}"] = Task(id=f"task-{i}", message=message)
+        if i in checkpoints:
+            current, _ = tracemalloc.get_traced_memory()
+            print(f"{name:>8} {i:>10} tasks: {current / 2 ** 20:8.1f} MiB, {len(store):>8} stored")
+    elapsed = time.perf_counter() - start
+    tracemalloc.stop()
+    print(f"{name:>8} {count / elapsed:,.0f} tasks/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=1000000, help="Number of tasks to store")
+    parser.add_argument("--max-tasks", type=int, default=10000, help="Bound of the stores")
+    args = parser.parse_args()
+
+    run("memory", MemoryTaskStore(max_tasks=args.max_tasks), args.tasks)
+    with tempfile.TemporaryDirectory() as directory:
+        store = SQLiteTaskStore(os.path.join(directory, "tasks.sqlite"), max_tasks=args.max_tasks)
+        run("sqlite", store, args.tasks // 10)
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
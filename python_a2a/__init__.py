@@ -39,6 +39,8 @@ from .models.content import (
 )
 from .models.agent import AgentCard, AgentSkill
 from .models.task import Task, TaskStatus, TaskState
+from .models.converters import WireFormat, use_wire_format
+from .models.lazy import LazyMessage
 
 # Core client functionality
 from .client.base import BaseA2AClient
@@ -51,6 +53,7 @@ from .client.streaming import StreamingClient
 from .server.base import BaseA2AServer
 from .server.a2a_server import A2AServer
 from .server.http import run_server
+from .server.asgi import create_asgi_app, run_asgi_server
 
 # Agent discovery functionality
 from .discovery import (
@@ -223,6 +226,9 @@ __all__ = [
     'Task',
     'TaskStatus',
     'TaskState',
+    'WireFormat',
+    'use_wire_format',
+    'LazyMessage',
     
     # Client
     'BaseA2AClient',
@@ -235,6 +241,8 @@ __all__ = [
     'BaseA2AServer',
     'A2AServer',
     'run_server',
+    'create_asgi_app',
+    'run_asgi_server',
     
     # Discovery
     'AgentRegistry',
@@ -5,6 +5,11 @@ Client implementations for the A2A protocol.
 # Import and re-export client classes for easy access
 from .base import BaseA2AClient
 from .http import A2AClient
+from .sessions import SharedConnectionPool, AsyncSessionManager
+from .endpoints import EndpointCache
+from .cache import ResponseCache, MemoryResponseCache, SQLiteResponseCache
+from .coalescing import SingleFlight
+from .resilience import ResiliencePolicy, CircuitBreaker, CircuitState, RetryBudget
 
 # Import LLM-specific clients
 from .llm import OpenAIA2AClient, AnthropicA2AClient
@@ -18,6 +23,17 @@ from .streaming import StreamingClient
 __all__ = [
     'BaseA2AClient',
     'A2AClient',
+    'SharedConnectionPool',
+    'AsyncSessionManager',
+    'EndpointCache',
+    'ResponseCache',
+    'MemoryResponseCache',
+    'SQLiteResponseCache',
+    'SingleFlight',
+    'ResiliencePolicy',
+    'CircuitBreaker',
+    'CircuitState',
+    'RetryBudget',
     'OpenAIA2AClient',
     'AnthropicA2AClient',
     'AgentNetwork',
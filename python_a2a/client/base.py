@@ -3,9 +3,11 @@ Base client for interacting with A2A-compatible agents.
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, AsyncGenerator, Any, Union, Dict, Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, AsyncGenerator, Any, Union, Dict, Callable, List
 
-from ..models.message import Message
+from ..models.message import Message, MessageRole
+from ..models.content import ErrorContent
 from ..models.conversation import Conversation
 from ..models.task import Task
 
@@ -47,6 +49,69 @@ class BaseA2AClient(ABC):
         """
         pass
     
+    def send_batch(self, messages: List[Message], max_concurrency: int = 8) -> List[Message]:
+        """
+        Send many independent messages to the agent and get all responses.
+        
+        The default implementation sends the messages concurrently from a
+        thread pool. Client implementations that can submit several messages
+        in a single request should override this method.
+        
+        Args:
+            messages: The messages to send
+            max_concurrency: Maximum number of messages in flight at once
+            
+        Returns:
+            The agent's responses, in the same order as the messages. A message
+            that could not be sent gets an error message as its response.
+        """
+        if not messages:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(messages)))) as executor:
+            return list(executor.map(self._send_batch_item, messages))
+    
+    async def send_batch_async(self, messages: List[Message], max_concurrency: int = 8) -> List[Message]:
+        """
+        Send many independent messages to the agent asynchronously.
+        
+        Args:
+            messages: The messages to send
+            max_concurrency: Maximum number of messages in flight at once
+            
+        Returns:
+            The agent's responses, in the same order as the messages. A message
+            that could not be sent gets an error message as its response.
+        """
+        import asyncio
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        
+        async def send(message):
+            async with semaphore:
+                try:
+                    return await self.send_message_async(message)
+                except Exception as e:
+                    return self._batch_error_reply(message, e)
+        
+        return list(await asyncio.gather(*(send(message) for message in messages)))
+    
+    def _send_batch_item(self, message: Message) -> Message:
+        """Send one message of a batch, turning failures into an error reply"""
+        try:
+            return self.send_message(message)
+        except Exception as e:
+            return self._batch_error_reply(message, e)
+    
+    @staticmethod
+    def _batch_error_reply(message: Message, error: Exception) -> Message:
+        """Create the error reply for a batch message that could not be sent"""
+        return Message(
+            content=ErrorContent(message=f"Failed to send message: {str(error)}"),
+            role=MessageRole.AGENT,
+            parent_message_id=message.message_id,
+            conversation_id=message.conversation_id
+        )
+    
     async def stream_response(
         self, 
         message: Message,
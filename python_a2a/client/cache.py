@@ -0,0 +1,260 @@
+"""
+Response caches for A2A clients.
+
+Deterministic agents answer the same question the same way, so their
+responses can be reused instead of sending the message again. A cache is
+opt-in: pass one to ``A2AClient(response_cache=...)``.
+"""
+
+import json
+import time
+import hashlib
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from ..models.message import Message
+
+
+class ResponseCache(ABC):
+    """
+    Base class for response cache backends.
+
+    Entries map a cache key (see ``make_key``) to the dictionary form of an
+    agent response. Backends implement ``_load``, ``_store`` and ``clear``;
+    this class takes care of expiry and of the hit/miss counters.
+    """
+
+    def __init__(self, ttl: Optional[float] = 300.0):
+        """
+        Initialize a response cache.
+
+        Args:
+            ttl: Lifetime of cached responses in seconds (None to never expire)
+        """
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._stats_lock = threading.Lock()
+
+    @staticmethod
+    def make_key(endpoint: str, message: Message) -> str:
+        """
+        Build the cache key for a message sent to an endpoint.
+
+        The key covers the endpoint, the message role, its content and its
+        custom metadata fields. Message, parent and conversation IDs and the
+        metadata timestamp are ignored, and whitespace in text content is
+        normalized, so repeated questions map to the same key.
+
+        Args:
+            endpoint: The agent endpoint URL
+            message: The message being sent
+
+        Returns:
+            The cache key
+        """
+        content = message.content.to_dict()
+        if isinstance(content.get("text"), str):
+            content["text"] = " ".join(content["text"].split())
+
+        metadata = message.metadata.custom_fields if message.metadata is not None else {}
+        role = getattr(message.role, "value", message.role)
+
+        key_data = json.dumps(
+            [endpoint.rstrip("/"), role, content, metadata],
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha256(key_data.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached response.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            The cached response data, or None if missing or expired
+        """
+        value = self._load(key, time.time())
+        with self._stats_lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """
+        Cache a response.
+
+        Args:
+            key: The cache key
+            value: The response data
+        """
+        expires_at = None if self.ttl is None else time.time() + self.ttl
+        self._store(key, value, expires_at)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with the number of hits, misses and cached entries
+        """
+        with self._stats_lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self)}
+
+    @abstractmethod
+    def _load(self, key: str, now: float) -> Optional[Dict[str, Any]]:
+        """Load an entry that has not expired at ``now``"""
+        pass
+
+    @abstractmethod
+    def _store(self, key: str, value: Dict[str, Any], expires_at: Optional[float]) -> None:
+        """Store an entry"""
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all cached responses"""
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+
+class MemoryResponseCache(ResponseCache):
+    """In-memory response cache with LRU eviction and a TTL"""
+
+    def __init__(self, ttl: Optional[float] = 300.0, max_entries: int = 1024):
+        """
+        Initialize an in-memory response cache.
+
+        Args:
+            ttl: Lifetime of cached responses in seconds (None to never expire)
+            max_entries: Maximum number of cached responses
+        """
+        super().__init__(ttl)
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[Dict[str, Any], Optional[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _load(self, key: str, now: float) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= now:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def _store(self, key: str, value: Dict[str, Any], expires_at: Optional[float]) -> None:
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteResponseCache(ResponseCache):
+    """
+    Disk-backed response cache stored in a SQLite database.
+
+    Cached responses survive restarts and can be shared by several processes
+    using the same database file.
+    """
+
+    def __init__(self, path: str = "a2a_response_cache.sqlite", ttl: Optional[float] = 300.0,
+                 max_entries: Optional[int] = None):
+        """
+        Initialize a SQLite response cache.
+
+        Args:
+            path: Path of the database file (":memory:" for a private in-memory database)
+            ttl: Lifetime of cached responses in seconds (None to never expire)
+            max_entries: Optional maximum number of cached responses; the least
+                recently stored ones are removed first
+        """
+        super().__init__(ttl)
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "expires_at REAL, stored_at REAL NOT NULL)"
+            )
+
+    def _load(self, key: str, now: float) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                with self._conn:
+                    self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+        return json.loads(value)
+
+    def _store(self, key: str, value: Dict[str, Any], expires_at: Optional[float]) -> None:
+        data = json.dumps(value)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, expires_at, stored_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, data, expires_at, time.time())
+            )
+            if self.max_entries is not None:
+                self._conn.execute(
+                    "DELETE FROM responses WHERE key NOT IN ("
+                    "SELECT key FROM responses ORDER BY stored_at DESC LIMIT ?)",
+                    (self.max_entries,)
+                )
+
+    def purge_expired(self) -> int:
+        """
+        Remove expired responses from the database.
+
+        Returns:
+            The number of removed responses
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM responses WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                (time.time(),)
+            )
+            return cursor.rowcount
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
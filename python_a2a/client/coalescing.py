@@ -0,0 +1,135 @@
+"""
+Request coalescing ("single-flight") for A2A clients.
+
+When several callers send the same request at the same time, only the first
+one is actually sent; the others wait for it and share its result.
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+
+class _Call:
+    """A synchronous call in flight"""
+
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Deduplicates concurrent calls that share a key.
+
+    Works for both threads (``call``) and coroutines (``call_async``). A key
+    is only shared while its call is in flight; once it completes, the next
+    call with the same key is sent again.
+
+    Example:
+        >>> flight = SingleFlight()
+        >>> result, shared = flight.call("key", lambda: "value")
+        >>> result, shared
+        ('value', False)
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._futures: Dict[Tuple[int, Hashable], "asyncio.Future"] = {}
+        self._lock = threading.Lock()
+
+    def call(self, key: Hashable, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Run ``fn``, unless a call with the same key is already in flight.
+
+        Args:
+            key: The deduplication key
+            fn: Function performing the call
+
+        Returns:
+            Tuple of the result and whether it was shared from another caller
+
+        Raises:
+            Exception: Whatever the in-flight call raised
+        """
+        with self._lock:
+            pending = self._calls.get(key)
+            if pending is None:
+                pending = self._calls[key] = _Call()
+                leader = True
+            else:
+                pending.waiters += 1
+                leader = False
+
+        if not leader:
+            pending.done.wait()
+            if pending.error is not None:
+                raise pending.error
+            return pending.result, True
+
+        try:
+            pending.result = fn()
+            return pending.result, False
+        except BaseException as e:
+            pending.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            pending.done.set()
+
+    async def call_async(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """
+        Await ``fn()``, unless a call with the same key is already in flight
+        on the running event loop.
+
+        Args:
+            key: The deduplication key
+            fn: Function returning the awaitable performing the call
+
+        Returns:
+            Tuple of the result and whether it was shared from another caller
+
+        Raises:
+            Exception: Whatever the in-flight call raised
+        """
+        loop = asyncio.get_running_loop()
+        flight_key = (id(loop), key)
+
+        future = self._futures.get(flight_key)
+        if future is not None:
+            # Shield the shared future so one cancelled waiter does not
+            # cancel the call for everyone else
+            return await asyncio.shield(future), True
+
+        future = loop.create_future()
+        self._futures[flight_key] = future
+        try:
+            result = await fn()
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                # Waiters re-raise the exception; avoid "never retrieved" warnings
+                future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            self._futures.pop(flight_key, None)
+
+    def in_flight(self) -> int:
+        """
+        Get the number of calls currently in flight.
+
+        Returns:
+            The number of distinct keys being processed
+        """
+        with self._lock:
+            return len(self._calls) + len(self._futures)
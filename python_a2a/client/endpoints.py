@@ -0,0 +1,192 @@
+"""
+Endpoint resolution cache for HTTP-based A2A clients.
+
+Agents can expose their A2A endpoints at several URL variations, so a cold
+client has to probe them. This module remembers what was resolved for each
+agent base URL (working endpoints, protocol format, agent card) so that
+later calls, from any client in the process, go straight to one URL.
+"""
+
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+class CachedResolution:
+    """
+    A single cached resolution result.
+
+    Attributes:
+        value: The resolved value (None for failures)
+        error: The error message for negative (failed) resolutions
+        expires_at: Monotonic time at which the entry expires
+    """
+
+    __slots__ = ("value", "error", "expires_at")
+
+    def __init__(self, value: Any = None, error: Optional[str] = None, expires_at: float = 0.0):
+        self.value = value
+        self.error = error
+        self.expires_at = expires_at
+
+    @property
+    def failed(self) -> bool:
+        """Whether this entry records a failed resolution"""
+        return self.error is not None
+
+
+class EndpointCache:
+    """
+    Thread-safe, TTL-based cache of endpoint resolutions keyed by agent base URL.
+
+    Each base URL maps to a set of named resolutions (for example
+    ``"agent_card"`` or ``"message_route"``). Successful resolutions live for
+    ``ttl`` seconds; failures are cached for the shorter ``negative_ttl`` so
+    that an unreachable agent is not re-probed on every call but is retried
+    soon. The least recently used base URLs are evicted beyond ``max_entries``.
+    """
+
+    def __init__(self, ttl: float = 300.0, negative_ttl: float = 30.0, max_entries: int = 1024):
+        """
+        Initialize an endpoint cache.
+
+        Args:
+            ttl: Lifetime of successful resolutions in seconds
+            negative_ttl: Lifetime of failed resolutions in seconds
+            max_entries: Maximum number of base URLs to keep
+        """
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+
+        self._entries: "OrderedDict[str, Dict[str, CachedResolution]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _normalize(base_url: str) -> str:
+        return base_url.rstrip("/")
+
+    def lookup(self, base_url: str, key: str) -> Optional[CachedResolution]:
+        """
+        Look up a resolution.
+
+        Args:
+            base_url: The agent base URL
+            key: The name of the resolution
+
+        Returns:
+            The cached resolution, or None if missing or expired
+        """
+        base_url = self._normalize(base_url)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(base_url)
+            if entry is None:
+                return None
+            resolution = entry.get(key)
+            if resolution is None:
+                return None
+            if resolution.expires_at <= now:
+                del entry[key]
+                return None
+            self._entries.move_to_end(base_url)
+            return resolution
+
+    def get(self, base_url: str, key: str, default: Any = None) -> Any:
+        """
+        Get a successfully resolved value.
+
+        Args:
+            base_url: The agent base URL
+            key: The name of the resolution
+            default: Value returned when there is no successful resolution
+
+        Returns:
+            The resolved value or the default
+        """
+        resolution = self.lookup(base_url, key)
+        if resolution is None or resolution.failed:
+            return default
+        return resolution.value
+
+    def set(self, base_url: str, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a successful resolution.
+
+        Args:
+            base_url: The agent base URL
+            key: The name of the resolution
+            value: The resolved value
+            ttl: Optional lifetime overriding the cache default
+        """
+        self._store(base_url, key, CachedResolution(
+            value=value,
+            expires_at=time.monotonic() + (self.ttl if ttl is None else ttl)
+        ))
+
+    def set_failure(self, base_url: str, key: str, error: str) -> None:
+        """
+        Store a failed resolution (negative caching).
+
+        Args:
+            base_url: The agent base URL
+            key: The name of the resolution
+            error: Description of the failure
+        """
+        self._store(base_url, key, CachedResolution(
+            error=error,
+            expires_at=time.monotonic() + self.negative_ttl
+        ))
+
+    def _store(self, base_url: str, key: str, resolution: CachedResolution) -> None:
+        base_url = self._normalize(base_url)
+        with self._lock:
+            entry = self._entries.get(base_url)
+            if entry is None:
+                entry = self._entries[base_url] = {}
+            entry[key] = resolution
+            self._entries.move_to_end(base_url)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, base_url: str, key: Optional[str] = None) -> None:
+        """
+        Drop cached resolutions for a base URL.
+
+        Args:
+            base_url: The agent base URL
+            key: Optional resolution name; all resolutions are dropped if omitted
+        """
+        base_url = self._normalize(base_url)
+        with self._lock:
+            if key is None:
+                self._entries.pop(base_url, None)
+            elif base_url in self._entries:
+                self._entries[base_url].pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all cached resolutions"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_default_cache: Optional[EndpointCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_endpoint_cache() -> EndpointCache:
+    """
+    Get the process-wide endpoint cache used by clients by default.
+
+    Returns:
+        The default endpoint cache
+    """
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = EndpointCache()
+        return _default_cache
@@ -3,15 +3,21 @@ HTTP client for interacting with A2A-compatible agents.
 """
 
 import requests
+from requests.structures import CaseInsensitiveDict
 import uuid
 import json
 import re
+import time
 import asyncio
 import logging
-from typing import Optional, Dict, Any, List, Union, AsyncGenerator, Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Optional, Dict, Any, List, Union, AsyncGenerator, AsyncIterator, Callable, Mapping
 
+from .. import codec, compression
 from ..models.message import Message, MessageRole
 from ..models.conversation import Conversation
+from ..models.converters import WireFormat
 from ..models.content import (
     TextContent, ErrorContent, FunctionCallContent, 
     FunctionResponseContent, FunctionParameter
@@ -19,16 +25,45 @@ from ..models.content import (
 from ..models.agent import AgentCard, AgentSkill
 from ..models.task import Task, TaskStatus, TaskState
 from .base import BaseA2AClient
+from .sessions import SharedConnectionPool, AsyncSessionManager, get_default_pool
+from .endpoints import EndpointCache, get_default_endpoint_cache
+from .sse import SSEDecoder
+from .cache import ResponseCache
+from .coalescing import SingleFlight
+from .resilience import ResiliencePolicy, CircuitBreaker
 from ..exceptions import A2AConnectionError, A2AResponseError, A2AStreamingError
 
 logger = logging.getLogger(__name__)
 
+# Start of the error reply used when no endpoint of the agent could be reached
+_UNREACHABLE_ERROR = "Failed to communicate with agent at"
+
+
+class _HTTPStatusError(A2AConnectionError):
+    """Raised when an agent answers with an HTTP error status"""
+
+    def __init__(self, status: int, text: str):
+        super().__init__(f"HTTP error {status}: {text}")
+        self.status = status
+
 
 class A2AClient(BaseA2AClient):
     """Client for interacting with HTTP-based A2A-compatible agents"""
     
+    # Maximum number of messages sent in a single JSON-RPC batch request
+    max_batch_size = 100
+    
     def __init__(self, endpoint_url: str, headers: Optional[Dict[str, str]] = None, 
-                 timeout: int = 30, google_a2a_compatible: bool = False):
+                 timeout: int = 30, google_a2a_compatible: bool = False,
+                 session: Optional[requests.Session] = None,
+                 connection_pool: Optional[SharedConnectionPool] = None,
+                 endpoint_cache: Optional[EndpointCache] = None,
+                 session_manager: Optional[AsyncSessionManager] = None,
+                 response_cache: Optional[ResponseCache] = None,
+                 coalesce_requests: bool = False,
+                 resilience: Optional[ResiliencePolicy] = None,
+                 compress_requests: Optional[str] = None,
+                 compress_min_size: int = compression.DEFAULT_MIN_SIZE):
         """
         Initialize a client with an agent endpoint URL
         
@@ -37,20 +72,80 @@ class A2AClient(BaseA2AClient):
             headers: Optional HTTP headers to include in requests
             timeout: Request timeout in seconds
             google_a2a_compatible: Whether to use Google A2A format by default (not normally needed)
+            session: Optional requests session to use for all synchronous requests
+            connection_pool: Optional shared connection pool to draw keep-alive
+                connections from (defaults to the process-wide pool)
+            endpoint_cache: Optional cache of resolved endpoints and protocol
+                details (defaults to the process-wide cache)
+            session_manager: Optional manager of the aiohttp session used for
+                async requests and streaming (defaults to one owned by the client)
+            response_cache: Optional cache of agent responses; when set,
+                repeated messages are answered from the cache (disabled by default)
+            coalesce_requests: Whether concurrent identical messages share a
+                single request to the agent (disabled by default)
+            resilience: Optional circuit breaker and retry policy; when set,
+                calls to an agent that keeps failing fail fast instead of
+                waiting for timeouts (disabled by default)
+            compress_requests: Optional content coding ("gzip", "br" or
+                "zstd") of request bodies; only use it with agents that
+                accept compressed requests (disabled by default). Responses
+                are decompressed whenever the agent compresses them.
+            compress_min_size: Minimum size in bytes of compressed request bodies
         """
         self.endpoint_url = endpoint_url.rstrip("/")
+        # The URL the client was created with, used as the endpoint cache key
+        self._base_url = self.endpoint_url
         self.headers = headers or {}
         self.timeout = timeout
         self._use_google_a2a = google_a2a_compatible
         self._protocol_detected = False  # True after we've detected the protocol type
         
+        # Reuse keep-alive connections to the agent host across requests and clients
+        self._owns_session = session is None
+        if session is None:
+            if connection_pool is None:
+                connection_pool = get_default_pool()
+            session = connection_pool.create_session(self.endpoint_url)
+        self._session = session
+        
+        # Remember resolved endpoints so later calls go straight to one URL
+        if endpoint_cache is None:
+            endpoint_cache = get_default_endpoint_cache()
+        self._endpoint_cache = endpoint_cache
+        if self._endpoint_cache.get(self._base_url, "google_a2a"):
+            self._use_google_a2a = True
+            self._protocol_detected = True
+        
+        # Long-lived aiohttp session for async requests, created lazily
+        if session_manager is None:
+            session_manager = AsyncSessionManager(timeout=self.timeout)
+        self._session_manager = session_manager
+        
+        # Opt-in cache of responses to repeated messages
+        self.response_cache = response_cache
+        
+        # Identical messages sent concurrently share one in-flight request
+        self._single_flight = SingleFlight() if coalesce_requests else None
+        
+        # Per-endpoint circuit breaker and retry budget
+        self.resilience = resilience
+        
+        # Opt-in compression of large request bodies
+        if compress_requests is not None and compress_requests not in compression.available_encodings():
+            raise ValueError(f"Unsupported request compression: {compress_requests!r} "
+                             f"(choose from {', '.join(compression.available_encodings())})")
+        self.compress_requests = compress_requests
+        self.compress_min_size = compress_min_size
+        
         # Always include content type for JSON
         if "Content-Type" not in self.headers:
             self.headers["Content-Type"] = "application/json"
         
         # Try to fetch the agent card for A2A protocol support
+        self._agent_card_fetched = False
         try:
             self.agent_card = self._fetch_agent_card()
+            self._agent_card_fetched = True
             
             # Check for protocol hints in the agent card
             if hasattr(self.agent_card, 'capabilities'):
@@ -120,77 +215,27 @@ class A2AClient(BaseA2AClient):
     
     def _fetch_agent_card(self):
         """Fetch the agent card from the well-known URL"""
-        # Try standard A2A endpoint first
-        try:
-            card_url = f"{self.endpoint_url}/agent.json"
-            
-            # Add Accept header to prefer JSON
-            headers = dict(self.headers)
-            headers["Accept"] = "application/json"
-            
-            # Make the request
-            response = requests.get(card_url, headers=headers, timeout=self.timeout)
-            response.raise_for_status()
-            
-            # Check content type to handle HTML responses
-            content_type = response.headers.get("Content-Type", "").lower()
-            
-            if "json" in content_type:
-                # JSON response
-                card_data = response.json()
-            elif "html" in content_type:
-                # HTML response - extract JSON
-                card_data = self._extract_json_from_html(response.text)
-                if not card_data:
-                    raise ValueError("Could not extract JSON from HTML response")
-            else:
-                # Try parsing as JSON anyway
-                try:
-                    card_data = response.json()
-                except json.JSONDecodeError:
-                    # Try to extract JSON from the response text
-                    card_data = self._extract_json_from_html(response.text)
-                    if not card_data:
-                        raise ValueError(f"Unexpected content type: {content_type}")
-                        
-        except Exception:
-            # Try alternate endpoint
+        cached = self._endpoint_cache.lookup(self._base_url, "agent_card")
+        if cached is not None and cached.failed:
+            # The agent card was recently found to be unavailable
+            raise A2AConnectionError(cached.error)
+        
+        if cached is not None:
+            card_data = cached.value
+        else:
+            # Try standard A2A endpoint first, then the alternate endpoint
             try:
-                card_url = f"{self.endpoint_url}/a2a/agent.json"
-                
-                # Add Accept header to prefer JSON
-                headers = dict(self.headers)
-                headers["Accept"] = "application/json"
-                
-                # Make the request
-                response = requests.get(card_url, headers=headers, timeout=self.timeout)
-                response.raise_for_status()
-                
-                # Check content type to handle HTML responses
-                content_type = response.headers.get("Content-Type", "").lower()
-                
-                if "json" in content_type:
-                    # JSON response
-                    card_data = response.json()
-                elif "html" in content_type:
-                    # HTML response - extract JSON
-                    card_data = self._extract_json_from_html(response.text)
-                    if not card_data:
-                        raise ValueError("Could not extract JSON from HTML response")
-                else:
-                    # Try parsing as JSON anyway
-                    try:
-                        card_data = response.json()
-                    except json.JSONDecodeError:
-                        # Try to extract JSON from the response text
-                        card_data = self._extract_json_from_html(response.text)
-                        if not card_data:
-                            raise ValueError(f"Unexpected content type: {content_type}")
+                try:
+                    card_data = self._get_card_data(f"{self.endpoint_url}/agent.json")
+                except Exception:
+                    card_data = self._get_card_data(f"{self.endpoint_url}/a2a/agent.json")
             except Exception as e:
-                # If both fail, create a minimal card and continue
-                raise A2AConnectionError(
-                    f"Failed to fetch agent card: {str(e)}"
-                ) from e
+                # If both fail, remember the failure and let the caller create a minimal card
+                error = f"Failed to fetch agent card: {str(e)}"
+                self._endpoint_cache.set_failure(self._base_url, "agent_card", error)
+                raise A2AConnectionError(error) from e
+            
+            self._endpoint_cache.set(self._base_url, "agent_card", card_data)
         
         # Check for protocol hints in the agent card
         if "capabilities" in card_data:
@@ -226,6 +271,52 @@ class A2AClient(BaseA2AClient):
             documentation_url=card_data.get("documentationUrl")
         )
     
+    def _get_card_data(self, card_url: str) -> Dict[str, Any]:
+        """
+        Fetch and decode agent card data from a URL
+        
+        Args:
+            card_url: The URL of the agent card
+            
+        Returns:
+            The agent card data
+            
+        Raises:
+            requests.RequestException: If the request fails
+            ValueError: If no agent card data could be decoded
+        """
+        # Add Accept header to prefer JSON
+        headers = dict(self.headers)
+        headers["Accept"] = "application/json"
+        
+        # Make the request
+        response = self._session.get(card_url, headers=headers, timeout=self.timeout)
+        response.raise_for_status()
+        
+        # Check content type to handle HTML responses
+        content_type = response.headers.get("Content-Type", "").lower()
+        
+        if "json" in content_type:
+            # JSON response
+            return codec.loads(response.content)
+        
+        if "html" in content_type:
+            # HTML response - extract JSON
+            card_data = self._extract_json_from_html(response.text)
+            if not card_data:
+                raise ValueError("Could not extract JSON from HTML response")
+            return card_data
+        
+        # Try parsing as JSON anyway
+        try:
+            return codec.loads(response.content)
+        except json.JSONDecodeError:
+            # Try to extract JSON from the response text
+            card_data = self._extract_json_from_html(response.text)
+            if not card_data:
+                raise ValueError(f"Unexpected content type: {content_type}")
+            return card_data
+    
     def _detect_protocol_version(self, response_error=None):
         """
         Detect protocol version based on the error or endpoint probing
@@ -260,12 +351,14 @@ class A2AClient(BaseA2AClient):
         # No clear indication, use the current setting
         return self._use_google_a2a
     
-    def send_message(self, message: Message) -> Message:
+    def send_message(self, message: Message, use_cache: bool = True) -> Message:
         """
         Send a message to an A2A-compatible agent and get a response
         
         Args:
             message: The A2A message to send
+            use_cache: Whether to use the client's response cache, if any,
+                for this call (False always sends the message)
             
         Returns:
             The agent's response as an A2A message
@@ -274,16 +367,60 @@ class A2AClient(BaseA2AClient):
             A2AConnectionError: If connection to the agent fails
             A2AResponseError: If the agent returns an invalid response
         """
-        # Try possible endpoints in order of preference
-        endpoints_to_try = [
-            self.endpoint_url,                  # Try the exact URL first
-            self.endpoint_url.rstrip("/"),      # URL without trailing slash
-            f"{self.endpoint_url.rstrip('/')}/a2a",  # Try /a2a endpoint
-            f"{self.endpoint_url.rstrip('/')}/tasks/send"  # Try direct tasks endpoint
-        ]
+        if not use_cache or self.response_cache is None:
+            return self._send_message_coalesced(message)
         
-        # Deduplicate endpoints
-        endpoints_to_try = list(dict.fromkeys(endpoints_to_try))
+        key = self.response_cache.make_key(self._base_url, message)
+        cached = self._cached_reply(key, message)
+        if cached is not None:
+            return cached
+        
+        response = self._send_message_coalesced(message)
+        self._cache_reply(key, response)
+        return response
+    
+    def _send_message_coalesced(self, message: Message) -> Message:
+        """Send a message, sharing the request with identical in-flight messages"""
+        if self._single_flight is None:
+            return self._send_message_guarded(message)
+        
+        key = ResponseCache.make_key(self._base_url, message)
+        response, shared = self._single_flight.call(key, lambda: self._send_message_guarded(message))
+        return self._readdress_reply(response, message) if shared else response
+    
+    def _send_message_guarded(self, message: Message) -> Message:
+        """Send a message through the agent's circuit breaker, if one is configured"""
+        breaker = self._circuit_breaker()
+        if breaker is None:
+            return self._send_message(message)
+        if not breaker.allow_request():
+            return self._circuit_open_reply(message, breaker)
+        
+        recorded = False
+        try:
+            response = self._send_message(message)
+            self._record_reply_outcome(breaker, response)
+            recorded = True
+            return response
+        finally:
+            # A call that raised records no outcome; free its trial slot
+            if not recorded:
+                breaker.release_trial()
+    
+    def _send_message(self, message: Message) -> Message:
+        """Send a message to the agent, bypassing the response cache"""
+        # Go straight to a previously resolved endpoint if there is one
+        route = self._endpoint_cache.lookup(self._base_url, "message_route")
+        if route is not None:
+            if route.failed:
+                return self._failed_message_reply(message)
+            response = self._send_message_via_route(message, *route.value)
+            if response is not None:
+                return response
+            # The endpoint stopped working, resolve it again
+            self._endpoint_cache.invalidate(self._base_url, "message_route")
+        
+        endpoints_to_try = self._message_endpoints()
         
         # First try A2A protocol style with tasks
         task_response = None
@@ -293,67 +430,19 @@ class A2AClient(BaseA2AClient):
                 task = self._create_task(message)
                 
                 # Try to send the task to this endpoint
-                result = self._send_task(task, endpoint_override=endpoint)
+                response_data, task_url = self._post_task(task, endpoint)
+                result = self._task_from_response(response_data, task)
                 
                 # If we get here, the endpoint worked
                 # Remember this working endpoint for future requests
                 self.endpoint_url = endpoint
                 
                 # Convert the task result back to a message
-                if result.artifacts and len(result.artifacts) > 0:
-                    for artifact in result.artifacts:
-                        if "parts" in artifact:
-                            parts = artifact["parts"]
-                            for part in parts:
-                                if part.get("type") == "text":
-                                    task_response = Message(
-                                        content=TextContent(text=part.get("text", "")),
-                                        role=MessageRole.AGENT,
-                                        parent_message_id=message.message_id,
-                                        conversation_id=message.conversation_id
-                                    )
-                                    break
-                                elif part.get("type") == "function_response":
-                                    task_response = Message(
-                                        content=FunctionResponseContent(
-                                            name=part.get("name", ""),
-                                            response=part.get("response", {})
-                                        ),
-                                        role=MessageRole.AGENT,
-                                        parent_message_id=message.message_id,
-                                        conversation_id=message.conversation_id
-                                    )
-                                    break
-                                elif part.get("type") == "function_call":
-                                    # Convert parameters to FunctionParameter objects
-                                    params = []
-                                    for param in part.get("parameters", []):
-                                        params.append(FunctionParameter(
-                                            name=param.get("name", ""),
-                                            value=param.get("value", "")
-                                        ))
-                                    
-                                    task_response = Message(
-                                        content=FunctionCallContent(
-                                            name=part.get("name", ""),
-                                            parameters=params
-                                        ),
-                                        role=MessageRole.AGENT,
-                                        parent_message_id=message.message_id,
-                                        conversation_id=message.conversation_id
-                                    )
-                                    break
-                                elif part.get("type") == "error":
-                                    task_response = Message(
-                                        content=ErrorContent(message=part.get("message", "")),
-                                        role=MessageRole.AGENT,
-                                        parent_message_id=message.message_id,
-                                        conversation_id=message.conversation_id
-                                    )
-                                    break
+                task_response = self._message_from_task(result, message)
                         
                 # If we got a response, return it
                 if task_response is not None:
+                    self._remember_route("message_route", task_url, "task")
                     return task_response
                     
             except Exception as e:
@@ -366,12 +455,7 @@ class A2AClient(BaseA2AClient):
             for endpoint in endpoints_to_try:
                 try:
                     # Standard python_a2a format
-                    response = requests.post(
-                        endpoint,
-                        json=message.to_dict(),
-                        headers=self.headers,
-                        timeout=self.timeout
-                    )
+                    response = self._post_json(endpoint, message.to_dict(WireFormat.PYTHON_A2A))
                     
                     # If we succeed, remember this endpoint
                     self.endpoint_url = endpoint
@@ -382,7 +466,7 @@ class A2AClient(BaseA2AClient):
                     except requests.HTTPError as e:
                         # Try to extract error details for protocol detection
                         try:
-                            error_data = response.json()
+                            error_data = codec.loads(response.content)
                             error_str = json.dumps(error_data)
                         except:
                             error_str = str(e)
@@ -399,32 +483,14 @@ class A2AClient(BaseA2AClient):
                     
                     # Process successful response
                     try:
-                        # Check if response has clear Google A2A format indicators
-                        response_data = response.json()
-                        
-                        # Check for clear Google A2A format markers
-                        if ("parts" in response_data and isinstance(response_data.get("parts"), list) and
-                            "role" in response_data and not "content" in response_data):
-                            # Response is in Google A2A format
-                            self._use_google_a2a = True
-                            self._protocol_detected = True
-                            return Message.from_google_a2a(response_data)
-                        else:
-                            # Standard format
-                            return Message.from_dict(response_data)
+                        reply = self._message_from_response(codec.loads(response.content), google_request=False)
                     except ValueError as e:
                         # Try to get plain text if JSON parsing fails
-                        try:
-                            text_content = response.text.strip()
-                            if text_content:
-                                return Message(
-                                    content=TextContent(text=text_content),
-                                    role=MessageRole.AGENT,
-                                    parent_message_id=message.message_id,
-                                    conversation_id=message.conversation_id
-                                )
-                        except:
-                            pass
+                        reply = self._text_reply(response.text, message)
+                    
+                    if reply is not None:
+                        self._remember_route("message_route", endpoint, "python")
+                        return reply
                             
                         # Try next endpoint
                         continue
@@ -438,12 +504,7 @@ class A2AClient(BaseA2AClient):
             for endpoint in endpoints_to_try:
                 try:
                     # Google A2A format
-                    response = requests.post(
-                        endpoint,
-                        json=message.to_google_a2a(),
-                        headers=self.headers,
-                        timeout=self.timeout
-                    )
+                    response = self._post_json(endpoint, message.to_google_a2a())
                     
                     # If we succeed, remember this endpoint
                     self.endpoint_url = endpoint
@@ -457,32 +518,14 @@ class A2AClient(BaseA2AClient):
                     
                     # Process successful response
                     try:
-                        response_data = response.json()
-                        
-                        # Check for Google A2A format response
-                        if ("parts" in response_data and 
-                            isinstance(response_data.get("parts"), list) and 
-                            "role" in response_data):
-                            # Google A2A format response
-                            self._use_google_a2a = True
-                            self._protocol_detected = True
-                            return Message.from_google_a2a(response_data)
-                        else:
-                            # Standard format response
-                            return Message.from_dict(response_data)
+                        reply = self._message_from_response(codec.loads(response.content), google_request=True)
                     except Exception:
                         # Try to handle plain text response
-                        try:
-                            text = response.text.strip()
-                            if text:
-                                return Message(
-                                    content=TextContent(text=text),
-                                    role=MessageRole.AGENT,
-                                    parent_message_id=message.message_id,
-                                    conversation_id=message.conversation_id
-                                )
-                        except:
-                            pass
+                        reply = self._text_reply(response.text, message)
+                    
+                    if reply is not None:
+                        self._remember_route("message_route", endpoint, "google")
+                        return reply
                         
                         # Try next endpoint
                         continue
@@ -492,12 +535,7 @@ class A2AClient(BaseA2AClient):
                     continue
         
         # If we get here, all endpoints failed
-        return Message(
-            content=ErrorContent(message=f"Failed to communicate with agent at {self.endpoint_url}. Tried multiple endpoint variations."),
-            role=MessageRole.AGENT,
-            parent_message_id=message.message_id,
-            conversation_id=message.conversation_id
-        )
+        return self._failed_message_reply(message, remember=True)
     
     def send_conversation(self, conversation: Conversation) -> Conversation:
         """
@@ -513,26 +551,24 @@ class A2AClient(BaseA2AClient):
             A2AConnectionError: If connection to the agent fails
             A2AResponseError: If the agent returns an invalid response
         """
-        # Try possible endpoints in order of preference
-        endpoints_to_try = [
-            self.endpoint_url,                  # Try the exact URL first
-            self.endpoint_url.rstrip("/"),      # URL without trailing slash
-            f"{self.endpoint_url.rstrip('/')}/a2a",  # Try /a2a endpoint
-        ]
-        
-        # Deduplicate endpoints
-        endpoints_to_try = list(dict.fromkeys(endpoints_to_try))
+        # Go straight to a previously resolved endpoint if there is one
+        route = self._endpoint_cache.lookup(self._base_url, "conversation_route")
+        if route is not None:
+            if route.failed:
+                return self._failed_conversation_reply(conversation)
+            response = self._send_conversation_via_route(conversation, *route.value)
+            if response is not None:
+                return response
+            # The endpoint stopped working, resolve it again
+            self._endpoint_cache.invalidate(self._base_url, "conversation_route")
+        
+        endpoints_to_try = self._message_endpoints(include_tasks_endpoint=False)
         
         # First try standard python_a2a format
         if not self._use_google_a2a:
             for endpoint in endpoints_to_try:
                 try:
-                    response = requests.post(
-                        endpoint,
-                        json=conversation.to_dict(),
-                        headers=self.headers,
-                        timeout=self.timeout
-                    )
+                    response = self._post_json(endpoint, conversation.to_dict(WireFormat.PYTHON_A2A))
                     
                     # If we succeed, remember this endpoint
                     self.endpoint_url = endpoint
@@ -543,7 +579,7 @@ class A2AClient(BaseA2AClient):
                     except requests.HTTPError as e:
                         # Try to extract error details for protocol detection
                         try:
-                            error_data = response.json()
+                            error_data = codec.loads(response.content)
                             error_str = json.dumps(error_data)
                         except:
                             error_str = str(e)
@@ -560,38 +596,14 @@ class A2AClient(BaseA2AClient):
                     
                     # Process successful response
                     try:
-                        response_data = response.json()
-                        
-                        # Check if the response is in Google A2A format
-                        if "messages" in response_data and isinstance(response_data["messages"], list):
-                            if (response_data["messages"] and 
-                                "parts" in response_data["messages"][0] and 
-                                isinstance(response_data["messages"][0].get("parts"), list)):
-                                # Response is in Google A2A format
-                                self._use_google_a2a = True
-                                self._protocol_detected = True
-                                return Conversation.from_google_a2a(response_data)
-                        
-                        # Standard format
-                        return Conversation.from_dict(response_data)
+                        reply = self._conversation_from_response(codec.loads(response.content))
                     except Exception:
                         # Try to extract text content if JSON parsing fails
-                        try:
-                            text_content = response.text.strip()
-                            if text_content:
-                                # Create a new message with the response text
-                                last_message = conversation.messages[-1] if conversation.messages else None
-                                parent_id = last_message.message_id if last_message else None
-                                
-                                # Add a response message to the conversation
-                                conversation.create_text_message(
-                                    text=text_content,
-                                    role=MessageRole.AGENT,
-                                    parent_message_id=parent_id
-                                )
-                                return conversation
-                        except:
-                            pass
+                        reply = conversation if self._append_text_reply(response.text, conversation) else None
+                    
+                    if reply is not None:
+                        self._remember_route("conversation_route", endpoint, "python")
+                        return reply
                         
                         # Try next endpoint
                         continue
@@ -605,12 +617,7 @@ class A2AClient(BaseA2AClient):
             for endpoint in endpoints_to_try:
                 try:
                     # Google A2A format
-                    response = requests.post(
-                        endpoint,
-                        json=conversation.to_google_a2a(),
-                        headers=self.headers,
-                        timeout=self.timeout
-                    )
+                    response = self._post_json(endpoint, conversation.to_google_a2a())
                     
                     # If we succeed, remember this endpoint
                     self.endpoint_url = endpoint
@@ -624,38 +631,14 @@ class A2AClient(BaseA2AClient):
                     
                     # Process successful response
                     try:
-                        response_data = response.json()
-                        
-                        # Check if the response is in Google A2A format
-                        if "messages" in response_data and isinstance(response_data["messages"], list):
-                            if (response_data["messages"] and 
-                                "parts" in response_data["messages"][0] and 
-                                isinstance(response_data["messages"][0].get("parts"), list)):
-                                # Response is in Google A2A format
-                                self._use_google_a2a = True
-                                self._protocol_detected = True
-                                return Conversation.from_google_a2a(response_data)
-                        
-                        # Standard format
-                        return Conversation.from_dict(response_data)
+                        reply = self._conversation_from_response(codec.loads(response.content))
                     except Exception:
                         # Try to extract text content if JSON parsing fails
-                        try:
-                            text_content = response.text.strip()
-                            if text_content:
-                                # Create a new message with the response text
-                                last_message = conversation.messages[-1] if conversation.messages else None
-                                parent_id = last_message.message_id if last_message else None
-                                
-                                # Add a response message to the conversation
-                                conversation.create_text_message(
-                                    text=text_content,
-                                    role=MessageRole.AGENT,
-                                    parent_message_id=parent_id
-                                )
-                                return conversation
-                        except:
-                            pass
+                        reply = conversation if self._append_text_reply(response.text, conversation) else None
+                    
+                    if reply is not None:
+                        self._remember_route("conversation_route", endpoint, "google")
+                        return reply
                         
                         # Try next endpoint
                         continue
@@ -665,17 +648,147 @@ class A2AClient(BaseA2AClient):
                     continue
         
         # If we get here, all endpoints failed
-        # Create an error message and add it to the conversation
-        error_msg = f"Failed to communicate with agent at {self.endpoint_url}. Tried multiple endpoint variations."
-        conversation.create_error_message(error_msg)
-        return conversation
+        return self._failed_conversation_reply(conversation, remember=True)
+    
+    def send_batch(self, messages: List[Message], max_concurrency: int = 8) -> List[Message]:
+        """
+        Send many independent messages to the agent and get all responses.
+        
+        Messages are submitted as JSON-RPC batches to the agent's tasks/send
+        endpoint, so that many messages share a single round-trip. Messages
+        the agent did not answer in a batch, or all messages if the agent does
+        not accept batches, are sent individually instead.
+        
+        Args:
+            messages: The messages to send
+            max_concurrency: Maximum number of batch requests in flight at once
+            
+        Returns:
+            The agent's responses, in the same order as the messages
+        """
+        if not messages:
+            return []
+        
+        chunks = self._batch_chunks(messages)
+        with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(chunks)))) as executor:
+            replies = [reply for chunk_replies in executor.map(self._send_batch_chunk, chunks)
+                       for reply in chunk_replies]
+        
+        # Send whatever the batch requests did not answer one by one
+        pending = [i for i, reply in enumerate(replies) if reply is None]
+        if pending:
+            fallback = super().send_batch([messages[i] for i in pending], max_concurrency)
+            for i, reply in zip(pending, fallback):
+                replies[i] = reply
+        
+        return replies
+    
+    def _send_batch_chunk(self, messages: List[Message]) -> List[Optional[Message]]:
+        """
+        Send one JSON-RPC batch of messages
+        
+        Args:
+            messages: The messages to send in this batch
+            
+        Returns:
+            The agent's responses, with None for messages that were not answered
+        """
+        tasks = [self._create_task(message) for message in messages]
+        request_data = self._build_batch_request(tasks)
+        
+        for url in self._batch_urls():
+            try:
+                response = self._post_json(url, request_data)
+                response.raise_for_status()
+                response_data = codec.loads(response.content)
+            except (requests.RequestException, ValueError):
+                continue
+            
+            if isinstance(response_data, list):
+                self._endpoint_cache.set(self._base_url, "batch_route", url)
+                return self._batch_replies(response_data, tasks, messages)
+        
+        self._endpoint_cache.set_failure(self._base_url, "batch_route", "Batch requests are not supported")
+        return [None] * len(messages)
+    
+    def _batch_chunks(self, messages: List[Message]) -> List[List[Message]]:
+        """Split messages into chunks of at most max_batch_size messages"""
+        size = max(1, self.max_batch_size)
+        return [messages[i:i + size] for i in range(0, len(messages), size)]
+    
+    def _build_batch_request(self, tasks: List[Task]) -> List[Dict[str, Any]]:
+        """
+        Build a JSON-RPC batch of tasks/send requests
+        
+        Args:
+            tasks: The tasks to send
+            
+        Returns:
+            The JSON-RPC batch, using each task's position as its request ID
+        """
+        return [
+            self._build_jsonrpc_request("tasks/send", task.to_dict(), rpc_id=i)
+            for i, task in enumerate(tasks)
+        ]
+    
+    def _batch_urls(self) -> List[str]:
+        """
+        Get the URLs to try for a JSON-RPC batch request
+        
+        Returns:
+            The candidate tasks/send URLs, or an empty list if the agent is
+            known not to accept batches
+        """
+        cached = self._endpoint_cache.lookup(self._base_url, "batch_route")
+        if cached is not None:
+            return [] if cached.failed else [cached.value]
+        
+        urls = []
+        route = self._endpoint_cache.get(self._base_url, "message_route")
+        if route is not None and route[1] == "task":
+            urls.append(route[0])
+        urls.extend(self._task_send_urls(self._base_url))
+        return list(dict.fromkeys(urls))
+    
+    def _batch_replies(self, response_data: List[Any], tasks: List[Task],
+                       messages: List[Message]) -> List[Optional[Message]]:
+        """
+        Match the responses of a JSON-RPC batch to the messages that were sent
+        
+        Args:
+            response_data: The decoded JSON-RPC batch response
+            tasks: The tasks that were sent
+            messages: The messages the tasks were created from
+            
+        Returns:
+            The agent's responses, with None for messages that were not answered
+        """
+        responses_by_id = {
+            item.get("id"): item for item in response_data if isinstance(item, dict)
+        }
+        
+        replies = []
+        for i, (task, message) in enumerate(zip(tasks, messages)):
+            item = responses_by_id.get(i)
+            if item is None:
+                replies.append(None)
+            elif "error" in item:
+                error = item["error"]
+                error_msg = error.get("message", str(error)) if isinstance(error, dict) else str(error)
+                replies.append(self._batch_error_reply(message, A2AResponseError(error_msg)))
+            else:
+                result = self._task_from_response(item, task)
+                replies.append(self._message_from_task(result, message))
+        
+        return replies
     
-    def ask(self, message_text):
+    def ask(self, message_text, use_cache: bool = True):
         """
         Simple helper for text-based queries
         
         Args:
             message_text: Text message to send
+            use_cache: Whether to use the client's response cache, if any
             
         Returns:
             Text response from the agent
@@ -690,7 +803,7 @@ class A2AClient(BaseA2AClient):
             message = message_text
         
         # Send message
-        response = self.send_message(message)
+        response = self.send_message(message, use_cache=use_cache)
         
         # Extract text from response
         if response and hasattr(response, "content"):
@@ -759,174 +872,662 @@ class A2AClient(BaseA2AClient):
         # Use the override if provided, otherwise use the standard endpoint
         base_url = endpoint_override if endpoint_override else self.endpoint_url
         
-        # Prepare JSON-RPC request
-        request_data = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "tasks/send",
-            "params": task.to_dict()
-        }
+        breaker = self._circuit_breaker(endpoint_override)
+        if breaker is not None:
+            if not breaker.allow_request():
+                return self._failed_task(task, self._circuit_open_error(breaker))
+            self.resilience.retry_budget.record_call()
         
+        # Whether an allowed call has not recorded its outcome yet (e.g. when
+        # it raised), in which case its trial slot is freed
+        pending = breaker is not None
         try:
-            # Try the standard endpoint first
-            endpoint_tried = False
-            try:
-                endpoint = f"{base_url}/tasks/send"
-                if endpoint.endswith("/tasks/send/tasks/send"):
-                    # Avoid doubled path
-                    endpoint = endpoint.replace("/tasks/send/tasks/send", "/tasks/send")
-                    
-                response = requests.post(
-                    endpoint,
-                    json=request_data,
-                    headers=self.headers,
-                    timeout=self.timeout
-                )
-                response.raise_for_status()
-                endpoint_tried = True
-                
-                # Check for content type
-                if "application/json" not in response.headers.get("Content-Type", "").lower():
-                    # Try to parse as JSON anyway
-                    try:
-                        response_data = response.json()
-                    except json.JSONDecodeError:
-                        # If we can't parse as JSON, consider this a failure
-                        raise ValueError("Response is not valid JSON")
-                else:
-                    response_data = response.json()
-                    
-            except Exception as e:
-                if endpoint_tried:
-                    # If we've tried this endpoint and it failed with a response error,
-                    # take a different approach for alternate endpoint
-                    raise e
-                
-                # Try the alternate endpoint
-                endpoint = f"{base_url}/a2a/tasks/send"
-                if endpoint.endswith("/a2a/tasks/send/a2a/tasks/send"):
-                    # Avoid doubled path
-                    endpoint = endpoint.replace("/a2a/tasks/send/a2a/tasks/send", "/a2a/tasks/send")
-                    
-                response = requests.post(
-                    endpoint,
-                    json=request_data,
-                    headers=self.headers,
-                    timeout=self.timeout
-                )
-                response.raise_for_status()
+            attempt = 0
+            while True:
+                try:
+                    response_data, _ = self._post_task(task, base_url)
+                except requests.RequestException as e:
+                    if breaker is None or not self._is_transient(e):
+                        return self._failed_task(task, str(e))
+                    breaker.record_failure()
+                    pending = False
+                    attempt += 1
+                    if not self._retry_allowed(breaker, attempt):
+                        return self._failed_task(task, str(e))
+                    pending = True
+                    time.sleep(self.resilience.backoff(attempt))
+                    continue
+                except Exception as e:
+                    return self._failed_task(task, str(e))
                 
-                # Check for content type
-                if "application/json" not in response.headers.get("Content-Type", "").lower():
-                    # Try to parse as JSON anyway
-                    try:
-                        response_data = response.json()
-                    except json.JSONDecodeError:
-                        # If we can't parse as JSON, consider this a failure
-                        raise ValueError("Response is not valid JSON")
-                else:
-                    response_data = response.json()
-            
-            # Parse the response
-            result = response_data.get("result", {})
-            
-            # If result is empty but we have a text response, create a task with it
-            if not result and isinstance(response_data, dict) and "text" in response_data:
-                # Create a simple task with text response
-                task.artifacts = [{
-                    "parts": [{
-                        "type": "text",
-                        "text": response_data["text"]
-                    }]
-                }]
-                task.status = TaskStatus(state=TaskState.COMPLETED)
-                return task
+                if breaker is not None:
+                    breaker.record_success()
+                    pending = False
+                try:
+                    return self._task_from_response(response_data, task)
+                except Exception as e:
+                    return self._failed_task(task, str(e))
+        finally:
+            if pending:
+                breaker.release_trial()
+    
+    @staticmethod
+    def _failed_task(task: Task, error: str) -> Task:
+        """Mark a task as failed with an error message"""
+        task.status = TaskStatus(
+            state=TaskState.FAILED,
+            message={"error": error}
+        )
+        return task
+    
+    def _circuit_breaker(self, endpoint_override: Optional[str] = None) -> Optional[CircuitBreaker]:
+        """
+        Get the circuit breaker guarding calls to the agent
+        
+        Args:
+            endpoint_override: Optional endpoint used instead of the client's base URL
             
-            # Convert to Task object or use raw result if parsing fails
-            try:
-                result_task = Task.from_dict(result)
-                
-                # Check if this might be Google A2A format
-                if result and isinstance(result, dict):
-                    try:
-                        for artifact in result.get("artifacts", []):
-                            if "parts" in artifact and isinstance(artifact["parts"], list):
-                                for part in artifact["parts"]:
-                                    if part.get("type") == "text" and "text" in part:
-                                        # This looks like Google A2A format
-                                        self._use_google_a2a = True
-                                        self._protocol_detected = True
-                                        break
-                    except:
-                        pass
-                        
-                return result_task
-            except Exception:
-                # Create a simple task with the raw result
-                task.artifacts = [{
-                    "parts": [{
-                        "type": "text",
-                        "text": str(result)
-                    }]
-                }]
-                task.status = TaskStatus(state=TaskState.COMPLETED)
-                return task
+        Returns:
+            The circuit breaker, or None if no resilience policy is configured
+        """
+        if self.resilience is None:
+            return None
+        return self.resilience.breaker(endpoint_override or self._base_url)
+    
+    @staticmethod
+    def _is_transient(error: Exception) -> bool:
+        """
+        Check whether a failed call may succeed when retried
+        
+        Connection errors, timeouts, 429 and 5xx responses are transient;
+        other 4xx responses (bad request, authentication) are not, and are
+        neither retried nor counted against the agent's circuit.
+        """
+        if isinstance(error, requests.HTTPError) and error.response is not None:
+            status = error.response.status_code
+        else:
+            status = getattr(error, "status", None)
+        return status is None or status == 429 or status >= 500
+    
+    def _retry_allowed(self, breaker: CircuitBreaker, attempt: int) -> bool:
+        """Check whether a failed call may be retried under the retry budget and circuit"""
+        return self.resilience.should_retry(attempt) and breaker.allow_request()
+    
+    def _circuit_open_error(self, breaker: CircuitBreaker) -> str:
+        """Describe a call rejected by an open circuit"""
+        return (f"Circuit open for agent at {self._base_url}: failing fast, "
+                f"retry in {breaker.retry_after():.1f}s")
+    
+    def _circuit_open_reply(self, message: Message, breaker: CircuitBreaker) -> Message:
+        """Create the error reply returned when the agent's circuit is open"""
+        return Message(
+            content=ErrorContent(message=self._circuit_open_error(breaker)),
+            role=MessageRole.AGENT,
+            parent_message_id=message.message_id,
+            conversation_id=message.conversation_id
+        )
+    
+    @staticmethod
+    def _record_reply_outcome(breaker: CircuitBreaker, response: Message) -> None:
+        """Record whether a message reached the agent"""
+        content = getattr(response, "content", None)
+        if isinstance(content, ErrorContent) and content.message.startswith(_UNREACHABLE_ERROR):
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+    
+    def _post_task(self, task: Task, base_url: str):
+        """
+        Post a tasks/send request, trying the standard and alternate task URLs
+        
+        Args:
+            task: The task to send
+            base_url: The base URL of the agent
             
-        except Exception as e:
-            # Create an error task
-            task.status = TaskStatus(
-                state=TaskState.FAILED,
-                message={"error": str(e)}
-            )
-            return task
+        Returns:
+            Tuple of (decoded JSON response, URL that answered)
+            
+        Raises:
+            requests.RequestException: If neither URL could be reached
+            ValueError: If the response is not valid JSON
+        """
+        request_data = self._build_jsonrpc_request("tasks/send", task.to_dict())
+        primary, alternate = self._task_send_urls(base_url)
+        
+        try:
+            return self._post_task_request(primary, request_data), primary
+        except requests.RequestException:
+            # Try the alternate endpoint
+            return self._post_task_request(alternate, request_data), alternate
     
-    def get_task(self, task_id, history_length=0):
+    def _post_task_request(self, url: str, request_data: Dict[str, Any]) -> Any:
         """
-        Get a task by ID
+        Post a JSON-RPC task request to a single URL
         
         Args:
-            task_id: ID of the task to retrieve
-            history_length: Number of history messages to include
+            url: The tasks/send URL
+            request_data: The JSON-RPC request
             
         Returns:
-            The task with current status and results
+            The decoded JSON response
+            
+        Raises:
+            requests.RequestException: If the request fails
+            ValueError: If the response is not valid JSON
         """
-        # Prepare JSON-RPC request
-        request_data = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "tasks/get",
-            "params": {
-                "id": task_id,
-                "historyLength": history_length
-            }
-        }
+        response = self._post_json(url, request_data)
+        response.raise_for_status()
+        return self._decode_json_response(
+            response.headers.get("Content-Type", ""), response.text
+        )
+    
+    def _cached_reply(self, key: str, message: Message) -> Optional[Message]:
+        """
+        Get a reply to a message from the response cache.
         
-        # Try possible endpoints
-        endpoints = [
-            f"{self.endpoint_url}/tasks/get",
-            f"{self.endpoint_url}/a2a/tasks/get"
-        ]
+        Args:
+            key: The cache key of the message
+            message: The message being sent
+            
+        Returns:
+            A copy of the cached reply addressed to this message, or None
+        """
+        data = self.response_cache.get(key)
+        if data is None:
+            return None
         
-        for endpoint in endpoints:
-            try:
-                response = requests.post(
-                    endpoint,
-                    json=request_data,
-                    headers=self.headers,
-                    timeout=self.timeout
-                )
-                response.raise_for_status()
-                
-                # Parse the response
-                response_data = response.json()
-                result = response_data.get("result", {})
-                
-                # Try to convert to Task object
-                try:
-                    # Check for Google A2A format
-                    if result and isinstance(result, dict):
-                        for artifact in result.get("artifacts", []):
+        try:
+            reply = Message.from_dict(data)
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable cached response: {e}")
+            return None
+        
+        return self._readdress_reply(reply, message, copy=False)
+    
+    @staticmethod
+    def _readdress_reply(reply: Message, message: Message, copy: bool = True) -> Message:
+        """
+        Address a reply obtained for another, identical message to this message.
+        
+        Args:
+            reply: The reply to reuse
+            message: The message being answered
+            copy: Whether to copy the reply rather than modify it in place
+            
+        Returns:
+            The reply with a new message ID, replying to the given message
+        """
+        if reply is None:
+            return None
+        if copy:
+            reply = Message.from_dict(reply.to_dict())
+        reply.message_id = str(uuid.uuid4())
+        reply.parent_message_id = message.message_id
+        reply.conversation_id = message.conversation_id
+        return reply
+    
+    def _cache_reply(self, key: str, response: Message) -> None:
+        """Store a reply in the response cache, unless it reports an error"""
+        if response is None or getattr(response.content, "type", None) == "error":
+            return
+        try:
+            self.response_cache.set(key, response.to_dict())
+        except Exception as e:
+            logger.debug(f"Could not cache response: {e}")
+    
+    def _remember_route(self, key: str, url: str, wire_format: str) -> None:
+        """
+        Remember a working endpoint for this agent in the endpoint cache
+        
+        Args:
+            key: The cache key of the route ("message_route" or "conversation_route")
+            url: The URL that answered
+            wire_format: How the request was sent ("task", "python" or "google")
+        """
+        self._endpoint_cache.set(self._base_url, key, (url, wire_format))
+        if self._protocol_detected:
+            self._endpoint_cache.set(self._base_url, "google_a2a", self._use_google_a2a)
+    
+    def _failed_message_reply(self, message: Message, remember: bool = False) -> Message:
+        """
+        Create the error reply returned when the agent could not be reached
+        
+        Args:
+            message: The message being replied to
+            remember: Whether to cache the failure so that the endpoints are not
+                probed again until the negative cache entry expires
+            
+        Returns:
+            An error message
+        """
+        error_msg = f"{_UNREACHABLE_ERROR} {self.endpoint_url}. Tried multiple endpoint variations."
+        if remember:
+            self._endpoint_cache.set_failure(self._base_url, "message_route", error_msg)
+        
+        return Message(
+            content=ErrorContent(message=error_msg),
+            role=MessageRole.AGENT,
+            parent_message_id=message.message_id,
+            conversation_id=message.conversation_id
+        )
+    
+    def _failed_conversation_reply(self, conversation: Conversation, remember: bool = False) -> Conversation:
+        """
+        Add the error reply used when the agent could not be reached to a conversation
+        
+        Args:
+            conversation: The conversation to update
+            remember: Whether to cache the failure so that the endpoints are not
+                probed again until the negative cache entry expires
+            
+        Returns:
+            The conversation with an error message added
+        """
+        error_msg = f"{_UNREACHABLE_ERROR} {self.endpoint_url}. Tried multiple endpoint variations."
+        if remember:
+            self._endpoint_cache.set_failure(self._base_url, "conversation_route", error_msg)
+        
+        conversation.create_error_message(error_msg)
+        return conversation
+    
+    def _send_message_via_route(self, message: Message, url: str, wire_format: str) -> Optional[Message]:
+        """
+        Send a message to a previously resolved endpoint
+        
+        Args:
+            message: The message to send
+            url: The resolved endpoint URL
+            wire_format: How to send the message ("task", "python" or "google")
+            
+        Returns:
+            The agent's response, or None if the endpoint did not answer usefully
+        """
+        try:
+            if wire_format == "task":
+                task = self._create_task(message)
+                request_data = self._build_jsonrpc_request("tasks/send", task.to_dict())
+                result = self._task_from_response(self._post_task_request(url, request_data), task)
+                return self._message_from_task(result, message)
+            
+            payload = message.to_google_a2a() if wire_format == "google" else message.to_dict(WireFormat.PYTHON_A2A)
+            response = self._post_json(url, payload)
+            response.raise_for_status()
+            try:
+                return self._message_from_response(codec.loads(response.content), google_request=wire_format == "google")
+            except ValueError:
+                return self._text_reply(response.text, message)
+        except Exception as e:
+            logger.debug(f"Resolved endpoint {url} failed: {e}")
+            return None
+    
+    def _send_conversation_via_route(self, conversation: Conversation, url: str,
+                                     wire_format: str) -> Optional[Conversation]:
+        """
+        Send a conversation to a previously resolved endpoint
+        
+        Args:
+            conversation: The conversation to send
+            url: The resolved endpoint URL
+            wire_format: How to send the conversation ("python" or "google")
+            
+        Returns:
+            The updated conversation, or None if the endpoint did not answer usefully
+        """
+        try:
+            payload = conversation.to_google_a2a() if wire_format == "google" else conversation.to_dict(WireFormat.PYTHON_A2A)
+            response = self._post_json(url, payload)
+            response.raise_for_status()
+            try:
+                return self._conversation_from_response(codec.loads(response.content))
+            except ValueError:
+                return conversation if self._append_text_reply(response.text, conversation) else None
+        except Exception as e:
+            logger.debug(f"Resolved endpoint {url} failed: {e}")
+            return None
+    
+    def _message_endpoints(self, include_tasks_endpoint: bool = True) -> List[str]:
+        """
+        Get the endpoint variations to try when sending a message
+        
+        Args:
+            include_tasks_endpoint: Whether to include the direct tasks endpoint
+            
+        Returns:
+            Deduplicated list of endpoint URLs in order of preference
+        """
+        # Always probe from the URL the client was created with, not from an
+        # endpoint variation that happened to answer an earlier request
+        base_url = self._base_url
+        endpoints_to_try = [
+            base_url,                           # Try the exact URL first
+            base_url.rstrip("/"),               # URL without trailing slash
+            f"{base_url.rstrip('/')}/a2a",      # Try /a2a endpoint
+        ]
+        
+        if include_tasks_endpoint:
+            # Try direct tasks endpoint
+            endpoints_to_try.append(f"{base_url.rstrip('/')}/tasks/send")
+        
+        # Deduplicate endpoints
+        return list(dict.fromkeys(endpoints_to_try))
+    
+    @staticmethod
+    def _task_send_urls(base_url: str):
+        """
+        Get the primary and alternate tasks/send URLs for a base URL
+        
+        Args:
+            base_url: The base URL of the agent
+            
+        Returns:
+            Tuple of (primary URL, alternate URL)
+        """
+        primary = f"{base_url}/tasks/send"
+        if primary.endswith("/tasks/send/tasks/send"):
+            # Avoid doubled path
+            primary = primary.replace("/tasks/send/tasks/send", "/tasks/send")
+        
+        alternate = f"{base_url}/a2a/tasks/send"
+        if alternate.endswith("/a2a/tasks/send/a2a/tasks/send"):
+            # Avoid doubled path
+            alternate = alternate.replace("/a2a/tasks/send/a2a/tasks/send", "/a2a/tasks/send")
+        
+        return primary, alternate
+    
+    @staticmethod
+    def _build_jsonrpc_request(method: str, params: Dict[str, Any], rpc_id: Any = 1) -> Dict[str, Any]:
+        """
+        Build a JSON-RPC 2.0 request envelope
+        
+        Args:
+            method: The JSON-RPC method name
+            params: The method parameters
+            rpc_id: The JSON-RPC request ID
+            
+        Returns:
+            The JSON-RPC request as a dictionary
+        """
+        return {
+            "jsonrpc": "2.0",
+            "id": rpc_id,
+            "method": method,
+            "params": params
+        }
+    
+    @staticmethod
+    def _decode_json_response(content_type: str, text: str) -> Any:
+        """
+        Decode a JSON response body
+        
+        Args:
+            content_type: The Content-Type header of the response
+            text: The response body
+            
+        Returns:
+            The decoded JSON data
+            
+        Raises:
+            ValueError: If the body is not valid JSON
+        """
+        try:
+            return codec.loads(text)
+        except json.JSONDecodeError:
+            if "application/json" in content_type.lower():
+                raise
+            # If we can't parse as JSON, consider this a failure
+            raise ValueError("Response is not valid JSON")
+    
+    def _task_from_response(self, response_data: Any, task: Task) -> Task:
+        """
+        Convert a tasks/send response into a Task
+        
+        Args:
+            response_data: The decoded JSON response
+            task: The task that was sent
+            
+        Returns:
+            The updated task with the agent's response
+        """
+        # Parse the response
+        result = response_data.get("result", {})
+        
+        # If result is empty but we have a text response, create a task with it
+        if not result and isinstance(response_data, dict) and "text" in response_data:
+            # Create a simple task with text response
+            task.artifacts = [{
+                "parts": [{
+                    "type": "text",
+                    "text": response_data["text"]
+                }]
+            }]
+            task.status = TaskStatus(state=TaskState.COMPLETED)
+            return task
+        
+        # Convert to Task object or use raw result if parsing fails
+        try:
+            result_task = Task.from_dict(result)
+            
+            # Check if this might be Google A2A format
+            if result and isinstance(result, dict):
+                try:
+                    for artifact in result.get("artifacts", []):
+                        if "parts" in artifact and isinstance(artifact["parts"], list):
+                            for part in artifact["parts"]:
+                                if part.get("type") == "text" and "text" in part:
+                                    # This looks like Google A2A format
+                                    self._use_google_a2a = True
+                                    self._protocol_detected = True
+                                    break
+                except:
+                    pass
+                    
+            return result_task
+        except Exception:
+            # Create a simple task with the raw result
+            task.artifacts = [{
+                "parts": [{
+                    "type": "text",
+                    "text": str(result)
+                }]
+            }]
+            task.status = TaskStatus(state=TaskState.COMPLETED)
+            return task
+    
+    def _message_from_task(self, result: Task, message: Message) -> Optional[Message]:
+        """
+        Convert the artifacts of a completed task back into a message
+        
+        Args:
+            result: The task returned by the agent
+            message: The message the task was created from
+            
+        Returns:
+            The agent's response message, or None if the task has no usable artifact
+        """
+        response = None
+        
+        for artifact in result.artifacts or []:
+            if "parts" not in artifact:
+                continue
+            
+            for part in artifact["parts"]:
+                if part.get("type") == "text":
+                    content = TextContent(text=part.get("text", ""))
+                elif part.get("type") == "function_response":
+                    content = FunctionResponseContent(
+                        name=part.get("name", ""),
+                        response=part.get("response", {})
+                    )
+                elif part.get("type") == "function_call":
+                    # Convert parameters to FunctionParameter objects
+                    params = []
+                    for param in part.get("parameters", []):
+                        params.append(FunctionParameter(
+                            name=param.get("name", ""),
+                            value=param.get("value", "")
+                        ))
+                    content = FunctionCallContent(
+                        name=part.get("name", ""),
+                        parameters=params
+                    )
+                elif part.get("type") == "error":
+                    content = ErrorContent(message=part.get("message", ""))
+                else:
+                    continue
+                
+                # Later artifacts take precedence over earlier ones
+                response = Message(
+                    content=content,
+                    role=MessageRole.AGENT,
+                    parent_message_id=message.message_id,
+                    conversation_id=message.conversation_id
+                )
+                break
+        
+        return response
+    
+    def _message_from_response(self, response_data: Dict[str, Any], google_request: bool) -> Message:
+        """
+        Convert a direct message response into a Message, detecting its format
+        
+        Args:
+            response_data: The decoded JSON response
+            google_request: Whether the request was sent in Google A2A format
+            
+        Returns:
+            The agent's response message
+        """
+        # Check for clear Google A2A format markers
+        is_google_response = (
+            "parts" in response_data and isinstance(response_data.get("parts"), list) and
+            "role" in response_data and (google_request or "content" not in response_data)
+        )
+        
+        if is_google_response:
+            # Response is in Google A2A format
+            self._use_google_a2a = True
+            self._protocol_detected = True
+            return Message.from_google_a2a(response_data)
+        
+        # Standard format
+        return Message.from_dict(response_data)
+    
+    def _conversation_from_response(self, response_data: Dict[str, Any]) -> Conversation:
+        """
+        Convert a conversation response into a Conversation, detecting its format
+        
+        Args:
+            response_data: The decoded JSON response
+            
+        Returns:
+            The updated conversation
+        """
+        # Check if the response is in Google A2A format
+        if "messages" in response_data and isinstance(response_data["messages"], list):
+            if (response_data["messages"] and 
+                "parts" in response_data["messages"][0] and 
+                isinstance(response_data["messages"][0].get("parts"), list)):
+                # Response is in Google A2A format
+                self._use_google_a2a = True
+                self._protocol_detected = True
+                return Conversation.from_google_a2a(response_data)
+        
+        # Standard format
+        return Conversation.from_dict(response_data)
+    
+    @staticmethod
+    def _text_reply(text: Optional[str], message: Message) -> Optional[Message]:
+        """
+        Wrap a plain text response body in an agent message
+        
+        Args:
+            text: The raw response body
+            message: The message being replied to
+            
+        Returns:
+            A text message, or None if the body is empty
+        """
+        text_content = (text or "").strip()
+        if not text_content:
+            return None
+        
+        return Message(
+            content=TextContent(text=text_content),
+            role=MessageRole.AGENT,
+            parent_message_id=message.message_id,
+            conversation_id=message.conversation_id
+        )
+    
+    @staticmethod
+    def _append_text_reply(text: Optional[str], conversation: Conversation) -> bool:
+        """
+        Append a plain text response body to a conversation as an agent message
+        
+        Args:
+            text: The raw response body
+            conversation: The conversation to update
+            
+        Returns:
+            True if a message was added, False if the body is empty
+        """
+        text_content = (text or "").strip()
+        if not text_content:
+            return False
+        
+        # Create a new message with the response text
+        last_message = conversation.messages[-1] if conversation.messages else None
+        parent_id = last_message.message_id if last_message else None
+        
+        # Add a response message to the conversation
+        conversation.create_text_message(
+            text=text_content,
+            role=MessageRole.AGENT,
+            parent_message_id=parent_id
+        )
+        return True
+    
+    def get_task(self, task_id, history_length=0):
+        """
+        Get a task by ID
+        
+        Args:
+            task_id: ID of the task to retrieve
+            history_length: Number of history messages to include
+            
+        Returns:
+            The task with current status and results
+        """
+        # Prepare JSON-RPC request
+        request_data = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "tasks/get",
+            "params": {
+                "id": task_id,
+                "historyLength": history_length
+            }
+        }
+        
+        # Try possible endpoints
+        endpoints = [
+            f"{self.endpoint_url}/tasks/get",
+            f"{self.endpoint_url}/a2a/tasks/get"
+        ]
+        
+        for endpoint in endpoints:
+            try:
+                response = self._post_json(endpoint, request_data)
+                response.raise_for_status()
+                
+                # Parse the response
+                response_data = codec.loads(response.content)
+                result = response_data.get("result", {})
+                
+                # Try to convert to Task object
+                try:
+                    # Check for Google A2A format
+                    if result and isinstance(result, dict):
+                        for artifact in result.get("artifacts", []):
                             if "parts" in artifact and isinstance(artifact["parts"], list):
                                 for part in artifact["parts"]:
                                     if part.get("type") == "text" and "text" in part:
@@ -964,241 +1565,836 @@ class A2AClient(BaseA2AClient):
     
     def cancel_task(self, task_id):
         """
-        Cancel a task
+        Cancel a task
+        
+        Args:
+            task_id: ID of the task to cancel
+            
+        Returns:
+            The canceled task
+        """
+        # Prepare JSON-RPC request
+        request_data = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "tasks/cancel",
+            "params": {
+                "id": task_id
+            }
+        }
+        
+        # Try possible endpoints
+        endpoints = [
+            f"{self.endpoint_url}/tasks/cancel",
+            f"{self.endpoint_url}/a2a/tasks/cancel"
+        ]
+        
+        for endpoint in endpoints:
+            try:
+                response = self._post_json(endpoint, request_data)
+                response.raise_for_status()
+                
+                # Parse the response
+                response_data = codec.loads(response.content)
+                result = response_data.get("result", {})
+                
+                # Try to convert to Task object
+                try:
+                    # Check for Google A2A format
+                    if result and isinstance(result, dict):
+                        for artifact in result.get("artifacts", []):
+                            if "parts" in artifact and isinstance(artifact["parts"], list):
+                                for part in artifact["parts"]:
+                                    if part.get("type") == "text" and "text" in part:
+                                        # This looks like Google A2A format
+                                        self._use_google_a2a = True
+                                        self._protocol_detected = True
+                                        return Task.from_google_a2a(result)
+                        
+                    # Standard format
+                    return Task.from_dict(result)
+                except Exception:
+                    # If conversion fails, create a simple task with the raw result
+                    return Task(
+                        id=task_id,
+                        status=TaskStatus(state=TaskState.CANCELED),
+                        artifacts=[{
+                            "parts": [{
+                                "type": "text",
+                                "text": str(result or response_data)
+                            }]
+                        }]
+                    )
+            except Exception:
+                # Try next endpoint
+                continue
+        
+        # If we get here, all endpoints failed
+        return Task(
+            id=task_id,
+            status=TaskStatus(
+                state=TaskState.CANCELED,
+                message={"error": f"Failed to cancel task on {self.endpoint_url}"}
+            )
+        )
+    
+    def use_google_a2a_format(self, use_google_format: bool = True) -> None:
+        """
+        Set whether to use Google A2A format for requests
+        
+        This method is not typically needed as format is automatically detected.
+        
+        Args:
+            use_google_format: Whether to use Google A2A format
+        """
+        self._use_google_a2a = use_google_format
+        self._protocol_detected = True
+        
+    def is_using_google_a2a_format(self) -> bool:
+        """
+        Check if using Google A2A format
+        
+        Returns:
+            True if using Google A2A format, False otherwise
+        """
+        return self._use_google_a2a
+        
+    def close(self) -> None:
+        """
+        Release the HTTP session used for synchronous requests.
+        
+        Shared keep-alive connection pools stay open for other clients.
+        Sessions passed in by the caller are left untouched.
+        """
+        if self._owns_session:
+            SharedConnectionPool.release_session(self._session)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
+    async def send_message_async(self, message: Message, use_cache: bool = True) -> Message:
+        """
+        Send a message to an A2A-compatible agent asynchronously.
+        
+        Uses a shared aiohttp session so that many concurrent calls can be
+        driven from a single event loop without tying up threads. Falls back
+        to running the synchronous implementation in an executor if aiohttp
+        is not installed.
+        
+        Args:
+            message: The A2A message to send
+            use_cache: Whether to use the client's response cache, if any,
+                for this call (False always sends the message)
+            
+        Returns:
+            The agent's response as an A2A message
+        """
+        if not use_cache or self.response_cache is None:
+            return await self._send_message_coalesced_async(message)
+        
+        key = self.response_cache.make_key(self._base_url, message)
+        cached = self._cached_reply(key, message)
+        if cached is not None:
+            return cached
+        
+        response = await self._send_message_coalesced_async(message)
+        self._cache_reply(key, response)
+        return response
+    
+    async def _send_message_coalesced_async(self, message: Message) -> Message:
+        """Send a message asynchronously, sharing the request with identical in-flight messages"""
+        if self._single_flight is None:
+            return await self._send_message_guarded_async(message)
+        
+        key = ResponseCache.make_key(self._base_url, message)
+        response, shared = await self._single_flight.call_async(
+            key, lambda: self._send_message_guarded_async(message)
+        )
+        return self._readdress_reply(response, message) if shared else response
+    
+    async def _send_message_guarded_async(self, message: Message) -> Message:
+        """Send a message asynchronously through the agent's circuit breaker, if one is configured"""
+        breaker = self._circuit_breaker()
+        if breaker is None:
+            return await self._send_message_async(message)
+        if not breaker.allow_request():
+            return self._circuit_open_reply(message, breaker)
+        
+        recorded = False
+        try:
+            response = await self._send_message_async(message)
+            self._record_reply_outcome(breaker, response)
+            recorded = True
+            return response
+        finally:
+            # A cancelled call records no outcome; free its trial slot
+            if not recorded:
+                breaker.release_trial()
+    
+    async def _send_message_async(self, message: Message) -> Message:
+        """Send a message to the agent asynchronously, bypassing the response cache"""
+        if not self._has_aiohttp():
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self._send_message, message)
+        
+        # Go straight to a previously resolved endpoint if there is one
+        route = self._endpoint_cache.lookup(self._base_url, "message_route")
+        if route is not None:
+            if route.failed:
+                return self._failed_message_reply(message)
+            response = await self._send_message_via_route_async(message, *route.value)
+            if response is not None:
+                return response
+            # The endpoint stopped working, resolve it again
+            self._endpoint_cache.invalidate(self._base_url, "message_route")
+        
+        endpoints_to_try = self._message_endpoints()
+        
+        # First try A2A protocol style with tasks
+        for endpoint in endpoints_to_try:
+            try:
+                task = self._create_task(message)
+                response_data, task_url = await self._post_task_async(task, endpoint)
+                result = self._task_from_response(response_data, task)
+                
+                # Remember this working endpoint for future requests
+                self.endpoint_url = endpoint
+                
+                task_response = self._message_from_task(result, message)
+                if task_response is not None:
+                    self._remember_route("message_route", task_url, "task")
+                    return task_response
+            except Exception:
+                # This endpoint didn't work, try the next one
+                continue
+        
+        # All task endpoints failed, try direct message posting in python_a2a format
+        if not self._use_google_a2a:
+            for endpoint in endpoints_to_try:
+                try:
+                    status, text = await self._post_json_async(endpoint, message.to_dict(WireFormat.PYTHON_A2A))
+                except A2AConnectionError:
+                    continue
+                
+                self.endpoint_url = endpoint
+                
+                if status >= 400:
+                    # If the error points at Google A2A format, switch to it
+                    if self._detect_protocol_version(text or f"HTTP error {status}"):
+                        break
+                    continue
+                
+                try:
+                    reply = self._message_from_response(codec.loads(text), google_request=False)
+                except ValueError:
+                    reply = self._text_reply(text, message)
+                
+                if reply is not None:
+                    self._remember_route("message_route", endpoint, "python")
+                    return reply
+        
+        # Try with Google A2A format if needed
+        if self._use_google_a2a or self._protocol_detected:
+            for endpoint in endpoints_to_try:
+                try:
+                    status, text = await self._post_json_async(endpoint, message.to_google_a2a())
+                except A2AConnectionError:
+                    continue
+                
+                self.endpoint_url = endpoint
+                
+                if status >= 400:
+                    continue
+                
+                try:
+                    reply = self._message_from_response(codec.loads(text), google_request=True)
+                except Exception:
+                    reply = self._text_reply(text, message)
+                
+                if reply is not None:
+                    self._remember_route("message_route", endpoint, "google")
+                    return reply
+        
+        # If we get here, all endpoints failed
+        return self._failed_message_reply(message, remember=True)
+    
+    async def send_batch_async(self, messages: List[Message], max_concurrency: int = 8) -> List[Message]:
+        """
+        Send many independent messages to the agent asynchronously.
+        
+        Messages are submitted as JSON-RPC batches like in ``send_batch``,
+        without blocking the event loop.
+        
+        Args:
+            messages: The messages to send
+            max_concurrency: Maximum number of batch requests in flight at once
+            
+        Returns:
+            The agent's responses, in the same order as the messages
+        """
+        if not self._has_aiohttp():
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self.send_batch, messages, max_concurrency)
+        
+        if not messages:
+            return []
+        
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        
+        async def send_chunk(chunk):
+            async with semaphore:
+                return await self._send_batch_chunk_async(chunk)
+        
+        chunk_replies = await asyncio.gather(
+            *(send_chunk(chunk) for chunk in self._batch_chunks(messages))
+        )
+        replies = [reply for chunk in chunk_replies for reply in chunk]
+        
+        # Send whatever the batch requests did not answer one by one
+        pending = [i for i, reply in enumerate(replies) if reply is None]
+        if pending:
+            fallback = await super().send_batch_async([messages[i] for i in pending], max_concurrency)
+            for i, reply in zip(pending, fallback):
+                replies[i] = reply
+        
+        return replies
+    
+    async def _send_batch_chunk_async(self, messages: List[Message]) -> List[Optional[Message]]:
+        """
+        Send one JSON-RPC batch of messages without blocking the event loop
+        
+        Args:
+            messages: The messages to send in this batch
+            
+        Returns:
+            The agent's responses, with None for messages that were not answered
+        """
+        tasks = [self._create_task(message) for message in messages]
+        request_data = self._build_batch_request(tasks)
+        
+        for url in self._batch_urls():
+            try:
+                status, text = await self._post_json_async(url, request_data)
+                if status >= 400:
+                    continue
+                response_data = codec.loads(text)
+            except (A2AConnectionError, ValueError):
+                continue
+            
+            if isinstance(response_data, list):
+                self._endpoint_cache.set(self._base_url, "batch_route", url)
+                return self._batch_replies(response_data, tasks, messages)
+        
+        self._endpoint_cache.set_failure(self._base_url, "batch_route", "Batch requests are not supported")
+        return [None] * len(messages)
+    
+    async def send_conversation_async(self, conversation: Conversation) -> Conversation:
+        """
+        Send a conversation to an A2A-compatible agent asynchronously.
         
         Args:
-            task_id: ID of the task to cancel
+            conversation: The conversation to send
             
         Returns:
-            The canceled task
+            The updated conversation with the agent's response
         """
-        # Prepare JSON-RPC request
-        request_data = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "tasks/cancel",
-            "params": {
-                "id": task_id
-            }
-        }
+        if not self._has_aiohttp():
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self.send_conversation, conversation)
+        
+        # Go straight to a previously resolved endpoint if there is one
+        route = self._endpoint_cache.lookup(self._base_url, "conversation_route")
+        if route is not None:
+            if route.failed:
+                return self._failed_conversation_reply(conversation)
+            response = await self._send_conversation_via_route_async(conversation, *route.value)
+            if response is not None:
+                return response
+            # The endpoint stopped working, resolve it again
+            self._endpoint_cache.invalidate(self._base_url, "conversation_route")
+        
+        endpoints_to_try = self._message_endpoints(include_tasks_endpoint=False)
         
-        # Try possible endpoints
-        endpoints = [
-            f"{self.endpoint_url}/tasks/cancel",
-            f"{self.endpoint_url}/a2a/tasks/cancel"
-        ]
+        # First try standard python_a2a format
+        if not self._use_google_a2a:
+            for endpoint in endpoints_to_try:
+                try:
+                    status, text = await self._post_json_async(endpoint, conversation.to_dict(WireFormat.PYTHON_A2A))
+                except A2AConnectionError:
+                    continue
+                
+                self.endpoint_url = endpoint
+                
+                if status >= 400:
+                    # If the error points at Google A2A format, switch to it
+                    if self._detect_protocol_version(text or f"HTTP error {status}"):
+                        break
+                    continue
+                
+                try:
+                    reply = self._conversation_from_response(codec.loads(text))
+                except Exception:
+                    reply = conversation if self._append_text_reply(text, conversation) else None
+                
+                if reply is not None:
+                    self._remember_route("conversation_route", endpoint, "python")
+                    return reply
         
-        for endpoint in endpoints:
-            try:
-                response = requests.post(
-                    endpoint,
-                    json=request_data,
-                    headers=self.headers,
-                    timeout=self.timeout
-                )
-                response.raise_for_status()
+        # Try with Google A2A format if needed
+        if self._use_google_a2a or self._protocol_detected:
+            for endpoint in endpoints_to_try:
+                try:
+                    status, text = await self._post_json_async(endpoint, conversation.to_google_a2a())
+                except A2AConnectionError:
+                    continue
                 
-                # Parse the response
-                response_data = response.json()
-                result = response_data.get("result", {})
+                self.endpoint_url = endpoint
+                
+                if status >= 400:
+                    continue
                 
-                # Try to convert to Task object
                 try:
-                    # Check for Google A2A format
-                    if result and isinstance(result, dict):
-                        for artifact in result.get("artifacts", []):
-                            if "parts" in artifact and isinstance(artifact["parts"], list):
-                                for part in artifact["parts"]:
-                                    if part.get("type") == "text" and "text" in part:
-                                        # This looks like Google A2A format
-                                        self._use_google_a2a = True
-                                        self._protocol_detected = True
-                                        return Task.from_google_a2a(result)
-                        
-                    # Standard format
-                    return Task.from_dict(result)
+                    reply = self._conversation_from_response(codec.loads(text))
                 except Exception:
-                    # If conversion fails, create a simple task with the raw result
-                    return Task(
-                        id=task_id,
-                        status=TaskStatus(state=TaskState.CANCELED),
-                        artifacts=[{
-                            "parts": [{
-                                "type": "text",
-                                "text": str(result or response_data)
-                            }]
-                        }]
-                    )
-            except Exception:
-                # Try next endpoint
-                continue
+                    reply = conversation if self._append_text_reply(text, conversation) else None
+                
+                if reply is not None:
+                    self._remember_route("conversation_route", endpoint, "google")
+                    return reply
         
         # If we get here, all endpoints failed
-        return Task(
-            id=task_id,
-            status=TaskStatus(
-                state=TaskState.CANCELED,
-                message={"error": f"Failed to cancel task on {self.endpoint_url}"}
-            )
-        )
+        return self._failed_conversation_reply(conversation, remember=True)
     
-    def use_google_a2a_format(self, use_google_format: bool = True) -> None:
+    async def send_task_async(self, task: Task) -> Task:
         """
-        Set whether to use Google A2A format for requests
+        Send a task to an A2A-compatible agent asynchronously.
         
-        This method is not typically needed as format is automatically detected.
+        Args:
+            task: The task to send
+            
+        Returns:
+            The updated task with the agent's response
+        """
+        if not self._has_aiohttp():
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self._send_task, task)
+        
+        return await self._send_task_async(task)
+    
+    async def _send_task_async(self, task: Task, endpoint_override: Optional[str] = None) -> Task:
+        """
+        Send a task to the agent without blocking the event loop
         
         Args:
-            use_google_format: Whether to use Google A2A format
+            task: The task to send
+            endpoint_override: Optional override for the endpoint URL
+            
+        Returns:
+            The updated task with the agent's response
         """
-        self._use_google_a2a = use_google_format
-        self._protocol_detected = True
+        base_url = endpoint_override if endpoint_override else self.endpoint_url
         
-    def is_using_google_a2a_format(self) -> bool:
+        breaker = self._circuit_breaker(endpoint_override)
+        if breaker is not None:
+            if not breaker.allow_request():
+                return self._failed_task(task, self._circuit_open_error(breaker))
+            self.resilience.retry_budget.record_call()
+        
+        # Whether an allowed call has not recorded its outcome yet (e.g. when
+        # it is cancelled), in which case its trial slot is freed
+        pending = breaker is not None
+        try:
+            attempt = 0
+            while True:
+                try:
+                    response_data, _ = await self._post_task_async(task, base_url)
+                except A2AConnectionError as e:
+                    if breaker is None or not self._is_transient(e):
+                        return self._failed_task(task, str(e))
+                    breaker.record_failure()
+                    pending = False
+                    attempt += 1
+                    if not self._retry_allowed(breaker, attempt):
+                        return self._failed_task(task, str(e))
+                    pending = True
+                    await asyncio.sleep(self.resilience.backoff(attempt))
+                    continue
+                except Exception as e:
+                    return self._failed_task(task, str(e))
+                
+                if breaker is not None:
+                    breaker.record_success()
+                    pending = False
+                try:
+                    return self._task_from_response(response_data, task)
+                except Exception as e:
+                    return self._failed_task(task, str(e))
+        finally:
+            if pending:
+                breaker.release_trial()
+    
+    async def _post_task_async(self, task: Task, base_url: str):
         """
-        Check if using Google A2A format
+        Post a tasks/send request without blocking the event loop
         
+        Args:
+            task: The task to send
+            base_url: The base URL of the agent
+            
         Returns:
-            True if using Google A2A format, False otherwise
+            Tuple of (decoded JSON response, URL that answered)
+            
+        Raises:
+            A2AConnectionError: If neither task URL answered successfully
+            ValueError: If the response is not valid JSON
         """
-        return self._use_google_a2a
+        request_data = self._build_jsonrpc_request("tasks/send", task.to_dict())
+        primary, alternate = self._task_send_urls(base_url)
         
-    async def send_message_async(self, message: Message) -> Message:
+        try:
+            return await self._post_task_request_async(primary, request_data), primary
+        except A2AConnectionError:
+            # Try the alternate endpoint
+            return await self._post_task_request_async(alternate, request_data), alternate
+    
+    async def _post_task_request_async(self, url: str, request_data: Dict[str, Any]) -> Any:
         """
-        Send a message to an A2A-compatible agent asynchronously.
+        Post a JSON-RPC task request to a single URL without blocking the event loop
         
         Args:
-            message: The A2A message to send
+            url: The tasks/send URL
+            request_data: The JSON-RPC request
             
         Returns:
-            The agent's response as an A2A message
+            The decoded JSON response
+            
+        Raises:
+            A2AConnectionError: If the request fails
+            ValueError: If the response is not valid JSON
         """
-        # Implement async version of send_message using asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.send_message, message)
+        status, text = await self._post_json_async(url, request_data)
+        if status >= 400:
+            raise _HTTPStatusError(status, text)
+        return self._decode_json_response("", text)
     
-    async def send_conversation_async(self, conversation: Conversation) -> Conversation:
+    async def _send_message_via_route_async(self, message: Message, url: str,
+                                            wire_format: str) -> Optional[Message]:
         """
-        Send a conversation to an A2A-compatible agent asynchronously.
+        Send a message to a previously resolved endpoint without blocking the event loop
+        
+        Args:
+            message: The message to send
+            url: The resolved endpoint URL
+            wire_format: How to send the message ("task", "python" or "google")
+            
+        Returns:
+            The agent's response, or None if the endpoint did not answer usefully
+        """
+        try:
+            if wire_format == "task":
+                task = self._create_task(message)
+                request_data = self._build_jsonrpc_request("tasks/send", task.to_dict())
+                response_data = await self._post_task_request_async(url, request_data)
+                return self._message_from_task(self._task_from_response(response_data, task), message)
+            
+            payload = message.to_google_a2a() if wire_format == "google" else message.to_dict(WireFormat.PYTHON_A2A)
+            status, text = await self._post_json_async(url, payload)
+            if status >= 400:
+                raise A2AConnectionError(f"HTTP error {status}: {text}")
+            try:
+                return self._message_from_response(codec.loads(text), google_request=wire_format == "google")
+            except ValueError:
+                return self._text_reply(text, message)
+        except Exception as e:
+            logger.debug(f"Resolved endpoint {url} failed: {e}")
+            return None
+    
+    async def _send_conversation_via_route_async(self, conversation: Conversation, url: str,
+                                                 wire_format: str) -> Optional[Conversation]:
+        """
+        Send a conversation to a previously resolved endpoint without blocking the event loop
         
         Args:
             conversation: The conversation to send
+            url: The resolved endpoint URL
+            wire_format: How to send the conversation ("python" or "google")
             
         Returns:
-            The updated conversation with the agent's response
+            The updated conversation, or None if the endpoint did not answer usefully
         """
-        # Implement async version of send_conversation using asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.send_conversation, conversation)
+        try:
+            payload = conversation.to_google_a2a() if wire_format == "google" else conversation.to_dict(WireFormat.PYTHON_A2A)
+            status, text = await self._post_json_async(url, payload)
+            if status >= 400:
+                raise A2AConnectionError(f"HTTP error {status}: {text}")
+            try:
+                return self._conversation_from_response(codec.loads(text))
+            except ValueError:
+                return conversation if self._append_text_reply(text, conversation) else None
+        except Exception as e:
+            logger.debug(f"Resolved endpoint {url} failed: {e}")
+            return None
     
-    async def send_task_async(self, task: Task) -> Task:
+    def _encode_body(self, payload: Any):
         """
-        Send a task to an A2A-compatible agent asynchronously.
+        Encode a JSON request body, compressing it if enabled and large enough
         
         Args:
-            task: The task to send
+            payload: JSON-serializable request body
             
         Returns:
-            The updated task with the agent's response
+            Tuple of (body bytes, request headers)
+        """
+        body = codec.dumps(payload)
+        if self.compress_requests is None or len(body) < self.compress_min_size:
+            return body, self.headers
+        headers = dict(self.headers)
+        headers["Content-Encoding"] = self.compress_requests
+        return compression.compress(body, self.compress_requests), headers
+    
+    def _post_json(self, url: str, payload: Any) -> requests.Response:
+        """
+        POST a JSON payload using the client's requests session
+        
+        Args:
+            url: The URL to post to
+            payload: JSON-serializable request body
+            
+        Returns:
+            The response
+        """
+        body, headers = self._encode_body(payload)
+        return self._session.post(url, data=body, headers=headers, timeout=self.timeout)
+    
+    async def _post_json_async(self, url: str, payload: Any):
+        """
+        POST a JSON payload using the shared aiohttp session
+        
+        Args:
+            url: The URL to post to
+            payload: JSON-serializable request body
+            
+        Returns:
+            Tuple of (HTTP status, response body text)
+            
+        Raises:
+            A2AConnectionError: If the request could not be completed
+        """
+        import aiohttp
+        
+        body, headers = self._encode_body(payload)
+        try:
+            async with self._session_manager.session() as session:
+                async with session.post(url, data=body, headers=headers) as response:
+                    return response.status, await response.text()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise A2AConnectionError(f"Failed to connect to {url}: {str(e)}") from e
+    
+    def _forward_request(self, path: str, headers: Optional[Mapping[str, str]]):
+        """
+        Build the URL and headers of a forwarded request
+        
+        Args:
+            path: Path (and query string) appended to the endpoint URL
+            headers: Headers of the original request
+            
+        Returns:
+            Tuple of (URL, request headers)
+        """
+        # Header names are case-insensitive: a forwarded header replaces the
+        # client's header of the same name whatever the casing
+        request_headers = CaseInsensitiveDict(self.headers)
+        if headers:
+            request_headers.update(headers)
+        # Without this, the HTTP library would ask for a compressed response
+        # the original caller may not accept
+        if "Accept-Encoding" not in request_headers:
+            request_headers["Accept-Encoding"] = "identity"
+        return self.endpoint_url + path, dict(request_headers)
+    
+    def forward_raw(self, body: bytes, path: str = "", headers: Optional[Mapping[str, str]] = None,
+                    method: str = "POST") -> requests.Response:
+        """
+        Forward a request body to the agent unchanged
+        
+        The body is sent as is, without being parsed or re-encoded, and the
+        response is streamed: read it with ``response.raw.stream(decode_content=False)``
+        to pass the agent's bytes on without decompressing them, and close it
+        when done.
+        
+        Args:
+            body: The request body (a JSON-RPC request or A2A payload)
+            path: Path (and query string) appended to the endpoint URL
+            headers: Headers to send, such as those of the original request;
+                they take precedence over the client's headers
+            method: HTTP method
+            
+        Returns:
+            The agent's streamed response
+            
+        Raises:
+            A2AConnectionError: If the agent could not be reached
+        """
+        url, request_headers = self._forward_request(path, headers)
+        try:
+            return self._session.request(method, url, data=body, headers=request_headers,
+                                         timeout=self.timeout, stream=True)
+        except requests.RequestException as e:
+            raise A2AConnectionError(f"Failed to connect to {url}: {str(e)}") from e
+    
+    @asynccontextmanager
+    async def forward_raw_async(self, body: bytes, path: str = "",
+                                headers: Optional[Mapping[str, str]] = None,
+                                method: str = "POST") -> AsyncIterator[Any]:
+        """
+        Forward a request body to the agent unchanged, using the shared aiohttp session
+        
+        Use as ``async with client.forward_raw_async(body) as response``; the
+        aiohttp response is not decompressed, so ``response.content.iter_any()``
+        yields the agent's bytes as they arrive.
+        
+        Args:
+            body: The request body (a JSON-RPC request or A2A payload)
+            path: Path (and query string) appended to the endpoint URL
+            headers: Headers to send, such as those of the original request;
+                they take precedence over the client's headers
+            method: HTTP method
+            
+        Yields:
+            The agent's aiohttp response
+            
+        Raises:
+            A2AConnectionError: If the agent could not be reached
+        """
+        import aiohttp
+        
+        url, request_headers = self._forward_request(path, headers)
+        try:
+            async with self._session_manager.session() as session:
+                async with session.request(method, url, data=body, headers=request_headers,
+                                           auto_decompress=False) as response:
+                    yield response
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise A2AConnectionError(f"Failed to connect to {url}: {str(e)}") from e
+    
+    @staticmethod
+    def _has_aiohttp() -> bool:
+        """Check whether aiohttp is available for native async requests"""
+        try:
+            import aiohttp
+            return True
+        except ImportError:
+            return False
+    
+    async def aclose(self) -> None:
+        """
+        Close the aiohttp session used for async requests and streaming.
+        
+        Streams that are still open keep the session alive until they finish.
+        The client can still be used afterwards; a new session is created
+        on the next async call.
         """
-        # Implement async version of _send_task using asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self._send_task, task)
+        await self._session_manager.aclose()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+        self.close()
     
     async def check_streaming_support(self) -> bool:
         """
         Check if the agent supports streaming.
         
+        The result is remembered per agent in the endpoint cache. It is taken
+        from the capabilities of the agent card fetched when the client was
+        created whenever possible, so usually no request is made at all.
+        
         Returns:
             True if streaming is supported, False otherwise
         """
+        cached = self._endpoint_cache.lookup(self._base_url, "streaming")
+        if cached is not None and not cached.failed:
+            return cached.value
+        
+        # Use the capabilities of the agent card we already have
+        capabilities = getattr(self.agent_card, "capabilities", None)
+        if self._agent_card_fetched and isinstance(capabilities, dict):
+            supported = bool(capabilities.get("streaming", False))
+            self._endpoint_cache.set(self._base_url, "streaming", supported)
+            return supported
+        
+        # No agent card could be fetched recently, so there is nothing to ask
+        card = self._endpoint_cache.lookup(self._base_url, "agent_card")
+        if card is not None and card.failed:
+            return False
+        
         try:
-            # Check the agent card capabilities
-            if hasattr(self.agent_card, 'capabilities'):
-                capabilities = getattr(self.agent_card, 'capabilities', {})
-                if isinstance(capabilities, dict) and capabilities.get("streaming", False):
-                    return True
-            
-            # Try to fetch agent metadata to check for streaming capability
-            try:
-                # Add Accept header to prefer JSON
-                headers = dict(self.headers)
-                headers["Accept"] = "application/json"
-                
-                # Try the standard endpoint first
-                endpoint = f"{self.endpoint_url}/agent.json"
+            supported = await self._fetch_streaming_capability()
+        except Exception as e:
+            logger.warning(f"Error checking streaming support: {e}")
+            supported = None
+        
+        if supported is None:
+            # Default to false if we couldn't determine streaming support,
+            # but check again once the negative cache entry expires
+            self._endpoint_cache.set(
+                self._base_url, "streaming", False, ttl=self._endpoint_cache.negative_ttl
+            )
+            return False
+        
+        self._endpoint_cache.set(self._base_url, "streaming", supported)
+        return supported
+    
+    async def _fetch_streaming_capability(self) -> Optional[bool]:
+        """
+        Fetch the agent card asynchronously and read its streaming capability
+        
+        Returns:
+            Whether the agent card advertises streaming, or None if no agent
+            card could be fetched
+        """
+        # Add Accept header to prefer JSON
+        headers = dict(self.headers)
+        headers["Accept"] = "application/json"
+        
+        async with self._create_aiohttp_session() as session:
+            for endpoint in (f"{self._base_url}/agent.json", f"{self._base_url}/a2a/agent.json"):
                 try:
-                    async with self._create_aiohttp_session() as session:
-                        async with session.get(endpoint, headers=headers) as response:
-                            if response.status == 200:
-                                data = await response.json(content_type=None)
-                                if isinstance(data, dict) and isinstance(data.get("capabilities"), dict):
-                                    return data.get("capabilities", {}).get("streaming", False)
-                except:
+                    async with session.get(endpoint, headers=headers) as response:
+                        if response.status != 200:
+                            continue
+                        data = await response.json(content_type=None)
+                except Exception:
                     # Try alternate endpoint
-                    endpoint = f"{self.endpoint_url}/a2a/agent.json"
-                    async with self._create_aiohttp_session() as session:
-                        async with session.get(endpoint, headers=headers) as response:
-                            if response.status == 200:
-                                data = await response.json(content_type=None)
-                                if isinstance(data, dict) and isinstance(data.get("capabilities"), dict):
-                                    return data.get("capabilities", {}).get("streaming", False)
-            except:
-                # Ignore errors in the async check
-                pass
-                
-            # Fall back to synchronous check
-            try:
-                # Add Accept header to prefer JSON
-                headers = dict(self.headers)
-                headers["Accept"] = "application/json"
+                    continue
                 
-                # Try the standard endpoint first
-                endpoint = f"{self.endpoint_url}/agent.json"
-                try:
-                    response = requests.get(endpoint, headers=headers, timeout=self.timeout)
-                    if response.status_code == 200:
-                        data = response.json()
-                        if isinstance(data, dict) and isinstance(data.get("capabilities"), dict):
-                            return data.get("capabilities", {}).get("streaming", False)
-                except:
-                    # Try alternate endpoint
-                    endpoint = f"{self.endpoint_url}/a2a/agent.json"
-                    response = requests.get(endpoint, headers=headers, timeout=self.timeout)
-                    if response.status_code == 200:
-                        data = response.json()
-                        if isinstance(data, dict) and isinstance(data.get("capabilities"), dict):
-                            return data.get("capabilities", {}).get("streaming", False)
-            except:
-                # Ignore errors in the synchronous check
-                pass
-        except Exception as e:
-            logger.warning(f"Error checking streaming support: {e}")
+                if isinstance(data, dict) and isinstance(data.get("capabilities"), dict):
+                    return bool(data["capabilities"].get("streaming", False))
+                return False
         
-        # Default to false if we couldn't determine streaming support
-        return False
+        return None
     
     def _create_aiohttp_session(self):
         """
-        Create an aiohttp session for async HTTP requests.
+        Use the client's shared aiohttp session for async HTTP requests.
         
         Returns:
-            An aiohttp session
+            An async context manager yielding the shared aiohttp session
         
         Raises:
             ImportError: If aiohttp is not installed
         """
-        try:
-            import aiohttp
-            return aiohttp.ClientSession(
-                headers=self.headers,
-                timeout=aiohttp.ClientTimeout(total=self.timeout)
-            )
-        except ImportError:
+        if not self._has_aiohttp():
             raise ImportError(
                 "aiohttp is required for streaming. "
                 "Install it with 'pip install aiohttp'."
             )
+        return self._session_manager.session()
     
     async def stream_response(
         self, 
@@ -1288,7 +2484,7 @@ class A2AClient(BaseA2AClient):
                         if self._use_google_a2a:
                             data = message.to_google_a2a()
                         else:
-                            data = message.to_dict()
+                            data = message.to_dict(WireFormat.PYTHON_A2A)
                             
                         # Make the request
                         response = await session.post(
@@ -1319,29 +2515,16 @@ class A2AClient(BaseA2AClient):
                 
                 # Process the streaming response
                 try:
-                    buffer = ""
+                    decoder = SSEDecoder()
                     
                     async for chunk in response.content.iter_chunks():
                         if not chunk:
                             continue
-                            
-                        # Decode chunk
-                        chunk_text = chunk[0].decode('utf-8')
-                        buffer += chunk_text
                         
-                        # Process complete events (separated by double newlines)
-                        while "\n\n" in buffer:
-                            event, buffer = buffer.split("\n\n", 1)
-                            
-                            # Extract data fields and event type from event
-                            event_type = "message"  # Default event type
-                            event_data = None
-                            
-                            for line in event.split("\n"):
-                                if line.startswith("event:"):
-                                    event_type = line[6:].strip()
-                                elif line.startswith("data:"):
-                                    event_data = line[5:].strip()
+                        # Process the events completed by this chunk
+                        for event in decoder.feed(chunk[0]):
+                            event_type = event.event
+                            event_data = event.data
                             
                             # Skip if no data
                             if not event_data:
@@ -1349,7 +2532,7 @@ class A2AClient(BaseA2AClient):
                                 
                             # Try to parse the data as JSON
                             try:
-                                data_obj = json.loads(event_data)
+                                data_obj = codec.loads(event_data)
                                 # Process with callback if provided
                                 if chunk_callback:
                                     chunk_callback(data_obj)
@@ -1539,29 +2722,16 @@ class A2AClient(BaseA2AClient):
                 
                 # Process the streaming response
                 try:
-                    buffer = ""
+                    decoder = SSEDecoder()
                     
                     async for chunk in response.content.iter_chunks():
                         if not chunk:
                             continue
-                            
-                        # Decode chunk
-                        chunk_text = chunk[0].decode('utf-8')
-                        buffer += chunk_text
                         
-                        # Process complete events (separated by double newlines)
-                        while "\n\n" in buffer:
-                            event, buffer = buffer.split("\n\n", 1)
-                            
-                            # Extract data fields and event type from event
-                            event_type = "update"  # Default event type
-                            event_data = None
-                            
-                            for line in event.split("\n"):
-                                if line.startswith("event:"):
-                                    event_type = line[6:].strip()
-                                elif line.startswith("data:"):
-                                    event_data = line[5:].strip()
+                        # Process the events completed by this chunk
+                        for event in decoder.feed(chunk[0]):
+                            event_type = event.event
+                            event_data = event.data
                             
                             # Skip if no data
                             if not event_data:
@@ -1569,7 +2739,7 @@ class A2AClient(BaseA2AClient):
                                 
                             # Try to parse the data as JSON
                             try:
-                                data_obj = json.loads(event_data)
+                                data_obj = codec.loads(event_data)
                                 # Process with callback if provided
                                 if chunk_callback:
                                     chunk_callback(data_obj)
@@ -0,0 +1,339 @@
+"""
+Circuit breaking and retry budgets for A2A clients.
+
+A client configured with a ``ResiliencePolicy`` tracks the health of each
+agent endpoint. After repeated failures the endpoint's circuit opens and
+calls fail immediately instead of waiting for timeouts; after a cool-down a
+few trial calls are let through to check whether the agent has recovered.
+Retries of failed calls use jittered exponential backoff and are limited by
+a retry budget, so that retries cannot multiply the load on a failing agent.
+"""
+
+import time
+import random
+import threading
+from collections import deque
+from enum import Enum
+from typing import Any, Dict, Optional
+
+
+class CircuitState(str, Enum):
+    """States of a circuit breaker"""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for a single endpoint.
+
+    The circuit is closed while calls succeed. ``failure_threshold``
+    consecutive failures open it, and requests are then rejected for
+    ``recovery_timeout`` seconds. After that the circuit is half-open: up to
+    ``half_open_max_calls`` trial calls are allowed, and the circuit closes
+    again if they succeed or re-opens on the first failure. A trial call that
+    ends without either outcome (e.g. it is cancelled) must give its slot
+    back with ``release_trial``.
+    """
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0,
+                 half_open_max_calls: int = 1):
+        """
+        Initialize a circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            recovery_timeout: Seconds the circuit stays open before trial calls
+            half_open_max_calls: Number of concurrent trial calls when half-open
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._trial_calls = 0
+        self._lock = threading.Lock()
+
+        # Metrics
+        self.successes = 0
+        self.failures = 0
+        self.rejected = 0
+        self.times_opened = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """The current state of the circuit"""
+        with self._lock:
+            return self._current_state(time.monotonic())
+
+    def _current_state(self, now: float) -> CircuitState:
+        if self._state == CircuitState.OPEN and now - self._opened_at >= self.recovery_timeout:
+            self._state = CircuitState.HALF_OPEN
+            self._trial_calls = 0
+        return self._state
+
+    def allow_request(self) -> bool:
+        """
+        Check whether a call may be made, reserving a trial call if half-open.
+
+        Returns:
+            True if the call may proceed, False if it should fail fast
+        """
+        with self._lock:
+            state = self._current_state(time.monotonic())
+            if state == CircuitState.CLOSED:
+                return True
+            if state == CircuitState.HALF_OPEN and self._trial_calls < self.half_open_max_calls:
+                self._trial_calls += 1
+                return True
+            self.rejected += 1
+            return False
+
+    def release_trial(self) -> None:
+        """Give back a trial call reserved by ``allow_request`` that recorded no outcome"""
+        with self._lock:
+            if self._state == CircuitState.HALF_OPEN and self._trial_calls > 0:
+                self._trial_calls -= 1
+
+    def record_success(self) -> None:
+        """Record a successful call"""
+        with self._lock:
+            self.successes += 1
+            self._consecutive_failures = 0
+            if self._state != CircuitState.CLOSED:
+                self._state = CircuitState.CLOSED
+                self._trial_calls = 0
+
+    def record_failure(self) -> None:
+        """Record a failed call"""
+        with self._lock:
+            self.failures += 1
+            self._consecutive_failures += 1
+            state = self._current_state(time.monotonic())
+            if state == CircuitState.HALF_OPEN or (
+                state == CircuitState.CLOSED and self._consecutive_failures >= self.failure_threshold
+            ):
+                self._state = CircuitState.OPEN
+                self._opened_at = time.monotonic()
+                self.times_opened += 1
+
+    def retry_after(self) -> float:
+        """
+        Get the time until trial calls are allowed.
+
+        Returns:
+            Seconds until the circuit becomes half-open (0 if it is not open)
+        """
+        with self._lock:
+            if self._current_state(time.monotonic()) != CircuitState.OPEN:
+                return 0.0
+            return max(0.0, self._opened_at + self.recovery_timeout - time.monotonic())
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Get the breaker metrics.
+
+        Returns:
+            Dictionary with the state and call counters
+        """
+        with self._lock:
+            return {
+                "state": self._current_state(time.monotonic()).value,
+                "consecutive_failures": self._consecutive_failures,
+                "successes": self.successes,
+                "failures": self.failures,
+                "rejected": self.rejected,
+                "times_opened": self.times_opened,
+            }
+
+
+class RetryBudget:
+    """
+    Limits retries to a fraction of recent calls.
+
+    Over a sliding window of ``window`` seconds, retries are allowed while
+    they stay below ``min_retries`` plus ``ratio`` times the number of calls.
+    This keeps retries cheap when failures are rare and bounds the extra
+    load when an agent is failing for everyone.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_retries: int = 3, window: float = 10.0):
+        """
+        Initialize a retry budget.
+
+        Args:
+            ratio: Allowed retries per call over the window
+            min_retries: Retries always allowed within the window
+            window: Length of the sliding window in seconds
+        """
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window = window
+
+        self._calls: deque = deque()
+        self._retries: deque = deque()
+        self._lock = threading.Lock()
+        self.exhausted = 0
+
+    def _trim(self, now: float) -> None:
+        cutoff = now - self.window
+        while self._calls and self._calls[0] <= cutoff:
+            self._calls.popleft()
+        while self._retries and self._retries[0] <= cutoff:
+            self._retries.popleft()
+
+    def record_call(self) -> None:
+        """Record a first attempt of a call"""
+        now = time.monotonic()
+        with self._lock:
+            self._trim(now)
+            self._calls.append(now)
+
+    def try_acquire_retry(self) -> bool:
+        """
+        Reserve a retry from the budget.
+
+        Returns:
+            True if the retry may be made
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._trim(now)
+            if len(self._retries) < self.min_retries + self.ratio * len(self._calls):
+                self._retries.append(now)
+                return True
+            self.exhausted += 1
+            return False
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Get the budget metrics.
+
+        Returns:
+            Dictionary with the calls and retries in the current window
+        """
+        with self._lock:
+            self._trim(time.monotonic())
+            return {
+                "calls": len(self._calls),
+                "retries": len(self._retries),
+                "exhausted": self.exhausted,
+            }
+
+
+def backoff_delay(attempt: int, base: float = 0.1, cap: float = 2.0) -> float:
+    """
+    Compute a jittered exponential backoff delay ("full jitter").
+
+    Args:
+        attempt: The retry number, starting at 1
+        base: Delay scale in seconds
+        cap: Maximum delay in seconds
+
+    Returns:
+        A random delay between 0 and ``min(cap, base * 2 ** (attempt - 1))``
+    """
+    return random.uniform(0, min(cap, base * (2 ** (attempt - 1))))
+
+
+class ResiliencePolicy:
+    """
+    Per-endpoint circuit breakers plus a shared retry budget.
+
+    A policy can be shared by several clients; breakers are keyed by the
+    agent base URL, so all clients talking to one agent see its health.
+
+    Example:
+        >>> policy = ResiliencePolicy(failure_threshold=3, recovery_timeout=10)
+        >>> client = A2AClient("http://localhost:5000", resilience=policy)  # doctest: +SKIP
+        >>> policy.metrics()  # doctest: +SKIP
+    """
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0,
+                 half_open_max_calls: int = 1, max_retries: int = 2,
+                 backoff_base: float = 0.1, backoff_cap: float = 2.0,
+                 retry_budget: Optional[RetryBudget] = None):
+        """
+        Initialize a resilience policy.
+
+        Args:
+            failure_threshold: Consecutive failures that open an endpoint's circuit
+            recovery_timeout: Seconds a circuit stays open before trial calls
+            half_open_max_calls: Number of concurrent trial calls when half-open
+            max_retries: Maximum retries of a failed call
+            backoff_base: Backoff delay scale in seconds
+            backoff_cap: Maximum backoff delay in seconds
+            retry_budget: Optional retry budget (defaults to a ``RetryBudget()``)
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.retry_budget = retry_budget or RetryBudget()
+
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def breaker(self, endpoint: str) -> CircuitBreaker:
+        """
+        Get the circuit breaker of an endpoint.
+
+        Args:
+            endpoint: The agent base URL
+
+        Returns:
+            The endpoint's circuit breaker
+        """
+        endpoint = endpoint.rstrip("/")
+        with self._lock:
+            breaker = self._breakers.get(endpoint)
+            if breaker is None:
+                breaker = self._breakers[endpoint] = CircuitBreaker(
+                    failure_threshold=self.failure_threshold,
+                    recovery_timeout=self.recovery_timeout,
+                    half_open_max_calls=self.half_open_max_calls
+                )
+            return breaker
+
+    def should_retry(self, attempt: int) -> bool:
+        """
+        Check whether a failed call should be retried.
+
+        Args:
+            attempt: The retry number, starting at 1
+
+        Returns:
+            True if the retry is within the retry limit and budget
+        """
+        return attempt <= self.max_retries and self.retry_budget.try_acquire_retry()
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Get the delay before a retry.
+
+        Args:
+            attempt: The retry number, starting at 1
+
+        Returns:
+            The delay in seconds
+        """
+        return backoff_delay(attempt, self.backoff_base, self.backoff_cap)
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Get metrics for all endpoints.
+
+        Returns:
+            Dictionary with per-endpoint breaker metrics and the retry budget
+        """
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {
+            "endpoints": {url: breaker.metrics() for url, breaker in breakers.items()},
+            "retry_budget": self.retry_budget.metrics(),
+        }
@@ -0,0 +1,351 @@
+"""
+Connection pooling for HTTP-based A2A clients.
+
+Provides shared, keep-alive connection pools so that clients talking to the
+same agent host reuse TCP (and TLS) connections instead of opening a new one
+for every request, and a long-lived aiohttp session for async requests.
+"""
+
+import asyncio
+import threading
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional, Set, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .. import codec
+
+logger = logging.getLogger(__name__)
+
+
+class SharedConnectionPool:
+    """
+    Registry of keep-alive connection pools shared between clients.
+
+    One ``HTTPAdapter`` (and therefore one urllib3 connection pool) is kept
+    per agent host. Each client gets its own ``requests.Session`` so that
+    cookies and other session state are never shared, but the session mounts
+    the shared adapter for its host, so connections are reused across all
+    clients targeting that host.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 20,
+        pool_block: bool = False,
+        max_retries: int = 0
+    ):
+        """
+        Initialize a shared connection pool.
+
+        Args:
+            pool_connections: Number of per-host pools to cache in each adapter
+            pool_maxsize: Maximum number of keep-alive connections kept per host
+            pool_block: Whether to block when all connections for a host are in
+                use instead of opening extra, non-pooled connections
+            max_retries: Number of low-level connection retries
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.max_retries = max_retries
+
+        self._adapters: Dict[Tuple[str, str], HTTPAdapter] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _host_key(url: str) -> Tuple[str, str]:
+        """Get the (scheme, host) key for a URL"""
+        parts = urlsplit(url)
+        return (parts.scheme or "http").lower(), parts.netloc.lower()
+
+    def get_adapter(self, url: str) -> HTTPAdapter:
+        """
+        Get the shared adapter for the host of a URL, creating it if needed.
+
+        Args:
+            url: Any URL on the target host
+
+        Returns:
+            The adapter holding the host's connection pool
+        """
+        key = self._host_key(url)
+        with self._lock:
+            adapter = self._adapters.get(key)
+            if adapter is None:
+                adapter = HTTPAdapter(
+                    pool_connections=self.pool_connections,
+                    pool_maxsize=self.pool_maxsize,
+                    pool_block=self.pool_block,
+                    max_retries=self.max_retries
+                )
+                self._adapters[key] = adapter
+                logger.debug(f"Created connection pool for {key[0]}://{key[1]}")
+            return adapter
+
+    def create_session(self, url: str) -> requests.Session:
+        """
+        Create a session that uses the shared connection pool for a URL's host.
+
+        Args:
+            url: Any URL on the target host
+
+        Returns:
+            A new session with the shared adapter mounted for the host
+        """
+        scheme, netloc = self._host_key(url)
+        session = requests.Session()
+        session.mount(f"{scheme}://{netloc}", self.get_adapter(url))
+        return session
+
+    @classmethod
+    def release_session(cls, session: requests.Session) -> None:
+        """
+        Close a session created by ``create_session`` without closing the
+        shared connection pools mounted on it.
+
+        Args:
+            session: The session to close
+        """
+        for prefix in list(session.adapters):
+            if prefix not in ("https://", "http://"):
+                session.adapters.pop(prefix)
+        session.close()
+
+    def close(self) -> None:
+        """Close all shared connection pools"""
+        with self._lock:
+            adapters = list(self._adapters.values())
+            self._adapters.clear()
+        for adapter in adapters:
+            adapter.close()
+
+    def __len__(self) -> int:
+        return len(self._adapters)
+
+
+_default_pool: Optional[SharedConnectionPool] = None
+_default_pool_lock = threading.Lock()
+
+
+def get_default_pool() -> SharedConnectionPool:
+    """
+    Get the process-wide connection pool used by clients by default.
+
+    Returns:
+        The default shared connection pool
+    """
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = SharedConnectionPool()
+        return _default_pool
+
+
+def set_default_pool(pool: SharedConnectionPool) -> None:
+    """
+    Replace the process-wide connection pool used by clients by default.
+
+    Clients that were already created keep using the pool they were created
+    with.
+
+    Args:
+        pool: The new default connection pool
+    """
+    global _default_pool
+    with _default_pool_lock:
+        _default_pool = pool
+
+
+class AsyncSessionManager:
+    """
+    Long-lived, reference-counted aiohttp session for async requests.
+    
+    The session and its connector (connection pool and DNS cache) are created
+    on first use and reused by every request and stream until ``aclose`` is
+    called. Each request holds a reference to the session while it runs, so
+    closing the manager while streams are still open defers the actual close
+    until the last of them finishes. The manager can be used again after
+    ``aclose``; a new session is created on the next request.
+    
+    aiohttp sessions are bound to an event loop, so a new session is created
+    when the manager is used from a different loop, and the idle session of
+    the previous loop is closed (e.g. between ``asyncio.run`` calls).
+    """
+    
+    def __init__(
+        self,
+        timeout: Optional[float] = 30,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        ttl_dns_cache: Optional[int] = 300,
+        keepalive_timeout: float = 15.0
+    ):
+        """
+        Initialize an async session manager.
+        
+        Args:
+            timeout: Total timeout for each request in seconds (None for no timeout)
+            limit: Maximum number of simultaneous connections (0 for no limit)
+            limit_per_host: Maximum number of simultaneous connections to one
+                host (0 for no limit)
+            ttl_dns_cache: Seconds to cache DNS lookups (None to cache forever)
+            keepalive_timeout: Seconds to keep idle connections open
+        """
+        self.timeout = timeout
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.ttl_dns_cache = ttl_dns_cache
+        self.keepalive_timeout = keepalive_timeout
+        
+        self._session = None
+        self._loop = None
+        self._closing = False
+        self._refs: Dict[Any, int] = {}
+        self._lock = threading.Lock()
+        # Closes of previous loops' sessions, referenced until they finish
+        self._stale_closes: Set[asyncio.Task] = set()
+    
+    def _new_session(self):
+        """Create an aiohttp session with a connector using the configured limits"""
+        import aiohttp
+        
+        connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            ttl_dns_cache=self.ttl_dns_cache,
+            keepalive_timeout=self.keepalive_timeout
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            json_serialize=codec.dumps_str
+        )
+    
+    def acquire(self):
+        """
+        Get the shared session and take a reference to it.
+        
+        Must be called from a running event loop. Every call must be matched
+        by a call to ``release``.
+        
+        Returns:
+            The shared aiohttp session
+            
+        Raises:
+            ImportError: If aiohttp is not installed
+        """
+        loop = asyncio.get_running_loop()
+        stale = None
+        with self._lock:
+            session = self._session
+            if session is None or session.closed or self._loop is not loop:
+                if session is not None and not session.closed and session not in self._refs:
+                    # Sessions still in use are closed by their last release
+                    stale = (session, self._loop)
+                session = self._new_session()
+                self._session = session
+                self._loop = loop
+                logger.debug("Created shared aiohttp session")
+            self._closing = False
+            self._refs[session] = self._refs.get(session, 0) + 1
+        if stale is not None:
+            self._close_stale(*stale)
+        return session
+    
+    def _close_stale(self, session, loop) -> None:
+        """Close the idle session of another event loop"""
+        if loop is not None and loop.is_running():
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+            return
+        # The session's loop has stopped (e.g. at the end of asyncio.run);
+        # closing it there is impossible, but closing the session and its
+        # connector does not need that loop
+        task = asyncio.get_running_loop().create_task(self._close_quietly(session))
+        self._stale_closes.add(task)
+        task.add_done_callback(self._stale_closes.discard)
+    
+    @staticmethod
+    async def _close_quietly(session) -> None:
+        try:
+            await session.close()
+        except Exception:
+            logger.debug("Failed to close the aiohttp session of a stopped event loop", exc_info=True)
+    
+    async def release(self, session) -> None:
+        """
+        Release a reference taken with ``acquire``.
+        
+        Closes the session if it is no longer the current one, or if
+        ``aclose`` was called while it was in use, and this was the last
+        reference.
+        
+        Args:
+            session: The session returned by ``acquire``
+        """
+        with self._lock:
+            count = self._refs.get(session, 0) - 1
+            if count > 0:
+                self._refs[session] = count
+                return
+            self._refs.pop(session, None)
+            
+            should_close = session is not self._session or self._closing
+            if should_close and session is self._session:
+                self._session = None
+                self._loop = None
+                self._closing = False
+        
+        if should_close and not session.closed:
+            await session.close()
+    
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[Any]:
+        """
+        Use the shared session for the duration of an ``async with`` block.
+        
+        Yields:
+            The shared aiohttp session
+        """
+        session = self.acquire()
+        try:
+            yield session
+        finally:
+            await self.release(session)
+    
+    @property
+    def active_references(self) -> int:
+        """Number of requests currently using the shared session"""
+        with self._lock:
+            return self._refs.get(self._session, 0) if self._session is not None else 0
+    
+    async def aclose(self) -> None:
+        """
+        Close the shared session.
+        
+        If requests are still using the session, it is closed when the last
+        of them releases it.
+        """
+        with self._lock:
+            session = self._session
+            if session is None:
+                return
+            busy = self._refs.get(session, 0) > 0
+            if busy:
+                self._closing = True
+            else:
+                self._session = None
+                self._loop = None
+        
+        if not busy and not session.closed:
+            await session.close()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
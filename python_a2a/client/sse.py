@@ -0,0 +1,191 @@
+"""
+Incremental decoder for server-sent events (SSE) streams.
+
+Decodes ``text/event-stream`` bodies chunk by chunk, following the
+WHATWG event stream format. Only the trailing, incomplete line of the
+stream is ever buffered, so decoding cost stays linear in the size of the
+stream regardless of how it is split into chunks.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import AsyncIterable, AsyncGenerator, List, Optional
+
+# A line ends with CRLF, a lone CR or a lone LF
+_LINE_END = re.compile(rb"\r\n|\r|\n")
+
+
+@dataclass
+class SSEEvent:
+    """
+    A single server-sent event.
+
+    Attributes:
+        event: The event type ("message" if the stream did not set one)
+        data: The event data, with multiple data lines joined by newlines
+        id: The last event ID seen on the stream, if any
+        retry: The reconnection time in milliseconds, if the stream set one
+    """
+    event: str = "message"
+    data: str = ""
+    id: Optional[str] = None
+    retry: Optional[int] = None
+
+
+class SSEDecoder:
+    """
+    Incremental, byte-oriented decoder for server-sent events.
+
+    Feed raw response bytes with ``feed`` and get back the events completed
+    by each chunk. Lines are split on bytes before being decoded, so UTF-8
+    characters split across chunk boundaries are decoded correctly.
+
+    Example:
+        >>> decoder = SSEDecoder()
+        >>> decoder.feed(b"event: update\\ndata: {\\"a\\"")
+        []
+        >>> decoder.feed(b": 1}\\n\\n")
+        [SSEEvent(event='update', data='{"a": 1}', id=None, retry=None)]
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._skip_lf = False
+        self._started = False
+
+        self._event_type = ""
+        self._data: List[str] = []
+        self._last_event_id: Optional[str] = None
+        self._retry: Optional[int] = None
+
+    @property
+    def last_event_id(self) -> Optional[str]:
+        """The last event ID seen on the stream"""
+        return self._last_event_id
+
+    def feed(self, chunk: bytes) -> List[SSEEvent]:
+        """
+        Decode a chunk of the stream.
+
+        Args:
+            chunk: Raw bytes received from the stream
+
+        Returns:
+            The events completed by this chunk, in stream order
+        """
+        if not chunk:
+            return []
+
+        buffer = self._buffer
+        scan_from = len(buffer)
+        buffer += chunk
+
+        if not self._started:
+            # Strip a UTF-8 byte order mark at the start of the stream
+            if len(buffer) < 3 and b"\xef\xbb\xbf".startswith(bytes(buffer)):
+                return []
+            if buffer.startswith(b"\xef\xbb\xbf"):
+                del buffer[:3]
+                scan_from = 0
+            self._started = True
+
+        if self._skip_lf:
+            # The previous chunk ended with CR, so a leading LF belongs to it
+            self._skip_lf = False
+            if buffer[:1] == b"\n":
+                del buffer[:1]
+                scan_from = 0
+
+        events = []
+        line_start = 0
+        for match in _LINE_END.finditer(buffer, scan_from):
+            line = buffer[line_start:match.start()].decode("utf-8", errors="replace")
+            line_start = match.end()
+            if match.end() == len(buffer) and match.group() == b"\r":
+                self._skip_lf = True
+
+            event = self._process_line(line)
+            if event is not None:
+                events.append(event)
+
+        if line_start:
+            del buffer[:line_start]
+
+        return events
+
+    def flush(self) -> List[SSEEvent]:
+        """
+        Signal the end of the stream.
+
+        An event that was not terminated by a blank line is discarded, as
+        required by the event stream format.
+
+        Returns:
+            Always an empty list; kept for symmetry with ``feed``
+        """
+        self._buffer.clear()
+        self._skip_lf = False
+        self._event_type = ""
+        self._data = []
+        return []
+
+    def _process_line(self, line: str) -> Optional[SSEEvent]:
+        """Process one line of the stream, returning an event if it completes one"""
+        if not line:
+            return self._dispatch()
+
+        if line.startswith(":"):
+            # Comment line
+            return None
+
+        field, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+
+        if field == "data":
+            self._data.append(value)
+        elif field == "event":
+            self._event_type = value
+        elif field == "id":
+            if "\0" not in value:
+                self._last_event_id = value
+        elif field == "retry":
+            if value.isdigit():
+                self._retry = int(value)
+
+        return None
+
+    def _dispatch(self) -> Optional[SSEEvent]:
+        """Complete the current event on a blank line"""
+        if not self._data:
+            # Nothing to dispatch, just reset the event type
+            self._event_type = ""
+            return None
+
+        event = SSEEvent(
+            event=self._event_type or "message",
+            data="\n".join(self._data),
+            id=self._last_event_id,
+            retry=self._retry
+        )
+        self._event_type = ""
+        self._data = []
+        return event
+
+
+async def iter_sse_events(chunks: AsyncIterable[bytes]) -> AsyncGenerator[SSEEvent, None]:
+    """
+    Decode server-sent events from an async iterable of byte chunks.
+
+    Args:
+        chunks: The raw stream, e.g. ``response.content.iter_any()`` of an
+            aiohttp response
+
+    Yields:
+        Decoded events, as soon as each one is complete
+    """
+    decoder = SSEDecoder()
+    async for chunk in chunks:
+        for event in decoder.feed(chunk):
+            yield event
+    decoder.flush()
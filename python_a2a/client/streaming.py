@@ -10,10 +10,13 @@ import asyncio
 import json
 import time
 import re
+import traceback
 from typing import Dict, List, Any, Optional, Union, AsyncGenerator, Callable, Tuple
 
 from .base import BaseA2AClient
 from .http import A2AClient
+from .sessions import AsyncSessionManager
+from .sse import SSEDecoder
 from ..models import Message, TextContent, MessageRole
 from ..models import Task, TaskStatus, TaskState
 from ..models import Conversation
@@ -102,7 +105,8 @@ class StreamingClient(BaseA2AClient):
         self, 
         url: str, 
         headers: Optional[Dict[str, str]] = None,
-        timeout: int = 30
+        timeout: int = 30,
+        session_manager: Optional[AsyncSessionManager] = None
     ):
         """
         Initialize a streaming client.
@@ -111,6 +115,9 @@ class StreamingClient(BaseA2AClient):
             url: Base URL of the A2A agent
             headers: Optional HTTP headers to include in requests
             timeout: Request timeout in seconds
+            session_manager: Optional manager of the long-lived aiohttp session
+                used for all requests (defaults to one owned by the client);
+                pass one to configure connector limits or share connections
         """
         self.url = url.rstrip('/')
         self.headers = headers or {}
@@ -134,6 +141,11 @@ class StreamingClient(BaseA2AClient):
         # Flag for checking if the agent supports streaming
         self._supports_streaming = None
         
+        # Long-lived aiohttp session shared by all requests and streams
+        if session_manager is None:
+            session_manager = AsyncSessionManager(timeout=self.timeout)
+        self._session_manager = session_manager
+        
     async def check_streaming_support(self) -> bool:
         """
         Check if the agent supports streaming.
@@ -157,7 +169,8 @@ class StreamingClient(BaseA2AClient):
             # Try to load agent card
             async with self._create_session() as session:
                 # Create headers specifically for JSON content negotiation
-                json_headers = {"Accept": "application/json"}
+                json_headers = dict(self.headers)
+                json_headers["Accept"] = "application/json"
                 
                 # First attempt with primary endpoint
                 async with session.get(
@@ -223,18 +236,35 @@ class StreamingClient(BaseA2AClient):
         return self._supports_streaming
     
     def _create_session(self):
-        """Create an aiohttp session."""
+        """
+        Use the client's long-lived aiohttp session.
+        
+        Returns:
+            An async context manager yielding the shared aiohttp session
+        """
         if not self._has_aiohttp:
             raise ImportError(
                 "aiohttp is required for streaming. "
                 "Install it with 'pip install aiohttp'."
             )
         
-        import aiohttp
-        return aiohttp.ClientSession(
-            headers=self.headers,
-            timeout=aiohttp.ClientTimeout(total=self.timeout)
-        )
+        return self._session_manager.session()
+    
+    async def aclose(self) -> None:
+        """
+        Close the aiohttp session used by this client.
+        
+        Streams that are still open keep the session alive until they finish.
+        The client can still be used afterwards; a new session is created on
+        the next request.
+        """
+        await self._session_manager.aclose()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
     
     def send_message(self, message: Message) -> Message:
         """
@@ -338,7 +368,8 @@ class StreamingClient(BaseA2AClient):
             async with self._create_session() as session:
                 async with session.post(
                     self.url,
-                    json=message.to_dict()
+                    json=message.to_dict(),
+                    headers=self.headers
                 ) as response:
                     # Handle HTTP errors
                     if response.status >= 400:
@@ -553,7 +584,8 @@ class StreamingClient(BaseA2AClient):
                             "id": 1,
                             "method": "tasks/send",
                             "params": task.to_dict()
-                        }
+                        },
+                        headers=self.headers
                     ) as response:
                         # Handle HTTP errors
                         if response.status >= 400:
@@ -574,7 +606,8 @@ class StreamingClient(BaseA2AClient):
                             "id": 1,
                             "method": "tasks/send",
                             "params": task.to_dict()
-                        }
+                        },
+                        headers=self.headers
                     ) as response:
                         # Handle HTTP errors
                         if response.status >= 400:
@@ -1155,8 +1188,7 @@ class StreamingClient(BaseA2AClient):
     async def _process_stream(self, response, chunk_callback=None):
         """Process a streaming response using enhanced parsing."""
         try:
-            buffer = ""
-            last_event_type = None
+            decoder = SSEDecoder()
             chunks_received = 0
             bytes_received = 0
             
@@ -1172,59 +1204,18 @@ class StreamingClient(BaseA2AClient):
                 chunks_received += 1
                 bytes_received += len(chunk[0])
                 
-                # Decode chunk
-                chunk_text = chunk[0].decode('utf-8')
-                buffer += chunk_text
-                
                 # Debug every 10 chunks
                 if chunks_received % 10 == 0:
                     logger.debug(f"Processed {chunks_received} chunks, {bytes_received} bytes")
                     
                 # Detailed debug for first few chunks
                 if chunks_received <= 3:
-                    logger.debug(f"Raw chunk {chunks_received}: {chunk_text}")
+                    logger.debug(f"Raw chunk {chunks_received}: {chunk[0][:200]!r}")
                 
-                # Process complete events (separated by double newlines)
-                while "\n\n" in buffer:
-                    event, buffer = buffer.split("\n\n", 1)
-                    
-                    # Skip comments (lines starting with colon)
-                    if event.startswith(':'):
-                        logger.debug(f"Skipping SSE comment: {event}")
-                        continue
-                    
-                    # Extract fields from the event
-                    event_type = None
-                    event_data = None
-                    event_id = None
-                    retry_time = None
-                    
-                    for line in event.split("\n"):
-                        line = line.strip()
-                        if not line:
-                            continue
-                            
-                        if line.startswith("event:"):
-                            event_type = line[6:].strip()
-                            logger.debug(f"Found event type: {event_type}")
-                        elif line.startswith("data:"):
-                            event_data = line[5:].strip()
-                            logger.debug(f"Found event data: {event_data[:50]}...")
-                        elif line.startswith("id:"):
-                            event_id = line[3:].strip()
-                            logger.debug(f"Found event ID: {event_id}")
-                        elif line.startswith("retry:"):
-                            try:
-                                retry_time = int(line[6:].strip())
-                                logger.debug(f"Found retry time: {retry_time}")
-                            except ValueError:
-                                pass
-                    
-                    # Default to "message" event type if none provided
-                    if not event_type:
-                        event_type = last_event_type or "message"
-                    
-                    last_event_type = event_type
+                # Process the events completed by this chunk
+                for event in decoder.feed(chunk[0]):
+                    event_type = event.event
+                    event_data = event.data
                     
                     # Handle connected event
                     if event_type == "connected":
@@ -0,0 +1,232 @@
+"""
+JSON codecs for the A2A protocol.
+
+Every request and response of the A2A client and servers is JSON, and
+message-heavy workloads spend much of their time encoding and decoding it.
+This module picks the fastest available JSON library: ``orjson`` or
+``msgspec`` when installed, falling back to the standard library ``json``
+module. Set the ``PYTHON_A2A_JSON_CODEC`` environment variable ("orjson",
+"msgspec" or "json") or call ``set_codec`` to choose one explicitly.
+
+Example:
+    >>> from python_a2a import codec
+    >>> codec.loads(codec.dumps({"role": "user"}))
+    {'role': 'user'}
+"""
+
+import os
+import json
+import logging
+from typing import Any, Callable, Dict, List, Optional, Type, Union
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+# Environment variable selecting the codec
+CODEC_ENV_VAR = "PYTHON_A2A_JSON_CODEC"
+
+
+class JSONCodec:
+    """
+    Standard library JSON codec; the base class of the other codecs.
+
+    Codecs encode to UTF-8 bytes and decode from bytes or str. Decoding errors
+    are raised as ``json.JSONDecodeError`` (a ``ValueError``) whatever the
+    library.
+    """
+
+    name = "json"
+
+    def dumps(self, obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+        """
+        Encode an object to JSON.
+
+        Args:
+            obj: The object to encode
+            default: Optional function converting objects the codec cannot encode
+
+        Returns:
+            The JSON document as UTF-8 bytes
+        """
+        return self.dumps_str(obj, default).encode("utf-8")
+
+    def dumps_str(self, obj: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+        """
+        Encode an object to a JSON string.
+
+        Args:
+            obj: The object to encode
+            default: Optional function converting objects the codec cannot encode
+
+        Returns:
+            The JSON document
+        """
+        return json.dumps(obj, default=default)
+
+    def loads(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        """
+        Decode a JSON document.
+
+        Args:
+            data: The JSON document
+
+        Returns:
+            The decoded object
+
+        Raises:
+            json.JSONDecodeError: If the document is not valid JSON
+        """
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """Codec using orjson"""
+
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("orjson is not installed. Install it with 'pip install orjson'")
+
+    def dumps(self, obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+        try:
+            return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # Integers beyond 64 bits and the like: let the standard library
+            # encode them or raise its usual error
+            return json.dumps(obj, default=default).encode("utf-8")
+
+    def dumps_str(self, obj: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+        return self.dumps(obj, default).decode("utf-8")
+
+    def loads(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(data)
+
+
+class MsgspecCodec(JSONCodec):
+    """Codec using msgspec"""
+
+    name = "msgspec"
+
+    def __init__(self):
+        if msgspec is None:
+            raise ImportError("msgspec is not installed. Install it with 'pip install msgspec'")
+        self._decoder = msgspec.json.Decoder()
+        self._encoder = msgspec.json.Encoder()
+
+    def dumps(self, obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+        try:
+            if default is None:
+                return self._encoder.encode(obj)
+            return msgspec.json.encode(obj, enc_hook=default)
+        except (TypeError, msgspec.EncodeError):
+            return json.dumps(obj, default=default).encode("utf-8")
+
+    def dumps_str(self, obj: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+        return self.dumps(obj, default).decode("utf-8")
+
+    def loads(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except msgspec.DecodeError as e:
+            doc = data if isinstance(data, str) else bytes(data).decode("utf-8", "replace")
+            raise json.JSONDecodeError(str(e), doc, 0) from None
+
+
+# Codecs by name, fastest first
+CODECS: Dict[str, Type[JSONCodec]] = {
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+    "json": JSONCodec,
+}
+
+
+def available_codecs() -> List[str]:
+    """
+    Get the names of the codecs whose library is installed.
+
+    Returns:
+        Codec names, fastest first
+    """
+    names = []
+    if orjson is not None:
+        names.append("orjson")
+    if msgspec is not None:
+        names.append("msgspec")
+    names.append("json")
+    return names
+
+
+def _default_codec() -> JSONCodec:
+    name = os.environ.get(CODEC_ENV_VAR)
+    if name:
+        try:
+            return CODECS[name]()
+        except (KeyError, ImportError) as e:
+            logger.warning("Cannot use JSON codec %r from %s (%s); using the fastest available",
+                           name, CODEC_ENV_VAR, e)
+    return CODECS[available_codecs()[0]]()
+
+
+_codec: JSONCodec = _default_codec()
+
+
+def get_codec() -> JSONCodec:
+    """
+    Get the codec in use.
+
+    Returns:
+        The current codec
+    """
+    return _codec
+
+
+def set_codec(codec: Union[str, JSONCodec, None] = None) -> JSONCodec:
+    """
+    Choose the codec used by the A2A client, servers and models.
+
+    Args:
+        codec: A codec name ("orjson", "msgspec" or "json"), a codec instance,
+            or None for the fastest available codec
+
+    Returns:
+        The codec now in use
+
+    Raises:
+        ValueError: If the codec name is unknown
+        ImportError: If the codec's library is not installed
+    """
+    global _codec
+    if codec is None:
+        codec = available_codecs()[0]
+    if isinstance(codec, str):
+        if codec not in CODECS:
+            raise ValueError(f"Unknown JSON codec: {codec!r} (choose from {', '.join(CODECS)})")
+        codec = CODECS[codec]()
+    _codec = codec
+    return _codec
+
+
+def dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """Encode an object to JSON bytes with the current codec"""
+    return _codec.dumps(obj, default)
+
+
+def dumps_str(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """Encode an object to a JSON string with the current codec"""
+    return _codec.dumps_str(obj, default)
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """Decode a JSON document with the current codec"""
+    return _codec.loads(data)
@@ -0,0 +1,302 @@
+"""
+HTTP content compression for the A2A protocol.
+
+Large task artifacts make A2A responses (and some requests) big, and agents
+often talk across regions. This module negotiates and applies the
+``Content-Encoding`` of bodies: ``gzip`` always, ``br`` when ``brotli`` is
+installed and ``zstd`` when ``zstandard`` is installed. Bodies smaller than
+a threshold are sent as is, since compressing them saves little.
+
+Example:
+    >>> from python_a2a import compression
+    >>> compression.choose_encoding("gzip;q=0.5, identity")
+    'gzip'
+    >>> body = compression.compress(b"a" * 2048, "gzip")
+    >>> compression.decompress(body, "gzip") == b"a" * 2048
+    True
+"""
+
+import zlib
+from typing import Dict, List, Optional, Union
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Bodies smaller than this many bytes are not compressed
+DEFAULT_MIN_SIZE = 1024
+
+# Maximum size of a decompressed body, guarding against decompression bombs
+DEFAULT_MAX_DECOMPRESSED_SIZE = 64 * 1024 * 1024
+
+# Compression levels favouring speed, as bodies are compressed per request
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 4
+ZSTD_LEVEL = 3
+
+# Chunk sizes used to decompress br and zstd bodies within the size limit
+BROTLI_OUTPUT_CHUNK = 64 * 1024
+BROTLI_INPUT_CHUNK = 256
+ZSTD_OUTPUT_CHUNK = 64 * 1024
+
+
+class DecompressionError(ValueError):
+    """Raised when a body cannot be decompressed"""
+    pass
+
+
+class UnsupportedEncodingError(DecompressionError):
+    """Raised when a body's content coding is not supported"""
+    pass
+
+
+def available_encodings() -> List[str]:
+    """
+    Get the content codings that can be used.
+
+    Returns:
+        Encoding names, preferred first
+    """
+    encodings = []
+    if zstandard is not None:
+        encodings.append("zstd")
+    if brotli is not None:
+        encodings.append("br")
+    encodings.append("gzip")
+    return encodings
+
+
+def accept_encoding() -> str:
+    """
+    Get an ``Accept-Encoding`` header value listing the available encodings.
+
+    Returns:
+        The header value
+    """
+    return ", ".join(available_encodings())
+
+
+def choose_encoding(accept_encoding_header: Optional[str]) -> Optional[str]:
+    """
+    Choose a response encoding from an ``Accept-Encoding`` header.
+
+    Among the encodings the client accepts with the highest quality, the
+    preferred available one is chosen.
+
+    Args:
+        accept_encoding_header: The request's ``Accept-Encoding`` header
+
+    Returns:
+        The encoding name, or None to send the body uncompressed
+    """
+    if not accept_encoding_header:
+        return None
+
+    qualities: Dict[str, float] = {}
+    for item in accept_encoding_header.split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if name:
+            qualities[name] = quality
+
+    best, best_quality = None, 0.0
+    for encoding in available_encodings():
+        quality = qualities.get(encoding, qualities.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    """
+    Compress a body.
+
+    Args:
+        data: The body
+        encoding: The content coding ("gzip", "br" or "zstd")
+
+    Returns:
+        The compressed body
+
+    Raises:
+        ValueError: If the encoding is not available
+    """
+    if encoding == "gzip":
+        compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+        return compressor.compress(data) + compressor.flush()
+    if encoding == "br" and brotli is not None:
+        return brotli.compress(data, quality=BROTLI_QUALITY)
+    if encoding == "zstd" and zstandard is not None:
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    raise ValueError(f"Unsupported content encoding: {encoding!r}")
+
+
+def _too_large(max_size: int) -> DecompressionError:
+    return DecompressionError(f"Decompressed body exceeds {max_size} bytes")
+
+
+def _decompress_brotli(data: bytes, max_size: int) -> bytes:
+    """Decompress a br body, stopping once it exceeds ``max_size`` bytes"""
+    decompressor = brotli.Decompressor()
+    output = []
+    size = 0
+    if hasattr(decompressor, "can_accept_more_data"):
+        # brotli 1.2+ bounds the output of each call
+        chunk = decompressor.process(data, output_buffer_limit=BROTLI_OUTPUT_CHUNK)
+        while chunk:
+            size += len(chunk)
+            if size > max_size:
+                raise _too_large(max_size)
+            output.append(chunk)
+            if decompressor.is_finished():
+                break
+            chunk = decompressor.process(b"", output_buffer_limit=BROTLI_OUTPUT_CHUNK)
+    else:
+        # Older versions: feed the input in small pieces, checking the size
+        # after each, so the overshoot is bounded by what one piece expands to
+        for start in range(0, len(data), BROTLI_INPUT_CHUNK):
+            chunk = decompressor.process(data[start:start + BROTLI_INPUT_CHUNK])
+            size += len(chunk)
+            if size > max_size:
+                raise _too_large(max_size)
+            output.append(chunk)
+    if not decompressor.is_finished():
+        raise DecompressionError("Truncated br body")
+    return b"".join(output)
+
+
+def _decompress_zstd(data: bytes, max_size: int) -> bytes:
+    """Decompress a zstd body, stopping once it exceeds ``max_size`` bytes"""
+    output = []
+    size = 0
+    with zstandard.ZstdDecompressor().stream_reader(data) as reader:
+        while True:
+            chunk = reader.read(ZSTD_OUTPUT_CHUNK)
+            if not chunk:
+                break
+            size += len(chunk)
+            if size > max_size:
+                raise _too_large(max_size)
+            output.append(chunk)
+    # Frames written in one go declare their size, which reveals truncation
+    expected = zstandard.frame_content_size(data)
+    if expected >= 0 and size != expected:
+        raise DecompressionError("Truncated zstd body")
+    return b"".join(output)
+
+
+def decompress(data: bytes, encoding: Optional[str],
+               max_size: int = DEFAULT_MAX_DECOMPRESSED_SIZE) -> bytes:
+    """
+    Decompress a body.
+
+    Args:
+        data: The compressed body
+        encoding: The ``Content-Encoding`` header value (None or "identity"
+            for an uncompressed body)
+        max_size: Maximum size of the decompressed body
+
+    Returns:
+        The decompressed body
+
+    Raises:
+        UnsupportedEncodingError: If the encoding is not supported
+        DecompressionError: If the body is corrupt or decompresses to more
+            than ``max_size`` bytes
+    """
+    encoding = (encoding or "identity").strip().lower()
+    try:
+        if encoding == "identity":
+            result = data
+        elif encoding in ("gzip", "x-gzip", "deflate"):
+            # wbits 47 accepts both gzip and zlib headers
+            decompressor = zlib.decompressobj(47)
+            result = decompressor.decompress(data, max_size + 1)
+            if len(result) > max_size:
+                raise _too_large(max_size)
+            # An empty body (e.g. of a 204 response) has nothing to decode
+            if data and not decompressor.eof:
+                raise DecompressionError(f"Truncated {encoding} body")
+        elif encoding == "br" and brotli is not None:
+            result = _decompress_brotli(data, max_size)
+        elif encoding == "zstd" and zstandard is not None:
+            result = _decompress_zstd(data, max_size)
+        else:
+            raise UnsupportedEncodingError(f"Unsupported content encoding: {encoding!r}")
+    except DecompressionError:
+        raise
+    except Exception as e:
+        raise DecompressionError(f"Invalid {encoding} body: {e}") from e
+    if len(result) > max_size:
+        raise _too_large(max_size)
+    return result
+
+
+class StreamCompressor:
+    """
+    Incremental compressor for streamed bodies.
+
+    Each chunk is flushed, so the client can decode it as soon as it arrives.
+    """
+
+    def __init__(self, encoding: str):
+        """
+        Initialize a stream compressor.
+
+        Args:
+            encoding: The content coding ("gzip", "br" or "zstd")
+
+        Raises:
+            ValueError: If the encoding is not available
+        """
+        self.encoding = encoding
+        if encoding == "gzip":
+            self._compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+        elif encoding == "br" and brotli is not None:
+            self._compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+        elif encoding == "zstd" and zstandard is not None:
+            self._compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compressobj()
+        else:
+            raise ValueError(f"Unsupported content encoding: {encoding!r}")
+
+    def compress(self, chunk: Union[bytes, str]) -> bytes:
+        """
+        Compress and flush a chunk.
+
+        Args:
+            chunk: The chunk (str chunks are UTF-8 encoded)
+
+        Returns:
+            The compressed chunk
+        """
+        if isinstance(chunk, str):
+            chunk = chunk.encode("utf-8")
+        if self.encoding == "gzip":
+            return self._compressor.compress(chunk) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+        if self.encoding == "br":
+            return self._compressor.process(chunk) + self._compressor.flush()
+        return self._compressor.compress(chunk) + self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        """
+        End the stream.
+
+        Returns:
+            The remaining compressed data
+        """
+        if self.encoding == "br":
+            return self._compressor.finish()
+        return self._compressor.flush()
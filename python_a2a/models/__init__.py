@@ -29,6 +29,8 @@ except ImportError:
 
 try:
     from .task import Task, TaskStatus, TaskState
+    from .converters import WireFormat, use_wire_format
+    from .lazy import LazyMessage
 except ImportError:
     # These may not be available yet
     pass
@@ -60,6 +62,6 @@ try:
     Task
     TaskStatus
     TaskState
-    __all__.extend(['Task', 'TaskStatus', 'TaskState'])
+    __all__.extend(['Task', 'TaskStatus', 'TaskState', 'WireFormat', 'use_wire_format', 'LazyMessage'])
 except NameError:
     pass
\ No newline at end of file
@@ -2,16 +2,52 @@
 Base models for the A2A protocol.
 """
 
-import json
 from typing import Dict, Any, TypeVar, Type, ClassVar, Optional
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, asdict, field, fields
+
+from .. import codec
 
 T = TypeVar('T', bound='BaseModel')
+C = TypeVar('C', bound=type)
+
+
+def slotted(cls: C) -> C:
+    """
+    Give a dataclass ``__slots__`` instead of a per-instance ``__dict__``
+    
+    Works like ``@dataclass(slots=True)`` (Python 3.10+) on every supported
+    Python version: instances store their fields in slots, which makes them
+    smaller and faster to create. Setting attributes that are not fields
+    raises ``AttributeError``. Apply it above ``@dataclass``; methods must
+    not use the zero-argument form of ``super()``.
+    
+    Args:
+        cls: The dataclass
+        
+    Returns:
+        An equivalent class with ``__slots__``
+    """
+    names = tuple(f.name for f in fields(cls))
+    namespace = dict(cls.__dict__)
+    for name in names:
+        # Defaults live in the generated __init__; class attributes of the
+        # same name would conflict with the slots
+        namespace.pop(name, None)
+    namespace.pop('__dict__', None)
+    namespace.pop('__weakref__', None)
+    namespace['__slots__'] = names
+    new_cls = type(cls)(cls.__name__, cls.__bases__, namespace)
+    new_cls.__qualname__ = cls.__qualname__
+    return new_cls
+
 
 class BaseModel(ABC):
     """Base class for all A2A models"""
     
+    # Subclasses may be slotted (see ``slotted``)
+    __slots__ = ()
+    
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert model to dictionary representation
@@ -30,7 +66,7 @@ class BaseModel(ABC):
         Returns:
             JSON string representation of the model
         """
-        return json.dumps(self.to_dict())
+        return codec.dumps_str(self.to_dict())
     
     @classmethod
     def from_dict(cls: Type[T], data: Dict[str, Any]) -> T:
@@ -57,5 +93,5 @@ class BaseModel(ABC):
         Returns:
             New model instance
         """
-        data = json.loads(json_str)
+        data = codec.loads(json_str)
         return cls.from_dict(data)
\ No newline at end of file
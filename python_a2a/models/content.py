@@ -7,7 +7,7 @@ from typing import Dict, List, Any, Optional, Union
 from enum import Enum
 import datetime
 
-from .base import BaseModel
+from .base import BaseModel, slotted
 
 
 class ContentType(str, Enum):
@@ -18,6 +18,7 @@ class ContentType(str, Enum):
     ERROR = "error"
 
 
+@slotted
 @dataclass
 class TextContent(BaseModel):
     """Simple text message content"""
@@ -33,6 +34,7 @@ class TextContent(BaseModel):
         )
 
 
+@slotted
 @dataclass
 class FunctionParameter(BaseModel):
     """Parameter for a function call"""
@@ -48,6 +50,7 @@ class FunctionParameter(BaseModel):
         )
 
 
+@slotted
 @dataclass
 class FunctionCallContent(BaseModel):
     """Function call message content"""
@@ -70,6 +73,7 @@ class FunctionCallContent(BaseModel):
         )
 
 
+@slotted
 @dataclass
 class FunctionResponseContent(BaseModel):
     """Function response message content"""
@@ -87,6 +91,7 @@ class FunctionResponseContent(BaseModel):
         )
 
 
+@slotted
 @dataclass
 class ErrorContent(BaseModel):
     """Error message content"""
@@ -102,6 +107,7 @@ class ErrorContent(BaseModel):
         )
 
 
+@slotted
 @dataclass
 class Metadata(BaseModel):
     """Custom metadata that can be attached to a message"""
@@ -136,33 +136,38 @@ class Conversation(BaseModel):
         return self.add_message(message)
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'Conversation':
-        """Create a Conversation from a dictionary"""
-        # Check if this is Google A2A format with careful detection
-        if ("messages" in data and isinstance(data.get("messages"), list) and 
-            data["messages"] and "parts" in data["messages"][0] and 
-            isinstance(data["messages"][0].get("parts"), list) and
-            "role" in data["messages"][0] and not "content" in data["messages"][0]):
-            return cls.from_google_a2a(data)
+    def from_dict(cls, data: Dict[str, Any], wire_format: Optional[str] = None) -> 'Conversation':
+        """Create a Conversation from a dictionary
         
-        # Standard python_a2a format
-        messages = [Message.from_dict(m) for m in data.get("messages", [])]
-        return cls(
-            conversation_id=data.get("conversation_id", str(uuid.uuid4())),
-            messages=messages,
-            metadata=data.get("metadata")
-        )
+        Args:
+            data: A dictionary in either wire format
+            wire_format: The dictionary's WireFormat (detected if None)
+            
+        Returns:
+            A Conversation object
+        """
+        from .converters import conversation_from_dict
+        return conversation_from_dict(data, wire_format)
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert Conversation to dictionary representation"""
-        # Use google format if compatibility mode is enabled
-        if self._GOOGLE_A2A_COMPATIBILITY:
-            return self.to_google_a2a()
+    def to_dict(self, wire_format: Optional[str] = None) -> Dict[str, Any]:
+        """Convert Conversation to dictionary representation
         
-        # Standard python_a2a format
+        Args:
+            wire_format: The WireFormat to produce. Defaults to the format set
+                by use_wire_format(), then to the compatibility mode.
+            
+        Returns:
+            A dictionary in the wire format
+        """
+        from .converters import WireFormat, conversation_to_dict, resolve_wire_format
+        if resolve_wire_format(wire_format, self._GOOGLE_A2A_COMPATIBILITY) == WireFormat.GOOGLE_A2A:
+            return conversation_to_dict(self, WireFormat.GOOGLE_A2A)
+        
+        # Standard python_a2a format; without an explicit or scoped format,
+        # messages follow their own compatibility mode
         result = {
             "conversation_id": self.conversation_id,
-            "messages": [message.to_dict() for message in self.messages]
+            "messages": [message.to_dict(wire_format) for message in self.messages]
         }
         
         if self.metadata:
@@ -174,6 +179,8 @@ class Conversation(BaseModel):
     def from_google_a2a(cls, data: Dict[str, Any]) -> 'Conversation':
         """Create a Conversation from a Google A2A format dictionary
         
+        Messages that cannot be read are skipped.
+        
         Args:
             data: A dictionary in Google A2A format
             
@@ -182,49 +189,9 @@ class Conversation(BaseModel):
         """
         if not ("messages" in data and isinstance(data.get("messages"), list)):
             raise ValueError("Not a valid Google A2A format conversation")
-            
-        conversation_id = data.get("conversation_id", str(uuid.uuid4()))
-        
-        # Process messages
-        messages = []
-        for msg_data in data.get("messages", []):
-            # Skip invalid messages
-            if not isinstance(msg_data, dict):
-                continue
-                
-            # Try to convert from Google A2A format
-            if "parts" in msg_data and "role" in msg_data and not "content" in msg_data:
-                try:
-                    # Convert message from Google A2A format
-                    message = Message.from_google_a2a(msg_data)
-                    
-                    # Set conversation_id if not already set
-                    if not message.conversation_id:
-                        message.conversation_id = conversation_id
-                        
-                    messages.append(message)
-                except Exception:
-                    # If conversion fails, skip this message
-                    continue
-            else:
-                # Try standard format as fallback
-                try:
-                    message = Message.from_dict(msg_data)
-                    
-                    # Set conversation_id if not already set
-                    if not message.conversation_id:
-                        message.conversation_id = conversation_id
-                        
-                    messages.append(message)
-                except Exception:
-                    # If parsing fails, skip this message
-                    continue
         
-        return cls(
-            conversation_id=conversation_id,
-            messages=messages,
-            metadata=data.get("metadata")
-        )
+        from .converters import WireFormat, conversation_from_dict
+        return conversation_from_dict(data, WireFormat.GOOGLE_A2A)
     
     def to_google_a2a(self) -> Dict[str, Any]:
         """Convert to Google A2A format dictionary
@@ -232,32 +199,16 @@ class Conversation(BaseModel):
         Returns:
             A dictionary in Google A2A format
         """
-        # Convert messages to Google A2A format
-        google_messages = []
-        for message in self.messages:
-            # Convert message to Google A2A format
-            try:
-                google_messages.append(message.to_google_a2a())
-            except Exception:
-                # Skip any messages that can't be converted
-                continue
-        
-        # Create the Google A2A conversation dict
-        result = {
-            "conversation_id": self.conversation_id,
-            "messages": google_messages
-        }
-        
-        if self.metadata:
-            result["metadata"] = self.metadata
-            
-        return result
+        from .converters import WireFormat, conversation_to_dict
+        return conversation_to_dict(self, WireFormat.GOOGLE_A2A)
     
     @classmethod
     def enable_google_a2a_compatibility(cls, enable: bool = True) -> None:
         """Enable or disable Google A2A compatibility mode
         
-        When enabled, to_dict() will output Google A2A format
+        When enabled, to_dict() will output Google A2A format. The mode is
+        process-wide: to serve both formats concurrently, pass wire_format to
+        to_dict() or use use_wire_format() instead.
         
         Args:
             enable: Whether to enable compatibility mode
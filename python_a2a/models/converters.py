@@ -0,0 +1,705 @@
+"""
+Single-pass conversion between A2A payloads and models.
+
+Payloads come in two wire formats: the python_a2a format (messages with a
+``content`` object) and the Google A2A format (messages with a ``parts``
+list). The functions here detect the format of a payload once, with plain
+key checks, and convert it directly: no trial parsing with exceptions as
+fallback, no intermediate model objects when converting between formats,
+and no global flag lookups when the format is given.
+
+``Message``, ``Conversation`` and ``Task`` use these functions for their
+``from_dict``/``to_dict`` and Google A2A conversion methods. Their
+``to_dict`` takes the wire format per call, or from ``use_wire_format`` for
+the current thread or asyncio task, so one process can serve both formats
+concurrently without the process-wide compatibility flags.
+
+Example:
+    >>> from python_a2a.models.converters import WireFormat, message_from_dict, message_to_dict
+    >>> message = message_from_dict({"role": "user", "parts": [{"type": "text", "text": "Hi"}]})
+    >>> message.content.text
+    'Hi'
+    >>> message_to_dict(message, WireFormat.GOOGLE_A2A)["parts"]
+    [{'type': 'text', 'text': 'Hi'}]
+"""
+
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from enum import Enum
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+
+from .content import (
+    ContentType, TextContent, FunctionParameter, FunctionCallContent,
+    FunctionResponseContent, ErrorContent, Metadata
+)
+from .message import Message, MessageRole
+from .conversation import Conversation
+from .task import Task, TaskStatus, TaskState
+
+
+class WireFormat(str, Enum):
+    """Wire formats of A2A payloads"""
+    PYTHON_A2A = "python_a2a"
+    GOOGLE_A2A = "google_a2a"
+
+
+# Wire format of to_dict() calls without an explicit format, set by use_wire_format()
+_scoped_wire_format: ContextVar[Optional[WireFormat]] = ContextVar("python_a2a_wire_format", default=None)
+
+
+def current_wire_format() -> Optional[WireFormat]:
+    """
+    Get the wire format set for the current context by ``use_wire_format``.
+
+    Returns:
+        The wire format, or None if none is set
+    """
+    return _scoped_wire_format.get()
+
+
+@contextmanager
+def use_wire_format(wire_format: Union[WireFormat, str]) -> Iterator[WireFormat]:
+    """
+    Set the wire format of ``to_dict()`` calls in the current context.
+
+    The format applies to the current thread or asyncio task only, so
+    concurrent requests can each use their own format. An explicit
+    ``wire_format`` argument takes precedence.
+
+    Example:
+        >>> message = Message(content=TextContent(text="Hi"), role=MessageRole.USER)
+        >>> with use_wire_format(WireFormat.GOOGLE_A2A):
+        ...     payload = message.to_dict()
+        >>> payload["parts"]
+        [{'type': 'text', 'text': 'Hi'}]
+
+    Args:
+        wire_format: The wire format to use
+
+    Yields:
+        The wire format
+    """
+    wire_format = WireFormat(wire_format)
+    token = _scoped_wire_format.set(wire_format)
+    try:
+        yield wire_format
+    finally:
+        _scoped_wire_format.reset(token)
+
+
+def resolve_wire_format(wire_format: Optional[Union[WireFormat, str]],
+                        google_a2a_compatibility: bool = False) -> WireFormat:
+    """
+    Resolve the wire format of a ``to_dict()`` call.
+
+    An explicit format comes first, then the format set by
+    ``use_wire_format``, then the process-wide Google A2A compatibility flag.
+
+    Args:
+        wire_format: The format given to the call, if any
+        google_a2a_compatibility: The model class's compatibility flag
+
+    Returns:
+        The wire format
+    """
+    if wire_format is not None:
+        return WireFormat(wire_format)
+    scoped = _scoped_wire_format.get()
+    if scoped is not None:
+        return scoped
+    return WireFormat.GOOGLE_A2A if google_a2a_compatibility else WireFormat.PYTHON_A2A
+
+
+# Content decoders by python_a2a content type
+_CONTENT_DECODERS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    ContentType.TEXT.value: TextContent.from_dict,
+    ContentType.FUNCTION_CALL.value: FunctionCallContent.from_dict,
+    ContentType.FUNCTION_RESPONSE.value: FunctionResponseContent.from_dict,
+    ContentType.ERROR.value: ErrorContent.from_dict,
+}
+
+_GOOGLE_ROLES = {"user": MessageRole.USER, "agent": MessageRole.AGENT}
+
+_ROLE_VALUES = frozenset(role.value for role in MessageRole)
+
+
+# Format detection
+
+def is_google_message(data: Any) -> bool:
+    """
+    Check whether a message payload is in Google A2A format.
+
+    Args:
+        data: The message payload
+
+    Returns:
+        True for a dictionary with ``role`` and a ``parts`` list but no ``content``
+    """
+    return (isinstance(data, dict) and "content" not in data and "role" in data
+            and isinstance(data.get("parts"), list))
+
+
+def _is_readable_python_message(data: Dict[str, Any]) -> bool:
+    """Check whether a python_a2a format message payload can be read"""
+    content = data.get("content")
+    if not isinstance(content, dict) or content.get("type") not in _CONTENT_DECODERS:
+        return False
+    role = data.get("role", MessageRole.USER)
+    if isinstance(role, str) and role not in _ROLE_VALUES:
+        return False
+    metadata = data.get("metadata")
+    return metadata is None or isinstance(metadata, dict)
+
+
+def can_read_message(data: Any) -> bool:
+    """
+    Check whether a message payload can be read in either wire format.
+
+    Args:
+        data: The message payload
+
+    Returns:
+        True if ``message_from_dict`` accepts the payload
+    """
+    return is_google_message(data) or (isinstance(data, dict) and _is_readable_python_message(data))
+
+
+def detect_message_format(data: Dict[str, Any]) -> WireFormat:
+    """
+    Detect the wire format of a message payload.
+
+    Args:
+        data: The message payload
+
+    Returns:
+        The wire format
+    """
+    return WireFormat.GOOGLE_A2A if is_google_message(data) else WireFormat.PYTHON_A2A
+
+
+def detect_conversation_format(data: Dict[str, Any]) -> WireFormat:
+    """
+    Detect the wire format of a conversation payload from its first message.
+
+    Args:
+        data: The conversation payload
+
+    Returns:
+        The wire format
+    """
+    messages = data.get("messages")
+    if isinstance(messages, list) and messages and is_google_message(messages[0]):
+        return WireFormat.GOOGLE_A2A
+    return WireFormat.PYTHON_A2A
+
+
+def detect_task_format(data: Dict[str, Any]) -> WireFormat:
+    """
+    Detect the wire format of a task payload.
+
+    A task is in Google A2A format if it has a status with a state and its
+    message or one of its artifact parts is in Google A2A form.
+
+    Args:
+        data: The task payload
+
+    Returns:
+        The wire format
+    """
+    status = data.get("status")
+    if not (isinstance(status, dict) and "state" in status):
+        return WireFormat.PYTHON_A2A
+    if is_google_message(data.get("message")):
+        return WireFormat.GOOGLE_A2A
+    artifacts = data.get("artifacts")
+    if isinstance(artifacts, list):
+        for artifact in artifacts:
+            parts = artifact.get("parts") if isinstance(artifact, dict) else None
+            if not isinstance(parts, list):
+                continue
+            for part in parts:
+                if not isinstance(part, dict):
+                    continue
+                part_type = part.get("type")
+                if ((part_type == "text" and "text" in part)
+                        or (part_type == "data" and isinstance(part.get("data"), dict))):
+                    return WireFormat.GOOGLE_A2A
+    return WireFormat.PYTHON_A2A
+
+
+# Content
+
+def content_to_dict(content: Any) -> Dict[str, Any]:
+    """
+    Convert message content to its python_a2a dictionary.
+
+    Args:
+        content: A content object
+
+    Returns:
+        The content dictionary
+    """
+    content_class = type(content)
+    if content_class is TextContent:
+        return {"text": content.text, "type": content.type}
+    if content_class is FunctionCallContent:
+        return {
+            "name": content.name,
+            "parameters": [{"name": p.name, "value": p.value} for p in content.parameters],
+            "type": content.type
+        }
+    if content_class is FunctionResponseContent:
+        return {"name": content.name, "response": content.response, "type": content.type}
+    if content_class is ErrorContent:
+        return {"message": content.message, "type": content.type}
+    # Subclasses may have more fields
+    return content.to_dict()
+
+
+def _content_to_google_part(content: Any) -> Optional[Dict[str, Any]]:
+    content_type = content.type
+    if content_type == "text":
+        return {"type": "text", "text": content.text}
+    if content_type == "function_call":
+        return {"type": "data", "data": {"function_call": {
+            "name": content.name,
+            "parameters": [{"name": p.name, "value": p.value} for p in content.parameters]
+        }}}
+    if content_type == "function_response":
+        return {"type": "data", "data": {"function_response": {
+            "name": content.name, "response": content.response
+        }}}
+    if content_type == "error":
+        return {"type": "data", "data": {"error": content.message}}
+    return None
+
+
+def _content_from_google_parts(parts: List[Any]) -> Any:
+    """Get the content of the first text or data part carrying content"""
+    for part in parts:
+        if not isinstance(part, dict):
+            continue
+        part_type = part.get("type")
+        if part_type == "text":
+            return TextContent(text=part.get("text", ""))
+        if part_type == "data":
+            data = part.get("data", {})
+            if not isinstance(data, dict):
+                continue
+            if "function_call" in data:
+                function = data["function_call"]
+                return FunctionCallContent(
+                    name=function.get("name", ""),
+                    parameters=[FunctionParameter(name=p.get("name", ""), value=p.get("value"))
+                                for p in function.get("parameters", [])]
+                )
+            if "function_response" in data:
+                function = data["function_response"]
+                return FunctionResponseContent(name=function.get("name", ""),
+                                               response=function.get("response"))
+            if "error" in data:
+                return ErrorContent(message=data["error"])
+    return TextContent(text="")
+
+
+def content_from_dict(data: Dict[str, Any]) -> Any:
+    """
+    Create message content from a python_a2a format content payload.
+
+    Args:
+        data: The content payload
+
+    Returns:
+        The content
+
+    Raises:
+        ValueError: If the content type is unknown
+    """
+    decode = _CONTENT_DECODERS.get(data.get("type"))
+    if decode is None:
+        raise ValueError(f"Unknown content type: {data.get('type')}")
+    return decode(data)
+
+
+def _metadata_from_google(metadata_data: Any) -> Optional[Metadata]:
+    """Get the metadata of a Google A2A message, without the python_a2a fields"""
+    if not isinstance(metadata_data, dict):
+        return None
+    custom_fields = {key: value for key, value in metadata_data.items()
+                     if key not in ("message_id", "parent_message_id", "conversation_id")}
+    if not custom_fields:
+        return None
+    created_at = custom_fields.pop("created_at", None)
+    return Metadata(created_at=created_at or "", custom_fields=custom_fields)
+
+
+def google_role(role: Any) -> MessageRole:
+    """
+    Map the role of a Google A2A message to a message role.
+
+    Args:
+        role: The role in the payload
+
+    Returns:
+        The message role; roles other than user and agent map to system
+    """
+    return _GOOGLE_ROLES.get(str(role).lower(), MessageRole.SYSTEM)
+
+
+# Messages
+
+def message_from_dict(data: Dict[str, Any], wire_format: Optional[WireFormat] = None) -> Message:
+    """
+    Create a message from a payload.
+
+    Args:
+        data: The message payload
+        wire_format: The payload's wire format (detected if None)
+
+    Returns:
+        The message
+
+    Raises:
+        ValueError: If a python_a2a format payload has an unknown content type
+    """
+    wire_format = detect_message_format(data) if wire_format is None else WireFormat(wire_format)
+    if wire_format == WireFormat.GOOGLE_A2A:
+        return _message_from_google(data)
+
+    metadata = data.get("metadata")
+    role = data.get("role", MessageRole.USER)
+    return Message(
+        content=content_from_dict(data.get("content", {})),
+        role=MessageRole(role) if isinstance(role, str) else role,
+        message_id=data["message_id"] if "message_id" in data else str(uuid.uuid4()),
+        parent_message_id=data.get("parent_message_id"),
+        conversation_id=data.get("conversation_id"),
+        metadata=Metadata.from_dict(metadata) if metadata is not None else None
+    )
+
+
+def _message_from_google(data: Dict[str, Any]) -> Message:
+    metadata_data = data.get("metadata") or {}
+    if isinstance(metadata_data, dict):
+        # The python_a2a fields travel in the metadata
+        message_id = metadata_data["message_id"] if "message_id" in metadata_data else str(uuid.uuid4())
+        parent_message_id = metadata_data.get("parent_message_id")
+        conversation_id = metadata_data.get("conversation_id")
+    else:
+        message_id, parent_message_id, conversation_id = str(uuid.uuid4()), None, None
+
+    return Message(
+        content=_content_from_google_parts(data.get("parts", [])),
+        role=google_role(data.get("role", "user")),
+        message_id=message_id,
+        parent_message_id=parent_message_id,
+        conversation_id=conversation_id,
+        metadata=_metadata_from_google(metadata_data)
+    )
+
+
+def message_to_dict(message: Message, wire_format: WireFormat = WireFormat.PYTHON_A2A) -> Dict[str, Any]:
+    """
+    Convert a message to a payload.
+
+    Args:
+        message: The message
+        wire_format: The wire format to produce
+
+    Returns:
+        The message payload
+    """
+    if wire_format == WireFormat.GOOGLE_A2A:
+        return _message_to_google(message)
+
+    result = {"content": content_to_dict(message.content), "role": message.role.value}
+    if message.message_id:
+        result["message_id"] = message.message_id
+    if message.parent_message_id:
+        result["parent_message_id"] = message.parent_message_id
+    if message.conversation_id:
+        result["conversation_id"] = message.conversation_id
+    if message.metadata:
+        result["metadata"] = {"created_at": message.metadata.created_at,
+                              "custom_fields": message.metadata.custom_fields}
+    return result
+
+
+def _message_to_google(message: Message) -> Dict[str, Any]:
+    part = _content_to_google_part(message.content)
+    metadata: Dict[str, Any] = {}
+    if message.metadata:
+        metadata.update(message.metadata.custom_fields)
+        if message.metadata.created_at:
+            metadata["created_at"] = message.metadata.created_at
+    if message.message_id:
+        metadata["message_id"] = message.message_id
+    if message.parent_message_id:
+        metadata["parent_message_id"] = message.parent_message_id
+    if message.conversation_id:
+        metadata["conversation_id"] = message.conversation_id
+    return {"role": message.role.value, "parts": [part] if part is not None else [], "metadata": metadata}
+
+
+def message_dict_to_google(data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Convert a python_a2a format message payload to Google A2A format
+    without building a ``Message``.
+
+    Args:
+        data: The python_a2a format message payload
+
+    Returns:
+        The Google A2A format payload, or None if the payload cannot be converted
+    """
+    if not _is_readable_python_message(data) or not isinstance(data.get("role", MessageRole.USER), str):
+        return None
+    content = data["content"]
+    content_type = content["type"]
+    if content_type == "text":
+        part = {"type": "text", "text": content.get("text", "")}
+    elif content_type == "function_call":
+        part = {"type": "data", "data": {"function_call": {
+            "name": content.get("name", ""),
+            "parameters": [{"name": p.get("name", ""), "value": p.get("value")}
+                           for p in content.get("parameters", []) if isinstance(p, dict)]
+        }}}
+    elif content_type == "function_response":
+        part = {"type": "data", "data": {"function_response": {
+            "name": content.get("name", ""), "response": content.get("response")
+        }}}
+    else:
+        part = {"type": "data", "data": {"error": content.get("message", "")}}
+
+    metadata: Dict[str, Any] = {}
+    metadata_data = data.get("metadata")
+    if metadata_data is not None:
+        metadata.update(metadata_data.get("custom_fields", {}))
+        created_at = metadata_data.get("created_at", datetime.now().isoformat())
+        if created_at:
+            metadata["created_at"] = created_at
+    message_id = data["message_id"] if "message_id" in data else str(uuid.uuid4())
+    for key, value in (("message_id", message_id),
+                       ("parent_message_id", data.get("parent_message_id")),
+                       ("conversation_id", data.get("conversation_id"))):
+        if value:
+            metadata[key] = value
+    return {"role": MessageRole(data.get("role", MessageRole.USER)).value, "parts": [part], "metadata": metadata}
+
+
+def google_message_dict_to_python(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert a Google A2A format message payload to python_a2a format.
+
+    Args:
+        data: The Google A2A format message payload
+
+    Returns:
+        The python_a2a format payload
+    """
+    return message_to_dict(_message_from_google(data), WireFormat.PYTHON_A2A)
+
+
+# Conversations
+
+def conversation_from_dict(data: Dict[str, Any], wire_format: Optional[WireFormat] = None) -> Conversation:
+    """
+    Create a conversation from a payload.
+
+    Messages of a Google A2A format conversation that cannot be read are
+    skipped, and messages without a conversation ID get the conversation's.
+
+    Args:
+        data: The conversation payload
+        wire_format: The payload's wire format (detected if None)
+
+    Returns:
+        The conversation
+
+    Raises:
+        ValueError: If a message of a python_a2a format conversation has an
+            unknown content type
+    """
+    wire_format = detect_conversation_format(data) if wire_format is None else WireFormat(wire_format)
+    conversation_id = data["conversation_id"] if "conversation_id" in data else str(uuid.uuid4())
+
+    if wire_format == WireFormat.PYTHON_A2A:
+        messages = [message_from_dict(m) for m in data.get("messages", [])]
+    else:
+        messages = []
+        for message_data in data.get("messages", []):
+            if not isinstance(message_data, dict):
+                continue
+            if is_google_message(message_data):
+                message = _message_from_google(message_data)
+            elif _is_readable_python_message(message_data):
+                message = message_from_dict(message_data, WireFormat.PYTHON_A2A)
+            else:
+                # Skip messages that cannot be read
+                continue
+            if not message.conversation_id:
+                message.conversation_id = conversation_id
+            messages.append(message)
+
+    return Conversation(conversation_id=conversation_id, messages=messages, metadata=data.get("metadata"))
+
+
+def conversation_to_dict(conversation: Conversation,
+                         wire_format: WireFormat = WireFormat.PYTHON_A2A) -> Dict[str, Any]:
+    """
+    Convert a conversation to a payload.
+
+    Args:
+        conversation: The conversation
+        wire_format: The wire format to produce
+
+    Returns:
+        The conversation payload
+    """
+    convert = _message_to_google if wire_format == WireFormat.GOOGLE_A2A else message_to_dict
+    result = {
+        "conversation_id": conversation.conversation_id,
+        "messages": [convert(message) for message in conversation.messages]
+    }
+    if conversation.metadata:
+        result["metadata"] = conversation.metadata
+    return result
+
+
+# Tasks
+
+def _part_from_google(part: Any) -> Any:
+    if not isinstance(part, dict) or part.get("type") != "data":
+        return part
+    data = part.get("data")
+    if not isinstance(data, dict):
+        return part
+    if "function_call" in data:
+        function = data["function_call"]
+        return {"type": "function_call", "name": function.get("name", ""),
+                "parameters": function.get("parameters", [])}
+    if "function_response" in data:
+        function = data["function_response"]
+        return {"type": "function_response", "name": function.get("name", ""),
+                "response": function.get("response", {})}
+    if "error" in data:
+        return {"type": "error", "message": data.get("error", "")}
+    return part
+
+
+def _part_to_google(part: Any) -> Any:
+    if not isinstance(part, dict):
+        return part
+    part_type = part.get("type")
+    if part_type == "function_call":
+        return {"type": "data", "data": {"function_call": {
+            "name": part.get("name", ""), "parameters": part.get("parameters", [])
+        }}}
+    if part_type == "function_response":
+        return {"type": "data", "data": {"function_response": {
+            "name": part.get("name", ""), "response": part.get("response", {})
+        }}}
+    if part_type == "error":
+        return {"type": "data", "data": {"error": part.get("message", "")}}
+    return part
+
+
+def _artifacts_from_google(artifacts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    converted = []
+    for artifact in artifacts:
+        parts = artifact.get("parts")
+        if isinstance(parts, list):
+            converted.append({"parts": [_part_from_google(part) for part in parts]})
+        else:
+            converted.append(artifact.copy())
+    return converted
+
+
+def _artifacts_to_google(artifacts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    converted = []
+    for artifact in artifacts:
+        if "parts" in artifact:
+            converted.append({"parts": [_part_to_google(part) for part in artifact["parts"]
+                                        if isinstance(part, dict)]})
+        else:
+            converted.append(artifact.copy())
+    return converted
+
+
+def task_from_dict(data: Dict[str, Any], wire_format: Optional[WireFormat] = None) -> Task:
+    """
+    Create a task from a payload.
+
+    The task's message and artifacts are kept in python_a2a format: those
+    of a Google A2A format payload are converted.
+
+    Args:
+        data: The task payload
+        wire_format: The payload's wire format (detected if None)
+
+    Returns:
+        The task
+    """
+    wire_format = detect_task_format(data) if wire_format is None else WireFormat(wire_format)
+    status_data = data.get("status", {})
+    message = data.get("message")
+    artifacts = data.get("artifacts", [])
+
+    if wire_format == WireFormat.GOOGLE_A2A:
+        status = TaskStatus.from_google_a2a(status_data) if status_data else TaskStatus(state=TaskState.SUBMITTED)
+        if is_google_message(message):
+            message = google_message_dict_to_python(message)
+        artifacts = _artifacts_from_google(artifacts)
+    else:
+        status = TaskStatus.from_dict(status_data) if status_data else TaskStatus(state=TaskState.SUBMITTED)
+
+    return Task(
+        id=data["id"] if "id" in data else str(uuid.uuid4()),
+        session_id=data.get("sessionId"),
+        status=status,
+        message=message,
+        history=data.get("history", []),
+        artifacts=artifacts,
+        metadata=data.get("metadata", {})
+    )
+
+
+def task_to_dict(task: Task, wire_format: WireFormat = WireFormat.PYTHON_A2A) -> Dict[str, Any]:
+    """
+    Convert a task to a payload.
+
+    Args:
+        task: The task
+        wire_format: The wire format to produce
+
+    Returns:
+        The task payload
+    """
+    result = {"id": task.id, "sessionId": task.session_id, "status": task.status.to_dict()}
+    message = task.message
+    artifacts = task.artifacts
+    if wire_format == WireFormat.GOOGLE_A2A:
+        if isinstance(message, dict):
+            if "content" in message and "role" in message:
+                message = message_dict_to_google(message) or message
+        elif isinstance(message, Message):
+            message = _message_to_google(message)
+        elif hasattr(message, "to_google_a2a"):
+            message = message.to_google_a2a()
+        elif hasattr(message, "to_dict"):
+            message = message.to_dict()
+            if "content" in message and "role" in message:
+                message = message_dict_to_google(message) or message
+        artifacts = _artifacts_to_google(artifacts)
+
+    if message:
+        result["message"] = message
+    if task.history:
+        result["history"] = task.history
+    if artifacts:
+        result["artifacts"] = artifacts
+    if task.metadata:
+        result["metadata"] = task.metadata
+    return result
@@ -0,0 +1,157 @@
+"""
+Lazily decoded views of A2A message payloads.
+"""
+
+import uuid
+from typing import Any, Dict, Optional
+
+from .content import Metadata
+from .message import Message, MessageRole
+from .converters import (
+    WireFormat, detect_message_format, content_from_dict, google_role,
+    _content_from_google_parts, _metadata_from_google, message_to_dict, resolve_wire_format
+)
+
+# Sentinel for attributes not decoded yet
+_UNSET = object()
+
+
+class LazyMessage:
+    """
+    A read-only view of a message payload that decodes on demand
+
+    The headers (role and the message, parent message and conversation IDs)
+    are read when the view is created; the content and metadata are decoded
+    on first access. Routers and pass-through proxies that only look at the
+    headers never build the content objects, and ``to_dict`` in the
+    payload's own wire format returns the payload itself.
+
+    Example:
+        >>> message = LazyMessage({"role": "user", "conversation_id": "c1",
+        ...                        "content": {"type": "text", "text": "Hi"}})
+        >>> message.conversation_id
+        'c1'
+        >>> message.content.text
+        'Hi'
+    """
+
+    __slots__ = ("_data", "wire_format", "role", "_message_id", "parent_message_id",
+                 "conversation_id", "_content", "_metadata")
+
+    def __init__(self, data: Dict[str, Any], wire_format: Optional[str] = None):
+        """
+        Create a view of a message payload
+
+        Args:
+            data: A message dictionary in either wire format; it must not be
+                modified while the view is in use
+            wire_format: The dictionary's WireFormat (detected if None)
+
+        Raises:
+            ValueError: If the payload's role is not a valid message role
+        """
+        self._data = data
+        self.wire_format = detect_message_format(data) if wire_format is None else WireFormat(wire_format)
+
+        if self.wire_format == WireFormat.GOOGLE_A2A:
+            self.role = google_role(data.get("role", "user"))
+            # The python_a2a fields travel in the metadata
+            headers = data.get("metadata")
+            if not isinstance(headers, dict):
+                headers = {}
+        else:
+            role = data.get("role", MessageRole.USER)
+            self.role = MessageRole(role) if isinstance(role, str) else role
+            headers = data
+
+        self._message_id = headers.get("message_id")
+        self.parent_message_id = headers.get("parent_message_id")
+        self.conversation_id = headers.get("conversation_id")
+        self._content = _UNSET
+        self._metadata = _UNSET
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], wire_format: Optional[str] = None) -> 'LazyMessage':
+        """Create a view of a message payload (see ``__init__``)"""
+        return cls(data, wire_format)
+
+    @property
+    def message_id(self) -> str:
+        """The message ID, generated on first access if the payload has none"""
+        if self._message_id is None:
+            self._message_id = str(uuid.uuid4())
+        return self._message_id
+
+    @property
+    def content(self) -> Any:
+        """
+        The message content, decoded on first access
+
+        Raises:
+            ValueError: If a python_a2a format payload has an unknown content type
+        """
+        if self._content is _UNSET:
+            if self.wire_format == WireFormat.GOOGLE_A2A:
+                self._content = _content_from_google_parts(self._data.get("parts", []))
+            else:
+                self._content = content_from_dict(self._data.get("content", {}))
+        return self._content
+
+    @property
+    def metadata(self) -> Optional[Metadata]:
+        """The message metadata, decoded on first access"""
+        if self._metadata is _UNSET:
+            if self.wire_format == WireFormat.GOOGLE_A2A:
+                self._metadata = _metadata_from_google(self._data.get("metadata"))
+            else:
+                metadata = self._data.get("metadata")
+                self._metadata = Metadata.from_dict(metadata) if metadata is not None else None
+        return self._metadata
+
+    @property
+    def is_decoded(self) -> bool:
+        """Whether the content has been decoded"""
+        return self._content is not _UNSET
+
+    @property
+    def raw(self) -> Dict[str, Any]:
+        """The underlying payload"""
+        return self._data
+
+    def to_message(self) -> Message:
+        """
+        Decode the whole payload into a Message
+
+        Returns:
+            A Message equal to ``Message.from_dict`` of the payload
+        """
+        return Message(
+            content=self.content,
+            role=self.role,
+            message_id=self.message_id,
+            parent_message_id=self.parent_message_id,
+            conversation_id=self.conversation_id,
+            metadata=self.metadata
+        )
+
+    def to_dict(self, wire_format: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Convert to dictionary representation
+
+        Args:
+            wire_format: The WireFormat to produce. Defaults to the format set
+                by use_wire_format(), then to the Message compatibility mode.
+
+        Returns:
+            The payload itself when it is already in the requested format,
+            otherwise a converted dictionary
+        """
+        wire_format = resolve_wire_format(wire_format, Message.is_google_a2a_compatibility_enabled())
+        if wire_format == self.wire_format:
+            return self._data
+        return message_to_dict(self.to_message(), wire_format)
+
+    def __repr__(self) -> str:
+        return (f"LazyMessage(role={self.role!r}, message_id={self._message_id!r}, "
+                f"conversation_id={self.conversation_id!r}, wire_format={self.wire_format.value!r}, "
+                f"decoded={self.is_decoded})")
@@ -5,6 +5,11 @@ Server implementations for the A2A protocol.
 # Import and re-export server classes for easy access
 from .base import BaseA2AServer
 from .http import run_server
+from .asgi import create_asgi_app, run_asgi_server
+from .task_store import TaskStore, MemoryTaskStore, SQLiteTaskStore
+from .event_bus import TaskEvent, TaskEventBus, RedisTaskEventBus
+from .admission import AdmissionController, AdmissionRejected, AdmissionMiddleware
+from .passthrough import RawRequest, create_passthrough_app, create_asgi_passthrough_app
 
 # Import enhanced A2A server
 from .a2a_server import A2AServer
@@ -19,6 +24,20 @@ __all__ = [
     'BaseA2AServer',
     'A2AServer',
     'run_server',
+    'create_asgi_app',
+    'run_asgi_server',
+    'TaskStore',
+    'MemoryTaskStore',
+    'SQLiteTaskStore',
+    'TaskEvent',
+    'TaskEventBus',
+    'RedisTaskEventBus',
+    'AdmissionController',
+    'AdmissionRejected',
+    'AdmissionMiddleware',
+    'RawRequest',
+    'create_passthrough_app',
+    'create_asgi_passthrough_app',
     'OpenAIA2AServer',
     'AnthropicA2AServer',
     'BedrockA2AServer'
@@ -4,8 +4,11 @@ Enhanced A2A server with protocol support.
 
 from flask import request, jsonify, Response, stream_with_context
 import uuid
-import json
+import logging
 import time
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional, Dict, Any, List, Union, Generator, Iterator, Callable
 
@@ -13,10 +16,18 @@ from ..models.agent import AgentCard, AgentSkill
 from ..models.task import Task, TaskStatus, TaskState
 from ..models.message import Message, MessageRole
 from ..models.conversation import Conversation
+from ..models.converters import WireFormat, can_read_message, message_from_dict
 from ..models.content import TextContent, ErrorContent, FunctionResponseContent, FunctionCallContent
+from .. import codec
 from .base import BaseA2AServer
+from .task_store import MemoryTaskStore
+from .event_bus import KEEPALIVE_INTERVAL, TaskEventBus, parse_last_event_id
+from .agent_card_cache import AgentCardCache, agent_card_key
+from .http import STREAM_TIMEOUT, cached_json_response
 from ..exceptions import A2AConfigurationError, A2AStreamingError
 
+logger = logging.getLogger(__name__)
+
 
 class A2AServer(BaseA2AServer):
     """
@@ -31,7 +42,14 @@ class A2AServer(BaseA2AServer):
             agent_card: Optional agent card
             message_handler: Optional message handler function
             google_a2a_compatible: Whether to use Google A2A format by default (True by default since this is an A2A protocol implementation)
-            **kwargs: Additional keyword arguments
+            **kwargs: Additional keyword arguments (``batch_max_workers`` sets how
+                many tasks of a JSON-RPC batch request are processed concurrently;
+                ``task_store`` sets the ``TaskStore`` holding processed tasks,
+                by default a ``MemoryTaskStore`` bounded by ``max_tasks`` and
+                ``task_ttl``; ``task_max_workers`` sets the size of the worker
+                pool running tasks/sendSubscribe tasks; ``event_bus`` sets the
+                ``TaskEventBus`` their updates are published on; ``admission``
+                sets an ``AdmissionController`` limiting concurrent requests)
         """
         # Create default agent card if none provided
         if agent_card:
@@ -44,14 +62,37 @@ class A2AServer(BaseA2AServer):
         self._handle_message_impl = message_handler
         
         # Initialize task storage
-        self.tasks = {}
+        self.tasks = kwargs.get("task_store")
+        if self.tasks is None:
+            self.tasks = MemoryTaskStore(
+                max_tasks=kwargs.get("max_tasks", 10000),
+                ttl=kwargs.get("task_ttl")
+            )
+        
+        # Initialize the event bus publishing task updates and its streaming
+        # subscriptions (task ID -> subscribers of a running task)
+        self.event_bus = kwargs.get("event_bus") or TaskEventBus()
+        self.streaming_subscriptions = self.event_bus.subscriptions
+        
+        # Worker pool running tasks/sendSubscribe tasks, created on first use
+        self.task_max_workers = kwargs.get("task_max_workers", 8)
+        self._task_executor = None
+        self._task_executor_lock = threading.Lock()
+        
+        # Number of tasks of a JSON-RPC batch request processed concurrently
+        self.batch_max_workers = kwargs.get("batch_max_workers", 8)
         
-        # Initialize streaming subscriptions
-        self.streaming_subscriptions = {}
+        # Optional admission control, applied by the Flask and ASGI apps
+        self.admission = kwargs.get("admission")
         
         # Set Google A2A compatibility mode
         self._use_google_a2a = google_a2a_compatible
         
+        # The serialized agent card, rebuilt when the card is replaced
+        self.agent_card_cache = AgentCardCache(
+            lambda: self.agent_card.to_dict(), key=lambda: agent_card_key(self)
+        )
+        
         # Add Google A2A compatibility to capabilities
         if not hasattr(self.agent_card, 'capabilities'):
             self.agent_card.capabilities = {}
@@ -160,42 +201,30 @@ class A2AServer(BaseA2AServer):
                 message = None
                 
                 if isinstance(message_data, dict):
-                    from ..models import Message
-                    
-                    # First, check for Google A2A format
-                    if "parts" in message_data and "role" in message_data and not "content" in message_data:
-                        try:
-                            message = Message.from_google_a2a(message_data)
-                        except Exception:
-                            # If conversion fails, fall back to standard format
-                            pass
-                    
-                    # If not Google A2A format or conversion failed, try standard format
-                    if message is None:
-                        try:
-                            message = Message.from_dict(message_data)
-                        except Exception:
-                            # If standard format fails too, create a basic message
-                            # Extract text directly from common formats to maintain compatibility
-                            text = ""
-                            if "content" in message_data and isinstance(message_data["content"], dict):
-                                # python_a2a format
-                                content = message_data["content"]
-                                if "text" in content:
-                                    text = content["text"]
-                                elif "message" in content:
-                                    text = content["message"]
-                            elif "parts" in message_data:
-                                # Google A2A format
-                                for part in message_data["parts"]:
-                                    if isinstance(part, dict) and part.get("type") == "text" and "text" in part:
-                                        text = part["text"]
-                                        break
-                            
-                            message = Message(
-                                content=TextContent(text=text),
-                                role=MessageRole.USER
-                            )
+                    # Detect the format once and convert directly
+                    if can_read_message(message_data):
+                        message = message_from_dict(message_data)
+                    else:
+                        # Unreadable message: extract text directly from common formats
+                        text = ""
+                        if "content" in message_data and isinstance(message_data["content"], dict):
+                            # python_a2a format
+                            content = message_data["content"]
+                            if "text" in content:
+                                text = content["text"]
+                            elif "message" in content:
+                                text = content["message"]
+                        elif isinstance(message_data.get("parts"), list):
+                            # Google A2A format
+                            for part in message_data["parts"]:
+                                if isinstance(part, dict) and part.get("type") == "text" and "text" in part:
+                                    text = part["text"]
+                                    break
+                        
+                        message = Message(
+                            content=TextContent(text=text),
+                            role=MessageRole.USER
+                        )
                 else:
                     # If it's already a Message object, use it directly
                     message = message_data
@@ -419,13 +448,13 @@ class A2AServer(BaseA2AServer):
         @app.route("/a2a/agent.json", methods=["GET"])
         def a2a_agent_card():
             """Return the agent card as JSON"""
-            return jsonify(self.agent_card.to_dict())
+            return cached_json_response(self.agent_card_cache.get())
             
         # Also support the standard agent.json at the root
         @app.route("/agent.json", methods=["GET"])
         def agent_card():
             """Return the agent card as JSON (standard location)"""
-            return jsonify(self.agent_card.to_dict())
+            return cached_json_response(self.agent_card_cache.get())
         
         # Task endpoints with proper JSON-RPC
         @app.route("/a2a/tasks/send", methods=["POST"])
@@ -435,17 +464,17 @@ class A2AServer(BaseA2AServer):
                 # Parse JSON data
                 request_data = request.json
                 
+                # Handle a JSON-RPC batch of tasks
+                if isinstance(request_data, list):
+                    return self._handle_jsonrpc_batch(request_data)
+                
                 # Handle as JSON-RPC if it follows that format
                 if "jsonrpc" in request_data:
                     rpc_id = request_data.get("id", 1)
                     params = request_data.get("params", {})
                     
                     # Detect format from params
-                    is_google_format = False
-                    if isinstance(params, dict) and "message" in params:
-                        message_data = params.get("message", {})
-                        if isinstance(message_data, dict) and "parts" in message_data and "role" in message_data:
-                            is_google_format = True
+                    is_google_format = self._is_google_task_params(params)
                     
                     # Process the task
                     result = self._handle_task_request(params, is_google_format)
@@ -536,10 +565,7 @@ class A2AServer(BaseA2AServer):
                         }), 404
                     
                     # Convert task to dict in appropriate format
-                    if self._use_google_a2a:
-                        task_dict = task.to_google_a2a()
-                    else:
-                        task_dict = task.to_dict()
+                    task_dict = task.to_dict(self.wire_format)
                     
                     # Return the task
                     return jsonify({
@@ -557,10 +583,7 @@ class A2AServer(BaseA2AServer):
                         return jsonify({"error": f"Task not found: {task_id}"}), 404
                     
                     # Convert task to dict in appropriate format
-                    if self._use_google_a2a:
-                        task_dict = task.to_google_a2a()
-                    else:
-                        task_dict = task.to_dict()
+                    task_dict = task.to_dict(self.wire_format)
                     
                     # Return the task
                     return jsonify(task_dict)
@@ -611,12 +634,10 @@ class A2AServer(BaseA2AServer):
                     
                     # Cancel the task
                     task.status = TaskStatus(state=TaskState.CANCELED)
+                    self.tasks[task_id] = task
                     
                     # Convert task to dict in appropriate format
-                    if self._use_google_a2a:
-                        task_dict = task.to_google_a2a()
-                    else:
-                        task_dict = task.to_dict()
+                    task_dict = task.to_dict(self.wire_format)
                     
                     # Return the task
                     return jsonify({
@@ -635,12 +656,10 @@ class A2AServer(BaseA2AServer):
                     
                     # Cancel the task
                     task.status = TaskStatus(state=TaskState.CANCELED)
+                    self.tasks[task_id] = task
                     
                     # Convert task to dict in appropriate format
-                    if self._use_google_a2a:
-                        task_dict = task.to_google_a2a()
-                    else:
-                        task_dict = task.to_dict()
+                    task_dict = task.to_dict(self.wire_format)
                     
                     # Return the task
                     return jsonify(task_dict)
@@ -747,7 +766,7 @@ class A2AServer(BaseA2AServer):
                 return jsonify(response.to_google_a2a())
             else:
                 # Use standard python_a2a format
-                return jsonify(response.to_dict())
+                return jsonify(response.to_dict(WireFormat.PYTHON_A2A))
         except Exception as e:
             # Return an error in the appropriate format
             error_msg = f"Error processing message: {str(e)}"
@@ -799,7 +818,7 @@ class A2AServer(BaseA2AServer):
                 return jsonify(response.to_google_a2a())
             else:
                 # Use standard python_a2a format
-                return jsonify(response.to_dict())
+                return jsonify(response.to_dict(WireFormat.PYTHON_A2A))
         except Exception as e:
             # Return an error in the appropriate format
             error_msg = f"Error processing conversation: {str(e)}"
@@ -848,27 +867,7 @@ class A2AServer(BaseA2AServer):
             task_id = data.get("id", str(uuid.uuid4()))
             session_id = data.get("sessionId")
             
-            # Create task based on format
-            if is_google_format:
-                # Google A2A format - preserve the exact format of message
-                task = Task.from_google_a2a(data)
-            else:
-                # Standard python_a2a format - preserve the exact format of message
-                task = Task.from_dict(data)
-            
-            # Process the task
-            result = self.handle_task(task)
-            
-            # Store the task
-            self.tasks[result.id] = result
-            
-            # Convert to the appropriate format for response
-            if is_google_format or self._use_google_a2a:
-                # Use Google A2A format for response
-                return jsonify(result.to_google_a2a())
-            else:
-                # Use standard python_a2a format
-                return jsonify(result.to_dict())
+            return jsonify(self._process_task_request(data, is_google_format))
         except Exception as e:
             # Return an error in the appropriate format
             error_msg = f"Error processing task: {str(e)}"
@@ -883,6 +882,134 @@ class A2AServer(BaseA2AServer):
             }
             return jsonify(error_response), 500
     
+    def _process_task_request(self, data, is_google_format=False) -> Dict[str, Any]:
+        """
+        Process and store a task request
+        
+        Args:
+            data: Task data
+            is_google_format: Whether the task is in Google A2A format
+            
+        Returns:
+            The processed task as a dictionary in the appropriate format
+        """
+        # Create task based on format
+        if is_google_format:
+            # Google A2A format - preserve the exact format of message
+            task = Task.from_google_a2a(data)
+        else:
+            # Standard python_a2a format - preserve the exact format of message
+            task = Task.from_dict(data)
+        
+        # Process the task
+        result = self.handle_task(task)
+        
+        # Store the task
+        self.tasks[result.id] = result
+        
+        # Convert to the appropriate format for response
+        if is_google_format or self._use_google_a2a:
+            # Use Google A2A format for response
+            return result.to_google_a2a()
+        else:
+            # Use standard python_a2a format
+            return result.to_dict(WireFormat.PYTHON_A2A)
+    
+    @staticmethod
+    def _is_google_task_params(params) -> bool:
+        """Check whether task parameters carry a Google A2A format message"""
+        if isinstance(params, dict) and "message" in params:
+            message_data = params.get("message", {})
+            if isinstance(message_data, dict) and "parts" in message_data and "role" in message_data:
+                return True
+        return False
+    
+    def _handle_jsonrpc_batch(self, batch):
+        """
+        Handle a JSON-RPC batch of tasks/send requests
+        
+        The tasks in the batch are processed concurrently by up to
+        ``batch_max_workers`` threads.
+        
+        Args:
+            batch: List of JSON-RPC requests
+            
+        Returns:
+            Response with the list of JSON-RPC responses
+        """
+        if not batch:
+            return jsonify({
+                "jsonrpc": "2.0",
+                "id": None,
+                "error": {
+                    "code": -32600,
+                    "message": "Invalid Request: empty batch"
+                }
+            }), 400
+        
+        workers = max(1, min(self.batch_max_workers, len(batch)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            responses = list(executor.map(self._handle_jsonrpc_batch_item, batch))
+        
+        # Notifications (requests without an ID) get no response
+        responses = [response for response in responses if response is not None]
+        if not responses:
+            return "", 204
+        
+        return jsonify(responses)
+    
+    def _handle_jsonrpc_batch_item(self, item) -> Optional[Dict[str, Any]]:
+        """
+        Handle a single request of a JSON-RPC batch
+        
+        Args:
+            item: The JSON-RPC request
+            
+        Returns:
+            The JSON-RPC response, or None for notifications
+        """
+        if not isinstance(item, dict) or "jsonrpc" not in item:
+            return {
+                "jsonrpc": "2.0",
+                "id": None,
+                "error": {
+                    "code": -32600,
+                    "message": "Invalid Request"
+                }
+            }
+        
+        rpc_id = item.get("id")
+        method = item.get("method", "tasks/send")
+        params = item.get("params", {})
+        
+        if method != "tasks/send":
+            response = {
+                "jsonrpc": "2.0",
+                "id": rpc_id,
+                "error": {
+                    "code": -32601,
+                    "message": f"Method not found: {method}"
+                }
+            }
+        else:
+            try:
+                response = {
+                    "jsonrpc": "2.0",
+                    "id": rpc_id,
+                    "result": self._process_task_request(params, self._is_google_task_params(params))
+                }
+            except Exception as e:
+                response = {
+                    "jsonrpc": "2.0",
+                    "id": rpc_id,
+                    "error": {
+                        "code": -32603,
+                        "message": f"Internal error: {str(e)}"
+                    }
+                }
+        
+        return response if "id" in item else None
+    
     def get_metadata(self) -> Dict[str, Any]:
         """
         Get metadata about this agent server
@@ -914,6 +1041,7 @@ class A2AServer(BaseA2AServer):
         if isinstance(self.agent_card.capabilities, dict):
             self.agent_card.capabilities["google_a2a_compatible"] = use_google_format
             self.agent_card.capabilities["parts_array_format"] = use_google_format
+        self.agent_card_cache.invalidate()
         
     def is_using_google_a2a_format(self) -> bool:
         """
@@ -924,6 +1052,141 @@ class A2AServer(BaseA2AServer):
         """
         return self._use_google_a2a
         
+    @property
+    def wire_format(self) -> WireFormat:
+        """The wire format of the server's responses"""
+        return WireFormat.GOOGLE_A2A if self._use_google_a2a else WireFormat.PYTHON_A2A
+        
+    def _task_data(self, task):
+        """Convert a task to a dictionary in the server's format"""
+        return task.to_dict(self.wire_format)
+    
+    def submit_task(self, task, callback=None) -> Future:
+        """
+        Run a task on the server's worker pool
+        
+        The task's current state is published, ``handle_task`` runs on a
+        worker thread and the final task is published as the ``complete``
+        event.
+        
+        Args:
+            task: The task to run
+            callback: Optional subscriber, added before the task starts (see
+                ``subscribe_task``)
+            
+        Returns:
+            A future resolving to the processed task
+        """
+        with self._task_executor_lock:
+            if self._task_executor is None:
+                self._task_executor = ThreadPoolExecutor(
+                    max_workers=self.task_max_workers, thread_name_prefix="a2a-task"
+                )
+        self.publish_task_update(task)
+        if callback is not None:
+            self.event_bus.subscribe(task.id, callback)
+        return self._task_executor.submit(self._run_task, task)
+    
+    def _run_task(self, task):
+        """Process a submitted task, publishing its progress"""
+        result_task = task
+        try:
+            task.status = TaskStatus(state=TaskState.WAITING)
+            self.publish_task_update(task)
+            result_task = self.handle_task(task)
+        except Exception as e:
+            logger.exception("Task %s failed", task.id)
+            task.status = TaskStatus(state=TaskState.FAILED, message={"error": str(e)})
+            result_task = task
+        finally:
+            self.publish_task_update(result_task, event="complete")
+        return result_task
+    
+    def subscribe_task(self, task_id, callback, last_event_id=None) -> bool:
+        """
+        Subscribe to the updates of a task run with ``submit_task``
+        
+        Args:
+            task_id: ID of the task
+            callback: Called with a ``TaskEvent`` for each update ("update",
+                "artifact" and finally "complete"); it runs on the publishing
+                thread and must not block
+            last_event_id: ID of the last event already received; the events
+                after it are replayed first
+            
+        Returns:
+            True if subscribed, False if no updates of the task were published
+        """
+        return self.event_bus.subscribe(task_id, callback, last_event_id)
+    
+    def unsubscribe_task(self, task_id, callback) -> None:
+        """
+        Remove a subscription added with ``subscribe_task``
+        
+        Args:
+            task_id: ID of the task
+            callback: The subscribed callback
+        """
+        self.event_bus.unsubscribe(task_id, callback)
+    
+    def publish_task_update(self, task, event="update") -> None:
+        """
+        Store a task and publish its current state to its subscribers
+        
+        Call this from ``handle_task`` to report progress (e.g. a new status
+        message) while a task submitted with tasks/sendSubscribe runs.
+        
+        Args:
+            task: The updated task
+            event: The event name sent to subscribers
+        """
+        self.tasks[task.id] = task
+        self.event_bus.publish(task.id, event, self._task_data(task))
+    
+    def publish_task_artifact(self, task, artifact) -> None:
+        """
+        Add an artifact to a task and publish it to the task's subscribers
+        
+        Args:
+            task: The running task
+            artifact: The new artifact (e.g. ``{"parts": [{"type": "text", "text": "..."}]}``)
+        """
+        task.artifacts.append(artifact)
+        self.publish_task_update(task, event="artifact")
+    
+    def _task_event_stream(self, task_id, events, callback, timeout=STREAM_TIMEOUT):
+        """
+        Generate Server-Sent Events from a task subscription
+        
+        A keepalive comment is sent when no event arrives for
+        KEEPALIVE_INTERVAL seconds, and the stream ends with an error
+        event if the task has not completed after ``timeout`` seconds.
+        
+        Args:
+            task_id: ID of the subscribed task
+            events: Queue receiving the subscription's events
+            callback: The subscribed callback, removed when the stream ends
+            timeout: Maximum duration of the stream in seconds
+        """
+        deadline = time.monotonic() + timeout
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    logger.warning("Event stream of task %s timed out", task_id)
+                    yield f"event: error\ndata: {codec.dumps_str({'error': 'Streaming timed out'})}\n\n"
+                    return
+                try:
+                    event = events.get(timeout=min(remaining, KEEPALIVE_INTERVAL))
+                except queue.Empty:
+                    yield ": keepalive\n\n"
+                    continue
+                yield event.to_sse()
+                if event.event == "complete":
+                    return
+        finally:
+            self.unsubscribe_task(task_id, callback)
+    
     def _handle_tasks_send_subscribe(self, params, rpc_id):
         """
         Handle the tasks/sendSubscribe method to create and subscribe to a new task
@@ -943,33 +1206,14 @@ class A2AServer(BaseA2AServer):
             # Create task from params
             task = Task.from_dict(params)
             
-            # Process the task in the background
-            # For this implementation, we'll create a generator to simulate real-time updates
+            # Run the task on the worker pool, streaming its updates as they
+            # are published
+            events = queue.Queue()
+            self.submit_task(task, callback=events.put)
             
             def generate_sse_stream():
                 """Generate a Server-Sent Events stream for task execution"""
-                # Send initial task state
-                initial_task = task.to_dict() if not self._use_google_a2a else task.to_google_a2a()
-                yield f"event: update\nid: {rpc_id}\ndata: {json.dumps(initial_task)}\n\n"
-                
-                # Process the task
-                result_task = None
-                try:
-                    result_task = self.handle_task(task)
-                except Exception as e:
-                    # Handle error
-                    task.status = TaskStatus(
-                        state=TaskState.FAILED,
-                        message={"error": str(e)}
-                    )
-                    result_task = task
-                
-                # Store the task
-                self.tasks[result_task.id] = result_task
-                
-                # Send complete event
-                complete_task = result_task.to_dict() if not self._use_google_a2a else result_task.to_google_a2a()
-                yield f"event: complete\nid: {rpc_id}\ndata: {json.dumps(complete_task)}\n\n"
+                return self._task_event_stream(task.id, events, events.put)
             
             # Create a streaming response
             return Response(
@@ -1020,6 +1264,23 @@ class A2AServer(BaseA2AServer):
                     }
                 }), 400
             
+            # Replay the task's published updates after the client's last
+            # event and stream the live ones
+            events = queue.Queue()
+            last_event_id = parse_last_event_id(
+                request.headers.get("Last-Event-ID") or params.get("lastEventId")
+            )
+            if self.subscribe_task(task_id, events.put, last_event_id):
+                return Response(
+                    stream_with_context(self._task_event_stream(task_id, events, events.put)),
+                    content_type="text/event-stream",
+                    headers={
+                        "Cache-Control": "no-cache",
+                        "Connection": "keep-alive",
+                        "X-Accel-Buffering": "no"  # Disable Nginx buffering
+                    }
+                )
+            
             # Get the task
             task = self.tasks.get(task_id)
             if not task:
@@ -1033,29 +1294,17 @@ class A2AServer(BaseA2AServer):
                     }
                 }), 404
             
-            # Generate a stream for the task's current state
+            # The task has no published events to follow (e.g. it was stored
+            # directly), so only its current state can be sent
             def generate_sse_stream():
                 """Generate a Server-Sent Events stream for the task's current state"""
-                # Send the current task state
-                current_task = task.to_dict() if not self._use_google_a2a else task.to_google_a2a()
-                yield f"event: update\nid: {rpc_id}\ndata: {json.dumps(current_task)}\n\n"
-                
-                # If the task is not completed, failed, or canceled, we should wait for updates
-                if task.status.state not in [TaskState.COMPLETED, TaskState.FAILED, TaskState.CANCELED]:
-                    # In a real implementation, this would wait for task updates
-                    # For this example, we'll just send a completion event after a delay
-                    time.sleep(0.5)  # Small delay to simulate processing
-                    
-                    # Update task status to completed
-                    task.status = TaskStatus(state=TaskState.COMPLETED)
-                    
-                    # Send complete event
-                    complete_task = task.to_dict() if not self._use_google_a2a else task.to_google_a2a()
-                    yield f"event: complete\nid: {rpc_id}\ndata: {json.dumps(complete_task)}\n\n"
+                current_task = codec.dumps_str(task.to_dict(self.wire_format))
+                yield f"event: update\nid: {rpc_id}\ndata: {current_task}\n\n"
+                if task.status.state in [TaskState.COMPLETED, TaskState.FAILED, TaskState.CANCELED]:
+                    yield f"event: complete\nid: {rpc_id}\ndata: {current_task}\n\n"
                 else:
-                    # If the task is already in a final state, send a complete event
-                    complete_task = task.to_dict() if not self._use_google_a2a else task.to_google_a2a()
-                    yield f"event: complete\nid: {rpc_id}\ndata: {json.dumps(complete_task)}\n\n"
+                    error = {"error": f"Live updates are not available for task {task_id}"}
+                    yield f"event: error\ndata: {codec.dumps_str(error)}\n\n"
             
             # Create a streaming response
             return Response(
@@ -0,0 +1,428 @@
+"""
+Admission control for A2A servers.
+
+Agent handlers usually call a rate-limited upstream model, so letting every
+request in at once overloads it and makes all requests time out together.
+An ``AdmissionController`` bounds the number of requests handled
+concurrently, both globally and per API key:
+
+- a request over its API key's limit is rejected at once with
+  ``429 Too Many Requests``;
+- when all global slots are busy, up to ``max_queue`` requests wait (at most
+  ``queue_timeout`` seconds) for a slot in arrival order; beyond that, or
+  after waiting too long, requests are rejected with
+  ``503 Service Unavailable``.
+
+Rejections carry a ``Retry-After`` header estimated from recent handling
+times. Task lookups and cancellations are never queued.
+"""
+
+import math
+import time
+import asyncio
+import hashlib
+import logging
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Mapping, Optional
+
+from .. import codec
+
+logger = logging.getLogger(__name__)
+
+# Request paths that are cheap and never wait for a slot
+EXEMPT_PATH_SUFFIXES = ("/tasks/get", "/tasks/cancel")
+
+
+class AdmissionRejected(Exception):
+    """Raised when a request is not admitted"""
+
+    def __init__(self, status_code: int, retry_after: int, reason: str):
+        super().__init__(reason)
+        self.status_code = status_code
+        self.retry_after = retry_after
+        self.reason = reason
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """Headers to send with the rejection"""
+        return {"Retry-After": str(self.retry_after)}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Body to send with the rejection"""
+        return {"error": self.reason, "retry_after": self.retry_after}
+
+
+def api_key_from_headers(headers: Mapping[str, str]) -> Optional[str]:
+    """
+    Get the API key of a request: the ``X-API-Key`` header, or the token of
+    an ``Authorization`` header.
+
+    Args:
+        headers: The request headers
+
+    Returns:
+        The API key, or None for anonymous requests
+    """
+    key = headers.get("X-API-Key") or headers.get("x-api-key")
+    if key:
+        return key
+    authorization = headers.get("Authorization") or headers.get("authorization")
+    if authorization:
+        return authorization.split(" ", 1)[-1].strip() or None
+    return None
+
+
+def is_admission_controlled(method: str, path: str) -> bool:
+    """
+    Check whether a request goes through admission control.
+
+    Args:
+        method: The HTTP method
+        path: The request path
+
+    Returns:
+        True for requests that run agent handlers
+    """
+    return method == "POST" and not path.rstrip("/").endswith(EXEMPT_PATH_SUFFIXES)
+
+
+class _Waiter:
+    """A request waiting for a slot, woken by the request releasing it"""
+
+    __slots__ = ("granted", "event", "future", "loop")
+
+    def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        self.granted = False
+        self.loop = loop
+        self.event = threading.Event() if loop is None else None
+        self.future = loop.create_future() if loop is not None else None
+
+    def wake(self) -> None:
+        self.granted = True
+        if self.loop is None:
+            self.event.set()
+        else:
+            self.loop.call_soon_threadsafe(self._resolve)
+
+    def _resolve(self) -> None:
+        if not self.future.done():
+            self.future.set_result(True)
+
+
+class Admission:
+    """A slot held by an admitted request; release it when the request ends"""
+
+    __slots__ = ("_controller", "_key", "_started", "_released")
+
+    def __init__(self, controller: "AdmissionController", key: Optional[str]):
+        self._controller = controller
+        self._key = key
+        self._started = time.monotonic()
+        self._released = False
+
+    def release(self) -> None:
+        """Release the slot (only the first call has an effect)"""
+        if not self._released:
+            self._released = True
+            self._controller._release(self._key, time.monotonic() - self._started)
+
+    def __enter__(self) -> "Admission":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.release()
+
+
+class AdmissionController:
+    """
+    Global and per-API-key concurrency limits with a bounded wait queue.
+
+    Example:
+        >>> controller = AdmissionController(max_concurrency=1, max_queue=0)
+        >>> with controller.acquire("key-1"):
+        ...     controller.try_acquire("key-2") is None
+        True
+    """
+
+    def __init__(self, max_concurrency: Optional[int] = None, max_queue: int = 0,
+                 queue_timeout: float = 10.0, per_key_concurrency: Optional[int] = None,
+                 key_limits: Optional[Dict[str, int]] = None,
+                 key_func: Callable[[Mapping[str, str]], Optional[str]] = api_key_from_headers,
+                 min_retry_after: int = 1):
+        """
+        Initialize an admission controller.
+
+        Args:
+            max_concurrency: Maximum number of requests handled at once (None
+                for no global limit)
+            max_queue: Maximum number of requests waiting for a global slot
+            queue_timeout: Maximum seconds a request waits for a slot
+            per_key_concurrency: Maximum number of requests of one API key
+                handled or waiting at once (None for no limit)
+            key_limits: Limits of specific API keys, overriding
+                ``per_key_concurrency``
+            key_func: Gets the API key from the request headers
+            min_retry_after: Minimum ``Retry-After`` value in seconds
+        """
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.per_key_concurrency = per_key_concurrency
+        self.key_limits = dict(key_limits or {})
+        self.key_func = key_func
+        self.min_retry_after = min_retry_after
+
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._waiters: Deque[_Waiter] = deque()
+        self._per_key: Dict[str, int] = {}
+        self._avg_duration: Optional[float] = None
+        self._admitted = 0
+        self._queued = 0
+        self._rejected = {429: 0, 503: 0}
+        self._max_queue_depth = 0
+
+    def _key_limit(self, key: Optional[str]) -> Optional[int]:
+        if key is None:
+            return None
+        return self.key_limits.get(key, self.per_key_concurrency)
+
+    def _retry_after(self) -> int:
+        """Estimate when a slot frees up, from the average handling time"""
+        if self._avg_duration is None or not self.max_concurrency:
+            return self.min_retry_after
+        waiting = len(self._waiters) + 1
+        estimate = self._avg_duration * waiting / self.max_concurrency
+        return max(self.min_retry_after, math.ceil(estimate))
+
+    def _reject(self, status_code: int, reason: str) -> AdmissionRejected:
+        self._rejected[status_code] += 1
+        return AdmissionRejected(status_code, self._retry_after(), reason)
+
+    def _enter(self, key: Optional[str], loop: Optional[asyncio.AbstractEventLoop]) -> Optional[_Waiter]:
+        """
+        Admit a request or queue it (lock held).
+
+        Returns:
+            None if admitted, otherwise the waiter to wait on
+
+        Raises:
+            AdmissionRejected: If the request's key is over its limit or the
+                queue is full
+        """
+        limit = self._key_limit(key)
+        if limit is not None and self._per_key.get(key, 0) >= limit:
+            raise self._reject(429, "Too many concurrent requests for this API key")
+
+        if self.max_concurrency is None or (self._in_flight < self.max_concurrency and not self._waiters):
+            self._in_flight += 1
+            waiter = None
+        elif len(self._waiters) < self.max_queue:
+            waiter = _Waiter(loop)
+            self._waiters.append(waiter)
+            self._queued += 1
+            self._max_queue_depth = max(self._max_queue_depth, len(self._waiters))
+        else:
+            raise self._reject(503, "Server is at capacity")
+
+        if key is not None:
+            self._per_key[key] = self._per_key.get(key, 0) + 1
+        if waiter is None:
+            self._admitted += 1
+        return waiter
+
+    def _leave_queue(self, key: Optional[str], waiter: _Waiter, timed_out: bool = True) -> None:
+        """
+        Stop waiting for a slot.
+
+        Args:
+            key: The request's API key
+            waiter: The request's waiter
+            timed_out: Whether the request waited too long (rather than
+                being cancelled)
+
+        Raises:
+            AdmissionRejected: If the request timed out without getting a slot
+        """
+        with self._lock:
+            if waiter.granted:
+                if timed_out:
+                    # The slot came just in time
+                    self._admitted += 1
+                    return
+            else:
+                self._waiters.remove(waiter)
+                self._forget_key(key)
+                if timed_out:
+                    raise self._reject(503, "Timed out waiting for capacity")
+                return
+        # Cancelled after being granted a slot: pass it on
+        Admission(self, key).release()
+
+    def _granted(self) -> None:
+        with self._lock:
+            self._admitted += 1
+
+    def _forget_key(self, key: Optional[str]) -> None:
+        # Lock held
+        if key is not None:
+            count = self._per_key.get(key, 0) - 1
+            if count > 0:
+                self._per_key[key] = count
+            else:
+                self._per_key.pop(key, None)
+
+    def _release(self, key: Optional[str], duration: float) -> None:
+        with self._lock:
+            self._forget_key(key)
+            self._avg_duration = duration if self._avg_duration is None else (
+                0.8 * self._avg_duration + 0.2 * duration
+            )
+            if self._waiters:
+                # Hand the slot straight to the next waiter
+                self._waiters.popleft().wake()
+            else:
+                self._in_flight -= 1
+
+    def try_acquire(self, key: Optional[str] = None) -> Optional[Admission]:
+        """
+        Admit a request only if a slot is free right now.
+
+        Args:
+            key: The request's API key
+
+        Returns:
+            The admission, or None if the request would have to wait or be rejected
+        """
+        with self._lock:
+            limit = self._key_limit(key)
+            if limit is not None and self._per_key.get(key, 0) >= limit:
+                return None
+            if self.max_concurrency is not None and (self._in_flight >= self.max_concurrency or self._waiters):
+                return None
+            self._enter(key, None)
+        return Admission(self, key)
+
+    def acquire(self, key: Optional[str] = None) -> Admission:
+        """
+        Admit a request, waiting in the queue if needed.
+
+        Args:
+            key: The request's API key
+
+        Returns:
+            The admission; release it when the request ends
+
+        Raises:
+            AdmissionRejected: If the request is not admitted
+        """
+        with self._lock:
+            waiter = self._enter(key, None)
+        if waiter is not None:
+            if waiter.event.wait(self.queue_timeout):
+                self._granted()
+            else:
+                self._leave_queue(key, waiter)
+        return Admission(self, key)
+
+    async def acquire_async(self, key: Optional[str] = None) -> Admission:
+        """
+        Admit a request from a coroutine, waiting in the queue if needed.
+
+        Args:
+            key: The request's API key
+
+        Returns:
+            The admission; release it when the request ends
+
+        Raises:
+            AdmissionRejected: If the request is not admitted
+        """
+        with self._lock:
+            waiter = self._enter(key, asyncio.get_running_loop())
+        if waiter is not None:
+            try:
+                await asyncio.wait_for(asyncio.shield(waiter.future), self.queue_timeout)
+            except asyncio.TimeoutError:
+                self._leave_queue(key, waiter)
+            except asyncio.CancelledError:
+                # The client went away
+                self._leave_queue(key, waiter, timed_out=False)
+                raise
+            else:
+                self._granted()
+        return Admission(self, key)
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Get admission metrics.
+
+        Returns:
+            Current and peak queue depth, requests in flight, per-key counts
+            (keys are shown as short hashes) and admission totals
+        """
+        with self._lock:
+            return {
+                "in_flight": self._in_flight,
+                "queue_depth": len(self._waiters),
+                "max_queue_depth": self._max_queue_depth,
+                "max_concurrency": self.max_concurrency,
+                "max_queue": self.max_queue,
+                "admitted": self._admitted,
+                "queued": self._queued,
+                "rejected_429": self._rejected[429],
+                "rejected_503": self._rejected[503],
+                "avg_duration": self._avg_duration,
+                "per_key": {
+                    hashlib.sha256(key.encode("utf-8")).hexdigest()[:8]: count
+                    for key, count in self._per_key.items()
+                },
+            }
+
+
+class AdmissionMiddleware:
+    """
+    ASGI middleware applying an admission controller to POST requests.
+
+    A request holds its slot until its response has been sent, so streams
+    keep theirs until they end.
+    """
+
+    def __init__(self, app: Any, admission: AdmissionController):
+        """
+        Initialize the middleware.
+
+        Args:
+            app: The ASGI application
+            admission: The admission controller
+        """
+        self.app = app
+        self.admission = admission
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http" or not is_admission_controlled(scope["method"], scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
+        headers = {name.decode("latin-1").lower(): value.decode("latin-1")
+                   for name, value in scope.get("headers", ())}
+        try:
+            admission = await self.admission.acquire_async(self.admission.key_func(headers))
+        except AdmissionRejected as e:
+            logger.info("Rejected %s %s with %d: %s", scope["method"], scope["path"], e.status_code, e.reason)
+            body = codec.dumps(e.to_dict())
+            await send({
+                "type": "http.response.start",
+                "status": e.status_code,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode("latin-1")),
+                ] + [(name.lower().encode("latin-1"), value.encode("latin-1"))
+                     for name, value in e.headers.items()],
+            })
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        with admission:
+            await self.app(scope, receive, send)
@@ -0,0 +1,147 @@
+"""
+Cached JSON documents for agent discovery endpoints.
+
+Load balancers and registries poll ``/agent.json`` constantly. Rather than
+rebuilding and re-serializing the agent card on every request, the serialized
+card is cached along with an ``ETag`` and ``Last-Modified`` date, and clients
+sending ``If-None-Match`` (or ``If-Modified-Since``) get an empty
+``304 Not Modified`` while the card is unchanged.
+
+The cached document is rebuilt when its key changes (e.g. the agent's card
+is replaced), when ``invalidate()`` is called, and at most every
+``refresh_interval`` seconds to pick up in-place edits of the card. A rebuild
+producing the same JSON keeps the same validators.
+"""
+
+import time
+import hashlib
+import threading
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Any, Callable, Dict, Optional
+
+from .. import codec
+
+
+def agent_card_key(agent: Any) -> Any:
+    """
+    Get a cheap key that changes when an agent's card is replaced or the
+    agent switches between the python_a2a and Google A2A formats.
+
+    Args:
+        agent: The A2A agent server
+
+    Returns:
+        A key for ``AgentCardCache``
+    """
+    return id(getattr(agent, "agent_card", None)), getattr(agent, "_use_google_a2a", None)
+
+
+class CachedDocument:
+    """A serialized JSON document with its HTTP validators"""
+
+    __slots__ = ("data", "body", "etag", "last_modified", "modified_at")
+
+    def __init__(self, data: Dict[str, Any], body: bytes, modified_at: float):
+        self.data = data
+        self.body = body
+        self.etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+        self.modified_at = modified_at
+        self.last_modified = formatdate(modified_at, usegmt=True)
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """Validator and caching headers to send with the document"""
+        return {
+            "ETag": self.etag,
+            "Last-Modified": self.last_modified,
+            "Cache-Control": "no-cache"
+        }
+
+    def not_modified(self, if_none_match: Optional[str] = None,
+                     if_modified_since: Optional[str] = None) -> bool:
+        """
+        Check whether a conditional request can be answered with 304.
+
+        Args:
+            if_none_match: The ``If-None-Match`` request header
+            if_modified_since: The ``If-Modified-Since`` request header, only
+                used without ``If-None-Match``
+
+        Returns:
+            True if the client's copy is current
+        """
+        if if_none_match:
+            # Weak comparison, as for GET requests
+            tags = [tag.strip() for tag in if_none_match.split(",")]
+            return any(tag == "*" or (tag[2:] if tag.startswith("W/") else tag) == self.etag for tag in tags)
+        if if_modified_since:
+            try:
+                since = parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+            return int(self.modified_at) <= since
+        return False
+
+
+class AgentCardCache:
+    """
+    Cache of a JSON document built from an agent, such as its agent card.
+
+    Example:
+        >>> cache = AgentCardCache(lambda: {"name": "Echo"})
+        >>> document = cache.get()
+        >>> codec.loads(document.body)
+        {'name': 'Echo'}
+        >>> document.not_modified(if_none_match=document.etag)
+        True
+    """
+
+    def __init__(self, build: Callable[[], Dict[str, Any]], key: Optional[Callable[[], Any]] = None,
+                 refresh_interval: float = 5.0):
+        """
+        Initialize the cache.
+
+        Args:
+            build: Builds the document
+            key: Optional cheap function whose result changes when the document
+                must be rebuilt (e.g. the identity of the agent card)
+            refresh_interval: Seconds after which the document is rebuilt to
+                pick up changes the key does not capture
+        """
+        self.build = build
+        self.key = key
+        self.refresh_interval = refresh_interval
+        self._document: Optional[CachedDocument] = None
+        self._key: Any = None
+        self._expires_at = float("-inf")
+        self._lock = threading.Lock()
+
+    def get(self) -> CachedDocument:
+        """
+        Get the current document, rebuilding it if needed.
+
+        Returns:
+            The cached document
+        """
+        key = self.key() if self.key is not None else None
+        now = time.monotonic()
+        document = self._document
+        if document is not None and key == self._key and now < self._expires_at:
+            return document
+
+        with self._lock:
+            document = self._document
+            if document is not None and key == self._key and now < self._expires_at:
+                return document
+            data = self.build()
+            body = codec.dumps(data)
+            if document is None or body != document.body:
+                document = CachedDocument(data, body, time.time())
+            self._document, self._key = document, key
+            self._expires_at = now + self.refresh_interval
+            return document
+
+    def invalidate(self) -> None:
+        """Rebuild the document on the next request"""
+        with self._lock:
+            self._expires_at = float("-inf")
@@ -0,0 +1,833 @@
+"""
+ASGI server implementation for the A2A protocol.
+
+Serves the same A2A routes as ``create_flask_app`` from a FastAPI (Starlette)
+application, so agents can run under uvicorn or any other ASGI server. Agent
+handlers written as coroutines (``async def handle_message``) are awaited on
+the event loop; synchronous handlers run in a thread pool so they never block
+it.
+"""
+
+import asyncio
+import inspect
+import logging
+from datetime import datetime
+from typing import Any, AsyncGenerator, Callable, Dict, Optional, Tuple, Union
+
+try:
+    from fastapi import FastAPI, Request
+    from fastapi.middleware.cors import CORSMiddleware
+    from fastapi.responses import JSONResponse, Response, StreamingResponse
+    from starlette.concurrency import run_in_threadpool
+except ImportError:
+    FastAPI = None
+
+from .. import codec, compression
+from ..models.message import Message
+from ..models.conversation import Conversation
+from ..models.converters import WireFormat
+from ..models.task import Task, TaskStatus, TaskState
+from .base import BaseA2AServer
+from .event_bus import COMPLETE_EVENT, KEEPALIVE_INTERVAL, TaskEvent, parse_last_event_id
+from .http import STREAM_TIMEOUT
+from .agent_card_cache import AgentCardCache, agent_card_key
+from .admission import AdmissionController, AdmissionMiddleware
+from ..exceptions import A2AImportError
+
+logger = logging.getLogger(__name__)
+
+# Per-chunk tracing of streams, enabled at DEBUG level
+stream_logger = logger.getChild("stream")
+
+if FastAPI is not None:
+    class CodecJSONResponse(JSONResponse):
+        """JSON response encoded with the python_a2a codec (orjson or msgspec when installed)"""
+
+        def render(self, content: Any) -> bytes:
+            return codec.dumps(content)
+else:
+    CodecJSONResponse = None
+
+
+async def _send_json(send: Callable, status: int, data: Dict[str, Any],
+                     headers: Optional[Dict[str, str]] = None) -> None:
+    """Send a complete JSON response from an ASGI middleware"""
+    body = codec.dumps(data)
+    raw_headers = [(b"content-type", b"application/json"),
+                   (b"content-length", str(len(body)).encode("latin-1"))]
+    raw_headers += [(name.lower().encode("latin-1"), value.encode("latin-1"))
+                    for name, value in (headers or {}).items()]
+    await send({"type": "http.response.start", "status": status, "headers": raw_headers})
+    await send({"type": "http.response.body", "body": body})
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware compressing responses and accepting compressed requests
+
+    Responses of at least ``min_size`` bytes are compressed with the encoding
+    negotiated from ``Accept-Encoding``; streamed responses are compressed
+    chunk by chunk, except Server-Sent Events. Request bodies sent with a
+    ``Content-Encoding`` are decompressed (415 for unsupported encodings,
+    400 for corrupt or oversized bodies).
+    """
+
+    def __init__(self, app: Any, min_size: int = compression.DEFAULT_MIN_SIZE,
+                 max_request_size: int = compression.DEFAULT_MAX_DECOMPRESSED_SIZE):
+        """
+        Initialize the middleware.
+
+        Args:
+            app: The ASGI application
+            min_size: Minimum size in bytes of compressed responses
+            max_request_size: Maximum size of a decompressed request body
+        """
+        self.app = app
+        self.min_size = min_size
+        self.max_request_size = max_request_size
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = {name.decode("latin-1").lower(): value.decode("latin-1")
+                   for name, value in scope.get("headers", ())}
+        request_encoding = headers.get("content-encoding", "").strip().lower()
+        if request_encoding and request_encoding != "identity":
+            body, more_body = b"", True
+            while more_body:
+                message = await receive()
+                if message["type"] == "http.disconnect":
+                    return
+                body += message.get("body", b"")
+                more_body = message.get("more_body", False)
+            try:
+                body = compression.decompress(body, request_encoding, self.max_request_size)
+            except compression.DecompressionError as e:
+                status = 415 if isinstance(e, compression.UnsupportedEncodingError) else 400
+                await _send_json(send, status, {"error": str(e)})
+                return
+
+            scope = dict(scope)
+            scope["headers"] = [(name, value) for name, value in scope["headers"]
+                                if name.lower() not in (b"content-encoding", b"content-length")]
+            scope["headers"].append((b"content-length", str(len(body)).encode("latin-1")))
+            receive = self._replay(body, receive)
+
+        encoding = compression.choose_encoding(headers.get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+        else:
+            await self.app(scope, receive, self._compressing_send(send, encoding))
+
+    @staticmethod
+    def _replay(body: bytes, receive: Callable) -> Callable:
+        """Receive a decompressed body, then defer to the server"""
+        sent = False
+
+        async def replay_receive() -> Dict[str, Any]:
+            nonlocal sent
+            if not sent:
+                sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        return replay_receive
+
+    def _compressing_send(self, send: Callable, encoding: str) -> Callable:
+        start: Optional[Dict[str, Any]] = None
+        compressor: Optional[compression.StreamCompressor] = None
+        passthrough = False
+
+        def with_headers(message: Dict[str, Any], length: Optional[int]) -> Dict[str, Any]:
+            raw_headers = [(name, value) for name, value in message.get("headers", ())
+                           if name.lower() != b"content-length"]
+            raw_headers += [(b"content-encoding", encoding.encode("latin-1")),
+                            (b"vary", b"Accept-Encoding")]
+            if length is not None:
+                raw_headers.append((b"content-length", str(length).encode("latin-1")))
+            return {**message, "headers": raw_headers}
+
+        async def compressing_send(message: Dict[str, Any]) -> None:
+            nonlocal start, compressor, passthrough
+            if message["type"] == "http.response.start":
+                response_headers = {name.lower(): value for name, value in message.get("headers", ())}
+                status = message["status"]
+                passthrough = (status < 200 or status in (204, 304)
+                               or b"content-encoding" in response_headers
+                               or response_headers.get(b"content-type", b"").startswith(b"text/event-stream"))
+                if passthrough:
+                    await send(message)
+                else:
+                    start = message
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if start is not None:
+                first, start = start, None
+                if not more_body:
+                    # The whole body is known: compress it if large enough
+                    if len(body) < self.min_size:
+                        passthrough = True
+                        vary = [(b"vary", b"Accept-Encoding")]
+                        await send({**first, "headers": list(first.get("headers", ())) + vary})
+                        await send(message)
+                        return
+                    body = compression.compress(body, encoding)
+                    await send(with_headers(first, len(body)))
+                    await send({**message, "body": body})
+                    return
+                compressor = compression.StreamCompressor(encoding)
+                await send(with_headers(first, None))
+
+            data = compressor.compress(body)
+            if not more_body:
+                data += compressor.finish()
+            await send({"type": "http.response.body", "body": data, "more_body": more_body})
+
+        return compressing_send
+
+_SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no"  # Disable Nginx buffering
+}
+
+
+async def call_handler(agent: BaseA2AServer, name: str, *args) -> Any:
+    """
+    Call an agent handler without blocking the event loop.
+
+    Coroutine handlers are awaited directly. Synchronous handlers run in a
+    worker thread, and an awaitable they return is awaited as well.
+
+    Args:
+        agent: The A2A agent server
+        name: Name of the handler method (e.g. "handle_message")
+        *args: Arguments for the handler
+
+    Returns:
+        The handler's result
+    """
+    handler = getattr(agent, name)
+    if inspect.iscoroutinefunction(handler):
+        return await handler(*args)
+
+    result = await run_in_threadpool(handler, *args)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+def _is_google_message(data: Any) -> bool:
+    """Check whether a message or conversation payload uses the Google A2A format"""
+    if not isinstance(data, dict):
+        return False
+    if "parts" in data and "role" in data and "content" not in data:
+        return True
+    messages = data.get("messages")
+    return bool(messages) and isinstance(messages[0], dict) and \
+        "parts" in messages[0] and "role" in messages[0]
+
+
+def _uses_google_format(agent: BaseA2AServer, is_google_format: bool) -> bool:
+    """Whether to answer in the Google A2A format"""
+    return is_google_format or getattr(agent, "_use_google_a2a", False)
+
+
+def _error_message(error_msg: str, google_format: bool) -> Dict[str, Any]:
+    """Build an error message in the requested format"""
+    if google_format:
+        return {
+            "role": "agent",
+            "parts": [
+                {
+                    "type": "data",
+                    "data": {"error": error_msg}
+                }
+            ]
+        }
+    return {
+        "content": {
+            "type": "error",
+            "message": error_msg
+        },
+        "role": "system"
+    }
+
+
+def _jsonrpc_error(rpc_id: Any, code: int, message: str) -> Dict[str, Any]:
+    """Build a JSON-RPC error response"""
+    return {
+        "jsonrpc": "2.0",
+        "id": rpc_id,
+        "error": {
+            "code": code,
+            "message": message
+        }
+    }
+
+
+def _task_dict(agent: BaseA2AServer, task: Task, google_format: bool = False) -> Dict[str, Any]:
+    """Convert a task to a dictionary in the agent's format"""
+    if _uses_google_format(agent, google_format):
+        return task.to_google_a2a()
+    return task.to_dict(WireFormat.PYTHON_A2A)
+
+
+def _agent_card_data(agent: BaseA2AServer) -> Dict[str, Any]:
+    """Get the agent card data, with the Google A2A compatibility flags"""
+    if hasattr(agent, "agent_card"):
+        agent_data = agent.agent_card.to_dict()
+    else:
+        agent_data = {
+            "name": "A2A Agent",
+            "description": "Agent details not available",
+            "version": "1.0.0",
+            "skills": []
+        }
+
+    if hasattr(agent, "_use_google_a2a"):
+        if "capabilities" not in agent_data:
+            agent_data["capabilities"] = {}
+        agent_data["capabilities"]["google_a2a_compatible"] = getattr(agent, "_use_google_a2a", False)
+        agent_data["capabilities"]["parts_array_format"] = getattr(agent, "_use_google_a2a", False)
+    return agent_data
+
+
+async def process_task(agent: BaseA2AServer, data: Dict[str, Any],
+                       is_google_format: bool = False) -> Dict[str, Any]:
+    """
+    Process and store a task request
+
+    Args:
+        agent: The A2A agent server
+        data: Task data
+        is_google_format: Whether the task is in Google A2A format
+
+    Returns:
+        The processed task as a dictionary in the appropriate format
+    """
+    task = Task.from_google_a2a(data) if is_google_format else Task.from_dict(data)
+    result = await call_handler(agent, "handle_task", task)
+    agent.tasks[result.id] = result
+    return _task_dict(agent, result, is_google_format)
+
+
+def _is_google_task_params(params: Any) -> bool:
+    """Check whether task parameters carry a Google A2A format message"""
+    if isinstance(params, dict):
+        return _is_google_message(params.get("message"))
+    return False
+
+
+def create_asgi_app(agent: BaseA2AServer,
+                    admission: Optional[AdmissionController] = None,
+                    compress_min_size: Optional[int] = compression.DEFAULT_MIN_SIZE) -> "FastAPI":
+    """
+    Create an ASGI (FastAPI) application that serves an A2A agent
+
+    The application serves the message, conversation, task, streaming and
+    agent card routes of ``create_flask_app``. Task routes are only served
+    for agents that keep a ``tasks`` store and implement ``handle_task``
+    (such as ``A2AServer``). Custom Flask routes added by an agent's
+    ``setup_routes`` are not available; the browser UI pages are replaced by
+    their JSON equivalents. The serialized agent card is cached in
+    ``app.state.agent_card_cache``. With an admission controller, POST
+    requests are subject to its concurrency limits (see
+    ``AdmissionMiddleware``) and ``/a2a/admission`` reports its metrics.
+    Responses are compressed as negotiated by ``Accept-Encoding`` and
+    compressed request bodies are accepted (see ``CompressionMiddleware``).
+
+    Args:
+        agent: The A2A agent server
+        admission: Optional admission controller (defaults to the agent's
+            ``admission`` attribute)
+        compress_min_size: Minimum size in bytes of compressed responses
+            (None to disable compression)
+
+    Returns:
+        A FastAPI application
+
+    Raises:
+        A2AImportError: If FastAPI is not installed
+    """
+    if FastAPI is None:
+        raise A2AImportError(
+            "FastAPI is not installed. "
+            "Install it with 'pip install fastapi uvicorn'"
+        )
+
+    card = getattr(agent, "agent_card", None)
+    app = FastAPI(
+        title=getattr(card, "name", "A2A Agent"),
+        description=getattr(card, "description", ""),
+        version=getattr(card, "version", "1.0.0"),
+        docs_url=None,
+        redoc_url=None,
+        openapi_url=None,
+        default_response_class=CodecJSONResponse
+    )
+
+    # Admission control runs inside the CORS and compression middlewares,
+    # so rejections get CORS headers too
+    if admission is None:
+        admission = getattr(agent, "admission", None)
+    if admission is not None:
+        app.add_middleware(AdmissionMiddleware, admission=admission)
+        app.add_api_route("/a2a/admission", admission.metrics, methods=["GET"])
+
+    # Allow CORS for all routes
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],
+        allow_methods=["GET", "POST", "OPTIONS"],
+        allow_headers=["Content-Type", "Authorization", "X-API-Key"],
+    )
+
+    if compress_min_size is not None:
+        app.add_middleware(CompressionMiddleware, min_size=compress_min_size)
+
+    # Agent information routes
+    async def agent_index():
+        """A2A index"""
+        capabilities = {}
+        if hasattr(agent, "agent_card") and hasattr(agent.agent_card, "capabilities"):
+            capabilities = agent.agent_card.capabilities
+        elif hasattr(agent, "_use_google_a2a"):
+            capabilities = {
+                "google_a2a_compatible": getattr(agent, "_use_google_a2a", False),
+                "parts_array_format": getattr(agent, "_use_google_a2a", False)
+            }
+
+        return {
+            "name": agent.agent_card.name if hasattr(agent, "agent_card") else "A2A Agent",
+            "description": agent.agent_card.description if hasattr(agent, "agent_card") else "",
+            "agent_card_url": "/a2a/agent.json",
+            "protocol": "a2a",
+            "capabilities": capabilities
+        }
+
+    # The serialized agent card, served to discovery and health polling
+    agent_card_cache = AgentCardCache(lambda: _agent_card_data(agent), key=lambda: agent_card_key(agent))
+    app.state.agent_card_cache = agent_card_cache
+
+    async def agent_card(request: Request):
+        """Agent card JSON, answering conditional requests with 304"""
+        document = agent_card_cache.get()
+        if document.not_modified(request.headers.get("if-none-match"),
+                                 request.headers.get("if-modified-since")):
+            return Response(status_code=304, headers=document.headers)
+        return Response(document.body, media_type="application/json", headers=document.headers)
+
+    async def get_agent_metadata():
+        """Return metadata about the agent"""
+        metadata = agent.get_metadata()
+        if hasattr(agent, "_use_google_a2a"):
+            metadata["google_a2a_compatible"] = getattr(agent, "_use_google_a2a", False)
+            metadata["parts_array_format"] = getattr(agent, "_use_google_a2a", False)
+        return metadata
+
+    async def health_check():
+        """Health check endpoint"""
+        return {"status": "ok"}
+
+    for path in ("/", "/a2a", "/agent"):
+        app.add_api_route(path, agent_index, methods=["GET"])
+    for path in ("/agent.json", "/a2a/agent.json"):
+        app.add_api_route(path, agent_card, methods=["GET"])
+    app.add_api_route("/a2a/metadata", get_agent_metadata, methods=["GET"])
+    app.add_api_route("/a2a/health", health_check, methods=["GET"])
+
+    # Messages and conversations
+    async def handle_a2a_request(request: Request):
+        """Handle messages, conversations and tasks posted to the agent"""
+        data = None
+        is_google_format = False
+        try:
+            data = codec.loads(await request.body())
+            is_google_format = _is_google_message(data)
+
+            # Check if it's a task
+            if hasattr(agent, "tasks") and "id" in data and ("message" in data or "status" in data):
+                return await _task_response(data, is_google_format)
+
+            google_format = _uses_google_format(agent, is_google_format)
+            if "messages" in data:
+                conversation = Conversation.from_google_a2a(data) if is_google_format \
+                    else Conversation.from_dict(data)
+                response = await call_handler(agent, "handle_conversation", conversation)
+            else:
+                message = Message.from_google_a2a(data) if is_google_format \
+                    else Message.from_dict(data)
+                response = await call_handler(agent, "handle_message", message)
+
+            return response.to_google_a2a() if google_format else response.to_dict(WireFormat.PYTHON_A2A)
+
+        except Exception as e:
+            logger.exception("Error processing A2A request")
+            error_msg = f"Error processing request: {str(e)}"
+            google_format = _uses_google_format(agent, is_google_format)
+            return JSONResponse(_error_message(error_msg, google_format), status_code=500)
+
+    async def _task_response(data: Dict[str, Any], is_google_format: bool):
+        """Process a task, returning the task or a failed task"""
+        try:
+            return await process_task(agent, data, is_google_format)
+        except Exception as e:
+            return JSONResponse({
+                "id": data.get("id", ""),
+                "sessionId": data.get("sessionId", ""),
+                "status": {
+                    "state": "failed",
+                    "message": {"error": f"Error processing task: {str(e)}"},
+                    "timestamp": datetime.now().isoformat()
+                }
+            }, status_code=500)
+
+    for path in ("/", "/a2a"):
+        app.add_api_route(path, handle_a2a_request, methods=["POST"])
+
+    # Streaming responses
+    async def handle_streaming_request(request: Request):
+        """Stream the agent's response as server-sent events"""
+        try:
+            data = codec.loads(await request.body())
+            if "message" in data and isinstance(data["message"], dict):
+                message = Message.from_dict(data["message"])
+            else:
+                message = Message.from_dict(data)
+        except Exception as e:
+            return JSONResponse({"error": str(e)}, status_code=500)
+
+        if not hasattr(agent, "stream_response"):
+            return JSONResponse({"error": "This agent does not support streaming"}, status_code=405)
+        if type(agent).stream_response is BaseA2AServer.stream_response:
+            return JSONResponse(
+                {"error": "This agent inherits but does not implement stream_response"},
+                status_code=501
+            )
+
+        async def generate() -> AsyncGenerator[str, None]:
+            yield ": SSE stream established\n\n"
+            index = 0
+            trace = stream_logger.isEnabledFor(logging.DEBUG)
+            try:
+                async for chunk in agent.stream_response(message):
+                    event = f"data: {codec.dumps_str({'content': chunk, 'index': index, 'append': True})}\n\n"
+                    if trace:
+                        stream_logger.debug(
+                            "Stream %s chunk %d (%d bytes)", message.message_id, index, len(event),
+                            extra={"stream_id": message.message_id, "chunk_index": index}
+                        )
+                    yield event
+                    index += 1
+                last_chunk = {"content": "", "index": index, "append": True, "lastChunk": True}
+                yield f"data: {codec.dumps_str(last_chunk)}\n\n"
+            except Exception as e:
+                logger.exception("Error in streaming response")
+                yield f"event: error\ndata: {codec.dumps_str({'error': str(e)})}\n\n"
+
+        return StreamingResponse(generate(), media_type="text/event-stream", headers=_SSE_HEADERS)
+
+    app.add_api_route("/stream", handle_streaming_request, methods=["POST"])
+
+    if hasattr(agent, "tasks") and hasattr(agent, "handle_task"):
+        _add_task_routes(app, agent, _task_response)
+
+    return app
+
+
+def _add_task_routes(app: "FastAPI", agent: BaseA2AServer, task_response) -> None:
+    """Add the JSON-RPC task routes of ``A2AServer.setup_routes``"""
+
+    async def tasks_send(request: Request):
+        """Create or update a task"""
+        request_data = None
+        try:
+            request_data = codec.loads(await request.body())
+
+            if isinstance(request_data, list):
+                return await _handle_jsonrpc_batch(agent, request_data)
+
+            if "jsonrpc" in request_data:
+                rpc_id = request_data.get("id", 1)
+                params = request_data.get("params", {})
+                result = await process_task(agent, params, _is_google_task_params(params))
+                return {"jsonrpc": "2.0", "id": rpc_id, "result": result}
+
+            return await task_response(request_data, _is_google_task_params(request_data))
+
+        except Exception as e:
+            if isinstance(request_data, dict) and "jsonrpc" in request_data:
+                return JSONResponse(
+                    _jsonrpc_error(request_data.get("id", 1), -32603, f"Internal error: {str(e)}"),
+                    status_code=500
+                )
+            return JSONResponse(
+                _error_message(f"Error: {str(e)}", getattr(agent, "_use_google_a2a", False)),
+                status_code=500
+            )
+
+    async def tasks_get(request: Request):
+        """Get a task"""
+        return await _task_lookup(request, cancel=False)
+
+    async def tasks_cancel(request: Request):
+        """Cancel a task"""
+        return await _task_lookup(request, cancel=True)
+
+    async def _task_lookup(request: Request, cancel: bool):
+        request_data = None
+        try:
+            request_data = codec.loads(await request.body())
+            is_jsonrpc = "jsonrpc" in request_data
+            rpc_id = request_data.get("id", 1)
+            params = request_data.get("params", {}) if is_jsonrpc else request_data
+            task_id = params.get("id")
+
+            task = agent.tasks.get(task_id)
+            if not task:
+                if is_jsonrpc:
+                    return JSONResponse(_jsonrpc_error(rpc_id, -32000, f"Task not found: {task_id}"),
+                                        status_code=404)
+                return JSONResponse({"error": f"Task not found: {task_id}"}, status_code=404)
+
+            if cancel:
+                task.status = TaskStatus(state=TaskState.CANCELED)
+                agent.tasks[task_id] = task
+
+            task_dict = _task_dict(agent, task)
+            if is_jsonrpc:
+                return {"jsonrpc": "2.0", "id": rpc_id, "result": task_dict}
+            return task_dict
+
+        except Exception as e:
+            rpc_id = request_data.get("id", 1) if isinstance(request_data, dict) else 1
+            return JSONResponse(_jsonrpc_error(rpc_id, -32603, f"Internal error: {str(e)}"),
+                                status_code=500)
+
+    async def tasks_stream(request: Request):
+        """Handle tasks/sendSubscribe and tasks/resubscribe"""
+        request_data = None
+        try:
+            request_data = codec.loads(await request.body())
+            if "jsonrpc" not in request_data:
+                return JSONResponse({"error": "Expected JSON-RPC format for streaming requests"},
+                                    status_code=400)
+
+            method = request_data.get("method", "")
+            params = request_data.get("params", {})
+            rpc_id = request_data.get("id", 1)
+
+            if method == "tasks/sendSubscribe":
+                stream = _send_subscribe_stream(agent, Task.from_dict(params), rpc_id)
+            elif method == "tasks/resubscribe":
+                task_id = params.get("id")
+                if not task_id:
+                    return JSONResponse(_jsonrpc_error(rpc_id, -32602, "Missing required parameter: id"),
+                                        status_code=400)
+                # Replay the task's published updates after the client's last
+                # event and stream the live ones
+                if hasattr(agent, "subscribe_task"):
+                    events, callback = _event_queue()
+                    last_event_id = parse_last_event_id(
+                        request.headers.get("last-event-id") or params.get("lastEventId")
+                    )
+                    if agent.subscribe_task(task_id, callback, last_event_id):
+                        stream = _published_events(agent, task_id, events, callback)
+                        return StreamingResponse(stream, media_type="text/event-stream",
+                                                 headers=_SSE_HEADERS)
+
+                task = agent.tasks.get(task_id)
+                if not task:
+                    return JSONResponse(_jsonrpc_error(rpc_id, -32000, f"Task not found: {task_id}"),
+                                        status_code=404)
+                stream = _resubscribe_stream(agent, task, rpc_id)
+            else:
+                return JSONResponse(_jsonrpc_error(rpc_id, -32601, f"Method '{method}' not found"),
+                                    status_code=404)
+
+            return StreamingResponse(stream, media_type="text/event-stream", headers=_SSE_HEADERS)
+
+        except Exception as e:
+            rpc_id = request_data.get("id", 1) if isinstance(request_data, dict) else 1
+            return JSONResponse(_jsonrpc_error(rpc_id, -32603, f"Internal error: {str(e)}"),
+                                status_code=500)
+
+    for prefix in ("/a2a", ""):
+        app.add_api_route(f"{prefix}/tasks/send", tasks_send, methods=["POST"])
+        app.add_api_route(f"{prefix}/tasks/get", tasks_get, methods=["POST"])
+        app.add_api_route(f"{prefix}/tasks/cancel", tasks_cancel, methods=["POST"])
+        app.add_api_route(f"{prefix}/tasks/stream", tasks_stream, methods=["POST"])
+
+
+async def _handle_jsonrpc_batch(agent: BaseA2AServer, batch: list):
+    """
+    Handle a JSON-RPC batch of tasks/send requests
+
+    Up to ``batch_max_workers`` tasks of the batch are processed concurrently.
+
+    Args:
+        agent: The A2A agent server
+        batch: List of JSON-RPC requests
+
+    Returns:
+        Response with the list of JSON-RPC responses
+    """
+    if not batch:
+        return JSONResponse(_jsonrpc_error(None, -32600, "Invalid Request: empty batch"), status_code=400)
+
+    semaphore = asyncio.Semaphore(max(1, getattr(agent, "batch_max_workers", 8)))
+
+    async def handle_item(item) -> Optional[Dict[str, Any]]:
+        if not isinstance(item, dict) or "jsonrpc" not in item:
+            return _jsonrpc_error(None, -32600, "Invalid Request")
+
+        rpc_id = item.get("id")
+        method = item.get("method", "tasks/send")
+        params = item.get("params", {})
+
+        if method != "tasks/send":
+            response = _jsonrpc_error(rpc_id, -32601, f"Method not found: {method}")
+        else:
+            try:
+                async with semaphore:
+                    result = await process_task(agent, params, _is_google_task_params(params))
+                response = {"jsonrpc": "2.0", "id": rpc_id, "result": result}
+            except Exception as e:
+                response = _jsonrpc_error(rpc_id, -32603, f"Internal error: {str(e)}")
+
+        # Notifications (requests without an ID) get no response
+        return response if "id" in item else None
+
+    responses = await asyncio.gather(*(handle_item(item) for item in batch))
+    responses = [response for response in responses if response is not None]
+    if not responses:
+        return Response(status_code=204)
+    return responses
+
+
+async def _published_events(agent: BaseA2AServer, task_id: str, events: "asyncio.Queue",
+                            callback: Callable[[TaskEvent], None],
+                            timeout: float = STREAM_TIMEOUT) -> AsyncGenerator[str, None]:
+    """Stream the events published for a task until it completes or ``timeout`` seconds pass"""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    try:
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                logger.warning("Event stream of task %s timed out", task_id)
+                yield f"event: error\ndata: {codec.dumps_str({'error': 'Streaming timed out'})}\n\n"
+                return
+            try:
+                event = await asyncio.wait_for(events.get(), min(remaining, KEEPALIVE_INTERVAL))
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            yield event.to_sse()
+            if event.event == COMPLETE_EVENT:
+                return
+    finally:
+        agent.unsubscribe_task(task_id, callback)
+
+
+def _event_queue() -> Tuple["asyncio.Queue", Callable[[TaskEvent], None]]:
+    """Create a queue and a task subscription callback feeding it from worker threads"""
+    loop = asyncio.get_running_loop()
+    events = asyncio.Queue()
+
+    def callback(event: TaskEvent) -> None:
+        loop.call_soon_threadsafe(events.put_nowait, event)
+
+    return events, callback
+
+
+async def _send_subscribe_stream(agent: BaseA2AServer, task: Task, rpc_id: Any) -> AsyncGenerator[str, None]:
+    """Stream the updates of a new task"""
+    if hasattr(agent, "submit_task"):
+        # Run the task on the agent's worker pool and relay what it publishes
+        events, callback = _event_queue()
+        agent.submit_task(task, callback=callback)
+        async for chunk in _published_events(agent, task.id, events, callback):
+            yield chunk
+        return
+
+    yield f"event: update\nid: {rpc_id}\ndata: {codec.dumps_str(_task_dict(agent, task))}\n\n"
+    try:
+        result_task = await call_handler(agent, "handle_task", task)
+    except Exception as e:
+        task.status = TaskStatus(state=TaskState.FAILED, message={"error": str(e)})
+        result_task = task
+
+    agent.tasks[result_task.id] = result_task
+    yield f"event: complete\nid: {rpc_id}\ndata: {codec.dumps_str(_task_dict(agent, result_task))}\n\n"
+
+
+async def _resubscribe_stream(agent: BaseA2AServer, task: Task, rpc_id: Any) -> AsyncGenerator[str, None]:
+    """
+    Stream the current state of a task that has no published events to follow
+
+    A task still running ends the stream with an error event, as its live
+    updates are not available.
+    """
+    current_task = codec.dumps_str(_task_dict(agent, task))
+    yield f"event: update\nid: {rpc_id}\ndata: {current_task}\n\n"
+    if task.status.state in [TaskState.COMPLETED, TaskState.FAILED, TaskState.CANCELED]:
+        yield f"event: complete\nid: {rpc_id}\ndata: {current_task}\n\n"
+    else:
+        error = {"error": f"Live updates are not available for task {task.id}"}
+        yield f"event: error\ndata: {codec.dumps_str(error)}\n\n"
+
+
+def run_asgi_server(
+    agent: Union[BaseA2AServer, str],
+    host: str = "0.0.0.0",
+    port: int = 5000,
+    workers: int = 1,
+    log_level: str = "info"
+) -> None:
+    """
+    Run an A2A agent as an ASGI server with uvicorn
+
+    To run several worker processes, pass an import string naming a module
+    level ASGI app instead of an agent, e.g. ``"my_agent:app"`` where
+    ``app = create_asgi_app(agent)``; each worker then imports its own app.
+
+    Args:
+        agent: The A2A agent server, or the import string of an ASGI app
+        host: Host to bind to (default: "0.0.0.0")
+        port: Port to listen on (default: 5000)
+        workers: Number of worker processes (default: 1)
+        log_level: Uvicorn log level (default: "info")
+
+    Raises:
+        A2AImportError: If FastAPI or uvicorn is not installed
+        ValueError: If several workers are requested for an agent instance
+    """
+    try:
+        import uvicorn
+    except ImportError:
+        raise A2AImportError(
+            "uvicorn is not installed. "
+            "Install it with 'pip install uvicorn'"
+        )
+
+    if isinstance(agent, str):
+        app = agent
+    else:
+        if workers > 1:
+            raise ValueError(
+                "Running several workers requires an import string of the app, "
+                "e.g. run_asgi_server('my_agent:app', workers=4)"
+            )
+        app = create_asgi_app(agent)
+
+    logger.info(f"Starting A2A ASGI server on http://{host}:{port}/a2a")
+    uvicorn.run(app, host=host, port=port, workers=workers, log_level=log_level)
@@ -0,0 +1,439 @@
+"""
+Task event bus for A2A servers.
+
+Running tasks publish their updates (status changes, artifacts and the final
+state) as events on a bus, and any number of clients can subscribe to the
+events of one task. Events get increasing IDs per task, and the latest events
+of each task are kept in a bounded ring buffer, so a client reconnecting with
+``Last-Event-ID`` receives the events it missed before the live ones.
+
+``TaskEventBus`` works within one process. ``RedisTaskEventBus`` shares the
+events through Redis, so clients can attach to a task running in another
+server process.
+"""
+
+import logging
+import queue
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from .. import codec
+
+logger = logging.getLogger(__name__)
+
+# Name of the event ending the events of a task
+COMPLETE_EVENT = "complete"
+
+# Seconds between keepalive comments on an idle task event stream, so that
+# disconnected clients are noticed
+KEEPALIVE_INTERVAL = 15
+
+
+@dataclass(frozen=True)
+class TaskEvent:
+    """An update of a task, as sent to subscribers"""
+    id: int
+    event: str
+    data: Dict[str, Any]
+
+    def to_sse(self) -> str:
+        """Format the event as a Server-Sent Event"""
+        return f"event: {self.event}\nid: {self.id}\ndata: {codec.dumps_str(self.data)}\n\n"
+
+    def to_json(self) -> str:
+        """Serialize the event to JSON"""
+        return codec.dumps_str({"id": self.id, "event": self.event, "data": self.data})
+
+    @classmethod
+    def from_json(cls, payload: Any) -> "TaskEvent":
+        """Deserialize an event serialized with ``to_json``"""
+        fields = codec.loads(payload)
+        return cls(id=fields["id"], event=fields["event"], data=fields["data"])
+
+
+EventCallback = Callable[[TaskEvent], None]
+
+
+def parse_last_event_id(value: Any) -> Optional[int]:
+    """
+    Parse a ``Last-Event-ID`` value.
+
+    Args:
+        value: The header or parameter value
+
+    Returns:
+        The event ID, or None if the value is missing or not an event ID
+    """
+    try:
+        return int(value) if value not in (None, "") else None
+    except (TypeError, ValueError):
+        return None
+
+
+class _Subscriber:
+    """A subscription callback that receives each event once, in order"""
+
+    __slots__ = ("callback", "last_id", "lock")
+
+    def __init__(self, callback: EventCallback):
+        self.callback = callback
+        self.last_id = 0
+        self.lock = threading.Lock()
+
+    def deliver(self, event: TaskEvent) -> None:
+        # Callers hold the lock; events already seen (e.g. both replayed and
+        # received live) are dropped
+        if event.id > self.last_id:
+            self.last_id = event.id
+            try:
+                self.callback(event)
+            except Exception:
+                logger.exception("Task event subscriber failed")
+
+
+class _TaskBuffer:
+    """The latest events of a task"""
+
+    __slots__ = ("events", "last_id", "published_at")
+
+    def __init__(self, size: int):
+        self.events: Deque[TaskEvent] = deque(maxlen=size)
+        self.last_id = 0
+        self.published_at = 0.0
+
+    @property
+    def complete(self) -> bool:
+        return bool(self.events) and self.events[-1].event == COMPLETE_EVENT
+
+
+def _replay(events: List[TaskEvent], last_event_id: Optional[int]) -> List[TaskEvent]:
+    """Select the events to replay to a new subscriber"""
+    replay = [event for event in events if last_event_id is None or event.id > last_event_id]
+    if not replay and events and events[-1].event == COMPLETE_EVENT:
+        # The subscriber has seen everything; repeat the end of the stream
+        replay = [events[-1]]
+    return replay
+
+
+class TaskEventBus:
+    """
+    In-process publish/subscribe of task events.
+
+    Subscriber callbacks run on the publishing thread and must not block
+    (e.g. put the event on a queue).
+
+    Example:
+        >>> bus = TaskEventBus()
+        >>> received = []
+        >>> _ = bus.publish("task-1", "update", {"state": "waiting"})
+        >>> bus.subscribe("task-1", received.append)
+        True
+        >>> _ = bus.publish("task-1", "complete", {"state": "completed"})
+        >>> [event.id for event in received]
+        [1, 2]
+    """
+
+    def __init__(self, buffer_size: int = 256, max_tasks: int = 1000,
+                 ttl: Optional[float] = 3600):
+        """
+        Initialize an in-process event bus.
+
+        Args:
+            buffer_size: Number of events kept per task for replay
+            max_tasks: Number of tasks whose events are kept; the buffers of
+                the least recently published tasks are dropped first
+            ttl: Seconds the events of a task are kept after its last event
+                (None to keep them until they are dropped for newer tasks)
+
+        Buffers of tasks with live subscribers are kept, whatever their age,
+        so that their event IDs keep increasing.
+        """
+        self.buffer_size = buffer_size
+        self.max_tasks = max_tasks
+        self.ttl = ttl
+        # Task ID -> subscribers waiting for live events
+        self.subscriptions: Dict[str, List[_Subscriber]] = {}
+        self._buffers: "OrderedDict[str, _TaskBuffer]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def publish(self, task_id: str, event: str, data: Dict[str, Any]) -> TaskEvent:
+        """
+        Publish an event of a task.
+
+        Args:
+            task_id: ID of the task
+            event: Event name ("update", "artifact" or "complete"; "complete"
+                ends the events of the task)
+            data: The event data (the task as a dictionary)
+
+        Returns:
+            The published event
+        """
+        now = time.monotonic()
+        with self._lock:
+            buffer = self._buffers.get(task_id)
+            if buffer is None:
+                buffer = self._buffers[task_id] = _TaskBuffer(self.buffer_size)
+            self._buffers.move_to_end(task_id)
+            buffer.published_at = now
+            self._evict(now)
+            buffer.last_id += 1
+            task_event = TaskEvent(id=buffer.last_id, event=event, data=data)
+            buffer.events.append(task_event)
+            if event == COMPLETE_EVENT:
+                subscribers = self.subscriptions.pop(task_id, [])
+            else:
+                subscribers = list(self.subscriptions.get(task_id, ()))
+        self._deliver(subscribers, task_event)
+        return task_event
+
+    def _evict(self, now: float) -> None:
+        # Called with the lock held; buffers are in least recently published
+        # order, so only the oldest ones are looked at
+        for _ in range(len(self._buffers)):
+            task_id, buffer = next(iter(self._buffers.items()))
+            if len(self._buffers) <= self.max_tasks and (
+                    self.ttl is None or now - buffer.published_at < self.ttl):
+                return
+            if task_id in self.subscriptions:
+                self._buffers.move_to_end(task_id)
+            else:
+                del self._buffers[task_id]
+
+    @staticmethod
+    def _deliver(subscribers: List[_Subscriber], event: TaskEvent) -> None:
+        for subscriber in subscribers:
+            with subscriber.lock:
+                subscriber.deliver(event)
+
+    def subscribe(self, task_id: str, callback: EventCallback,
+                  last_event_id: Optional[int] = None) -> bool:
+        """
+        Subscribe to the events of a task.
+
+        The buffered events after ``last_event_id`` (all of them if None) are
+        replayed to the callback first, followed by the live events up to the
+        ``complete`` event. Events that dropped out of the ring buffer are
+        not replayed.
+
+        Args:
+            task_id: ID of the task
+            callback: Called with each ``TaskEvent``
+            last_event_id: ID of the last event the subscriber has seen
+
+        Returns:
+            True if subscribed, False if the bus has no events for the task
+        """
+        subscriber = _Subscriber(callback)
+        with self._lock:
+            buffer = self._buffers.get(task_id)
+            if buffer is None:
+                return False
+            replay = _replay(list(buffer.events), last_event_id)
+            if not buffer.complete:
+                self.subscriptions.setdefault(task_id, []).append(subscriber)
+            # Hold the subscriber until the replay is delivered, so live
+            # events cannot overtake it
+            subscriber.lock.acquire()
+        try:
+            for event in replay:
+                subscriber.deliver(event)
+        finally:
+            subscriber.lock.release()
+        return True
+
+    def unsubscribe(self, task_id: str, callback: EventCallback) -> None:
+        """
+        Remove a subscription.
+
+        Args:
+            task_id: ID of the task
+            callback: The subscribed callback
+        """
+        with self._lock:
+            self._remove(task_id, callback)
+
+    def _remove(self, task_id: str, callback: EventCallback) -> bool:
+        """Remove a subscriber (lock held); return True if none are left for the task"""
+        subscribers = self.subscriptions.get(task_id)
+        if subscribers is None:
+            return False
+        subscribers[:] = [s for s in subscribers if s.callback != callback]
+        if not subscribers:
+            del self.subscriptions[task_id]
+            return True
+        return False
+
+    def close(self) -> None:
+        """Release the bus's resources"""
+        pass
+
+
+class RedisTaskEventBus(TaskEventBus):
+    """
+    Task event bus sharing events through Redis.
+
+    The events of each task are stored in a capped Redis list (the ring
+    buffer) and announced on a pub/sub channel of the same name. A listener
+    thread relays announced events to local subscribers. The pub/sub
+    connection is not thread-safe, so only the listener thread uses it:
+    other threads queue their channel subscriptions for it. Any client with
+    the redis-py API works, e.g. ``RedisTaskEventBus(redis.Redis())``.
+    """
+
+    def __init__(self, client: Any, prefix: str = "a2a:task-events", buffer_size: int = 256,
+                 ttl: int = 3600, poll_interval: float = 0.1):
+        """
+        Initialize a Redis event bus.
+
+        Args:
+            client: Redis client (``redis.Redis`` or compatible)
+            prefix: Prefix of the Redis keys and channels
+            buffer_size: Number of events kept per task for replay
+            ttl: Seconds the events of a task are kept after its last event
+            poll_interval: Seconds the listener thread waits for messages
+                before handling queued subscriptions and checking whether
+                the bus was closed; the first subscriber of a task may wait
+                this long
+        """
+        super().__init__(buffer_size=buffer_size)
+        self.client = client
+        self.prefix = prefix
+        self.ttl = ttl
+        self.poll_interval = poll_interval
+        self._pubsub = None
+        self._listener: Optional[threading.Thread] = None
+        self._closed = threading.Event()
+        # (method, channel, done) pub/sub calls for the listener thread to make
+        self._commands: "queue.Queue[tuple]" = queue.Queue()
+        # Task ID -> set once the listener has subscribed to the task's channel
+        self._subscribed: Dict[str, threading.Event] = {}
+
+    def _key(self, task_id: str) -> str:
+        return f"{self.prefix}:{task_id}"
+
+    def publish(self, task_id: str, event: str, data: Dict[str, Any]) -> TaskEvent:
+        key = self._key(task_id)
+        event_id = self.client.incr(f"{key}:seq")
+        task_event = TaskEvent(id=event_id, event=event, data=data)
+        payload = task_event.to_json()
+
+        pipeline = self.client.pipeline()
+        pipeline.rpush(key, payload)
+        pipeline.ltrim(key, -self.buffer_size, -1)
+        pipeline.expire(key, self.ttl)
+        pipeline.expire(f"{key}:seq", self.ttl)
+        pipeline.publish(key, payload)
+        pipeline.execute()
+        return task_event
+
+    def subscribe(self, task_id: str, callback: EventCallback,
+                  last_event_id: Optional[int] = None) -> bool:
+        key = self._key(task_id)
+        subscriber = _Subscriber(callback)
+        with subscriber.lock:
+            # Listen before reading the buffer, so no event falls in between;
+            # events both read and received live are delivered once
+            with self._lock:
+                if task_id not in self.subscriptions:
+                    self._subscribed[task_id] = self._listen(key)
+                self.subscriptions.setdefault(task_id, []).append(subscriber)
+                subscribed = self._subscribed[task_id]
+            # Every subscriber waits, as the channel may still be pending for
+            # an earlier one. The listener subscribes before delivering any
+            # message, so it cannot be blocked on this subscriber meanwhile
+            while not subscribed.wait(self.poll_interval) and not self._closed.is_set():
+                pass
+
+            events = [TaskEvent.from_json(payload) for payload in self.client.lrange(key, 0, -1)]
+            if not events or events[-1].event == COMPLETE_EVENT:
+                self._drop(task_id, callback)
+            if not events:
+                return False
+            for event in _replay(events, last_event_id):
+                subscriber.deliver(event)
+        return True
+
+    def unsubscribe(self, task_id: str, callback: EventCallback) -> None:
+        self._drop(task_id, callback)
+
+    def _drop(self, task_id: str, callback: EventCallback) -> None:
+        with self._lock:
+            if self._remove(task_id, callback) and self._pubsub is not None:
+                del self._subscribed[task_id]
+                self._commands.put(("unsubscribe", self._key(task_id), None))
+
+    def _listen(self, channel: str) -> threading.Event:
+        # Called with the lock held; the returned event is set once subscribed
+        if self._pubsub is None:
+            self._pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+        subscribed = threading.Event()
+        self._commands.put(("subscribe", channel, subscribed))
+        if self._listener is None:
+            self._listener = threading.Thread(target=self._run_listener, name="a2a-task-events", daemon=True)
+            self._listener.start()
+        return subscribed
+
+    def _run_commands(self) -> None:
+        # Makes the queued pub/sub calls, on the listener thread
+        while True:
+            try:
+                method, channel, done = self._commands.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                getattr(self._pubsub, method)(channel)
+            except Exception:
+                logger.exception("Failed to %s Redis channel %s", method, channel)
+            finally:
+                if done is not None:
+                    done.set()
+
+    def _run_listener(self) -> None:
+        prefix = f"{self.prefix}:"
+        while not self._closed.is_set():
+            self._run_commands()
+            try:
+                message = self._pubsub.get_message(timeout=self.poll_interval)
+            except Exception:
+                if self._closed.is_set():
+                    return
+                logger.exception("Failed to read task events from Redis")
+                self._closed.wait(self.poll_interval)
+                continue
+            if not message:
+                if not self.subscriptions:
+                    # Some clients return at once when nothing is subscribed
+                    self._closed.wait(self.poll_interval)
+                continue
+            if message.get("type") != "message":
+                continue
+            # Subscribers waiting for their channel hold their lock, so
+            # subscribe them before delivering to anyone
+            self._run_commands()
+
+            channel = message["channel"]
+            if isinstance(channel, bytes):
+                channel = channel.decode()
+            task_id = channel[len(prefix):]
+            event = TaskEvent.from_json(message["data"])
+            with self._lock:
+                if event.event == COMPLETE_EVENT:
+                    subscribers = self.subscriptions.pop(task_id, [])
+                    if subscribers:
+                        del self._subscribed[task_id]
+                        self._pubsub.unsubscribe(channel)
+                else:
+                    subscribers = list(self.subscriptions.get(task_id, ()))
+            self._deliver(subscribers, event)
+
+    def close(self) -> None:
+        """Stop the listener thread and close the pub/sub connection"""
+        self._closed.set()
+        if self._listener is not None:
+            self._listener.join(timeout=self.poll_interval + 1)
+        if self._pubsub is not None:
+            self._pubsub.close()
@@ -2,33 +2,113 @@
 HTTP server implementation for the A2A protocol.
 """
 
+import io
 import json
-import traceback
-import time
-import threading
-import asyncio
-from queue import Queue, Empty
+import logging
 from typing import Type, Optional, Dict, Any, Callable, Union
 
 try:
-    from flask import Flask, request, jsonify, Response, render_template_string, make_response
+    from flask import Flask, request, jsonify, Response, render_template_string, make_response, g
 except ImportError:
     Flask = None
 
+try:
+    from flask.json.provider import DefaultJSONProvider
+except ImportError:
+    # Flask < 2.2 has no JSON providers; the standard library is used
+    DefaultJSONProvider = None
+
+from .. import codec, compression
 from ..models.message import Message, MessageRole
 from ..models.conversation import Conversation
+from ..models.converters import WireFormat
 from ..models.content import TextContent, ErrorContent
 from .base import BaseA2AServer
+from .stream_loop import get_stream_loop, StreamTimeoutError
+from .agent_card_cache import AgentCardCache, CachedDocument, agent_card_key
+from .admission import AdmissionController, AdmissionRejected, is_admission_controlled
 from ..exceptions import A2AImportError, A2ARequestError, A2AStreamingError
 from .ui_templates import AGENT_INDEX_HTML, JSON_HTML_TEMPLATE
 
+logger = logging.getLogger(__name__)
+
+# Per-chunk tracing of streams; enable with
+# logging.getLogger("python_a2a.server.http.stream").setLevel(logging.DEBUG)
+stream_logger = logger.getChild("stream")
+
+# Maximum number of chunks buffered per stream before the agent is paused
+STREAM_QUEUE_SIZE = 64
+
+# Maximum duration of a stream in seconds
+STREAM_TIMEOUT = 60
+
+
+def cached_json_response(document: CachedDocument) -> Response:
+    """
+    Serve a cached JSON document, answering conditional requests with 304
+    
+    Args:
+        document: The cached document
+        
+    Returns:
+        A Flask response
+    """
+    if document.not_modified(request.headers.get("If-None-Match"),
+                             request.headers.get("If-Modified-Since")):
+        return Response(status=304, headers=document.headers)
+    return Response(document.body, mimetype="application/json", headers=document.headers)
+
+
+if DefaultJSONProvider is not None:
+    class CodecJSONProvider(DefaultJSONProvider):
+        """
+        Flask JSON provider using the python_a2a codec
+        
+        ``request.json`` and ``jsonify`` then use orjson or msgspec when
+        installed (see ``python_a2a.codec``).
+        """
+        
+        def dumps(self, obj: Any, **kwargs: Any) -> str:
+            if kwargs.keys() - {"default"}:
+                # Formatting options such as indent are only supported by the
+                # standard library
+                return super().dumps(obj, **kwargs)
+            return codec.dumps_str(obj, default=kwargs.get("default", self.default))
+        
+        def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+            return codec.loads(s)
+        
+        def response(self, *args: Any, **kwargs: Any) -> Response:
+            obj = self._prepare_response_obj(args, kwargs)
+            return self._app.response_class(codec.dumps(obj, default=self.default), mimetype=self.mimetype)
+else:
+    CodecJSONProvider = None
+
 
-def create_flask_app(agent: BaseA2AServer) -> Flask:
+def create_flask_app(agent: BaseA2AServer,
+                     admission: Optional[AdmissionController] = None,
+                     compress_min_size: Optional[int] = compression.DEFAULT_MIN_SIZE) -> Flask:
     """
     Create a Flask application that serves an A2A agent
     
+    The serialized agent card is cached (see ``AgentCardCache``); after
+    editing the card in place, call
+    ``app.extensions["a2a_agent_card_cache"].invalidate()`` to serve the
+    change at once.
+    
+    With an admission controller, POST requests running agent handlers are
+    subject to its concurrency limits (rejected requests get 429 or 503 with
+    ``Retry-After``), and ``/a2a/admission`` reports its metrics.
+    
+    Responses are compressed as negotiated by ``Accept-Encoding`` (see
+    ``python_a2a.compression``) and compressed request bodies are accepted.
+    
     Args:
         agent: The A2A agent server
+        admission: Optional admission controller (defaults to the agent's
+            ``admission`` attribute)
+        compress_min_size: Minimum size in bytes of compressed responses
+            (None to disable compression)
         
     Returns:
         A Flask application
@@ -43,15 +123,24 @@ def create_flask_app(agent: BaseA2AServer) -> Flask:
         )
     
     app = Flask(__name__)
+    if CodecJSONProvider is not None:
+        app.json = CodecJSONProvider(app)
     
     # Allow CORS for all routes
     @app.after_request
     def add_cors_headers(response):
         response.headers['Access-Control-Allow-Origin'] = '*'
         response.headers['Access-Control-Allow-Methods'] = 'GET, POST, OPTIONS'
-        response.headers['Access-Control-Allow-Headers'] = 'Content-Type, Authorization'
+        response.headers['Access-Control-Allow-Headers'] = 'Content-Type, Authorization, X-API-Key'
         return response
     
+    if admission is None:
+        admission = getattr(agent, 'admission', None)
+    if admission is not None:
+        setup_admission(app, admission)
+    if compress_min_size is not None:
+        setup_compression(app, compress_min_size)
+    
     # Handle OPTIONS requests for CORS preflight
     @app.route('/', methods=['OPTIONS'])
     @app.route('/<path:path>', methods=['OPTIONS'])
@@ -126,10 +215,8 @@ def create_flask_app(agent: BaseA2AServer) -> Flask:
         """Agent endpoint with beautiful UI"""
         return enhanced_a2a_index()
     
-    @app.route("/a2a/agent.json", methods=["GET"])
-    def enhanced_a2a_agent_json():
-        """Agent card JSON with beautiful UI"""
-        # Get agent data
+    def get_agent_card_data():
+        """Get the agent card data, with the Google A2A compatibility flags"""
         agent_data = get_agent_data()
         
         # Add Google A2A compatibility flag if available
@@ -138,6 +225,17 @@ def create_flask_app(agent: BaseA2AServer) -> Flask:
                 agent_data["capabilities"] = {}
             agent_data["capabilities"]["google_a2a_compatible"] = getattr(agent, '_use_google_a2a', False)
             agent_data["capabilities"]["parts_array_format"] = getattr(agent, '_use_google_a2a', False)
+        return agent_data
+    
+    # The serialized agent card, served to discovery and health polling
+    agent_card_cache = AgentCardCache(get_agent_card_data, key=lambda: agent_card_key(agent))
+    app.extensions["a2a_agent_card_cache"] = agent_card_cache
+    
+    @app.route("/a2a/agent.json", methods=["GET"])
+    def enhanced_a2a_agent_json():
+        """Agent card JSON with beautiful UI"""
+        document = agent_card_cache.get()
+        agent_data = document.data
         
         # Check request format preferences
         user_agent = request.headers.get('User-Agent', '')
@@ -149,7 +247,7 @@ def create_flask_app(agent: BaseA2AServer) -> Flask:
             'application/json' in accept_header and 
             not any(browser in user_agent.lower() for browser in ['mozilla', 'chrome', 'safari', 'edge'])
         ):
-            return jsonify(agent_data)
+            return cached_json_response(document)
         
         # Otherwise serve HTML with pretty JSON visualization
         formatted_json = json.dumps(agent_data, indent=2)
@@ -185,19 +283,14 @@ def create_flask_app(agent: BaseA2AServer) -> Flask:
                 response.headers['Access-Control-Allow-Headers'] = 'Content-Type'
                 return response
             
-            # Check accept header for streaming support
-            accept_header = request.headers.get('Accept', '')
-            supports_sse = 'text/event-stream' in accept_header
-            
-            # Debug logging
-            print(f"Streaming request received with Accept: {accept_header}")
-            print(f"Request supports SSE: {supports_sse}")
-            
             # Extract the message from the request
             data = request.json
             
-            # Debug logging for request data
-            print(f"Streaming request data: {json.dumps(data)[:500]}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Streaming request received (Accept: %s): %s",
+                    request.headers.get('Accept', ''), json.dumps(data)[:500]
+                )
             
             # Check if this is a direct message or wrapped
             if "message" in data and isinstance(data["message"], dict):
@@ -206,151 +299,69 @@ def create_flask_app(agent: BaseA2AServer) -> Flask:
                 # Try parsing the entire request as a message
                 message = Message.from_dict(data)
             
-            # Debug logging for message
-            print(f"Extracted message: {message.content}")
-            
             # Check if the agent supports streaming
             if not hasattr(agent, 'stream_response'):
                 error_msg = "This agent does not support streaming"
-                print(f"Error: {error_msg}")
+                logger.warning(error_msg)
                 return jsonify({"error": error_msg}), 405
             
             # Check if stream_response is implemented (not just inherited)
             if agent.stream_response == BaseA2AServer.stream_response:
                 error_msg = "This agent inherits but does not implement stream_response"
-                print(f"Error: {error_msg}")
+                logger.warning(error_msg)
                 return jsonify({"error": error_msg}), 501
             
             # Set up SSE streaming response
             def generate():
                 """Generator for streaming server-sent events."""
-                # Create a thread and asyncio event loop for streaming
-                queue = Queue()
-                done_event = threading.Event()
-                
-                def run_async_stream():
-                    """Run the async stream in a dedicated thread with its own event loop."""
-                    async def process_stream():
-                        """Process the streaming response."""
-                        try:
-                            print("Starting streaming process")
-                            # Get the stream generator from the agent
-                            # Note: stream_response returns an async generator, not an awaitable
-                            stream_gen = agent.stream_response(message)
-                            
-                            # First heartbeat is sent from outside this function
-                            
-                            # Process each chunk
-                            index = 0
-                            async for chunk in stream_gen:
-                                print(f"Received chunk from agent: {chunk}")
-                                
-                                # Create chunk object with metadata
-                                chunk_data = {
-                                    "content": chunk,
-                                    "index": index,
-                                    "append": True
-                                }
-                                
-                                # Put in queue
-                                queue.put(chunk_data)
-                                print(f"Put chunk {index} in queue")
-                                index += 1
-                            
-                            # Signal completion
-                            queue.put({
-                                "content": "",
-                                "index": index,
-                                "append": True,
-                                "lastChunk": True
-                            })
-                            print(f"Streaming complete, signaling with lastChunk")
-                            
-                        except Exception as e:
-                            # Log the error
-                            print(f"Error in streaming process: {str(e)}")
-                            traceback.print_exc()
-                            
-                            # Put error in queue
-                            queue.put({"error": str(e)})
-                            
-                        finally:
-                            # Signal we're done
-                            done_event.set()
-                            print("Set done_event")
-                    
-                    # Create a new event loop for this thread
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    
-                    # Run the streaming process
-                    try:
-                        print("Starting async streaming thread")
-                        loop.run_until_complete(process_stream())
-                    except Exception as e:
-                        print(f"Exception in async thread: {e}")
-                        traceback.print_exc()
-                    finally:
-                        loop.close()
-                        print("Closed async loop")
-                
-                # Start the streaming thread
-                thread = threading.Thread(target=run_async_stream)
-                thread.daemon = True
-                thread.start()
-                print("Started streaming thread")
-                
                 # Yield initial SSE comment to establish connection
                 yield f": SSE stream established\n\n"
                 
-                # Process queue items until done
-                timeout = time.time() + 60  # 60-second timeout
-                
+                # The agent's async generator runs on the shared stream loop;
+                # the bounded queue pauses it when the client reads slowly
                 total_chunks = 0
                 
-                while not done_event.is_set() and time.time() < timeout:
-                    try:
-                        # Check if we have a chunk in the queue
-                        if not queue.empty():
-                            chunk = queue.get(block=False)
-                            total_chunks += 1
-                            
-                            # Check if it's an error
-                            if "error" in chunk:
-                                error_event = f"event: error\ndata: {json.dumps(chunk)}\n\n"
-                                print(f"Yielding error event: {error_event}")
-                                yield error_event
-                                break
-                            
-                            # Format as SSE event with proper newlines
-                            data_event = f"data: {json.dumps(chunk)}\n\n"
-                            print(f"Yielding data event #{total_chunks}")
-                            yield data_event
-                            
-                            # Check if it's the last chunk
-                            if chunk.get("lastChunk", False):
-                                print("Last chunk detected, ending stream")
-                                break
-                        else:
-                            # No data yet, sleep briefly
-                            time.sleep(0.01)
-                    except Empty:
-                        # Queue was empty
-                        time.sleep(0.01)
-                    except Exception as e:
-                        # Other error
-                        print(f"Error in queue processing: {e}")
-                        error_event = f"event: error\ndata: {json.dumps({'error': str(e)})}\n\n"
-                        yield error_event
-                        break
-                
-                # If timed out, send timeout error
-                if time.time() >= timeout and not done_event.is_set():
-                    error_event = f"event: error\ndata: {json.dumps({'error': 'Streaming timed out'})}\n\n"
-                    print("Stream timed out")
-                    yield error_event
+                # Decide once per stream, so disabled tracing costs nothing per chunk
+                trace = stream_logger.isEnabledFor(logging.DEBUG)
+                stream_id = message.message_id
+                try:
+                    for chunk in get_stream_loop().iterate(
+                        agent.stream_response(message),
+                        maxsize=STREAM_QUEUE_SIZE,
+                        timeout=STREAM_TIMEOUT
+                    ):
+                        # Format as SSE event with proper newlines
+                        chunk_data = {
+                            "content": chunk,
+                            "index": total_chunks,
+                            "append": True
+                        }
+                        event = f"data: {codec.dumps_str(chunk_data)}\n\n"
+                        if trace:
+                            stream_logger.debug(
+                                "Stream %s chunk %d (%d bytes)", stream_id, total_chunks, len(event),
+                                extra={"stream_id": stream_id, "chunk_index": total_chunks}
+                            )
+                        yield event
+                        total_chunks += 1
+                    
+                    # Signal completion
+                    last_chunk = {
+                        "content": "",
+                        "index": total_chunks,
+                        "append": True,
+                        "lastChunk": True
+                    }
+                    yield f"data: {codec.dumps_str(last_chunk)}\n\n"
+                    
+                except StreamTimeoutError:
+                    logger.warning("Stream %s timed out after %d chunks", stream_id, total_chunks)
+                    yield f"event: error\ndata: {codec.dumps_str({'error': 'Streaming timed out'})}\n\n"
+                except Exception as e:
+                    logger.exception("Error in stream %s", stream_id)
+                    yield f"event: error\ndata: {codec.dumps_str({'error': str(e)})}\n\n"
                 
-                print(f"Stream complete - yielded {total_chunks} chunks")
+                logger.debug("Stream %s complete - yielded %d chunks", stream_id, total_chunks)
             
             # Create the streaming response
             response = Response(generate(), mimetype="text/event-stream")
@@ -361,8 +372,7 @@ def create_flask_app(agent: BaseA2AServer) -> Flask:
             
         except Exception as e:
             # Log the exception
-            print(f"Exception in streaming request handler: {str(e)}")
-            traceback.print_exc()
+            logger.exception("Exception in streaming request handler")
             
             # Return error response for any other exception
             return jsonify({"error": str(e)}), 500
@@ -403,7 +413,7 @@ def create_flask_app(agent: BaseA2AServer) -> Flask:
                 if use_google_format:
                     return jsonify(response.to_google_a2a())
                 else:
-                    return jsonify(response.to_dict())
+                    return jsonify(response.to_dict(WireFormat.PYTHON_A2A))
             else:
                 # This is a single message
                 if is_google_format:
@@ -421,7 +431,7 @@ def create_flask_app(agent: BaseA2AServer) -> Flask:
                 if use_google_format:
                     return jsonify(response.to_google_a2a())
                 else:
-                    return jsonify(response.to_dict())
+                    return jsonify(response.to_dict(WireFormat.PYTHON_A2A))
                 
         except Exception as e:
             # Determine response format based on request
@@ -488,6 +498,132 @@ def create_flask_app(agent: BaseA2AServer) -> Flask:
     return app
 
 
+def setup_admission(app: Flask, admission: AdmissionController) -> None:
+    """
+    Apply an admission controller to the POST requests of a Flask app
+    
+    A request holds its slot until its response is closed, so streams keep
+    theirs until they end.
+    
+    Args:
+        app: The Flask application
+        admission: The admission controller
+    """
+    @app.before_request
+    def admit_request():
+        if not is_admission_controlled(request.method, request.path):
+            return None
+        try:
+            g.a2a_admission = admission.acquire(admission.key_func(request.headers))
+        except AdmissionRejected as e:
+            logger.info("Rejected %s %s with %d: %s", request.method, request.path, e.status_code, e.reason)
+            response = jsonify(e.to_dict())
+            response.status_code = e.status_code
+            response.headers.update(e.headers)
+            return response
+        return None
+    
+    @app.after_request
+    def release_on_close(response):
+        ticket = g.pop('a2a_admission', None)
+        if ticket is not None:
+            response.call_on_close(ticket.release)
+        return response
+    
+    @app.teardown_request
+    def release_on_error(exc=None):
+        # Requests failing before a response was made
+        ticket = g.pop('a2a_admission', None)
+        if ticket is not None:
+            ticket.release()
+    
+    @app.route("/a2a/admission", methods=["GET"])
+    def admission_metrics() -> Response:
+        """Admission control metrics (queue depth, requests in flight, rejections)"""
+        return jsonify(admission.metrics())
+
+
+class DecompressRequestMiddleware:
+    """
+    WSGI middleware decompressing request bodies sent with ``Content-Encoding``
+    
+    Bodies with an unsupported encoding are rejected with 415, and corrupt
+    or oversized ones with 400.
+    """
+    
+    def __init__(self, app: Callable, max_size: int = compression.DEFAULT_MAX_DECOMPRESSED_SIZE):
+        self.app = app
+        self.max_size = max_size
+    
+    def __call__(self, environ: Dict[str, Any], start_response: Callable):
+        encoding = environ.get("HTTP_CONTENT_ENCODING", "").strip().lower()
+        if encoding and encoding != "identity":
+            length = environ.get("CONTENT_LENGTH")
+            stream = environ["wsgi.input"]
+            body = stream.read(int(length)) if length else stream.read()
+            try:
+                body = compression.decompress(body, encoding, self.max_size)
+            except compression.DecompressionError as e:
+                status = 415 if isinstance(e, compression.UnsupportedEncodingError) else 400
+                response = Response(codec.dumps({"error": str(e)}), status=status, mimetype="application/json")
+                return response(environ, start_response)
+            environ["wsgi.input"] = io.BytesIO(body)
+            environ["CONTENT_LENGTH"] = str(len(body))
+            del environ["HTTP_CONTENT_ENCODING"]
+        return self.app(environ, start_response)
+
+
+def setup_compression(app: Flask, min_size: int = compression.DEFAULT_MIN_SIZE) -> None:
+    """
+    Compress the responses of a Flask app and accept compressed requests
+    
+    Responses of at least ``min_size`` bytes are compressed with the
+    encoding negotiated from ``Accept-Encoding``. Streamed responses are
+    compressed chunk by chunk, except Server-Sent Events, whose events must
+    reach the client as they are sent.
+    
+    Args:
+        app: The Flask application
+        min_size: Minimum size in bytes of compressed responses
+    """
+    app.wsgi_app = DecompressRequestMiddleware(app.wsgi_app)
+    
+    @app.after_request
+    def compress_response(response):
+        if (response.status_code < 200 or response.status_code in (204, 304)
+                or response.direct_passthrough
+                or "Content-Encoding" in response.headers
+                or response.mimetype == "text/event-stream"):
+            return response
+        response.vary.add("Accept-Encoding")
+        encoding = compression.choose_encoding(request.headers.get("Accept-Encoding"))
+        if encoding is None:
+            return response
+        
+        if response.is_streamed:
+            compressor = compression.StreamCompressor(encoding)
+            chunks = response.response
+            
+            def generate():
+                for chunk in chunks:
+                    data = compressor.compress(chunk)
+                    if data:
+                        yield data
+                yield compressor.finish()
+            
+            if hasattr(chunks, "close"):
+                response.call_on_close(chunks.close)
+            response.response = generate()
+            response.headers.pop("Content-Length", None)
+        else:
+            data = response.get_data()
+            if len(data) < min_size:
+                return response
+            response.set_data(compression.compress(data, encoding))
+        response.headers["Content-Encoding"] = encoding
+        return response
+
+
 def run_server(
     agent: BaseA2AServer,
     host: str = "0.0.0.0",
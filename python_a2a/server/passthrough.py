@@ -0,0 +1,298 @@
+"""
+Pass-through proxying of A2A requests to other agents.
+
+A gateway built with these apps forwards each request body to an upstream
+agent as raw bytes and streams the agent's response straight back, still
+compressed if the agent compressed it. Bodies are never decoded into
+``Message`` or ``Task`` objects and never re-encoded; the JSON-RPC envelope
+is parsed only if the routing function asks for it.
+
+Example:
+    >>> from python_a2a import A2AClient
+    >>> agents = {"search": A2AClient("http://search:5000"), "chat": A2AClient("http://chat:5000")}
+    >>> app = create_passthrough_app(
+    ...     lambda request: agents["search"] if request.method == "tasks/send" else agents["chat"])
+"""
+
+import logging
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+from .. import codec, compression
+from ..client.http import A2AClient
+from ..models.lazy import LazyMessage
+from ..exceptions import A2AConnectionError, A2AImportError
+
+logger = logging.getLogger(__name__)
+
+# Headers describing a single connection, which are not forwarded
+HOP_BY_HOP_HEADERS = frozenset({
+    "connection", "keep-alive", "proxy-authenticate", "proxy-authorization",
+    "te", "trailer", "trailers", "transfer-encoding", "upgrade", "host", "content-length"
+})
+
+# Size of the chunks read from a response that is not chunk-encoded
+STREAM_CHUNK_SIZE = 64 * 1024
+
+_NOT_PARSED = object()
+
+
+class RawRequest:
+    """
+    A request to forward, with its body kept as bytes
+
+    The body is parsed on first access to ``envelope``, ``method``,
+    ``rpc_id`` or ``message``; forwarding it never parses it.
+    """
+
+    __slots__ = ("body", "path", "headers", "_data")
+
+    def __init__(self, body: bytes, path: str = "", headers: Optional[Mapping[str, str]] = None):
+        """
+        Args:
+            body: The request body
+            path: The request path and query string
+            headers: The request headers
+        """
+        self.body = body
+        self.path = path
+        self.headers = headers or {}
+        self._data = _NOT_PARSED
+
+    @property
+    def data(self) -> Any:
+        """The parsed body, or None if it is not valid JSON"""
+        if self._data is _NOT_PARSED:
+            body = self.body
+            encoding = _header(self.headers, "Content-Encoding")
+            try:
+                if encoding and encoding.lower() != "identity":
+                    body = compression.decompress(body, encoding.lower())
+                self._data = codec.loads(body) if body else None
+            except ValueError:
+                self._data = None
+        return self._data
+
+    @property
+    def envelope(self) -> Dict[str, Any]:
+        """The JSON-RPC members of the request (``jsonrpc``, ``id`` and ``method``)"""
+        data = self.data
+        if not isinstance(data, dict):
+            return {}
+        return {key: data[key] for key in ("jsonrpc", "id", "method") if key in data}
+
+    @property
+    def method(self) -> Optional[str]:
+        """The JSON-RPC method, if the request is a JSON-RPC request"""
+        return self.envelope.get("method")
+
+    @property
+    def rpc_id(self) -> Any:
+        """The JSON-RPC request ID, if any"""
+        return self.envelope.get("id")
+
+    @property
+    def message(self) -> Optional[LazyMessage]:
+        """
+        A lazily decoded view of the request's message
+
+        The message of a ``tasks/send`` request, or the body of a direct
+        message request; None for other requests.
+        """
+        data = self.data
+        if not isinstance(data, dict):
+            return None
+        if "method" in data:
+            params = data.get("params")
+            data = params.get("message") if isinstance(params, dict) else None
+        if isinstance(data, dict) and ("content" in data or isinstance(data.get("parts"), list)):
+            return LazyMessage(data)
+        return None
+
+
+Upstream = Union[A2AClient, Callable[[RawRequest], A2AClient]]
+
+
+def _header(headers: Mapping[str, str], name: str) -> Optional[str]:
+    """Get a header regardless of the mapping's key case"""
+    value = headers.get(name)
+    if value is None:
+        value = headers.get(name.lower())
+    return value
+
+
+def forwarded_headers(headers: Iterable[Tuple[str, str]]) -> Dict[str, str]:
+    """
+    Select the headers of a message to forward
+
+    Args:
+        headers: The message's (name, value) headers
+
+    Returns:
+        The headers, without hop-by-hop headers
+    """
+    return {name: value for name, value in headers if name.lower() not in HOP_BY_HOP_HEADERS}
+
+
+def _upstream_client(upstream: Upstream, request: RawRequest) -> A2AClient:
+    """Get the client of the agent a request goes to"""
+    return upstream if isinstance(upstream, A2AClient) else upstream(request)
+
+
+def _unreachable_error(request: RawRequest, error: Exception) -> Dict[str, Any]:
+    """Build the JSON-RPC error returned when the upstream agent cannot be reached"""
+    return {
+        "jsonrpc": "2.0",
+        "id": request.rpc_id,
+        "error": {
+            "code": -32000,
+            "message": f"Upstream agent unavailable: {str(error)}"
+        }
+    }
+
+
+def create_passthrough_app(upstream: Upstream, methods: Optional[List[str]] = None):
+    """
+    Create a Flask application forwarding every request to upstream agents
+
+    Args:
+        upstream: The client of the agent to forward to, or a function
+            choosing the client for each ``RawRequest``
+        methods: HTTP methods forwarded (defaults to GET and POST)
+
+    Returns:
+        Flask application
+
+    Raises:
+        A2AImportError: If Flask is not installed
+    """
+    try:
+        from flask import Flask, Response, request
+    except ImportError:
+        raise A2AImportError(
+            "Flask is not installed. "
+            "Install it with 'pip install flask'"
+        )
+
+    app = Flask(__name__)
+    methods = methods or ["GET", "POST"]
+
+    @app.route("/", defaults={"path": ""}, methods=methods)
+    @app.route("/<path:path>", methods=methods)
+    def forward(path):
+        target = request.full_path.rstrip("?") if request.query_string else request.path
+        raw = RawRequest(request.get_data(cache=False), target, request.headers)
+        try:
+            response = _upstream_client(upstream, raw).forward_raw(
+                raw.body, target, forwarded_headers(request.headers.items()), method=request.method
+            )
+        except A2AConnectionError as e:
+            logger.warning("Upstream agent unavailable for %s: %s", target, e)
+            return Response(codec.dumps(_unreachable_error(raw, e)), status=502,
+                            mimetype="application/json")
+
+        headers = forwarded_headers(response.raw.headers.items())
+        if not response.raw.chunked and "Content-Length" in response.headers:
+            # The body is passed on byte for byte, so its length is unchanged
+            headers["Content-Length"] = response.headers["Content-Length"]
+        proxied = Response(response.raw.stream(STREAM_CHUNK_SIZE, decode_content=False),
+                           status=response.status_code, headers=headers, direct_passthrough=True)
+        proxied.call_on_close(response.close)
+        return proxied
+
+    return app
+
+
+class PassthroughASGIApp:
+    """
+    ASGI application forwarding every HTTP request to upstream agents
+
+    Works under any ASGI server without FastAPI. Uses the upstream clients'
+    shared aiohttp sessions; at shutdown the session of a single upstream
+    client is closed, those of clients chosen by a function are left to
+    their owner.
+    """
+
+    def __init__(self, upstream: Upstream):
+        """
+        Args:
+            upstream: The client of the agent to forward to, or a function
+                choosing the client for each ``RawRequest``
+        """
+        self.upstream = upstream
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+
+        chunks = []
+        more_body = True
+        while more_body:
+            event = await receive()
+            if event["type"] == "http.disconnect":
+                return
+            chunks.append(event.get("body", b""))
+            more_body = event.get("more_body", False)
+        body = chunks[0] if len(chunks) == 1 else b"".join(chunks)
+
+        target = scope.get("root_path", "") + scope["path"]
+        if scope.get("query_string"):
+            target += "?" + scope["query_string"].decode("latin-1")
+        headers = forwarded_headers((name.decode("latin-1"), value.decode("latin-1"))
+                                    for name, value in scope["headers"])
+        raw = RawRequest(body, target, headers)
+
+        started = False
+        try:
+            client = _upstream_client(self.upstream, raw)
+            async with client.forward_raw_async(body, target, headers, method=scope["method"]) as response:
+                raw_headers = [(name.lower(), value) for name, value in response.raw_headers
+                               if name.decode("latin-1").lower() not in HOP_BY_HOP_HEADERS]
+                if response.content_length is not None and "chunked" not in \
+                        response.headers.get("Transfer-Encoding", "").lower():
+                    # The body is passed on byte for byte, so its length is unchanged
+                    raw_headers.append((b"content-length", str(response.content_length).encode("latin-1")))
+                await send({"type": "http.response.start", "status": response.status,
+                            "headers": raw_headers})
+                started = True
+                async for chunk in response.content.iter_any():
+                    await send({"type": "http.response.body", "body": chunk, "more_body": True})
+                await send({"type": "http.response.body", "body": b""})
+        except A2AConnectionError as e:
+            logger.warning("Upstream agent unavailable for %s: %s", target, e)
+            if started:
+                # The response is under way; the truncated body ends it
+                return
+            error = codec.dumps(_unreachable_error(raw, e))
+            await send({"type": "http.response.start", "status": 502,
+                        "headers": [(b"content-type", b"application/json"),
+                                    (b"content-length", str(len(error)).encode("latin-1"))]})
+            await send({"type": "http.response.body", "body": error})
+
+    async def _lifespan(self, receive, send) -> None:
+        """Handle the ASGI lifespan, closing the upstream client's session at shutdown"""
+        while True:
+            event = await receive()
+            if event["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif event["type"] == "lifespan.shutdown":
+                if isinstance(self.upstream, A2AClient):
+                    await self.upstream.aclose()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+
+def create_asgi_passthrough_app(upstream: Upstream) -> PassthroughASGIApp:
+    """
+    Create an ASGI application forwarding every request to upstream agents
+
+    Args:
+        upstream: The client of the agent to forward to, or a function
+            choosing the client for each ``RawRequest``
+
+    Returns:
+        ASGI application
+    """
+    return PassthroughASGIApp(upstream)
@@ -0,0 +1,197 @@
+"""
+Shared background event loop for serving async streams from sync servers.
+
+WSGI servers such as Flask handle each request on a worker thread, but agent
+streams (``stream_response``) are async generators. Rather than starting a
+thread and an event loop per request, all streams are driven by one event
+loop running in a single background thread. Each stream is buffered in a
+bounded queue; when the client reads slower than the agent produces, the
+agent's generator is paused until there is room again.
+"""
+
+import time
+import asyncio
+import logging
+import threading
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, AsyncIterator, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+# Marks the end of a stream in its queue
+_END = object()
+
+
+class StreamTimeoutError(Exception):
+    """Raised when a stream does not finish before its deadline"""
+    pass
+
+
+class _StreamError:
+    """Wraps an exception raised by a stream so it can be queued"""
+
+    __slots__ = ("error",)
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+class BackgroundLoop:
+    """
+    An asyncio event loop running in a daemon thread, shared by many streams.
+
+    Example:
+        >>> loop = BackgroundLoop()
+        >>> async def numbers():
+        ...     for i in range(3):
+        ...         yield i
+        >>> list(loop.iterate(numbers()))
+        [0, 1, 2]
+    """
+
+    def __init__(self, name: str = "a2a-stream-loop"):
+        """
+        Initialize a background loop; the thread starts on first use.
+
+        Args:
+            name: Name of the background thread
+        """
+        self.name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._active_streams = 0
+
+    @property
+    def active_streams(self) -> int:
+        """Number of streams currently being served"""
+        return self._active_streams
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The running event loop, started if needed"""
+        with self._lock:
+            if self._loop is None or self._loop.is_closed() or not self._thread.is_alive():
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._run, args=(self._loop,), name=self.name, daemon=True
+                )
+                self._thread.start()
+            return self._loop
+
+    @staticmethod
+    def _run(loop: asyncio.AbstractEventLoop) -> None:
+        asyncio.set_event_loop(loop)
+        loop.run_forever()
+
+    def iterate(self, stream: AsyncIterator[Any], maxsize: int = 64,
+                timeout: Optional[float] = None) -> Iterator[Any]:
+        """
+        Iterate an async stream from synchronous code.
+
+        The stream runs on the background loop and fills a queue of at most
+        ``maxsize`` items. Closing the returned iterator (for example when
+        the client disconnects) cancels the stream.
+
+        Args:
+            stream: The async iterator to consume
+            maxsize: Maximum number of buffered items before the stream is paused
+            timeout: Optional deadline in seconds for the whole stream
+
+        Yields:
+            The items of the stream
+
+        Raises:
+            StreamTimeoutError: If the deadline passes before the stream ends
+            Exception: Whatever the stream raised
+        """
+        loop = self.loop
+        deadline = None if timeout is None else time.monotonic() + timeout
+        queue_ready = threading.Event()
+        state = {}
+
+        async def pump():
+            queue = asyncio.Queue(maxsize=maxsize)
+            state["queue"] = queue
+            queue_ready.set()
+            try:
+                async for item in stream:
+                    await queue.put(item)
+                await queue.put(_END)
+            except asyncio.CancelledError:
+                raise
+            except BaseException as e:
+                await queue.put(_StreamError(e))
+            finally:
+                aclose = getattr(stream, "aclose", None)
+                if aclose is not None:
+                    try:
+                        await aclose()
+                    except Exception:
+                        pass
+
+        async def next_items():
+            # Take everything already buffered, so a fast stream costs one
+            # cross-thread hop per batch rather than per item
+            queue = state["queue"]
+            items = [await queue.get()]
+            while not queue.empty() and len(items) < maxsize:
+                items.append(queue.get_nowait())
+            return items
+
+        with self._lock:
+            self._active_streams += 1
+        task_future = asyncio.run_coroutine_threadsafe(pump(), loop)
+        try:
+            queue_ready.wait()
+            while True:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise StreamTimeoutError("Streaming timed out")
+
+                items_future = asyncio.run_coroutine_threadsafe(next_items(), loop)
+                try:
+                    items = items_future.result(remaining)
+                except FutureTimeoutError:
+                    items_future.cancel()
+                    raise StreamTimeoutError("Streaming timed out")
+
+                for item in items:
+                    if item is _END:
+                        return
+                    if isinstance(item, _StreamError):
+                        raise item.error
+                    yield item
+        finally:
+            if not task_future.done():
+                task_future.cancel()
+            with self._lock:
+                self._active_streams -= 1
+
+    def close(self) -> None:
+        """Stop the loop and its thread"""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout=5)
+            loop.close()
+
+
+_default_loop: Optional[BackgroundLoop] = None
+_default_loop_lock = threading.Lock()
+
+
+def get_stream_loop() -> BackgroundLoop:
+    """
+    Get the process-wide background loop used to serve streams.
+
+    Returns:
+        The shared background loop
+    """
+    global _default_loop
+    with _default_loop_lock:
+        if _default_loop is None:
+            _default_loop = BackgroundLoop()
+        return _default_loop
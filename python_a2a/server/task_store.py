@@ -0,0 +1,252 @@
+"""
+Task storage for A2A servers.
+
+``A2AServer.tasks`` holds the tasks an agent has processed so that clients
+can fetch them (``tasks/get``), cancel them or resubscribe to them. A task
+store bounds that storage: the in-memory store evicts the least recently
+used and expired tasks, and the SQLite store keeps tasks on disk.
+
+Task stores behave like dictionaries mapping task IDs to ``Task`` objects,
+so existing code using ``server.tasks[task_id]`` keeps working. Tasks are
+not guaranteed to be live objects: after modifying a task, store it again
+with ``store[task.id] = task``.
+"""
+
+import json
+import time
+import sqlite3
+import threading
+from abc import abstractmethod
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from ..models.task import Task, TaskStatus
+
+
+class TaskStore(MutableMapping):
+    """
+    Base class for task stores.
+
+    Subclasses implement the mapping methods (``__getitem__``,
+    ``__setitem__``, ``__delitem__``, ``__iter__`` and ``__len__``).
+    """
+
+    def save(self, task: Task) -> None:
+        """
+        Store a task under its ID.
+
+        Args:
+            task: The task to store
+        """
+        self[task.id] = task
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all tasks"""
+        pass
+
+
+class MemoryTaskStore(TaskStore):
+    """
+    In-memory task store with LRU eviction and an optional TTL.
+
+    Memory use is bounded by ``max_tasks``: storing a task beyond that evicts
+    the least recently used one.
+    """
+
+    def __init__(self, max_tasks: Optional[int] = 10000, ttl: Optional[float] = None):
+        """
+        Initialize an in-memory task store.
+
+        Args:
+            max_tasks: Maximum number of tasks kept (None for no limit)
+            ttl: Seconds a task is kept after it was last stored (None to keep
+                tasks until they are evicted)
+        """
+        self.max_tasks = max_tasks
+        self.ttl = ttl
+        self._tasks: "OrderedDict[str, Tuple[Task, Optional[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getitem__(self, task_id: str) -> Task:
+        with self._lock:
+            task, expires_at = self._tasks[task_id]
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._tasks[task_id]
+                raise KeyError(task_id)
+            self._tasks.move_to_end(task_id)
+            return task
+
+    def __setitem__(self, task_id: str, task: Task) -> None:
+        expires_at = None if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            self._tasks[task_id] = (task, expires_at)
+            self._tasks.move_to_end(task_id)
+            if self.max_tasks is not None:
+                while len(self._tasks) > self.max_tasks:
+                    self._tasks.popitem(last=False)
+
+    def __delitem__(self, task_id: str) -> None:
+        with self._lock:
+            del self._tasks[task_id]
+
+    def __iter__(self) -> Iterator[str]:
+        self.purge_expired()
+        with self._lock:
+            return iter(list(self._tasks))
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def purge_expired(self) -> int:
+        """
+        Remove expired tasks.
+
+        Returns:
+            The number of removed tasks
+        """
+        if self.ttl is None:
+            return 0
+        now = time.monotonic()
+        with self._lock:
+            expired = [task_id for task_id, (_, expires_at) in self._tasks.items() if expires_at <= now]
+            for task_id in expired:
+                del self._tasks[task_id]
+            return len(expired)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tasks.clear()
+
+
+class SQLiteTaskStore(TaskStore):
+    """
+    Task store backed by a SQLite database.
+
+    Tasks are kept on disk, so memory use does not grow with the number of
+    tasks and tasks survive restarts. Each lookup returns a new ``Task``.
+    """
+
+    def __init__(self, path: str = "a2a_tasks.sqlite", ttl: Optional[float] = None,
+                 max_tasks: Optional[int] = None):
+        """
+        Initialize a SQLite task store.
+
+        Args:
+            path: Path of the database file (":memory:" for a private in-memory database)
+            ttl: Seconds a task is kept after it was last stored (None to keep tasks)
+            max_tasks: Optional maximum number of tasks; the least recently
+                stored ones are removed first. The limit is enforced every
+                ``max_tasks // 100`` writes, so it may be exceeded by up to 1%.
+        """
+        self.path = path
+        self.ttl = ttl
+        self.max_tasks = max_tasks
+        self._prune_interval = max(1, (max_tasks or 0) // 100)
+        self._writes = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        # WAL with NORMAL sync avoids an fsync per stored task
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS tasks ("
+                "id TEXT PRIMARY KEY, data TEXT NOT NULL, "
+                "expires_at REAL, stored_at REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS tasks_stored_at ON tasks (stored_at)")
+
+    @staticmethod
+    def _serialize(task: Task) -> str:
+        return json.dumps({
+            "id": task.id,
+            "session_id": task.session_id,
+            "status": task.status.to_dict(),
+            "message": task.message,
+            "history": task.history,
+            "artifacts": task.artifacts,
+            "metadata": task.metadata,
+        }, default=str)
+
+    @staticmethod
+    def _deserialize(data: str) -> Task:
+        fields: Dict[str, Any] = json.loads(data)
+        fields["status"] = TaskStatus.from_dict(fields["status"])
+        return Task(**fields)
+
+    def __getitem__(self, task_id: str) -> Task:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data, expires_at FROM tasks WHERE id = ?", (task_id,)
+            ).fetchone()
+        if row is None or (row[1] is not None and row[1] <= time.time()):
+            raise KeyError(task_id)
+        return self._deserialize(row[0])
+
+    def __setitem__(self, task_id: str, task: Task) -> None:
+        now = time.time()
+        expires_at = None if self.ttl is None else now + self.ttl
+        data = self._serialize(task)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO tasks (id, data, expires_at, stored_at) VALUES (?, ?, ?, ?)",
+                (task_id, data, expires_at, now)
+            )
+            self._writes += 1
+            if self.max_tasks is not None and self._writes % self._prune_interval == 0:
+                # Drop everything older than the newest max_tasks tasks
+                self._conn.execute(
+                    "DELETE FROM tasks WHERE stored_at < ("
+                    "SELECT stored_at FROM tasks ORDER BY stored_at DESC LIMIT 1 OFFSET ?)",
+                    (self.max_tasks - 1,)
+                )
+
+    def __delitem__(self, task_id: str) -> None:
+        with self._lock, self._conn:
+            cursor = self._conn.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+        if cursor.rowcount == 0:
+            raise KeyError(task_id)
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id FROM tasks WHERE expires_at IS NULL OR expires_at > ?", (time.time(),)
+            ).fetchall()
+        return iter([row[0] for row in rows])
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM tasks WHERE expires_at IS NULL OR expires_at > ?", (time.time(),)
+            ).fetchone()[0]
+
+    def __contains__(self, task_id: object) -> bool:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT 1 FROM tasks WHERE id = ? AND (expires_at IS NULL OR expires_at > ?)",
+                (task_id, time.time())
+            ).fetchone() is not None
+
+    def purge_expired(self) -> int:
+        """
+        Remove expired tasks from the database.
+
+        Returns:
+            The number of removed tasks
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM tasks WHERE expires_at IS NOT NULL AND expires_at <= ?", (time.time(),)
+            )
+            return cursor.rowcount
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM tasks")
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
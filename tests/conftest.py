@@ -101,4 +101,34 @@ def echo_server():
                 conversation_id=message.conversation_id
             )
     
-    return EchoServer()
\ No newline at end of file
+    return EchoServer()
+
+@pytest.fixture
+def live_server(echo_server):
+    """Serve an A2A agent over HTTP on a free local port for the duration of a test"""
+    import threading
+    from werkzeug.serving import make_server
+    from python_a2a.server.http import create_flask_app
+
+    def start(agent=None):
+        app = create_flask_app(agent or echo_server)
+        server = make_server("127.0.0.1", 0, app, threaded=True)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        servers.append(server)
+        return f"http://127.0.0.1:{server.server_port}"
+
+    servers = []
+    yield start
+    for server in servers:
+        server.shutdown()
+
+
+@pytest.fixture(autouse=True)
+def clear_endpoint_cache():
+    """Make sure endpoints resolved by one test are not reused by the next"""
+    from python_a2a.client.endpoints import get_default_endpoint_cache
+
+    get_default_endpoint_cache().clear()
+    yield
+    get_default_endpoint_cache().clear()
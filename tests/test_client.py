@@ -5,11 +5,12 @@ Tests for the client module.
 import pytest
 from unittest.mock import patch, MagicMock
 import json
+import requests
 import responses
 
 from python_a2a import (
     A2AClient, Message, TextContent, MessageRole, Conversation,
-    FunctionCallContent, FunctionParameter, A2AConnectionError
+    FunctionCallContent, FunctionParameter, A2AConnectionError, TaskState
 )
 
 
@@ -137,4 +138,774 @@ class TestA2AClient:
         
         # Should raise an exception
         with pytest.raises(A2AConnectionError):
-            client.send_message(text_message)
\ No newline at end of file
+            client.send_message(text_message)
+
+class TestA2AClientAsync:
+    def test_send_message_async(self, live_server, text_message):
+        """Test sending a message over the native async transport"""
+        import asyncio
+        from python_a2a import A2AServer
+
+        url = live_server(A2AServer(google_a2a_compatible=False))
+
+        async def run():
+            client = A2AClient(url)
+            try:
+                return await client.send_message_async(text_message)
+            finally:
+                await client.aclose()
+
+        response = asyncio.run(run())
+
+        assert response.role == MessageRole.AGENT
+        assert response.content.text == "Hello, world!"
+        assert response.parent_message_id == text_message.message_id
+
+    def test_concurrent_send_shares_session(self, live_server):
+        """Test that concurrent async calls reuse one aiohttp session"""
+        import asyncio
+        from python_a2a import A2AServer
+
+        url = live_server(A2AServer(google_a2a_compatible=False))
+
+        async def run():
+            client = A2AClient(url)
+            try:
+                messages = [
+                    Message(content=TextContent(text=f"msg {i}"), role=MessageRole.USER)
+                    for i in range(20)
+                ]
+                replies = await asyncio.gather(
+                    *(client.send_message_async(m) for m in messages)
+                )
+                session = client._session_manager._session
+                return replies, session
+            finally:
+                await client.aclose()
+
+        replies, session = asyncio.run(run())
+
+        assert [r.content.text for r in replies] == [f"msg {i}" for i in range(20)]
+        assert session is not None and session.closed
+
+    def test_send_task_async(self, live_server):
+        """Test sending a task over the native async transport"""
+        import asyncio
+        from python_a2a import A2AServer, Task
+
+        url = live_server(A2AServer(google_a2a_compatible=False))
+        task = Task(message={"content": {"type": "text", "text": "task text"}, "role": "user"})
+
+        async def run():
+            client = A2AClient(url)
+            try:
+                return await client.send_task_async(task)
+            finally:
+                await client.aclose()
+
+        result = asyncio.run(run())
+
+        assert result.status.state.value == "completed"
+        assert result.get_text() == "task text"
+
+
+class TestConnectionPooling:
+    def test_clients_share_host_pool(self):
+        """Test that clients for the same host share one connection pool"""
+        from python_a2a.client import SharedConnectionPool
+
+        pool = SharedConnectionPool(pool_maxsize=4)
+        with patch.object(A2AClient, "_fetch_agent_card", side_effect=A2AConnectionError("offline")):
+            first = A2AClient("https://example.com/a2a", connection_pool=pool)
+            second = A2AClient("https://example.com/other", connection_pool=pool)
+            third = A2AClient("https://other.example.com", connection_pool=pool)
+
+        assert len(pool) == 2
+        assert first._session is not second._session
+        assert (first._session.get_adapter("https://example.com/x")
+                is second._session.get_adapter("https://example.com/y"))
+        assert (third._session.get_adapter("https://other.example.com/x")
+                is not first._session.get_adapter("https://example.com/x"))
+
+    def test_close_keeps_shared_pool_open(self):
+        """Test that closing a client does not close the shared pool"""
+        from python_a2a.client import SharedConnectionPool
+
+        pool = SharedConnectionPool()
+        with patch.object(A2AClient, "_fetch_agent_card", side_effect=A2AConnectionError("offline")):
+            client = A2AClient("https://example.com/a2a", connection_pool=pool)
+        adapter = pool.get_adapter("https://example.com")
+
+        with patch.object(adapter, "close") as mock_close:
+            client.close()
+
+        mock_close.assert_not_called()
+
+    def test_keep_alive_reuses_connection(self, live_server):
+        """Test that repeated requests reuse a pooled keep-alive connection"""
+        from python_a2a.client import SharedConnectionPool
+
+        url = live_server()
+        pool = SharedConnectionPool()
+        client = A2AClient(url, connection_pool=pool)
+        client.send_message(Message(content=TextContent(text="one"), role=MessageRole.USER))
+        client.send_message(Message(content=TextContent(text="two"), role=MessageRole.USER))
+
+        pools = pool.get_adapter(url).poolmanager.pools
+        host_pools = [pools[key] for key in pools.keys()]
+        assert len(host_pools) == 1
+        assert host_pools[0].num_requests > host_pools[0].num_connections
+        client.close()
+
+
+class TestEndpointCache:
+    AGENT_URL = "https://agent.example.com"
+
+    def _mock_agent(self, text_message):
+        """Mock an agent that only answers direct messages on its /a2a endpoint"""
+        responses.add(
+            responses.POST,
+            f"{self.AGENT_URL}/a2a",
+            json={
+                "content": {"type": "text", "text": "Response text"},
+                "role": "agent",
+                "parent_message_id": text_message.message_id,
+                "conversation_id": text_message.conversation_id
+            },
+            status=200
+        )
+
+    @responses.activate
+    def test_resolved_endpoint_is_reused(self, text_message):
+        """Test that later sends, from any client, hit exactly one URL"""
+        self._mock_agent(text_message)
+
+        client = A2AClient(self.AGENT_URL)
+        assert client.send_message(text_message).content.text == "Response text"
+        cold_calls = len(responses.calls)
+        assert cold_calls > 2
+
+        assert client.send_message(text_message).content.text == "Response text"
+        assert len(responses.calls) == cold_calls + 1
+
+        # A new client for the same agent reuses both the route and the failed card lookup
+        other = A2AClient(self.AGENT_URL)
+        assert other.send_message(text_message).content.text == "Response text"
+        assert len(responses.calls) == cold_calls + 2
+        assert responses.calls[-1].request.url == f"{self.AGENT_URL}/a2a"
+
+    @responses.activate
+    def test_failing_endpoint_is_invalidated(self, text_message):
+        """Test that a resolved endpoint returning 5xx is resolved again"""
+        from python_a2a.client import EndpointCache
+
+        cache = EndpointCache()
+        self._mock_agent(text_message)
+        client = A2AClient(self.AGENT_URL, endpoint_cache=cache)
+        client.send_message(text_message)
+        assert cache.get(self.AGENT_URL, "message_route") == (f"{self.AGENT_URL}/a2a", "python")
+
+        responses.replace(responses.POST, f"{self.AGENT_URL}/a2a", json={"error": "down"}, status=503)
+        responses.add(
+            responses.POST,
+            f"{self.AGENT_URL}/tasks/send",
+            json={"jsonrpc": "2.0", "id": 1, "result": {
+                "id": "task-1",
+                "status": {"state": "completed"},
+                "artifacts": [{"parts": [{"type": "text", "text": "task text"}]}]
+            }},
+            status=200
+        )
+
+        assert client.send_message(text_message).content.text == "task text"
+        assert cache.get(self.AGENT_URL, "message_route") == (f"{self.AGENT_URL}/tasks/send", "task")
+
+    @responses.activate
+    def test_unreachable_agent_is_negatively_cached(self, text_message):
+        """Test that an unreachable agent is not probed again on every send"""
+        from python_a2a.client import EndpointCache
+
+        cache = EndpointCache(negative_ttl=60)
+        client = A2AClient(self.AGENT_URL, endpoint_cache=cache)
+        assert client.send_message(text_message).content.type == "error"
+        cold_calls = len(responses.calls)
+
+        assert client.send_message(text_message).content.type == "error"
+        assert A2AClient(self.AGENT_URL, endpoint_cache=cache).agent_card.name == "Unknown Agent"
+        assert len(responses.calls) == cold_calls
+
+    def test_entries_expire(self):
+        """Test that resolutions expire after their TTL"""
+        from python_a2a.client import EndpointCache
+
+        cache = EndpointCache(ttl=60, negative_ttl=5)
+        with patch("python_a2a.client.endpoints.time.monotonic", return_value=100.0):
+            cache.set(self.AGENT_URL, "message_route", ("url", "python"))
+            cache.set_failure(self.AGENT_URL, "agent_card", "not found")
+
+        with patch("python_a2a.client.endpoints.time.monotonic", return_value=110.0):
+            assert cache.get(f"{self.AGENT_URL}/", "message_route") == ("url", "python")
+            assert cache.lookup(self.AGENT_URL, "agent_card") is None
+
+        with patch("python_a2a.client.endpoints.time.monotonic", return_value=161.0):
+            assert cache.get(self.AGENT_URL, "message_route") is None
+
+    def test_least_recently_used_agents_are_evicted(self):
+        """Test that the cache is bounded"""
+        from python_a2a.client import EndpointCache
+
+        cache = EndpointCache(max_entries=2)
+        cache.set("https://a.example.com", "agent_card", {})
+        cache.set("https://b.example.com", "agent_card", {})
+        cache.get("https://a.example.com", "agent_card")
+        cache.set("https://c.example.com", "agent_card", {})
+
+        assert len(cache) == 2
+        assert cache.lookup("https://b.example.com", "agent_card") is None
+        assert cache.lookup("https://a.example.com", "agent_card") is not None
+
+
+class TestSendBatch:
+    def _messages(self, count):
+        return [
+            Message(content=TextContent(text=f"message {i}"), role=MessageRole.USER)
+            for i in range(count)
+        ]
+
+    def test_send_batch_uses_one_request(self, live_server):
+        """Test that a batch is submitted to an A2A server in a single request"""
+        from python_a2a import A2AServer
+
+        url = live_server(A2AServer(google_a2a_compatible=False))
+        client = A2AClient(url)
+        messages = self._messages(10)
+
+        with patch.object(client._session, "post", wraps=client._session.post) as mock_post:
+            replies = client.send_batch(messages)
+
+        assert mock_post.call_count == 1
+        assert [r.content.text for r in replies] == [f"message {i}" for i in range(10)]
+        assert all(r.parent_message_id == m.message_id for r, m in zip(replies, messages))
+
+    def test_send_batch_async(self, live_server):
+        """Test sending a batch asynchronously"""
+        import asyncio
+        from python_a2a import A2AServer
+
+        url = live_server(A2AServer(google_a2a_compatible=False))
+        client = A2AClient(url)
+        client.max_batch_size = 4
+
+        async def run():
+            try:
+                return await client.send_batch_async(self._messages(10), max_concurrency=2)
+            finally:
+                await client.aclose()
+
+        replies = asyncio.run(run())
+
+        assert [r.content.text for r in replies] == [f"message {i}" for i in range(10)]
+
+    def test_send_batch_falls_back_to_single_messages(self, live_server, echo_server):
+        """Test that agents without batch support still answer every message"""
+        client = A2AClient(live_server(echo_server))
+
+        replies = client.send_batch(self._messages(5), max_concurrency=3)
+
+        assert [r.content.text for r in replies] == [f"Echo: message {i}" for i in range(5)]
+
+
+class TestAsyncSessionManager:
+    def test_session_is_reused_until_closed(self):
+        """Test that requests share one session and connector"""
+        import asyncio
+        from python_a2a.client.sessions import AsyncSessionManager
+
+        async def run():
+            manager = AsyncSessionManager(limit=5, limit_per_host=2)
+            async with manager.session() as first:
+                pass
+            async with manager.session() as second:
+                assert second.connector.limit == 5
+                assert second.connector.limit_per_host == 2
+            await manager.aclose()
+            return first, second
+
+        first, second = asyncio.run(run())
+
+        assert first is second
+        assert first.closed
+
+    def test_close_waits_for_open_streams(self):
+        """Test that aclose defers closing while the session is in use"""
+        import asyncio
+        from python_a2a.client.sessions import AsyncSessionManager
+
+        async def run():
+            manager = AsyncSessionManager()
+            async with manager.session() as session:
+                await manager.aclose()
+                assert not session.closed
+                assert manager.active_references == 1
+            assert session.closed
+
+            # The manager can be used again after closing
+            async with manager:
+                async with manager.session() as new_session:
+                    assert new_session is not session
+            assert new_session.closed
+
+        asyncio.run(run())
+
+    def test_session_of_finished_loop_is_closed(self, live_server, caplog):
+        """Test that reusing a manager across asyncio.run calls closes the old session"""
+        import asyncio
+        import gc
+        from python_a2a import A2AServer
+        from python_a2a.client.sessions import AsyncSessionManager
+
+        url = live_server(A2AServer(google_a2a_compatible=False)) + "/agent.json"
+        manager = AsyncSessionManager()
+
+        async def fetch():
+            async with manager.session() as session:
+                async with session.get(url) as response:
+                    await response.read()
+            return session
+
+        first = asyncio.run(fetch())
+        second = asyncio.run(fetch())
+        assert second is not first
+        assert first.closed
+
+        del first
+        gc.collect()
+        assert "Unclosed" not in caplog.text
+        asyncio.run(manager.aclose())
+
+    def test_streaming_client_uses_shared_session(self, live_server):
+        """Test that StreamingClient keeps one session across requests"""
+        import asyncio
+        from python_a2a import A2AServer
+        from python_a2a.client import StreamingClient
+
+        url = live_server(A2AServer(google_a2a_compatible=False))
+
+        async def run():
+            async with StreamingClient(url) as client:
+                with patch("aiohttp.ClientSession", wraps=__import__("aiohttp").ClientSession) as mock_session:
+                    assert await client.check_streaming_support()
+                    reply = await client.send_message_async(
+                        Message(content=TextContent(text="hi"), role=MessageRole.USER)
+                    )
+                    task = await client.send_task(await client.create_task("task"))
+                return reply, task, mock_session.call_count
+
+        reply, task, sessions_created = asyncio.run(run())
+
+        assert reply.content.text == "hi"
+        assert task.status.state.value == "completed"
+        assert sessions_created == 1
+
+
+class TestStreamingSupportCache:
+    def test_uses_fetched_agent_card(self, live_server):
+        """Test that streaming support comes from the agent card without requests"""
+        import asyncio
+        from python_a2a import A2AServer
+
+        client = A2AClient(live_server(A2AServer(google_a2a_compatible=False)))
+
+        async def run():
+            return [await client.check_streaming_support() for _ in range(3)]
+
+        with patch.object(client, "_create_aiohttp_session") as mock_async, \
+                patch.object(client._session, "get") as mock_get:
+            results = asyncio.run(run())
+
+        assert results == [True, True, True]
+        mock_async.assert_not_called()
+        mock_get.assert_not_called()
+
+    def test_fetches_capability_once(self, live_server):
+        """Test that a capability fetch is memoized per endpoint"""
+        import asyncio
+        from python_a2a import A2AServer
+
+        url = live_server(A2AServer(google_a2a_compatible=False))
+        with patch.object(A2AClient, "_fetch_agent_card", side_effect=A2AConnectionError("offline")):
+            client = A2AClient(url)
+            other = A2AClient(url)
+
+        async def run():
+            try:
+                first = await client.check_streaming_support()
+                second = await other.check_streaming_support()
+                return first, second
+            finally:
+                await client.aclose()
+
+        with patch.object(A2AClient, "_fetch_streaming_capability",
+                          autospec=True, side_effect=A2AClient._fetch_streaming_capability) as mock_fetch, \
+                patch.object(client._session, "get") as mock_get:
+            assert asyncio.run(run()) == (True, True)
+
+        assert mock_fetch.call_count == 1
+        mock_get.assert_not_called()
+
+    def test_unreachable_agent_makes_no_requests(self, text_message):
+        """Test that an agent whose card could not be fetched is not probed again"""
+        import asyncio
+        from python_a2a.client import EndpointCache
+
+        cache = EndpointCache()
+        with patch.object(A2AClient, "_get_card_data", side_effect=A2AConnectionError("offline")):
+            client = A2AClient("https://agent.example.com", endpoint_cache=cache)
+
+        with patch.object(client, "_fetch_streaming_capability") as mock_fetch:
+            assert asyncio.run(client.check_streaming_support()) is False
+
+        mock_fetch.assert_not_called()
+
+
+class TestResponseCache:
+    def _client(self, live_server, echo_server, cache):
+        return A2AClient(live_server(echo_server), response_cache=cache)
+
+    def test_repeated_message_is_served_from_cache(self, live_server, echo_server):
+        """Test that a repeated message does not leave the process"""
+        from python_a2a.client import MemoryResponseCache
+
+        cache = MemoryResponseCache()
+        client = self._client(live_server, echo_server, cache)
+
+        first = Message(content=TextContent(text="Hello  world"), role=MessageRole.USER)
+        second = Message(content=TextContent(text=" Hello world "), role=MessageRole.USER)
+        reply = client.send_message(first)
+
+        with patch.object(client._session, "post") as mock_post:
+            cached = client.send_message(second)
+
+        mock_post.assert_not_called()
+        assert cached.content.text == reply.content.text
+        assert cached.parent_message_id == second.message_id
+        assert cached.message_id != reply.message_id
+        assert cache.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+    def test_bypass_and_metadata_in_key(self, live_server, echo_server):
+        """Test per-call bypass and that custom metadata is part of the key"""
+        from python_a2a.client import MemoryResponseCache
+        from python_a2a.models.content import Metadata
+
+        cache = MemoryResponseCache()
+        client = self._client(live_server, echo_server, cache)
+        client.ask("Hello")
+
+        with patch.object(client, "_send_message", wraps=client._send_message) as mock_send:
+            client.ask("Hello", use_cache=False)
+            client.send_message(Message(
+                content=TextContent(text="Hello"),
+                role=MessageRole.USER,
+                metadata=Metadata(custom_fields={"user": "alice"})
+            ))
+            client.ask("Hello")
+
+        assert mock_send.call_count == 2
+        assert cache.hits == 1
+
+    def test_error_replies_are_not_cached(self, text_message):
+        """Test that failed calls are not remembered"""
+        from python_a2a.client import EndpointCache, MemoryResponseCache
+
+        cache = MemoryResponseCache()
+        with patch.object(A2AClient, "_get_card_data", side_effect=A2AConnectionError("offline")):
+            client = A2AClient("https://agent.example.com", endpoint_cache=EndpointCache(),
+                               response_cache=cache)
+
+        with patch.object(client._session, "post",
+                          side_effect=requests.exceptions.ConnectionError("offline")):
+            reply = client.send_message(text_message)
+
+        assert reply.content.type == "error"
+        assert len(cache) == 0
+
+    def test_entries_expire(self):
+        """Test that cached responses expire after the TTL"""
+        from python_a2a.client import MemoryResponseCache
+
+        cache = MemoryResponseCache(ttl=10)
+        with patch("python_a2a.client.cache.time.time", return_value=1000.0):
+            cache.set("key", {"value": 1})
+            assert cache.get("key") == {"value": 1}
+        with patch("python_a2a.client.cache.time.time", return_value=1011.0):
+            assert cache.get("key") is None
+
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_sqlite_cache_persists(self, tmp_path, live_server, echo_server):
+        """Test that the SQLite backend survives a new cache instance"""
+        import asyncio
+        from python_a2a.client import SQLiteResponseCache
+
+        path = str(tmp_path / "responses.sqlite")
+        cache = SQLiteResponseCache(path)
+        client = self._client(live_server, echo_server, cache)
+        reply = client.ask("Hello")
+        cache.close()
+
+        reopened = SQLiteResponseCache(path)
+        client.response_cache = reopened
+        with patch.object(client, "_send_message_async") as mock_send:
+            cached = asyncio.run(client.send_message_async(
+                Message(content=TextContent(text="Hello"), role=MessageRole.USER)
+            ))
+
+        mock_send.assert_not_called()
+        assert cached.content.text == reply
+        assert reopened.stats() == {"hits": 1, "misses": 0, "size": 1}
+        reopened.close()
+
+
+class TestRequestCoalescing:
+    def _client(self):
+        from python_a2a.client import EndpointCache
+
+        with patch.object(A2AClient, "_get_card_data", side_effect=A2AConnectionError("offline")):
+            return A2AClient("https://agent.example.com", endpoint_cache=EndpointCache(),
+                             coalesce_requests=True)
+
+    @staticmethod
+    def _reply(message):
+        return Message(content=TextContent(text="answer"), role=MessageRole.AGENT,
+                       parent_message_id=message.message_id)
+
+    def test_concurrent_threads_share_one_request(self):
+        """Test that identical messages sent from several threads share a request"""
+        import threading
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        client = self._client()
+        started = threading.Event()
+
+        def slow_send(message):
+            started.set()
+            time.sleep(0.2)
+            return self._reply(message)
+
+        messages = [Message(content=TextContent(text="question"), role=MessageRole.USER)
+                    for _ in range(5)]
+        with patch.object(client, "_send_message", side_effect=slow_send) as mock_send, \
+                ThreadPoolExecutor(max_workers=5) as executor:
+            first = executor.submit(client.send_message, messages[0])
+            started.wait()
+            others = list(executor.map(client.send_message, messages[1:]))
+
+        assert mock_send.call_count == 1
+        replies = [first.result()] + others
+        assert [r.content.text for r in replies] == ["answer"] * 5
+        assert [r.parent_message_id for r in replies] == [m.message_id for m in messages]
+        assert len({r.message_id for r in replies}) == 5
+
+    def test_concurrent_coroutines_share_one_request(self):
+        """Test that identical concurrent async sends share a request and its errors"""
+        import asyncio
+
+        client = self._client()
+        calls = []
+
+        async def slow_send(message):
+            calls.append(message)
+            await asyncio.sleep(0.05)
+            if message.content.text == "fail":
+                raise A2AConnectionError("offline")
+            return self._reply(message)
+
+        async def run(text):
+            return await asyncio.gather(*[
+                client.send_message_async(Message(content=TextContent(text=text), role=MessageRole.USER))
+                for _ in range(10)
+            ], return_exceptions=True)
+
+        with patch.object(client, "_send_message_async", side_effect=slow_send):
+            replies = asyncio.run(run("question"))
+            errors = asyncio.run(run("fail"))
+            asyncio.run(run("question"))
+
+        assert len(calls) == 3
+        assert all(r.content.text == "answer" for r in replies)
+        assert all(isinstance(e, A2AConnectionError) for e in errors)
+        assert client._single_flight.in_flight() == 0
+
+
+class TestResilience:
+    AGENT_URL = "https://agent.example.com"
+
+    def _client(self, policy):
+        from python_a2a.client import EndpointCache
+
+        with patch.object(A2AClient, "_get_card_data", side_effect=A2AConnectionError("offline")):
+            return A2AClient(self.AGENT_URL, endpoint_cache=EndpointCache(), resilience=policy)
+
+    def _task(self, client):
+        return client._create_task(Message(content=TextContent(text="hi"), role=MessageRole.USER))
+
+    def test_breaker_opens_and_recovers(self):
+        """Test the closed, open and half-open transitions"""
+        from python_a2a.client import CircuitBreaker, CircuitState
+
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=10)
+        with patch("python_a2a.client.resilience.time.monotonic", return_value=100.0):
+            breaker.record_failure()
+            assert breaker.state == CircuitState.CLOSED
+            breaker.record_failure()
+            assert breaker.state == CircuitState.OPEN
+            assert not breaker.allow_request()
+
+        with patch("python_a2a.client.resilience.time.monotonic", return_value=111.0):
+            assert breaker.allow_request()
+            assert not breaker.allow_request()
+            breaker.record_failure()
+            assert breaker.state == CircuitState.OPEN
+
+        with patch("python_a2a.client.resilience.time.monotonic", return_value=122.0):
+            assert breaker.allow_request()
+            breaker.record_success()
+            assert breaker.state == CircuitState.CLOSED
+
+        metrics = breaker.metrics()
+        assert (metrics["times_opened"], metrics["rejected"]) == (2, 2)
+
+    def test_retry_budget_limits_retries(self):
+        """Test that retries are capped by the budget"""
+        from python_a2a.client import RetryBudget
+
+        budget = RetryBudget(ratio=0.5, min_retries=1)
+        for _ in range(4):
+            budget.record_call()
+
+        assert [budget.try_acquire_retry() for _ in range(4)] == [True, True, True, False]
+        assert budget.metrics()["exhausted"] == 1
+
+    def test_open_circuit_fails_fast(self):
+        """Test that a failing agent is shed without network calls"""
+        from python_a2a.client import ResiliencePolicy
+
+        policy = ResiliencePolicy(failure_threshold=2, max_retries=1, backoff_base=0)
+        client = self._client(policy)
+
+        with patch.object(client._session, "post",
+                          side_effect=requests.exceptions.ConnectionError("offline")) as mock_post:
+            failed = client._send_task(self._task(client))
+            calls = mock_post.call_count
+            shed = client._send_task(self._task(client))
+            reply = client.send_message(Message(content=TextContent(text="hi"), role=MessageRole.USER))
+
+        assert failed.status.state == TaskState.FAILED
+        assert calls == 4  # first attempt and one retry, each trying both task URLs
+        assert mock_post.call_count == calls
+        assert "Circuit open" in shed.status.message["error"]
+        assert "Circuit open" in reply.content.message
+        assert policy.metrics()["endpoints"][self.AGENT_URL]["state"] == "open"
+
+    def test_cancelled_trial_call_frees_its_slot(self):
+        """Test that a half-open circuit recovers after its trial calls are cancelled"""
+        import asyncio
+        from python_a2a.client import CircuitState, ResiliencePolicy
+
+        policy = ResiliencePolicy(failure_threshold=1, recovery_timeout=0.01, max_retries=0)
+        client = self._client(policy)
+        breaker = policy.breaker(client._base_url)
+        message = Message(content=TextContent(text="hi"), role=MessageRole.USER)
+
+        async def hang(*args):
+            await asyncio.Event().wait()
+
+        async def cancel(call):
+            breaker.record_failure()
+            await asyncio.sleep(0.02)
+            trial = asyncio.ensure_future(call)
+            await asyncio.sleep(0.01)
+            assert not breaker.allow_request()  # the trial holds the only slot
+            trial.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await trial
+
+        with patch.object(client, "_send_message_async", side_effect=hang), \
+                patch.object(client, "_post_task_async", side_effect=hang):
+            asyncio.run(cancel(client._send_message_guarded_async(message)))
+            assert breaker.state == CircuitState.HALF_OPEN
+            assert breaker.allow_request()
+            breaker.release_trial()
+
+            asyncio.run(cancel(client._send_task_async(self._task(client))))
+            assert breaker.allow_request()
+            breaker.record_success()
+
+        assert breaker.state == CircuitState.CLOSED
+
+    @pytest.mark.parametrize("status,attempts", [(401, 1), (404, 1), (422, 1), (429, 2), (503, 2)])
+    def test_only_transient_errors_are_retried(self, status, attempts):
+        """Test that client errors fail at once without counting against the circuit"""
+        import asyncio
+        from python_a2a.client import ResiliencePolicy
+
+        policy = ResiliencePolicy(failure_threshold=2, max_retries=1, backoff_base=0)
+        client = self._client(policy)
+        response = requests.Response()
+        response.status_code = status
+        response.url = self.AGENT_URL
+        response._content = b"error"
+
+        with patch.object(client, "_post_json", return_value=response) as mock_post:
+            failed = client._send_task(self._task(client))
+        assert failed.status.state == TaskState.FAILED
+        assert mock_post.call_count == 2 * attempts  # each attempt tries both task URLs
+
+        breaker = policy.breaker(client._base_url)
+        breaker.record_success()
+
+        async def post_json(url, data):
+            return status, "error"
+
+        with patch.object(client, "_post_json_async", side_effect=post_json) as mock_post:
+            failed = asyncio.run(client._send_task_async(self._task(client)))
+        assert failed.status.state == TaskState.FAILED
+        assert str(status) in failed.status.message["error"]
+        assert mock_post.call_count == 2 * attempts
+
+        # Failures of the sync and async calls
+        metrics = breaker.metrics()
+        assert metrics["failures"] == (0 if attempts == 1 else 4)
+        assert metrics["state"] == ("closed" if attempts == 1 else "open")
+
+    def test_successful_retry_closes_circuit(self, live_server):
+        """Test that a transient failure is retried and counted"""
+        import asyncio
+        from python_a2a import A2AServer
+        from python_a2a.client import ResiliencePolicy
+
+        policy = ResiliencePolicy(backoff_base=0)
+        client = A2AClient(live_server(A2AServer(google_a2a_compatible=False)), resilience=policy)
+        post = client._post_task_async
+        attempts = []
+
+        async def flaky(task, base_url):
+            attempts.append(base_url)
+            if len(attempts) == 1:
+                raise A2AConnectionError("reset")
+            return await post(task, base_url)
+
+        async def run():
+            try:
+                return await client._send_task_async(self._task(client))
+            finally:
+                await client.aclose()
+
+        with patch.object(client, "_post_task_async", side_effect=flaky):
+            result = asyncio.run(run())
+
+        assert result.status.state == TaskState.COMPLETED
+        assert len(attempts) == 2
+        metrics = policy.breaker(client._base_url).metrics()
+        assert (metrics["failures"], metrics["successes"], metrics["state"]) == (1, 1, "closed")
@@ -0,0 +1,56 @@
+"""
+Tests for the JSON codec module.
+"""
+
+import json
+
+import pytest
+
+from python_a2a import codec, Message, Conversation, Task, TaskStatus, TaskState, TextContent, MessageRole
+
+
+@pytest.fixture(params=codec.available_codecs())
+def each_codec(request):
+    """Run a test with each installed codec, restoring the previous one"""
+    previous = codec.get_codec()
+    yield codec.set_codec(request.param)
+    codec.set_codec(previous)
+
+
+class TestCodec:
+    def test_round_trip_models(self, each_codec, conversation):
+        """Test that models survive encoding and decoding with each codec"""
+        task = Task(
+            id="task-1",
+            status=TaskStatus(state=TaskState.COMPLETED),
+            message=Message(content=TextContent(text="héllo ✓"), role=MessageRole.USER).to_dict(),
+            artifacts=[{"parts": [{"type": "text", "text": "done"}]}]
+        )
+
+        assert Task.from_json(task.to_json()).to_dict() == task.to_dict()
+        assert Conversation.from_json(conversation.to_json()).to_dict() == conversation.to_dict()
+        assert json.loads(codec.dumps({"big": 2 ** 70, 1: "int key"})) == {"big": 2 ** 70, "1": "int key"}
+
+    def test_decode_errors_are_value_errors(self, each_codec):
+        """Test that invalid documents raise json.JSONDecodeError with each codec"""
+        with pytest.raises(json.JSONDecodeError):
+            codec.loads(b"{not json")
+
+    def test_set_codec(self):
+        """Test choosing codecs by name"""
+        previous = codec.get_codec()
+        try:
+            assert codec.set_codec("json").name == "json"
+            assert codec.set_codec().name == codec.available_codecs()[0]
+            with pytest.raises(ValueError):
+                codec.set_codec("yaml")
+        finally:
+            codec.set_codec(previous)
+
+    def test_servers_use_codec(self, each_codec, echo_server, text_message):
+        """Test a round trip through the Flask app with each codec"""
+        from python_a2a.server.http import create_flask_app
+
+        response = create_flask_app(echo_server).test_client().post("/a2a", json=text_message.to_dict())
+
+        assert Message.from_dict(codec.loads(response.data)).content.text == "Echo: Hello, world!"
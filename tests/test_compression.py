@@ -0,0 +1,155 @@
+"""
+Tests for HTTP content compression.
+"""
+
+import gzip
+import json
+import zlib
+
+import pytest
+import responses
+
+from python_a2a import compression, A2AClient, A2AServer, Message, TextContent, MessageRole
+
+
+def _large_reply_server():
+    return A2AServer(
+        message_handler=lambda message: Message(content=TextContent(text="artifact " * 1000),
+                                                role=MessageRole.AGENT),
+        google_a2a_compatible=False
+    )
+
+
+def _message(text="hello"):
+    return Message(content=TextContent(text=text), role=MessageRole.USER).to_dict()
+
+
+class TestCompression:
+    def test_choose_encoding(self):
+        """Test Accept-Encoding negotiation"""
+        assert compression.choose_encoding(None) is None
+        assert compression.choose_encoding("identity") is None
+        assert compression.choose_encoding("gzip;q=0") is None
+        assert compression.choose_encoding("deflate, gzip;q=0.5") == "gzip"
+        assert compression.choose_encoding("*") == compression.available_encodings()[0]
+
+    @pytest.mark.parametrize("encoding", compression.available_encodings())
+    def test_round_trip(self, encoding):
+        """Test whole and streamed compression with each available encoding"""
+        data = b"artifact " * 1000
+        assert compression.decompress(compression.compress(data, encoding), encoding) == data
+
+        compressor = compression.StreamCompressor(encoding)
+        stream = b"".join([compressor.compress(data[:100]), compressor.compress(data[100:]),
+                           compressor.finish()])
+        assert compression.decompress(stream, encoding) == data
+
+    def test_decompression_errors(self):
+        """Test unsupported encodings, corrupt bodies and decompression bombs"""
+        with pytest.raises(compression.UnsupportedEncodingError):
+            compression.decompress(b"data", "compress")
+        with pytest.raises(compression.DecompressionError):
+            compression.decompress(b"not gzip", "gzip")
+        with pytest.raises(compression.DecompressionError):
+            compression.decompress(gzip.compress(b"\0" * 10000), "gzip", max_size=1000)
+
+    @pytest.mark.parametrize("encoding,compress", [("gzip", gzip.compress), ("deflate", zlib.compress)])
+    def test_truncated_gzip_body(self, encoding, compress):
+        """Test that a gzip or deflate body cut short is rejected rather than partly decoded"""
+        body = compress(json.dumps({"text": "artifact " * 1000}).encode())
+
+        with pytest.raises(compression.DecompressionError, match="Truncated"):
+            compression.decompress(body[:len(body) // 2], encoding)
+        with pytest.raises(compression.DecompressionError, match="Truncated"):
+            compression.decompress(body[:-4], encoding)
+        assert compression.decompress(b"", encoding) == b""
+
+    @pytest.mark.parametrize("encoding,module", [("br", "brotli"), ("zstd", "zstandard")])
+    def test_decompression_bombs(self, encoding, module):
+        """Test that br and zstd bodies are not expanded past the size limit"""
+        pytest.importorskip(module)
+        bomb = compression.compress(b"\0" * (8 * 1024 * 1024), encoding)
+        assert len(bomb) < 64 * 1024
+
+        with pytest.raises(compression.DecompressionError):
+            compression.decompress(bomb, encoding, max_size=100000)
+        assert len(compression.decompress(bomb, encoding)) == 8 * 1024 * 1024
+        with pytest.raises(compression.DecompressionError):
+            compression.decompress(bomb[:len(bomb) // 2], encoding)
+
+    def test_flask_app(self):
+        """Test response compression and compressed requests on the Flask app"""
+        from python_a2a.server.http import create_flask_app
+
+        client = create_flask_app(_large_reply_server()).test_client()
+
+        response = client.post("/a2a", json=_message(), headers={"Accept-Encoding": "gzip"})
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert response.headers["Vary"] == "Accept-Encoding"
+        reply = json.loads(gzip.decompress(response.data))
+        assert reply["content"]["text"].startswith("artifact")
+
+        # Small responses and clients not accepting compression
+        response = client.get("/a2a/health", headers={"Accept-Encoding": "gzip"})
+        assert "Content-Encoding" not in response.headers
+        response = client.post("/a2a", json=_message())
+        assert "Content-Encoding" not in response.headers
+
+        response = client.post("/a2a", data=gzip.compress(json.dumps(_message()).encode()),
+                               headers={"Content-Encoding": "gzip", "Content-Type": "application/json"})
+        assert response.status_code == 200
+        response = client.post("/a2a", data=b"data", headers={"Content-Encoding": "compress"})
+        assert response.status_code == 415
+
+    def test_flask_streams_are_not_compressed(self):
+        """Test that Server-Sent Events are sent uncompressed"""
+        from python_a2a.server.http import create_flask_app
+
+        client = create_flask_app(_large_reply_server()).test_client()
+        response = client.post("/stream", json=_message(), headers={"Accept-Encoding": "gzip"})
+        assert response.mimetype == "text/event-stream"
+        assert "Content-Encoding" not in response.headers
+
+    def test_asgi_app(self):
+        """Test response compression and compressed requests on the ASGI app"""
+        from fastapi.testclient import TestClient
+        from python_a2a.server.asgi import create_asgi_app
+
+        client = TestClient(create_asgi_app(_large_reply_server()))
+
+        response = client.post("/a2a", json=_message(), headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert int(response.headers["content-length"]) < 1000
+        assert response.json()["content"]["text"].startswith("artifact")
+
+        response = client.post("/a2a", content=gzip.compress(json.dumps(_message()).encode()),
+                               headers={"Content-Encoding": "gzip", "Content-Type": "application/json"})
+        assert response.status_code == 200
+        response = client.post("/a2a", content=b"not gzip", headers={"Content-Encoding": "gzip"})
+        assert response.status_code == 400
+
+        # Compression can be disabled
+        client = TestClient(create_asgi_app(_large_reply_server(), compress_min_size=None))
+        response = client.post("/a2a", json=_message(), headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in response.headers
+
+    @responses.activate
+    def test_client_compresses_large_requests(self):
+        """Test that the client compresses request bodies above the threshold"""
+        responses.add(responses.POST, "https://example.com/a2a", status=200, json={
+            "content": {"type": "text", "text": "ok"}, "role": "agent"
+        })
+        client = A2AClient("https://example.com/a2a", compress_requests="gzip", compress_min_size=500)
+        client._protocol_detected = True
+
+        assert client.send_message(Message.from_dict(_message("x" * 1000))).content.text == "ok"
+        request = [call.request for call in responses.calls if call.request.method == "POST"][-1]
+        assert request.headers["Content-Encoding"] == "gzip"
+        assert json.loads(gzip.decompress(request.body))["content"]["text"] == "x" * 1000
+
+        client.send_message(Message.from_dict(_message("small")))
+        request = [call.request for call in responses.calls if call.request.method == "POST"][-1]
+        assert "Content-Encoding" not in request.headers
+
+        with pytest.raises(ValueError):
+            A2AClient("https://example.com/a2a", compress_requests="compress")
@@ -147,4 +147,239 @@ class TestConversation:
         
         # Check first message
         assert parsed.messages[0].content.type == conversation.messages[0].content.type
-        assert parsed.messages[0].content.text == conversation.messages[0].content.text
\ No newline at end of file
+        assert parsed.messages[0].content.text == conversation.messages[0].content.text
+
+class TestSlottedModels:
+    def test_models_have_no_instance_dict(self):
+        """Test that the message and task models store their fields in slots"""
+        from python_a2a import Task, TaskStatus, TaskState, Metadata
+
+        instances = [
+            Message(content=TextContent(text="Hello"), role=MessageRole.USER, metadata=Metadata()),
+            FunctionCallContent(name="f", parameters=[FunctionParameter(name="p", value=1)]),
+            FunctionResponseContent(name="f", response={"ok": True}),
+            ErrorContent(message="failed"),
+            Task(status=TaskStatus(state=TaskState.COMPLETED)),
+        ]
+        for instance in instances:
+            assert not hasattr(instance, "__dict__")
+            with pytest.raises(AttributeError):
+                instance.undeclared = True
+
+    def test_slotted_models_behave_like_dataclasses(self):
+        """Test equality, copies, pickling and dataclass helpers on slotted models"""
+        import copy
+        import pickle
+        import dataclasses
+
+        message = Message(content=TextContent(text="Hello"), role=MessageRole.USER,
+                          conversation_id="conversation-1")
+
+        assert dataclasses.is_dataclass(message)
+        assert [f.name for f in dataclasses.fields(Message)][:2] == ["content", "role"]
+        assert pickle.loads(pickle.dumps(message)) == message
+        assert copy.deepcopy(message) == message
+        assert dataclasses.replace(message, role=MessageRole.AGENT).role == MessageRole.AGENT
+        assert Message.from_dict(message.to_dict()) == message
+        assert Message.__name__ == "Message" and Message.__qualname__ == "Message"
+
+
+class TestConverters:
+    def test_format_detection(self):
+        """Test wire format detection for messages, conversations and tasks"""
+        from python_a2a.models.converters import (
+            WireFormat, detect_message_format, detect_conversation_format, detect_task_format
+        )
+
+        google_message = {"role": "user", "parts": [{"type": "text", "text": "Hi"}]}
+        python_message = {"role": "user", "content": {"type": "text", "text": "Hi"}}
+
+        assert detect_message_format(google_message) == WireFormat.GOOGLE_A2A
+        assert detect_message_format(python_message) == WireFormat.PYTHON_A2A
+        assert detect_conversation_format({"messages": [google_message]}) == WireFormat.GOOGLE_A2A
+        assert detect_conversation_format({"messages": []}) == WireFormat.PYTHON_A2A
+        assert detect_task_format({"status": {"state": "completed"},
+                                   "message": google_message}) == WireFormat.GOOGLE_A2A
+        assert detect_task_format({"status": {"state": "completed"},
+                                   "message": python_message}) == WireFormat.PYTHON_A2A
+
+    def test_message_round_trips(self):
+        """Test converting messages to and from both wire formats"""
+        from python_a2a import Metadata
+        from python_a2a.models.converters import (
+            WireFormat, message_from_dict, message_to_dict, message_dict_to_google
+        )
+
+        messages = [
+            Message(content=TextContent(text="Hi"), role=MessageRole.USER, conversation_id="c"),
+            Message(content=FunctionCallContent(name="f", parameters=[FunctionParameter(name="p", value=1)]),
+                    role=MessageRole.AGENT, parent_message_id="m",
+                    metadata=Metadata(created_at="now", custom_fields={"k": "v"})),
+            Message(content=FunctionResponseContent(name="f", response={"ok": True}), role=MessageRole.AGENT),
+            Message(content=ErrorContent(message="failed"), role=MessageRole.SYSTEM),
+        ]
+        for message in messages:
+            for wire_format in WireFormat:
+                assert message_from_dict(message_to_dict(message, wire_format)) == message
+            # Direct dict conversion matches conversion through the model
+            assert message_dict_to_google(message.to_dict()) == message.to_google_a2a()
+
+        with pytest.raises(ValueError):
+            message_from_dict({"role": "user", "content": {"type": "unknown"}})
+        assert message_dict_to_google({"role": "user", "content": {"type": "unknown"}}) is None
+
+    def test_google_message_input_is_not_mutated(self):
+        """Test that reading a Google A2A message leaves the payload unchanged"""
+        data = {"role": "agent", "parts": [{"type": "text", "text": "Hi"}],
+                "metadata": {"message_id": "m", "created_at": "now", "k": "v"}}
+        expected = json.loads(json.dumps(data))
+
+        message = Message.from_google_a2a(data)
+        assert data == expected
+        assert message.message_id == "m"
+        assert message.metadata.custom_fields == {"k": "v"}
+
+    def test_google_conversation_skips_unreadable_messages(self):
+        """Test that unreadable messages of a Google A2A conversation are skipped"""
+        data = {
+            "conversation_id": "c",
+            "messages": [
+                {"role": "user", "parts": [{"type": "text", "text": "Hi"}]},
+                {"role": "user", "content": {"type": "unknown"}},
+                "not a message",
+                {"role": "agent", "content": {"type": "text", "text": "Hello"}},
+            ]
+        }
+        conversation = Conversation.from_dict(data)
+
+        assert [m.content.text for m in conversation.messages] == ["Hi", "Hello"]
+        assert all(m.conversation_id == "c" for m in conversation.messages)
+
+    def test_task_round_trips(self):
+        """Test converting tasks with function parts to and from the Google A2A format"""
+        from python_a2a import Task, TaskStatus, TaskState
+
+        task = Task(
+            id="t", session_id="s", status=TaskStatus(state=TaskState.COMPLETED, timestamp="now"),
+            message={"role": "user", "content": {"type": "text", "text": "Hi"}},
+            artifacts=[{"parts": [{"type": "function_call", "name": "f", "parameters": []},
+                                  {"type": "error", "message": "failed"}]}]
+        )
+        google = task.to_google_a2a()
+
+        assert google["message"]["parts"] == [{"type": "text", "text": "Hi"}]
+        assert google["artifacts"][0]["parts"][1] == {"type": "data", "data": {"error": "failed"}}
+        restored = Task.from_dict(google)
+        assert restored.artifacts == task.artifacts
+        assert restored.message["content"]["text"] == "Hi"
+
+    def test_wire_format_per_call_and_context(self):
+        """Test that explicit and scoped wire formats take precedence over the global flag"""
+        from python_a2a import Task, TaskStatus, TaskState, WireFormat, use_wire_format
+
+        message = Message(content=TextContent(text="Hi"), role=MessageRole.USER)
+        conversation = Conversation(conversation_id="c", messages=[message])
+        task = Task(status=TaskStatus(state=TaskState.COMPLETED), message=message.to_dict())
+
+        assert "parts" in message.to_dict(WireFormat.GOOGLE_A2A)
+        assert "parts" in message.to_dict("google_a2a")
+        assert "parts" in conversation.to_dict(WireFormat.GOOGLE_A2A)["messages"][0]
+        assert "parts" in task.to_dict(WireFormat.GOOGLE_A2A)["message"]
+
+        with use_wire_format(WireFormat.GOOGLE_A2A):
+            assert "parts" in message.to_dict()
+            assert "parts" in conversation.to_dict()["messages"][0]
+            assert "content" in message.to_dict(WireFormat.PYTHON_A2A)
+        assert "content" in message.to_dict()
+
+        Conversation.enable_google_a2a_compatibility(True)
+        try:
+            assert "parts" in conversation.to_dict()["messages"][0]
+            assert "content" in conversation.to_dict(WireFormat.PYTHON_A2A)["messages"][0]
+            with use_wire_format(WireFormat.PYTHON_A2A):
+                assert "content" in message.to_dict()
+        finally:
+            Conversation.enable_google_a2a_compatibility(False)
+
+        with pytest.raises(ValueError):
+            message.to_dict("google")
+
+    def test_wire_format_is_scoped_per_thread(self):
+        """Test that threads serialize concurrently in their own wire formats"""
+        import threading
+        from python_a2a import WireFormat, use_wire_format
+
+        message = Message(content=TextContent(text="Hi"), role=MessageRole.USER)
+        barrier = threading.Barrier(2)
+        results = {}
+
+        def serialize(wire_format):
+            with use_wire_format(wire_format):
+                barrier.wait()
+                results[wire_format] = message.to_dict()
+
+        threads = [threading.Thread(target=serialize, args=(wire_format,)) for wire_format in WireFormat]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert "content" in results[WireFormat.PYTHON_A2A]
+        assert "parts" in results[WireFormat.GOOGLE_A2A]
+
+
+class TestLazyMessage:
+    def test_headers_are_read_without_decoding_content(self):
+        """Test that headers are read eagerly and content on first access"""
+        from python_a2a import LazyMessage, WireFormat
+
+        data = {"role": "agent", "message_id": "m", "conversation_id": "c",
+                "content": {"type": "function_call", "name": "f",
+                            "parameters": [{"name": "p", "value": 1}]},
+                "metadata": {"created_at": "now", "custom_fields": {"k": "v"}}}
+        message = LazyMessage(data)
+
+        assert message.wire_format == WireFormat.PYTHON_A2A
+        assert (message.role, message.message_id, message.conversation_id) == (MessageRole.AGENT, "m", "c")
+        assert not message.is_decoded
+        assert message.content.parameters[0].value == 1
+        assert message.is_decoded
+        assert message.content is message.content
+        assert message.metadata.custom_fields == {"k": "v"}
+        assert message.to_message() == Message.from_dict(data)
+
+    def test_google_payload(self):
+        """Test a view of a Google A2A message"""
+        from python_a2a import LazyMessage, WireFormat
+
+        data = {"role": "USER", "parts": [{"type": "text", "text": "Hi"}],
+                "metadata": {"message_id": "m", "conversation_id": "c", "created_at": "now"}}
+        message = LazyMessage(data)
+
+        assert message.wire_format == WireFormat.GOOGLE_A2A
+        assert (message.role, message.message_id, message.conversation_id) == (MessageRole.USER, "m", "c")
+        assert message.to_message() == Message.from_dict(data)
+        assert message.to_dict(WireFormat.PYTHON_A2A) == Message.from_dict(data).to_dict()
+
+    def test_to_dict_passes_payload_through(self):
+        """Test that to_dict in the payload's own format returns the payload"""
+        from python_a2a import LazyMessage, WireFormat
+
+        data = {"role": "user", "content": {"type": "text", "text": "Hi"}}
+        message = LazyMessage(data)
+
+        assert message.to_dict() is data
+        assert not message.is_decoded
+        assert message.to_dict(WireFormat.GOOGLE_A2A)["parts"] == [{"type": "text", "text": "Hi"}]
+
+    def test_errors(self):
+        """Test that invalid roles fail eagerly and unknown content lazily"""
+        from python_a2a import LazyMessage
+
+        with pytest.raises(ValueError):
+            LazyMessage({"role": "robot", "content": {"type": "text", "text": "Hi"}})
+
+        message = LazyMessage({"role": "user", "conversation_id": "c", "content": {"type": "unknown"}})
+        assert message.conversation_id == "c"
+        with pytest.raises(ValueError):
+            message.content
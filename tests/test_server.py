@@ -7,7 +7,7 @@ from unittest.mock import patch, MagicMock
 
 from python_a2a import (
     A2AServer, Message, TextContent, MessageRole, Conversation,
-    BaseA2AServer, run_server
+    BaseA2AServer, run_server, Task, TaskStatus, TaskState
 )
 
 
@@ -115,4 +115,1118 @@ class TestRunServer:
             
             # Check that the app was created and run
             mock_create_app.assert_called_once_with(echo_server)
-            mock_app.run.assert_called_once_with(host="localhost", port=8080, debug=True)
\ No newline at end of file
+            mock_app.run.assert_called_once_with(host="localhost", port=8080, debug=True)
+
+class TestJsonRpcBatch:
+    def _request(self, rpc_id, text, **extra):
+        request = {
+            "jsonrpc": "2.0",
+            "method": "tasks/send",
+            "params": {
+                "id": f"task-{rpc_id}",
+                "message": Message(content=TextContent(text=text), role=MessageRole.USER).to_dict()
+            }
+        }
+        if rpc_id is not None:
+            request["id"] = rpc_id
+        request.update(extra)
+        return request
+
+    def _client(self, server):
+        from python_a2a.server.http import create_flask_app
+        return create_flask_app(server).test_client()
+
+    def test_batch_dispatches_tasks_concurrently(self):
+        """Test that the tasks of a batch are processed concurrently"""
+        import threading
+
+        barrier = threading.Barrier(3, timeout=5)
+
+        def handler(message):
+            barrier.wait()
+            return Message(content=TextContent(text=message.content.text.upper()), role=MessageRole.AGENT)
+
+        server = A2AServer(message_handler=handler, google_a2a_compatible=False)
+        response = self._client(server).post(
+            "/tasks/send", json=[self._request(i, f"msg {i}") for i in range(3)]
+        )
+
+        assert response.status_code == 200
+        results = {item["id"]: item["result"] for item in response.get_json()}
+        assert set(results) == {0, 1, 2}
+        for i in range(3):
+            assert results[i]["artifacts"][0]["parts"][0]["text"] == f"MSG {i}"
+            assert results[i]["status"]["state"] == "completed"
+        assert set(server.tasks) == {"task-0", "task-1", "task-2"}
+
+    def test_batch_errors_and_notifications(self):
+        """Test per-request errors and notifications in a batch"""
+        server = A2AServer(google_a2a_compatible=False)
+        response = self._client(server).post("/a2a/tasks/send", json=[
+            self._request(1, "hello"),
+            self._request(2, "hello", method="tasks/unknown"),
+            "not a request",
+            self._request(None, "notification")
+        ])
+
+        items = response.get_json()
+        assert len(items) == 3
+        assert items[0]["id"] == 1 and "result" in items[0]
+        assert items[1]["error"]["code"] == -32601
+        assert items[2]["error"]["code"] == -32600
+        assert "task-None" in server.tasks
+
+    def test_empty_batch_is_invalid(self):
+        """Test that an empty batch is rejected"""
+        response = self._client(A2AServer()).post("/tasks/send", json=[])
+
+        assert response.status_code == 400
+        assert response.get_json()["error"]["code"] == -32600
+
+
+class TestAsgiApp:
+    def _client(self, agent):
+        from fastapi.testclient import TestClient
+        from python_a2a.server.asgi import create_asgi_app
+        return TestClient(create_asgi_app(agent))
+
+    def test_message_and_conversation(self, echo_server, text_message, conversation):
+        """Test the message routes with a synchronous agent"""
+        client = self._client(echo_server)
+
+        response = client.post("/a2a", json=text_message.to_dict())
+        assert response.status_code == 200
+        assert Message.from_dict(response.json()).content.text == "Echo: Hello, world!"
+
+        response = client.post("/", json=conversation.to_dict())
+        assert len(Conversation.from_dict(response.json()).messages) == len(conversation.messages) + 1
+
+        assert client.get("/a2a/health").json() == {"status": "ok"}
+        assert client.get("/agent.json").json()["name"] == "A2A Agent"
+
+    def test_async_handlers_are_awaited(self):
+        """Test that coroutine handlers run concurrently on the event loop"""
+        import asyncio
+        import httpx
+        from python_a2a.server.asgi import create_asgi_app
+
+        class SlowAgent(BaseA2AServer):
+            async def handle_message(self, message):
+                await asyncio.sleep(0.2)
+                return Message(content=TextContent(text=message.content.text.upper()),
+                               role=MessageRole.AGENT)
+
+        async def run():
+            transport = httpx.ASGITransport(app=create_asgi_app(SlowAgent()))
+            async with httpx.AsyncClient(transport=transport, base_url="http://agent") as client:
+                start = asyncio.get_running_loop().time()
+                responses = await asyncio.gather(*[
+                    client.post("/a2a", json=Message(content=TextContent(text=f"m{i}"),
+                                                     role=MessageRole.USER).to_dict())
+                    for i in range(10)
+                ])
+                return responses, asyncio.get_running_loop().time() - start
+
+        responses, elapsed = asyncio.run(run())
+
+        assert [r.json()["content"]["text"] for r in responses] == [f"M{i}" for i in range(10)]
+        assert elapsed < 1.0
+
+    def test_task_routes(self):
+        """Test JSON-RPC task send, get, cancel and batch"""
+        client = self._client(A2AServer(google_a2a_compatible=False))
+        params = {
+            "id": "task-1",
+            "message": Message(content=TextContent(text="hello"), role=MessageRole.USER).to_dict()
+        }
+
+        response = client.post("/tasks/send", json={"jsonrpc": "2.0", "id": 7, "method": "tasks/send",
+                                                    "params": params})
+        body = response.json()
+        assert body["id"] == 7
+        assert body["result"]["status"]["state"] == "completed"
+        assert body["result"]["artifacts"][0]["parts"][0]["text"] == "hello"
+
+        response = client.post("/a2a/tasks/get", json={"jsonrpc": "2.0", "id": 8, "params": {"id": "task-1"}})
+        assert response.json()["result"]["id"] == "task-1"
+
+        response = client.post("/tasks/cancel", json={"id": "task-1"})
+        assert response.json()["status"]["state"] == "canceled"
+
+        response = client.post("/tasks/get", json={"jsonrpc": "2.0", "id": 9, "params": {"id": "missing"}})
+        assert response.status_code == 404
+        assert response.json()["error"]["code"] == -32000
+
+        response = client.post("/tasks/send", json=[
+            {"jsonrpc": "2.0", "id": i, "method": "tasks/send", "params": dict(params, id=f"batch-{i}")}
+            for i in range(3)
+        ] + [{"jsonrpc": "2.0", "id": 3, "method": "tasks/unknown"}])
+        items = response.json()
+        assert [item["id"] for item in items] == [0, 1, 2, 3]
+        assert items[3]["error"]["code"] == -32601
+
+    def test_streaming(self):
+        """Test that streamed chunks are sent as server-sent events"""
+        import json
+        from python_a2a.client.sse import SSEDecoder
+
+        class StreamingAgent(BaseA2AServer):
+            def handle_message(self, message):
+                return message
+
+            async def stream_response(self, message):
+                for word in ("one", "two"):
+                    yield word
+
+        response = self._client(StreamingAgent()).post(
+            "/stream", json=Message(content=TextContent(text="hi"), role=MessageRole.USER).to_dict()
+        )
+
+        events = SSEDecoder().feed(response.content)
+        chunks = [json.loads(event.data) for event in events]
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert [chunk["content"] for chunk in chunks] == ["one", "two", ""]
+        assert chunks[-1]["lastChunk"] is True
+
+
+class TestStreamLoop:
+    def test_streams_share_one_thread(self):
+        """Test that concurrent streams are served by a single background thread"""
+        import asyncio
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+        from python_a2a.server.stream_loop import BackgroundLoop
+
+        loop = BackgroundLoop()
+        threads = set()
+
+        async def numbers():
+            for i in range(5):
+                threads.add(threading.current_thread().name)
+                await asyncio.sleep(0.01)
+                yield i
+
+        try:
+            with ThreadPoolExecutor(max_workers=20) as executor:
+                results = list(executor.map(lambda _: list(loop.iterate(numbers())), range(20)))
+        finally:
+            loop.close()
+
+        assert results == [[0, 1, 2, 3, 4]] * 20
+        assert threads == {"a2a-stream-loop"}
+        assert loop.active_streams == 0
+
+    def test_backpressure_and_cancellation(self):
+        """Test that a slow reader pauses the stream and closing it cancels the stream"""
+        import time
+        from python_a2a.server.stream_loop import BackgroundLoop
+
+        loop = BackgroundLoop()
+        produced = []
+        closed = []
+
+        async def endless():
+            try:
+                i = 0
+                while True:
+                    produced.append(i)
+                    yield i
+                    i += 1
+            finally:
+                closed.append(True)
+
+        try:
+            stream = loop.iterate(endless(), maxsize=3)
+            assert next(stream) == 0
+            time.sleep(0.1)
+            # At most one batch handed to the reader, a full queue and one pending item
+            assert len(produced) <= 2 * 3 + 1
+            stream.close()
+            time.sleep(0.1)
+        finally:
+            loop.close()
+
+        assert closed == [True]
+
+    def test_errors_and_timeouts(self):
+        """Test that stream errors and deadlines reach the reader"""
+        import asyncio
+        from python_a2a.server.stream_loop import BackgroundLoop, StreamTimeoutError
+
+        loop = BackgroundLoop()
+
+        async def failing():
+            yield "first"
+            raise ValueError("model failed")
+
+        async def slow():
+            await asyncio.sleep(5)
+            yield "late"
+
+        try:
+            stream = loop.iterate(failing())
+            assert next(stream) == "first"
+            with pytest.raises(ValueError):
+                next(stream)
+            with pytest.raises(StreamTimeoutError):
+                list(loop.iterate(slow(), timeout=0.1))
+        finally:
+            loop.close()
+
+    def test_flask_stream_route(self):
+        """Test the /stream route of the Flask app"""
+        import json
+        from python_a2a.client.sse import SSEDecoder
+        from python_a2a.server.http import create_flask_app
+
+        class StreamingAgent(BaseA2AServer):
+            def handle_message(self, message):
+                return message
+
+            async def stream_response(self, message):
+                for word in message.content.text.split():
+                    yield word
+
+        response = create_flask_app(StreamingAgent()).test_client().post(
+            "/stream", json=Message(content=TextContent(text="one two three"), role=MessageRole.USER).to_dict()
+        )
+
+        chunks = [json.loads(event.data) for event in SSEDecoder().feed(response.data)]
+        assert [chunk["content"] for chunk in chunks] == ["one", "two", "three", ""]
+        assert chunks[-1]["lastChunk"] is True
+
+    def test_stream_tracing_is_level_gated(self, caplog, capsys):
+        """Test that chunks are only traced at DEBUG level and nothing is printed"""
+        import logging
+        from python_a2a.server.http import create_flask_app
+
+        class StreamingAgent(BaseA2AServer):
+            def handle_message(self, message):
+                return message
+
+            async def stream_response(self, message):
+                for word in ("one", "two"):
+                    yield word
+
+        client = create_flask_app(StreamingAgent()).test_client()
+        payload = Message(content=TextContent(text="hi"), role=MessageRole.USER).to_dict()
+
+        with caplog.at_level(logging.INFO, logger="python_a2a.server.http"):
+            client.post("/stream", json=payload).get_data()
+        assert not caplog.records
+
+        with caplog.at_level(logging.DEBUG, logger="python_a2a.server.http"):
+            client.post("/stream", json=payload).get_data()
+        chunks = [r for r in caplog.records if r.name == "python_a2a.server.http.stream"]
+        assert [r.chunk_index for r in chunks] == [0, 1]
+        assert chunks[0].stream_id == payload["message_id"]
+        assert capsys.readouterr().out == ""
+
+
+class TestTaskStore:
+    def _task(self, task_id, text="hello"):
+        from python_a2a import Task
+        return Task(id=task_id, message=Message(content=TextContent(text=text), role=MessageRole.USER).to_dict())
+
+    def test_memory_store_evicts_least_recently_used(self):
+        """Test that the in-memory store stays bounded and evicts LRU tasks"""
+        from python_a2a.server import MemoryTaskStore
+
+        store = MemoryTaskStore(max_tasks=100)
+        for i in range(10000):
+            store[f"task-{i}"] = self._task(f"task-{i}")
+            if i == 50:
+                assert store["task-0"].id == "task-0"  # keep task-0 recently used
+
+        assert len(store) == 100
+        assert "task-9999" in store
+        assert "task-1" not in store
+        assert store.get("task-1") is None
+
+    def test_memory_store_ttl(self):
+        """Test that tasks expire after the TTL"""
+        from python_a2a.server import MemoryTaskStore
+
+        store = MemoryTaskStore(ttl=60)
+        store.save(self._task("old"))
+        with patch("python_a2a.server.task_store.time.monotonic", return_value=10 ** 9):
+            assert store.get("old") is None
+            store.save(self._task("new"))
+            assert list(store) == ["new"]
+
+    def test_sqlite_store_round_trip(self, tmp_path):
+        """Test that the SQLite store persists tasks and bounds their number"""
+        from python_a2a import TaskState, TaskStatus
+        from python_a2a.server import SQLiteTaskStore
+
+        path = str(tmp_path / "tasks.sqlite")
+        store = SQLiteTaskStore(path, max_tasks=5)
+        task = self._task("task-1", "persist me")
+        task.status = TaskStatus(state=TaskState.COMPLETED)
+        task.artifacts = [{"parts": [{"type": "text", "text": "done"}]}]
+        store.save(task)
+        for i in range(2, 10):
+            store.save(self._task(f"task-{i}"))
+        assert len(store) == 5
+        store.close()
+
+        store = SQLiteTaskStore(path)
+        assert "task-1" not in store
+        store.save(task)
+        loaded = SQLiteTaskStore(path)["task-1"]
+        assert loaded.status.state == TaskState.COMPLETED
+        assert loaded.message["content"]["text"] == "persist me"
+        assert loaded.artifacts == task.artifacts
+        del store["task-1"]
+        assert "task-1" not in store
+        store.close()
+
+    def test_server_serves_tasks_from_store(self):
+        """Test tasks/get and tasks/cancel against a SQLite-backed server"""
+        from python_a2a.server import SQLiteTaskStore
+        from python_a2a.server.http import create_flask_app
+
+        server = A2AServer(google_a2a_compatible=False, task_store=SQLiteTaskStore(":memory:"))
+        client = create_flask_app(server).test_client()
+        client.post("/tasks/send", json={
+            "jsonrpc": "2.0", "id": 1, "method": "tasks/send",
+            "params": self._task("task-1").to_dict()
+        })
+
+        response = client.post("/tasks/get", json={"jsonrpc": "2.0", "id": 2, "params": {"id": "task-1"}})
+        assert response.get_json()["result"]["id"] == "task-1"
+
+        client.post("/tasks/cancel", json={"jsonrpc": "2.0", "id": 3, "params": {"id": "task-1"}})
+        assert server.tasks["task-1"].status.state.value == "canceled"
+
+
+class TestTaskExecution:
+    class ProgressAgent(A2AServer):
+        """Agent reporting progress while it waits for ``release``"""
+
+        def __init__(self, **kwargs):
+            import threading
+            super().__init__(google_a2a_compatible=False, **kwargs)
+            self.release = threading.Event()
+
+        def handle_task(self, task):
+            self.publish_task_artifact(task, {"parts": [{"type": "text", "text": "partial"}]})
+            self.release.wait(5)
+            task.artifacts.append({"parts": [{"type": "text", "text": "final"}]})
+            task.status = TaskStatus(state=TaskState.COMPLETED)
+            return task
+
+    def _request(self, method, params):
+        return {"jsonrpc": "2.0", "id": 1, "method": method, "params": params}
+
+    def _task_params(self, task_id):
+        return {"id": task_id, "message": Message(content=TextContent(text="go"), role=MessageRole.USER).to_dict()}
+
+    def _events(self, lines):
+        """Read (event, data) pairs from SSE lines until the complete event"""
+        import json
+        event = None
+        for line in lines:
+            line = line.decode() if isinstance(line, bytes) else line
+            if line.startswith("event:"):
+                event = line[6:].strip()
+            elif line.startswith("data:"):
+                yield event, json.loads(line[5:])
+                if event == "complete":
+                    return
+
+    def test_flask_streams_progress_before_completion(self):
+        """Test that published updates reach the client while the task still runs"""
+        from python_a2a.server.http import create_flask_app
+
+        agent = self.ProgressAgent()
+        response = create_flask_app(agent).test_client().post(
+            "/tasks/stream", json=self._request("tasks/sendSubscribe", self._task_params("task-1")),
+            buffered=False
+        )
+        events = self._events(line for chunk in response.response for line in chunk.splitlines())
+
+        assert next(events)[1]["status"]["state"] == "submitted"
+        assert next(events)[1]["status"]["state"] == "waiting"
+        event, data = next(events)
+        assert event == "artifact" and data["artifacts"][0]["parts"][0]["text"] == "partial"
+        assert not agent.release.is_set()  # the task is still running
+
+        agent.release.set()
+        event, data = next(events)
+        assert event == "complete" and data["status"]["state"] == "completed"
+        assert len(data["artifacts"]) == 2
+        assert agent.tasks["task-1"].status.state == TaskState.COMPLETED
+        assert agent.streaming_subscriptions == {}
+
+    def test_asgi_resubscribe_to_running_task(self):
+        """Test resubscribing to a running task on the ASGI app"""
+        import threading
+        from fastapi.testclient import TestClient
+        from python_a2a.server.asgi import create_asgi_app
+
+        agent = self.ProgressAgent()
+        agent.submit_task(Task.from_dict(self._task_params("task-2")))
+        client = TestClient(create_asgi_app(agent))
+
+        # The test client reads the whole stream, so release the task from a timer
+        timer = threading.Timer(0.2, agent.release.set)
+        timer.start()
+        with client.stream("POST", "/tasks/stream",
+                           json=self._request("tasks/resubscribe", {"id": "task-2"})) as response:
+            events = list(self._events(response.iter_lines()))
+        timer.join()
+
+        # The events published before resubscribing are replayed
+        assert [event for event, _ in events] == ["update", "update", "artifact", "complete"]
+        assert events[1][1]["status"]["state"] == "waiting"
+        assert events[-1][1]["status"]["state"] == "completed"
+
+    def test_task_event_stream_keepalive_and_timeout(self, monkeypatch):
+        """Test that idle task event streams send keepalives and end at their deadline"""
+        import asyncio
+        import importlib
+        import queue
+        flask_module = importlib.import_module("python_a2a.server.a2a_server")
+        asgi_module = importlib.import_module("python_a2a.server.asgi")
+        monkeypatch.setattr(flask_module, "KEEPALIVE_INTERVAL", 0.05)
+        monkeypatch.setattr(asgi_module, "KEEPALIVE_INTERVAL", 0.05)
+        agent = self.ProgressAgent()
+        unsubscribed = []
+        agent.unsubscribe_task = lambda task_id, callback: unsubscribed.append(task_id)
+
+        events = queue.Queue()
+        chunks = list(agent._task_event_stream("task-1", events, events.put, timeout=0.2))
+
+        async def read_asgi_stream():
+            return [chunk async for chunk in asgi_module._published_events(
+                agent, "task-2", asyncio.Queue(), None, timeout=0.2)]
+
+        for stream in (chunks, asyncio.run(read_asgi_stream())):
+            assert stream[0] == ": keepalive\n\n"
+            assert stream[-1].startswith("event: error\n")
+            assert "timed out" in stream[-1]
+        assert unsubscribed == ["task-1", "task-2"]
+
+    def test_resubscribe_without_events_reports_real_state(self):
+        """Test that resubscribing to a task with no published events does not fake its completion"""
+        import json
+        from fastapi.testclient import TestClient
+        from python_a2a.server.asgi import create_asgi_app
+        from python_a2a.server.http import create_flask_app
+
+        agent = A2AServer(google_a2a_compatible=False)
+        agent.tasks["task-4"] = Task.from_dict({"id": "task-4", "status": {"state": "waiting"}})
+        request = self._request("tasks/resubscribe", {"id": "task-4"})
+
+        flask_body = create_flask_app(agent).test_client().post("/tasks/stream", json=request).get_data(as_text=True)
+        asgi_body = TestClient(create_asgi_app(agent)).post("/tasks/stream", json=request).text
+
+        for body in (flask_body, asgi_body):
+            lines = body.splitlines()
+            events = [line[6:].strip() for line in lines if line.startswith("event:")]
+            data = [json.loads(line[5:]) for line in lines if line.startswith("data:")]
+            assert events == ["update", "error"]
+            assert data[0]["status"]["state"] == "waiting"
+            assert "not available" in data[1]["error"]
+        assert agent.tasks["task-4"].status.state == TaskState.WAITING
+
+    def test_failing_task_is_published_as_failed(self):
+        """Test that a task raising an error completes as failed"""
+        class FailingAgent(A2AServer):
+            def handle_task(self, task):
+                raise RuntimeError("model unavailable")
+
+        agent = FailingAgent(google_a2a_compatible=False)
+        result = agent.submit_task(Task.from_dict(self._task_params("task-3"))).result(5)
+
+        assert result.status.state == TaskState.FAILED
+        assert agent.tasks["task-3"].status.message == {"error": "model unavailable"}
+
+
+class FakeRedis:
+    """Minimal in-process stand-in for the redis-py client used by RedisTaskEventBus"""
+
+    def __init__(self):
+        import threading
+        self.data = {}
+        self.channels = {}
+        self.lock = threading.Lock()
+        # When set, pub/sub subscriptions wait for it, as if Redis were slow
+        self.subscribe_gate = None
+
+    def incr(self, key):
+        with self.lock:
+            self.data[key] = self.data.get(key, 0) + 1
+            return self.data[key]
+
+    def rpush(self, key, value):
+        with self.lock:
+            self.data.setdefault(key, []).append(value)
+
+    def ltrim(self, key, start, end):
+        with self.lock:
+            items = self.data.get(key, [])
+            self.data[key] = items[start:] if end == -1 else items[start:end + 1]
+
+    def lrange(self, key, start, end):
+        with self.lock:
+            items = list(self.data.get(key, []))
+        return items[start:] if end == -1 else items[start:end + 1]
+
+    def expire(self, key, seconds):
+        pass
+
+    def publish(self, channel, message):
+        with self.lock:
+            subscribers = list(self.channels.get(channel, ()))
+        for pubsub in subscribers:
+            pubsub.messages.put({"type": "message", "channel": channel.encode(), "data": message.encode()})
+
+    def pipeline(self):
+        client = self
+
+        class Pipeline:
+            def __init__(self):
+                self.calls = []
+
+            def __getattr__(self, name):
+                return lambda *args: self.calls.append((name, args))
+
+            def execute(self):
+                return [getattr(client, name)(*args) for name, args in self.calls]
+
+        return Pipeline()
+
+    def pubsub(self, ignore_subscribe_messages=False):
+        import queue
+        import threading
+        client = self
+
+        class PubSub:
+            # Like redis-py's, not thread-safe: records the threads using it
+            def __init__(self):
+                self.messages = queue.Queue()
+                self.threads = set()
+
+            def subscribe(self, channel):
+                self.threads.add(threading.get_ident())
+                if client.subscribe_gate is not None:
+                    client.subscribe_gate.wait()
+                with client.lock:
+                    client.channels.setdefault(channel, set()).add(self)
+
+            def unsubscribe(self, channel):
+                self.threads.add(threading.get_ident())
+                with client.lock:
+                    client.channels.get(channel, set()).discard(self)
+
+            def get_message(self, timeout=0.0):
+                self.threads.add(threading.get_ident())
+                try:
+                    return self.messages.get(timeout=timeout)
+                except queue.Empty:
+                    return None
+
+            def close(self):
+                pass
+
+        return PubSub()
+
+
+class TestTaskEventBus:
+    def test_fan_out_and_replay(self):
+        """Test that subscribers share a task's events and replay missed ones"""
+        from python_a2a.server import TaskEventBus
+
+        bus = TaskEventBus(buffer_size=3)
+        first, second = [], []
+        assert not bus.subscribe("task-1", first.append)
+
+        bus.publish("task-1", "update", {"n": 1})
+        assert bus.subscribe("task-1", first.append)
+        for n in range(2, 5):
+            bus.publish("task-1", "update", {"n": n})
+        # A late subscriber gets what is left in the ring buffer after event 2
+        assert bus.subscribe("task-1", second.append, last_event_id=2)
+        bus.publish("task-1", "complete", {"n": 5})
+
+        assert [event.id for event in first] == [1, 2, 3, 4, 5]
+        assert [event.id for event in second] == [3, 4, 5]
+        assert bus.subscriptions == {}
+
+        # After completion only the buffered events are replayed
+        late = []
+        assert bus.subscribe("task-1", late.append, last_event_id=5)
+        assert [(event.id, event.event) for event in late] == [(5, "complete")]
+
+    def test_buffers_are_bounded_whatever_the_task_state(self):
+        """Test that buffers of running tasks are dropped by age and count, unless followed"""
+        from python_a2a.server import TaskEventBus
+
+        bus = TaskEventBus(max_tasks=2, ttl=60)
+        followed = []
+        with patch("python_a2a.server.event_bus.time.monotonic", return_value=100.0):
+            for n in range(1, 4):
+                bus.publish(f"task-{n}", "update", {"n": n})
+            assert bus.subscribe("task-2", followed.append)
+            assert not bus.subscribe("task-1", [].append)
+            bus.publish("task-4", "update", {"n": 4})
+            assert not bus.subscribe("task-3", [].append)
+
+        with patch("python_a2a.server.event_bus.time.monotonic", return_value=170.0):
+            bus.publish("task-5", "update", {"n": 5})
+            assert not bus.subscribe("task-4", [].append)
+            # The followed task keeps its buffer and event IDs
+            bus.publish("task-2", "complete", {"n": 2})
+
+        assert [event.id for event in followed] == [1, 2]
+        assert len(bus._buffers) == 2
+
+    def test_flask_resubscribe_with_last_event_id(self):
+        """Test that a reconnecting client resumes after its Last-Event-ID"""
+        import json
+        from python_a2a.server.http import create_flask_app
+
+        agent = TestTaskExecution.ProgressAgent()
+        agent.release.set()
+        agent.submit_task(Task.from_dict({"id": "task-1"})).result(5)
+
+        response = create_flask_app(agent).test_client().post(
+            "/tasks/stream",
+            json={"jsonrpc": "2.0", "id": 1, "method": "tasks/resubscribe", "params": {"id": "task-1"}},
+            headers={"Last-Event-ID": "2"}
+        )
+
+        ids = [int(line[3:]) for line in response.get_data(as_text=True).splitlines() if line.startswith("id:")]
+        events = [line[6:].strip() for line in response.get_data(as_text=True).splitlines()
+                  if line.startswith("event:")]
+        assert ids == [3, 4]
+        assert events == ["artifact", "complete"]
+
+    def test_redis_bus_shares_events_between_servers(self):
+        """Test that a task running on one server can be followed from another"""
+        import queue
+        from python_a2a.server import RedisTaskEventBus
+
+        redis = FakeRedis()
+        publisher = RedisTaskEventBus(redis, buffer_size=10, poll_interval=0.05)
+        follower = RedisTaskEventBus(redis, buffer_size=10, poll_interval=0.05)
+        received = queue.Queue()
+        try:
+            publisher.publish("task-1", "update", {"n": 1})
+            assert follower.subscribe("task-1", received.put)
+            publisher.publish("task-1", "artifact", {"n": 2})
+            publisher.publish("task-1", "complete", {"n": 3})
+
+            events = [received.get(timeout=2) for _ in range(3)]
+            assert [(event.id, event.event) for event in events] == [
+                (1, "update"), (2, "artifact"), (3, "complete")
+            ]
+            assert follower.subscriptions == {}
+            assert not follower.subscribe("task-2", received.put)
+        finally:
+            publisher.close()
+            follower.close()
+        # Only the listener thread used the pub/sub connection
+        assert follower._pubsub.threads == {follower._listener.ident}
+
+    def test_redis_bus_subscribers_wait_for_pending_subscription(self):
+        """Test that a subscriber joining a pending channel subscription misses no events"""
+        import queue
+        import threading
+        from python_a2a.server import RedisTaskEventBus
+
+        redis = FakeRedis()
+        publisher = RedisTaskEventBus(redis, poll_interval=0.05)
+        follower = RedisTaskEventBus(redis, poll_interval=0.05)
+        first, second = queue.Queue(), queue.Queue()
+        try:
+            publisher.publish("task-1", "update", {"n": 1})
+            redis.subscribe_gate = threading.Event()
+            threads = [threading.Thread(target=follower.subscribe, args=("task-1", q.put))
+                       for q in (first, second)]
+            for thread in threads:
+                thread.start()
+            # Both subscribers wait until the channel subscription is made
+            threads[1].join(0.2)
+            assert all(thread.is_alive() for thread in threads)
+
+            redis.subscribe_gate.set()
+            for thread in threads:
+                thread.join(5)
+            publisher.publish("task-1", "complete", {"n": 2})
+
+            for events in (first, second):
+                assert [events.get(timeout=2).id for _ in range(2)] == [1, 2]
+            assert follower._subscribed == {}
+        finally:
+            publisher.close()
+            follower.close()
+
+    def test_redis_bus_concurrent_subscribers(self):
+        """Test that subscribers on many threads each get their task's events"""
+        import queue
+        import threading
+        from python_a2a.server import RedisTaskEventBus
+
+        redis = FakeRedis()
+        publisher = RedisTaskEventBus(redis, poll_interval=0.05)
+        follower = RedisTaskEventBus(redis, poll_interval=0.05)
+        received = {n: queue.Queue() for n in range(8)}
+
+        def follow(n):
+            follower.subscribe(f"task-{n}", received[n].put)
+
+        try:
+            for n in received:
+                publisher.publish(f"task-{n}", "update", {"n": n})
+            threads = [threading.Thread(target=follow, args=(n,)) for n in received]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(5)
+            for n in received:
+                publisher.publish(f"task-{n}", "complete", {"n": n})
+
+            for n, events in received.items():
+                assert [events.get(timeout=2).event for _ in range(2)] == ["update", "complete"]
+        finally:
+            publisher.close()
+            follower.close()
+        assert follower._pubsub.threads == {follower._listener.ident}
+
+
+class TestAgentCardCache:
+    def test_flask_agent_card_etag(self):
+        """Test conditional agent card requests and invalidation on the Flask app"""
+        from python_a2a import AgentCard
+        from python_a2a.server.http import create_flask_app
+
+        agent = A2AServer(agent_card=AgentCard(name="Cached", description="", url="http://localhost"))
+        app = create_flask_app(agent)
+        client = app.test_client()
+        headers = {"Accept": "application/json"}
+
+        first = client.get("/agent.json", headers=headers)
+        assert first.status_code == 200
+        assert first.get_json()["name"] == "Cached"
+        etag = first.headers["ETag"]
+
+        response = client.get("/a2a/agent.json", headers={**headers, "If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.data == b""
+        response = client.get("/agent.json", headers={
+            **headers, "If-Modified-Since": first.headers["Last-Modified"]
+        })
+        assert response.status_code == 304
+
+        # Replacing the card is picked up at once; in-place edits after invalidate()
+        agent.agent_card = AgentCard(name="Renamed", description="", url="http://localhost")
+        response = client.get("/agent.json", headers={**headers, "If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.get_json()["name"] == "Renamed"
+
+        agent.agent_card.description = "Edited"
+        app.extensions["a2a_agent_card_cache"].invalidate()
+        assert client.get("/agent.json", headers=headers).get_json()["description"] == "Edited"
+
+    def test_unchanged_rebuild_keeps_validators(self):
+        """Test that rebuilding an unchanged document keeps its ETag"""
+        from python_a2a.server.agent_card_cache import AgentCardCache
+
+        builds = []
+
+        def build():
+            builds.append(1)
+            return {"name": "Echo"}
+
+        cache = AgentCardCache(build, refresh_interval=60)
+        document = cache.get()
+        assert cache.get() is document
+        cache.invalidate()
+        assert cache.get() is document
+        assert len(builds) == 2
+        assert document.not_modified(if_none_match='W/' + document.etag + ', "other"')
+        assert not document.not_modified(if_none_match='"other"')
+
+    def test_asgi_agent_card_etag(self):
+        """Test conditional agent card requests on the ASGI app"""
+        from fastapi.testclient import TestClient
+        from python_a2a.server.asgi import create_asgi_app
+
+        client = TestClient(create_asgi_app(A2AServer()))
+        first = client.get("/agent.json")
+        assert first.status_code == 200
+        assert first.json()["capabilities"]["google_a2a_compatible"] is True
+
+        response = client.get("/a2a/agent.json", headers={"If-None-Match": first.headers["etag"]})
+        assert response.status_code == 304
+
+
+class TestAdmissionControl:
+    def test_global_queue_and_per_key_limits(self):
+        """Test queueing, hand-off and rejections of the admission controller"""
+        import threading
+        from python_a2a.server import AdmissionController, AdmissionRejected
+
+        controller = AdmissionController(max_concurrency=1, max_queue=1, queue_timeout=0.1,
+                                         per_key_concurrency=1, key_limits={"vip": 2})
+        first = controller.acquire("a")
+
+        # Over its key's limit: rejected at once
+        with pytest.raises(AdmissionRejected) as excinfo:
+            controller.acquire("a")
+        assert excinfo.value.status_code == 429
+        assert excinfo.value.headers == {"Retry-After": "1"}
+
+        # Global slots busy: wait, then time out
+        with pytest.raises(AdmissionRejected) as excinfo:
+            controller.acquire("b")
+        assert excinfo.value.status_code == 503
+
+        # A waiting request gets the released slot; the queue is then full
+        controller.queue_timeout = 5
+        admitted = []
+        waiter = threading.Thread(target=lambda: admitted.append(controller.acquire("vip")))
+        waiter.start()
+        while controller.metrics()["queue_depth"] < 1:
+            pass
+        with pytest.raises(AdmissionRejected) as excinfo:
+            controller.acquire("c")
+        assert excinfo.value.status_code == 503
+        first.release()
+        first.release()
+        waiter.join(5)
+        assert len(admitted) == 1
+
+        metrics = controller.metrics()
+        assert metrics["in_flight"] == 1 and metrics["queue_depth"] == 0
+        assert metrics["max_queue_depth"] == 1
+        assert metrics["admitted"] == 2
+        assert metrics["rejected_429"] == 1 and metrics["rejected_503"] == 2
+        assert list(metrics["per_key"].values()) == [1]
+        assert "vip" not in metrics["per_key"]
+
+        admitted[0].release()
+        assert controller.metrics()["in_flight"] == 0
+        assert controller.metrics()["per_key"] == {}
+
+    def test_flask_rejects_with_retry_after(self):
+        """Test that the Flask app rejects requests beyond the limits"""
+        import threading
+        from python_a2a.server import AdmissionController
+        from python_a2a.server.http import create_flask_app
+
+        entered = threading.Event()
+        release = threading.Event()
+
+        def handler(message):
+            entered.set()
+            release.wait(5)
+            return Message(content=TextContent(text="done"), role=MessageRole.AGENT)
+
+        server = A2AServer(message_handler=handler, google_a2a_compatible=False,
+                           admission=AdmissionController(max_concurrency=1, per_key_concurrency=1))
+        app = create_flask_app(server)
+        message = Message(content=TextContent(text="hi"), role=MessageRole.USER).to_dict()
+
+        responses = []
+        busy = threading.Thread(target=lambda: responses.append(
+            app.test_client().post("/a2a", json=message, headers={"X-API-Key": "tenant"})
+        ))
+        busy.start()
+        assert entered.wait(5)
+
+        client = app.test_client()
+        response = client.post("/a2a", json=message, headers={"Authorization": "Bearer tenant"})
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "1"
+        response = client.post("/a2a", json=message)
+        assert response.status_code == 503
+        assert response.get_json()["error"] == "Server is at capacity"
+        # Task lookups are not queued
+        assert client.post("/tasks/get", json={"jsonrpc": "2.0", "id": 1,
+                                               "method": "tasks/get",
+                                               "params": {"id": "missing"}}).status_code == 404
+        assert client.get("/a2a/admission").get_json()["in_flight"] == 1
+
+        release.set()
+        busy.join(5)
+        assert responses[0].status_code == 200
+        # The slot is held until the WSGI server closes the response
+        responses[0].close()
+        assert client.get("/a2a/admission").get_json()["in_flight"] == 0
+
+    def test_asgi_queues_requests(self):
+        """Test that the ASGI app queues requests up to the limits"""
+        import asyncio
+        import httpx
+        from python_a2a.server import AdmissionController
+        from python_a2a.server.asgi import create_asgi_app
+
+        class SlowAgent(BaseA2AServer):
+            async def handle_message(self, message):
+                await asyncio.sleep(0.1)
+                return Message(content=TextContent(text=message.content.text.upper()),
+                               role=MessageRole.AGENT)
+
+        admission = AdmissionController(max_concurrency=2, max_queue=2, queue_timeout=5)
+        app = create_asgi_app(SlowAgent(), admission=admission)
+
+        async def run():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://agent") as client:
+                return await asyncio.gather(*[
+                    client.post("/a2a", json=Message(content=TextContent(text=f"m{i}"),
+                                                     role=MessageRole.USER).to_dict())
+                    for i in range(6)
+                ])
+
+        responses = asyncio.run(run())
+
+        statuses = sorted(r.status_code for r in responses)
+        assert statuses == [200, 200, 200, 200, 503, 503]
+        assert all("retry-after" in r.headers for r in responses if r.status_code == 503)
+        metrics = admission.metrics()
+        assert metrics["max_queue_depth"] == 2 and metrics["in_flight"] == 0
+
+
+class TestPassthrough:
+    def _send_request(self, text="hello", rpc_id=7):
+        return {"jsonrpc": "2.0", "id": rpc_id, "method": "tasks/send", "params": {
+            "id": "task-1",
+            "message": {"role": "user", "conversation_id": "c1", "content": {"type": "text", "text": text}}
+        }}
+
+    def test_raw_request_parses_envelope_on_demand(self):
+        """Test that the body is parsed only when the envelope is inspected"""
+        import gzip
+        import json
+        from python_a2a.server import RawRequest, passthrough
+
+        body = json.dumps(self._send_request()).encode()
+        request = RawRequest(body, "/a2a/tasks/send", {"Content-Type": "application/json"})
+        assert request._data is passthrough._NOT_PARSED and request.body is body
+
+        assert (request.method, request.rpc_id) == ("tasks/send", 7)
+        assert request.message.conversation_id == "c1"
+        assert not request.message.is_decoded
+
+        compressed = RawRequest(gzip.compress(body), "/", {"content-encoding": "gzip"})
+        assert compressed.method == "tasks/send"
+        assert RawRequest(b"not json").envelope == {}
+        assert RawRequest(b"[]").message is None
+
+    def test_flask_passthrough(self, live_server):
+        """Test forwarding requests and responses unchanged through the Flask app"""
+        import json
+        from python_a2a import A2AClient
+        from python_a2a.server import create_passthrough_app
+
+        upstream = A2AClient(live_server(A2AServer(google_a2a_compatible=False)))
+        routed = []
+
+        def route(request):
+            routed.append(request.method)
+            return upstream
+
+        client = create_passthrough_app(route).test_client()
+
+        response = client.post("/tasks/send", json=self._send_request())
+        assert response.status_code == 200
+        result = response.get_json()
+        assert result["id"] == 7
+        assert result["result"]["artifacts"][0]["parts"][0]["text"] == "hello"
+        assert routed == ["tasks/send"]
+
+        # Compressed responses are passed on without being decompressed
+        response = client.post("/tasks/send", json=self._send_request("x" * 5000),
+                               headers={"Accept-Encoding": "gzip"})
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert int(response.headers["Content-Length"]) == len(response.data) < 5000
+
+        assert client.get("/a2a/health").status_code == 200
+
+    def test_asgi_passthrough_sends_each_header_once(self):
+        """Test that forwarded headers replace the client's headers whatever their casing"""
+        import threading
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        from fastapi.testclient import TestClient
+        from python_a2a import A2AClient
+        from python_a2a.server import create_asgi_passthrough_app
+
+        received = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                self.send_response(404)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers["Content-Length"]))
+                received.append(self.headers)
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", "2")
+                self.end_headers()
+                self.wfile.write(b"{}")
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            upstream = A2AClient(f"http://127.0.0.1:{server.server_port}",
+                                 headers={"Authorization": "Bearer gateway"})
+            with TestClient(create_asgi_passthrough_app(upstream)) as client:
+                response = client.post("/tasks/send", json=self._send_request(),
+                                       headers={"Authorization": "Bearer caller"})
+        finally:
+            server.shutdown()
+
+        assert response.status_code == 200
+        headers = received[-1]
+        assert headers.get_all("Content-Type") == ["application/json"]
+        assert headers.get_all("Authorization") == ["Bearer caller"]
+
+        # The merged headers hold each name once, whatever the HTTP library does with them
+        _, merged = upstream._forward_request("", {"content-type": "application/json",
+                                                   "authorization": "Bearer caller"})
+        names = [name.lower() for name in merged]
+        assert len(names) == len(set(names))
+        assert {name.lower(): value for name, value in merged.items()}["authorization"] == "Bearer caller"
+
+    def test_flask_passthrough_unreachable_upstream(self):
+        """Test the JSON-RPC error returned when the upstream agent is down"""
+        from python_a2a import A2AClient
+        from python_a2a.server import create_passthrough_app
+
+        upstream = A2AClient("http://127.0.0.1:1")
+        client = create_passthrough_app(upstream).test_client()
+
+        response = client.post("/tasks/send", json=self._send_request())
+        assert response.status_code == 502
+        assert response.get_json()["id"] == 7
+
+    def test_asgi_passthrough(self, live_server):
+        """Test forwarding requests and responses unchanged through the ASGI app"""
+        from fastapi.testclient import TestClient
+        from python_a2a import A2AClient
+        from python_a2a.server import create_asgi_passthrough_app
+
+        upstream = A2AClient(live_server(A2AServer(google_a2a_compatible=False)))
+
+        with TestClient(create_asgi_passthrough_app(upstream)) as client:
+            response = client.post("/tasks/send", json=self._send_request())
+            assert response.status_code == 200
+            assert response.json()["result"]["artifacts"][0]["parts"][0]["text"] == "hello"
+
+            response = client.post("/tasks/send", json=self._send_request("x" * 5000),
+                                   headers={"Accept-Encoding": "gzip"})
+            assert response.headers["content-encoding"] == "gzip"
+            assert response.json()["result"]["artifacts"][0]["parts"][0]["text"] == "x" * 5000
+
+        assert upstream._session_manager._session is None
@@ -0,0 +1,77 @@
+"""
+Tests for the incremental server-sent events decoder.
+"""
+
+import asyncio
+import json
+
+from python_a2a.client.sse import SSEDecoder, SSEEvent, iter_sse_events
+
+
+def decode_all(*chunks):
+    decoder = SSEDecoder()
+    events = []
+    for chunk in chunks:
+        events.extend(decoder.feed(chunk))
+    return events
+
+
+class TestSSEDecoder:
+    def test_fields_and_multiline_data(self):
+        """Test event, id, retry and multi-line data fields"""
+        events = decode_all(
+            b"event: update\nid: 7\nretry: 1500\ndata: first\ndata: second\n\n"
+            b"data: plain\n\n"
+        )
+
+        assert events == [
+            SSEEvent(event="update", data="first\nsecond", id="7", retry=1500),
+            SSEEvent(event="message", data="plain", id="7", retry=1500),
+        ]
+
+    def test_byte_by_byte_matches_single_chunk(self):
+        """Test that chunk boundaries never change the decoded events"""
+        stream = (
+            "\ufeffevent: chunk\r\ndata: {\"text\": \"héllo 世界 \U0001F600\"}\r\n\r\n"
+            ": keep-alive comment\n\n"
+            "id: 3\rdata: café\r\r"
+        ).encode("utf-8")
+
+        whole = decode_all(stream)
+        split = decode_all(*(stream[i:i + 1] for i in range(len(stream))))
+
+        assert whole == split
+        assert json.loads(whole[0].data)["text"] == "héllo 世界 \U0001F600"
+        assert whole[0].event == "chunk"
+        assert whole[1] == SSEEvent(event="message", data="café", id="3")
+
+    def test_crlf_split_across_chunks(self):
+        """Test that a CRLF split between chunks is a single line break"""
+        events = decode_all(b"data: a\r", b"\ndata: b\r", b"\n\r", b"\n")
+
+        assert events == [SSEEvent(data="a\nb")]
+
+    def test_ignores_events_without_data_and_unknown_fields(self):
+        """Test events without data, unknown fields and field values without a space"""
+        events = decode_all(b"event: ping\n\nfoo: bar\ndata:x\nid: bad\0id\n\n")
+
+        assert events == [SSEEvent(event="message", data="x")]
+
+    def test_unterminated_event_is_discarded(self):
+        """Test that a trailing event without a blank line is not dispatched"""
+        decoder = SSEDecoder()
+
+        assert decoder.feed(b"data: complete\n\ndata: partial") == [SSEEvent(data="complete")]
+        assert decoder.flush() == []
+        assert decoder.feed(b"\n\n") == []
+
+    def test_iter_sse_events(self):
+        """Test decoding an async stream of chunks"""
+        async def chunks():
+            for chunk in (b"data: one\n", b"\ndata: t", b"wo\n\n"):
+                yield chunk
+
+        async def run():
+            return [event.data async for event in iter_sse_events(chunks())]
+
+        assert asyncio.run(run()) == ["one", "two"]